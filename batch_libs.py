@@ -0,0 +1,197 @@
+# Classification (U)
+
+"""Program:  batch_libs.py
+
+    Description:  Library of functions for batch mode, which runs a number of
+        replication sets at the same time.
+
+    Functions:
+        run_batch
+        batch_files
+        run_set
+        set_lock_id
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import os
+import io
+import sys
+import copy
+import time
+import datetime
+import contextlib
+import concurrent.futures
+import hashlib
+
+# Local
+try:
+    from .lazy_class import gen_class
+    from . import version
+    from . import report_libs
+
+except (ValueError, ImportError) as err:
+    from lazy_class import gen_class
+    import version
+    import report_libs
+
+
+def run_batch(args, func_dict, run_func, **kwargs):
+
+    """Function:  run_batch
+
+    Description:  Run the commands for each replication set in the batch at
+        the same time, each in its own process, with no more processes than
+        the -q option count.  The output of each set is displayed once the set is
+        done and the timing reports of the sets are combined into one report.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) func_dict -> Dictionary list of functions and options
+        (input) run_func -> Function which runs the commands of a set
+        (input) kwargs:
+            slv_key -> Dictionary of keys and data types
+        (output) report -> Batch timing report dictionary
+
+    """
+
+    start = time.monotonic()
+    slv_files = batch_files(args.get_val("-m"), args.get_val("-d"))
+    report = {"program": "mysql_rep_failover", "version": version.__version__,
+              "start": datetime.datetime.now().isoformat(),
+              "commands": sorted(set(args.get_args_keys()) & set(func_dict)),
+              "status": "Success", "sets": []}
+
+    if slv_files:
+        max_workers = int(args.get_val("-q", def_val=len(slv_files)))
+
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=min(len(slv_files), max_workers)) as pool:
+            futures = [pool.submit(run_set, args, func_dict, run_func,
+                                   slv_file, slv_key=kwargs.get("slv_key", {}))
+                       for slv_file in slv_files]
+
+            for slv_file, future in zip(slv_files, futures):
+                output, set_report = future.result()
+                print(f"Replication set: {slv_file}")
+                print(output, end="")
+                report["sets"].append(set_report)
+
+        failed = [item["slave_file"] for item in report["sets"]
+                  if item["status"] != "Success"]
+
+        if failed:
+            report["status"] = f"Replication sets failed: {failed}"
+            print(f'Error:  {report["status"]}')
+
+    else:
+        report["status"] = \
+            f'No slave config files found for: {args.get_val("-m")}'
+        print(f'Error:  {report["status"]}')
+
+    report["total"] = time.monotonic() - start
+
+    if args.get_val("-r", def_val=False) or args.get_val("-o"):
+        report_libs.write_report(report, args.get_val("-o"))
+
+    return report
+
+
+def batch_files(batch, cfg_path=None):
+
+    """Function:  batch_files
+
+    Description:  Return the slave config files of a batch.  A directory,
+        either as given or under the config path, gives all of its files
+        ending in .txt, otherwise the batch is a comma separated list of
+        files.
+
+    Arguments:
+        (input) batch -> Directory or comma separated list of files
+        (input) cfg_path -> Directory path to the config files
+        (output) List of slave config files
+
+    """
+
+    batch = batch or ""
+
+    for path in [batch, os.path.join(cfg_path or "", batch)]:
+        if batch and os.path.isdir(path):
+            return [os.path.abspath(os.path.join(path, name))
+                    for name in sorted(os.listdir(path))
+                    if name.endswith(".txt")]
+
+    return [name.strip() for name in batch.split(",") if name.strip()]
+
+
+def run_set(args, func_dict, run_func, slv_file, **kwargs):
+
+    """Function:  run_set
+
+    Description:  Run the commands for one replication set of a batch under
+        its own program lock, capturing the output of the set.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) func_dict -> Dictionary list of functions and options
+        (input) run_func -> Function which runs the commands of the set
+        (input) slv_file -> Slave config file of the replication set
+        (input) kwargs:
+            slv_key -> Dictionary of keys and data types
+        (output) output -> Output of the replication set
+        (output) report -> Timing report dictionary of the replication set
+
+    """
+
+    args = copy.copy(args)
+    args.args_array = {opt: val for opt, val in args.args_array.items()
+                       if opt not in ["-m", "-r", "-o"]}
+    args.args_array["-s"] = slv_file
+    lock_id = set_lock_id(args, slv_file)
+    output = io.StringIO()
+
+    with contextlib.redirect_stdout(output):
+        try:
+            prog_lock = gen_class.ProgramLock(sys.argv, lock_id)
+            report = run_func(
+                args, func_dict, slv_key=kwargs.get("slv_key", {}))
+            del prog_lock
+
+        except gen_class.SingleInstanceException:
+            print(f"WARNING:  Lock in place for mysql_rep_failover with id:"
+                  f" {lock_id}")
+            report = {"slave_file": slv_file, "status": "Lock in place"}
+
+        except Exception as err:                    # pylint:disable=W0703
+            print(f"Error:  {err}")
+            report = {"slave_file": slv_file, "status": str(err)}
+
+    return output.getvalue(), report
+
+
+def set_lock_id(args, slv_file):
+
+    """Function:  set_lock_id
+
+    Description:  Return the program lock id of a replication set of a
+        batch.  The id is made of the flavor id, the name of the slave config
+        file and a digest of the absolute path of the file, so the sets of
+        config files with the same name in different directories do not
+        share a lock.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) slv_file -> Slave config file of the replication set
+        (output) Program lock id
+
+    """
+
+    path = os.path.abspath(
+        os.path.join(args.get_val("-d", def_val=""), slv_file))
+    digest = hashlib.sha256(path.encode("UTF-8")).hexdigest()[:12]
+
+    return "_".join(
+        [val for val in [args.get_val("-y", def_val=""),
+                         os.path.basename(slv_file), digest] if val])
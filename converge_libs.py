@@ -0,0 +1,157 @@
+# Classification (U)
+
+"""Program:  converge_libs.py
+
+    Description:  Library of functions for verifying the slaves converge on the
+        new master after a failover.
+
+    Functions:
+        verify_convergence
+        convergence_reason
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import time
+
+# Local
+try:
+    from . import gtid_class
+    from . import report_libs
+    from . import probe_libs
+
+except (ValueError, ImportError) as err:
+    import gtid_class
+    import report_libs
+    import probe_libs
+
+# Status fields polled to verify the slaves converge on the new master.
+CONVERGE_FIELDS = (
+    "exe_gtidset", "io_running", "sql_running", "source_host", "source_port")
+
+
+def verify_convergence(master, slaves, **kwargs):
+
+    """Function:  verify_convergence
+
+    Description:  Poll the slaves concurrently until each slave has its IO
+        and SQL threads running, is replicating from the new master and has
+        executed the transactions the new master had executed when the
+        verification started, or until the deadline.  The time for each
+        slave to converge is displayed along with the p50 and p99 of the
+        slaves and added to the timing report.
+
+    Arguments:
+        (input) master -> MasterRep instance of the new master
+        (input) slaves -> Slave instance array
+        (input) kwargs:
+            timeout -> Deadline in seconds
+            max_workers -> Maximum number of slaves polled concurrently
+            report -> Timing report dictionary
+            tracker -> GtidTracker instance to advance the GTID sets with
+        (output) not_converged -> List of slave names that did not converge
+
+    """
+
+    slaves = list(slaves)
+    kwargs["tracker"] = kwargs.get("tracker") or gtid_class.GtidTracker()
+    start = time.monotonic()
+    deadline = start + kwargs.get("timeout", 60)
+    converged = {}
+    reasons = {}
+    pending = slaves
+    delay = 0.05
+
+    if not slaves:
+        return []
+
+    try:
+        target = gtid_class.GtidSet(master.col_sql(
+            "SELECT @@GLOBAL.gtid_executed AS gtid_executed")[0]
+            ["gtid_executed"])
+
+    except Exception as err:                        # pylint:disable=W0703
+        print(f"Warning:  Executed set of new master {master.name} not read:"
+              f" {err}")
+        target = gtid_class.GtidSet(master.exe_gtid)
+
+    while pending:
+        probed = probe_libs.probe_slaves(
+            pending, CONVERGE_FIELDS,
+            max_workers=kwargs.get("max_workers", 16), quiet=True,
+            tracker=kwargs["tracker"])
+
+        now = time.monotonic()
+
+        for slv in pending:
+            reasons[slv.name] = "Status not read" if slv not in probed \
+                else convergence_reason(slv, master, target)
+
+            if reasons[slv.name] is None:
+                converged[slv.name] = now - start
+
+        pending = [slv for slv in pending if slv.name not in converged]
+
+        if not pending or now + delay > deadline:
+            break
+
+        time.sleep(delay)
+        delay = min(delay * 2, 1.0)
+
+    for slv in slaves:
+        if slv.name in converged:
+            print(f"Slave: {slv.name}\tConverge time:"
+                  f" {converged[slv.name]:.3f}s")
+            report_libs.slave_time(
+                kwargs.get("report"), slv.name, "converge",
+                converged[slv.name])
+
+        else:
+            print(f"Slave: {slv.name}\tNot converged: {reasons[slv.name]}")
+
+    summary = {"converged": len(converged), "slaves": len(slaves),
+               "p50": report_libs.percentile(converged.values(), 50),
+               "p99": report_libs.percentile(converged.values(), 99)}
+    print(f'Converged: {summary["converged"]}/{summary["slaves"]} slaves'
+          f'\tp50: {report_libs.plan_value(summary["p50"], "s")}'
+          f'\tp99: {report_libs.plan_value(summary["p99"], "s")}')
+
+    if kwargs.get("report") is not None:
+        kwargs["report"]["convergence"] = summary
+        kwargs["report"]["gtid_reads"] = kwargs["tracker"].stats
+
+    return [slv.name for slv in pending]
+
+
+def convergence_reason(slave, master, target):
+
+    """Function:  convergence_reason
+
+    Description:  Return why a slave has not converged on the new master.
+
+    Arguments:
+        (input) slave -> Slave instance with the convergence fields
+        (input) master -> MasterRep instance of the new master
+        (input) target -> GtidSet instance the slave must contain
+        (output) Reason or None if the slave has converged
+
+    """
+
+    if not slave.io_running:
+        return "IO thread not running"
+
+    if not slave.sql_running:
+        return "SQL thread not running"
+
+    if (slave.source_host, slave.source_port) \
+       != (str(master.host), str(master.port)):
+        return f"Replicating from {slave.source_host}:{slave.source_port}"
+
+    missing = target.subtract(probe_libs.slave_gtids(slave))
+
+    if missing:
+        return f"Missing {missing.count()} transactions"
+
+    return None
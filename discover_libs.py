@@ -0,0 +1,413 @@
+# Classification (U)
+
+"""Program:  discover_libs.py
+
+    Description:  Library of functions for reading the slave config file and
+        connecting to the slaves.
+
+    Functions:
+        slave_records
+        create_inventory
+        create_instances
+        probe_reachable
+        find_slave
+        discover_slaves
+        _discovered_slaves
+        _abandon_slave
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import time
+import queue
+import threading
+
+# Local
+try:
+    from .lazy_class import gen_libs, mysql_libs
+    from . import report_libs
+    from . import probe_libs
+    from . import engine_libs
+    from . import score_libs
+
+except (ValueError, ImportError) as err:
+    from lazy_class import gen_libs, mysql_libs
+    import report_libs
+    import probe_libs
+    import engine_libs
+    import score_libs
+
+
+def slave_records(entry, result, wall_time):
+
+    """Function:  slave_records
+
+    Description:  Create the NDJSON status records of a slave from its
+        connection attempt.
+
+    Arguments:
+        (input) entry -> Slave configuration dictionary
+        (input) result -> List of slave instances or the error
+        (input) wall_time -> Wall time of the connection attempt
+        (output) records -> List of NDJSON record dictionaries
+
+    """
+
+    records = []
+    error = None if isinstance(result, list) else str(result)
+
+    for slv in result if error is None else [None]:
+        record = {"type": "slave", "name": entry["name"],
+                  "status": "excluded", "seconds": round(wall_time, 6)}
+
+        if slv is None:
+            record["error"] = error
+
+        elif slv.conn_msg:
+            record["error"] = str(slv.conn_msg)
+
+        else:
+            record["status"] = "ok"
+            record["gtid_mode"] = bool(slv.gtid_mode)
+            record["transactions"] = probe_libs.slave_gtids(slv).count()
+
+        records.append(record)
+
+    return records
+
+
+def create_inventory(args, **kwargs):
+
+    """Function:  create_inventory
+
+    Description:  Parse the slave config file once and index the entries by
+        name and by name and port.  The first entry for a name is used for
+        the name index.  The slave index is filled in by create_instances.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) kwargs:
+            slv_key -> Dictionary of keys and data types
+        (output) inventory -> Slave inventory dictionary
+            entries -> List of slave configuration dictionaries
+            names -> Dictionary of name to configuration dictionary
+            keys -> Dictionary of (name, port) to configuration dictionary
+            slaves -> Dictionary of name to slave instance
+            scoring -> Scoring settings from score_settings
+
+    """
+
+    slv_array = gen_libs.create_cfg_array(
+        args.get_val("-s"), cfg_path=args.get_val("-d"))
+    slv_array = gen_libs.transpose_dict(slv_array, kwargs.get("slv_key", {}))
+    inventory = {"entries": slv_array, "names": {}, "keys": {}, "slaves": {},
+                 "scoring": score_libs.score_settings(
+                     slv_array, quiet=bool(kwargs.get("stream")))}
+
+    for entry in slv_array:
+        inventory["names"].setdefault(entry["name"], entry)
+        inventory["keys"][(entry["name"], int(entry["port"]))] = entry
+
+    return inventory
+
+
+def create_instances(args, **kwargs):
+
+    """Function:  create_instances
+
+    Description:  Create SlaveRep instances for the slaves.  The slave
+        instances will be appended to an array and indexed by name in the
+        slave inventory.  Slaves whose host does not accept a TCP connection
+        are excluded before the MySQL connection is attempted.  Only the
+        given entries of the slave config file are used, when given.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) kwargs:
+            slv_key -> Dictionary of keys and data types
+            report -> Timing report dictionary
+            inventory -> Slave inventory dictionary
+            entries -> List of slave configuration dictionaries to use
+            stream -> Function to write NDJSON records with
+        (output) slaves -> List of slave instances
+
+    """
+
+    inventory = kwargs.get("inventory") or create_inventory(args, **kwargs)
+
+    with report_libs.time_phase(kwargs.get("report"), "tcp_probe"):
+        entries = probe_reachable(
+            kwargs.get("entries", inventory["entries"]),
+            timeout=float(args.get_val("-e", def_val=250)) / 1000,
+            report=kwargs.get("report"), stream=kwargs.get("stream"))
+
+    slaves = discover_slaves(
+        entries, max_workers=int(args.get_val("-p", def_val=16)),
+        timeout=float(args.get_val("-t", def_val=30)),
+        report=kwargs.get("report"), stream=kwargs.get("stream"))
+
+    for slv in slaves:
+        inventory["slaves"].setdefault(slv.name, slv)
+
+    return slaves
+
+
+def probe_reachable(slv_array, **kwargs):
+
+    """Function:  probe_reachable
+
+    Description:  Check that the host and port of each slave accept a TCP
+        connection, all at the same time and with a tight deadline, before
+        the MySQL connection is attempted.  Slaves that are down or
+        firewalled are reported and excluded without waiting out the driver
+        connect timeout.  Slaves without a host are not checked.
+
+    Arguments:
+        (input) slv_array -> List of slave configuration dictionaries
+        (input) kwargs:
+            timeout -> Deadline in seconds for each TCP connection
+            max_workers -> Maximum number of TCP connections in flight
+            report -> Timing report dictionary
+            stream -> Function to write NDJSON records with
+        (output) entries -> List of reachable slave configuration
+            dictionaries in configuration order
+
+    """
+
+    slv_array = list(slv_array)
+    checked = [entry for entry in slv_array if entry.get("host")]
+    entries = []
+
+    if not checked:
+        return slv_array
+
+    results = iter(engine_libs.run_coroutine(engine_libs.probe_tcp(
+        [(entry["host"], int(entry.get("port") or 3306))
+         for entry in checked],
+        timeout=kwargs.get("timeout", 0.25),
+        max_workers=kwargs.get("max_workers", 256))))
+
+    for entry in slv_array:
+        if not entry.get("host"):
+            entries.append(entry)
+            continue
+
+        err, wall_time = next(results)
+        report_libs.slave_time(
+            kwargs.get("report"), entry["name"], "tcp_probe", wall_time)
+
+        if err is None:
+            entries.append(entry)
+
+        elif kwargs.get("stream"):
+            for record in slave_records(entry, err, wall_time):
+                kwargs["stream"](record)
+
+        else:
+            print(f'Warning:  Slave {entry["name"]} excluded: {err}')
+
+    return entries
+
+
+def find_slave(slaves, name, **kwargs):
+
+    """Function:  find_slave
+
+    Description:  Find a slave by name using the slave inventory index.
+        Without an inventory the slave array is searched.  A slave in the
+        inventory which is not in the slave array (i.e. excluded when its
+        status fields were probed) is not found.
+
+    Arguments:
+        (input) slaves -> Slave instance array
+        (input) name -> Name of the slave
+        (input) kwargs:
+            inventory -> Slave inventory dictionary
+        (output) Slave instance or None if not found
+
+    """
+
+    inventory = kwargs.get("inventory")
+
+    if inventory is None:
+        return mysql_libs.find_name(slaves, name)
+
+    slave = inventory["slaves"].get(name)
+
+    return slave if any(slv is slave for slv in slaves) else None
+
+
+def discover_slaves(slv_array, **kwargs):               # pylint:disable=R0914
+
+    """Function:  discover_slaves
+
+    Description:  Create and connect the SlaveRep instances on a bounded
+        pool of worker threads.  Each host is given its own deadline from the
+        time its connection attempt starts.  Slaves that fail to connect or
+        that exceed their deadline are reported and excluded from the array
+        without holding up the other slaves.  When streaming, the status
+        record of each slave is written as soon as its attempt is done.
+
+    NOTE:  A connection attempt that exceeds its deadline cannot be
+        interrupted, it is abandoned and disconnected if it ever completes.
+        A replacement worker is started for each abandoned attempt, so no
+        more than max_workers attempts are in progress, and the worker of
+        the abandoned attempt exits once the attempt completes.  The worker
+        threads are daemon threads, so an abandoned attempt does not hold
+        up the exit of the program.
+
+    Arguments:
+        (input) slv_array -> List of slave configuration dictionaries
+        (input) kwargs:
+            max_workers -> Maximum number of concurrent connections
+            timeout -> Per host connect and status read deadline in seconds
+            report -> Timing report dictionary
+            stream -> Function to write NDJSON records with
+        (output) slaves -> List of slave instances in configuration order
+
+    """
+
+    slv_array = list(slv_array)
+    timeout = kwargs.get("timeout", 30)
+    stream = kwargs.get("stream")
+    tasks = queue.Queue()
+    completed = queue.Queue()
+    lock = threading.Lock()
+    abandoned = set()
+    started = {}
+    finished = {}
+    results = {}
+
+    if not slv_array:
+        return []
+
+    def _done(entry, result, wall_time):
+        if stream:
+            for record in slave_records(entry, result, wall_time):
+                stream(record)
+
+    def _worker():
+        while True:
+            try:
+                index = tasks.get_nowait()
+
+            except queue.Empty:
+                return
+
+            with lock:
+                started[index] = time.monotonic()
+
+            try:
+                result = mysql_libs.create_slv_array([slv_array[index]])
+
+            except Exception as err:                # pylint:disable=W0703
+                result = err
+
+            with lock:
+                finished[index] = time.monotonic()
+                late = index in abandoned
+
+            if late:
+                _abandon_slave(result)
+                return
+
+            completed.put((index, result))
+
+    for index in range(len(slv_array)):
+        tasks.put(index)
+
+    for _ in range(max(1, min(kwargs.get("max_workers", 16),
+                              len(slv_array)))):
+        threading.Thread(target=_worker, daemon=True).start()
+
+    while len(results) < len(slv_array):
+        try:
+            index, result = completed.get(timeout=0.05)
+            results[index] = result
+            _done(slv_array[index], result,
+                  finished[index] - started[index])
+
+        except queue.Empty:
+            pass
+
+        now = time.monotonic()
+
+        with lock:
+            late = [index for index in started
+                    if index not in finished and index not in abandoned
+                    and now - started[index] > timeout]
+            abandoned.update(late)
+
+        for index in late:
+            results[index] = \
+                f"No response within the {timeout} second deadline"
+            _done(slv_array[index], results[index], now - started[index])
+
+            if not tasks.empty():
+                threading.Thread(target=_worker, daemon=True).start()
+
+    now = time.monotonic()
+
+    return _discovered_slaves(
+        slv_array, [results[index] for index in range(len(slv_array))],
+        [finished.get(index, now) - started.get(index, now)
+         for index in range(len(slv_array))], kwargs.get("report"),
+        quiet=bool(stream))
+
+
+def _discovered_slaves(slv_array, results, wall_times, report, **kwargs):
+
+    """Function:  _discovered_slaves
+
+    Description:  Record the discovery time of each slave and return the
+        slaves which connected, reporting the slaves which are excluded.
+
+    Arguments:
+        (input) slv_array -> List of slave configuration dictionaries
+        (input) results -> List of slave lists or errors in slv_array order
+        (input) wall_times -> List of wall times in slv_array order
+        (input) report -> Timing report dictionary
+        (input) kwargs:
+            quiet -> True to not print the excluded slaves
+        (output) slaves -> List of slave instances in configuration order
+
+    """
+
+    slaves = []
+    quiet = kwargs.get("quiet", False)
+
+    for entry, result, wall_time in zip(slv_array, results, wall_times):
+        report_libs.slave_time(report, entry["name"], "discovery", wall_time)
+
+        if isinstance(result, list):
+            for slv in result:
+                if not slv.conn_msg:
+                    slaves.append(slv)
+
+                elif not quiet:
+                    print(f'Warning:  Slave {entry["name"]} excluded:'
+                          f' {slv.conn_msg}')
+
+        elif not quiet:
+            print(f'Warning:  Slave {entry["name"]} excluded: {result}')
+
+    return slaves
+
+
+def _abandon_slave(result):
+
+    """Function:  _abandon_slave
+
+    Description:  Disconnect any slaves from a connection attempt which
+        completed after its deadline had passed.
+
+    Arguments:
+        (input) result -> List of slave instances or the error of the
+            abandoned connection attempt
+
+    """
+
+    if isinstance(result, list):
+        mysql_libs.disconnect(result)
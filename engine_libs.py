@@ -0,0 +1,114 @@
+# Classification (U)
+
+"""Program:  engine_libs.py
+
+    Description:  Library of functions which run a blocking call for each
+        slave concurrently on a thread pool, and the TCP check of the slave
+        hosts as coroutines.
+
+    Functions:
+        run_coroutine
+        probe_tcp
+        run_engine
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import time
+import asyncio
+import concurrent.futures
+
+
+def run_coroutine(coro):
+
+    """Function:  run_coroutine
+
+    Description:  Run a coroutine to completion on a new event loop and
+        close the loop.  Stands in for asyncio.run, which is not in Python
+        3.6.
+
+    Arguments:
+        (input) coro -> Coroutine
+        (output) Result of the coroutine
+
+    """
+
+    loop = asyncio.new_event_loop()
+
+    try:
+        return loop.run_until_complete(coro)
+
+    finally:
+        loop.close()
+
+
+async def probe_tcp(addresses, **kwargs):
+
+    """Function:  probe_tcp
+
+    Description:  Open and close a TCP connection to each address as
+        coroutines, with no more than max_workers connections in flight.
+
+    Arguments:
+        (input) addresses -> List of (host, port)
+        (input) kwargs:
+            timeout -> Deadline in seconds for each connection
+            max_workers -> Maximum number of connections in flight
+        (output) List of (error message or None, wall time) in address
+            order
+
+    """
+
+    timeout = kwargs.get("timeout", 0.25)
+    semaphore = asyncio.Semaphore(kwargs.get("max_workers", 256))
+
+    async def _probe(host, port):
+        async with semaphore:
+            start = time.monotonic()
+
+            try:
+                _, writer = await asyncio.wait_for(
+                    asyncio.open_connection(host, port), timeout)
+                writer.close()
+                err = None
+
+            except asyncio.TimeoutError:
+                err = f"Host {host}:{port} did not accept a TCP connection" \
+                      f" within {timeout * 1000:.0f} ms"
+
+            except OSError as os_err:
+                err = f"Host {host}:{port} is not reachable: {os_err}"
+
+            return err, time.monotonic() - start
+
+    return await asyncio.gather(
+        *[_probe(host, port) for host, port in addresses])
+
+
+def run_engine(func, items, **kwargs):
+
+    """Function:  run_engine
+
+    Description:  Run a function over the items concurrently on a thread
+        pool.
+
+    Arguments:
+        (input) func -> Function to call with each item
+        (input) items -> List of items
+        (input) kwargs:
+            max_workers -> Maximum number of calls run concurrently
+        (output) List of the function results in item order
+
+    """
+
+    items = list(items)
+
+    if not items:
+        return []
+
+    with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, min(kwargs.get("max_workers", 16),
+                                   len(items)))) as pool:
+        return list(pool.map(func, items))
@@ -0,0 +1,753 @@
+# Classification (U)
+
+"""Program:  gtid_class.py
+
+    Description:  Class that has class definitions and methods for working
+        with MySQL GTID sets.
+
+    Classes:
+        GtidSet
+        GtidTracker
+        GtidMatrix
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import array
+import hashlib
+
+# Interval bounds are packed as 32 bit unsigned integers while they fit.
+SMALL_MAX = 2 ** (8 * array.array("I").itemsize) - 1
+
+
+class GtidSet():
+
+    """Class:  GtidSet
+
+    Description:  Class which is a representation of a GTID set.  The set is
+        held as a dictionary of interned source UUIDs (or UUID:tag for tagged
+        GTIDs) to arrays of the bounds of sorted, merged, inclusive
+        transaction intervals, packed as start, end, start, end and so on.
+        An interval costs 8 bytes (16 bytes past 2^32 transactions) instead
+        of a tuple of two integers.  All set operations are merges across the
+        interval arrays and run in linear time over the number of intervals.
+
+    Methods:
+        __init__
+        __str__
+        __eq__
+        __bool__
+        _merge
+        _pack
+        _common
+        intervals
+        count
+        issuperset
+        subtract
+        union
+
+    """
+
+    __slots__ = ("gtids",)
+
+    def __init__(self, gtids=None):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the GtidSet class.
+
+        Arguments:
+            (input) gtids -> GTID set string, GtidSet or object whose string
+                form is a GTID set (i.e. mysql_class.GTIDSet)
+
+        """
+
+        self.gtids = {}
+
+        if isinstance(gtids, GtidSet):
+            self.gtids = {uuid: array.array(bounds.typecode, bounds)
+                          for uuid, bounds in gtids.gtids.items()}
+            return
+
+        text = str(gtids) if gtids is not None else ""
+        ranges = {}
+
+        for uuid_set in text.replace("\n", "").split(","):
+            uuid_set = uuid_set.strip()
+
+            if not uuid_set:
+                continue
+
+            parts = uuid_set.split(":")
+            uuid = parts[0].strip().lower()
+            key = uuid
+
+            for part in parts[1:]:
+                part = part.strip()
+
+                if part[:1].isdigit():
+                    start, _, end = part.partition("-")
+                    ranges.setdefault(key, []).append(
+                        (int(start), int(end) if end else int(start)))
+
+                else:
+                    key = f"{uuid}:{part.lower()}"
+
+        self.gtids = {sys.intern(uuid): self._pack(self._merge(items))
+                      for uuid, items in ranges.items()}
+
+    def __str__(self):
+
+        """Method:  __str__
+
+        Description:  Return the GTID set in MySQL format.
+
+        Arguments:
+            (output) GTID set string
+
+        """
+
+        return ",".join(
+            uuid + "".join(
+                f":{start}" if start == end else f":{start}-{end}"
+                for start, end in zip(self.gtids[uuid][::2],
+                                      self.gtids[uuid][1::2]))
+            for uuid in sorted(self.gtids))
+
+    def __eq__(self, other):
+
+        """Method:  __eq__
+
+        Description:  Check if two GTID sets hold the same transactions.
+
+        Arguments:
+            (input) other -> GtidSet instance
+            (output) True|False - If the sets are equal
+
+        """
+
+        if not isinstance(other, GtidSet):
+            return NotImplemented
+
+        return self.gtids == other.gtids
+
+    def __bool__(self):
+
+        """Method:  __bool__
+
+        Description:  Check if the GTID set holds any transactions.
+
+        Arguments:
+            (output) True|False - If the set is not empty
+
+        """
+
+        return bool(self.gtids)
+
+    @staticmethod
+    def _merge(ranges):
+
+        """Method:  _merge
+
+        Description:  Sort and merge overlapping or adjacent intervals.
+
+        Arguments:
+            (input) ranges -> List of (start, end) intervals
+            (output) merged -> Sorted list of merged intervals
+
+        """
+
+        merged = []
+
+        for start, end in sorted(ranges):
+            if merged and start <= merged[-1][1] + 1:
+                if end > merged[-1][1]:
+                    merged[-1] = (merged[-1][0], end)
+
+            else:
+                merged.append((start, end))
+
+        return merged
+
+    @staticmethod
+    def _pack(ranges):
+
+        """Method:  _pack
+
+        Description:  Pack sorted, merged intervals into an array of bounds.
+
+        Arguments:
+            (input) ranges -> Sorted list of merged (start, end) intervals
+            (output) Array of the interval bounds
+
+        """
+
+        typecode = "I" if not ranges or ranges[-1][1] <= SMALL_MAX else "Q"
+
+        return array.array(typecode, [bound for item in ranges
+                                      for bound in item])
+
+    @staticmethod
+    def _common(mine, theirs):
+
+        """Method:  _common
+
+        Description:  Return the number of leading intervals two arrays of
+            bounds share.  The GTID sets of slaves of a replica set mostly
+            differ in their last intervals, so the set operations merge from
+            the first interval that differs.  The arrays are walked from the
+            start in blocks of doubling size, compared through memory views
+            so no bounds are copied, until a block differs.  The first
+            interval that differs is then found by halving that block, so
+            each bound is compared a constant number of times.
+
+        Arguments:
+            (input) mine -> Array of interval bounds
+            (input) theirs -> Array of interval bounds
+            (output) Number of shared leading intervals
+
+        """
+
+        size = min(len(mine), len(theirs)) // 2 * 2
+
+        if not size:
+            return 0
+
+        mine, theirs = memoryview(mine), memoryview(theirs)
+        pos, step, end = 0, 2, 0
+
+        while pos < size:
+            end = min(pos + step, size)
+
+            if mine[pos:end] != theirs[pos:end]:
+                break
+
+            pos, step = end, step * 2
+
+        else:
+            return pos // 2
+
+        while end - pos > 2:
+            half = pos + (end - pos) // 4 * 2
+
+            if mine[pos:half] == theirs[pos:half]:
+                pos = half
+
+            else:
+                end = half
+
+        return pos // 2
+
+    def intervals(self):
+
+        """Method:  intervals
+
+        Description:  Return the intervals of each source of the GTID set.
+
+        Arguments:
+            (output) Dictionary of source to list of (start, end) intervals
+
+        """
+
+        return {uuid: list(zip(bounds[::2], bounds[1::2]))
+                for uuid, bounds in self.gtids.items()}
+
+    def count(self):
+
+        """Method:  count
+
+        Description:  Return the number of transactions in the GTID set.
+
+        Arguments:
+            (output) Number of transactions
+
+        """
+
+        return sum(sum(bounds[1::2]) - sum(bounds[::2]) + len(bounds) // 2
+                   for bounds in self.gtids.values())
+
+    def issuperset(self, other):
+
+        """Method:  issuperset
+
+        Description:  Check if the GTID set contains every transaction of
+            another GTID set.
+
+        Arguments:
+            (input) other -> GtidSet instance
+            (output) True|False - If self contains other
+
+        """
+
+        for uuid, theirs in other.gtids.items():
+            mine = self.gtids.get(uuid, ())
+            index = pos = 2 * self._common(mine, theirs)
+
+            while pos < len(theirs):
+                start, end = theirs[pos], theirs[pos + 1]
+
+                while index < len(mine) and mine[index + 1] < start:
+                    index += 2
+
+                if index == len(mine) or mine[index] > start \
+                   or mine[index + 1] < end:
+                    return False
+
+                pos += 2
+
+        return True
+
+    def subtract(self, other):
+
+        """Method:  subtract
+
+        Description:  Return the transactions in the GTID set that are not in
+            another GTID set.
+
+        Arguments:
+            (input) other -> GtidSet instance
+            (output) diff -> GtidSet instance
+
+        """
+
+        diff = GtidSet()
+
+        for uuid, bounds in self.gtids.items():
+            theirs = other.gtids.get(uuid, ())
+            index = pos = 2 * self._common(bounds, theirs)
+            result = []
+
+            while pos < len(bounds):
+                start, end = bounds[pos], bounds[pos + 1]
+                pos += 2
+
+                while index < len(theirs) and theirs[index + 1] < start:
+                    index += 2
+
+                last = index
+
+                while start <= end:
+                    if last == len(theirs) or theirs[last] > end:
+                        result.append((start, end))
+                        break
+
+                    if theirs[last] > start:
+                        result.append((start, theirs[last] - 1))
+
+                    start = max(start, theirs[last + 1] + 1)
+                    last += 2
+
+            if result:
+                diff.gtids[uuid] = self._pack(result)
+
+        return diff
+
+    def union(self, other):
+
+        """Method:  union
+
+        Description:  Return the transactions in either GTID set.
+
+        Arguments:
+            (input) other -> GtidSet instance
+            (output) combined -> GtidSet instance
+
+        """
+
+        combined = GtidSet(self)
+
+        for uuid, bounds in other.gtids.items():
+            mine = combined.gtids.get(uuid, array.array("I"))
+            shared = 2 * self._common(mine, bounds)
+
+            if shared < len(bounds):
+                rest = list(zip(mine[shared::2], mine[shared + 1::2]))
+                rest.extend(zip(bounds[shared::2], bounds[shared + 1::2]))
+                rest = self._pack(self._merge(rest))
+
+                if rest.typecode != mine.typecode:
+                    mine = array.array("Q", mine)
+                    rest = array.array("Q", rest)
+
+                combined.gtids[uuid] = mine[:shared] + rest
+
+        return combined
+
+
+class GtidTracker():
+
+    """Class:  GtidTracker
+
+    Description:  Class which keeps the parsed GTID sets of the slaves across
+        polls.  On a later poll the set is advanced with the last
+        transactions applied (or queued) by the slave instead of reading and
+        parsing the full set again.  The advanced set is only used if its
+        digest matches the digest of the set on the server, otherwise (such
+        as on a gap left by a parallel applier, a new source, a local
+        transaction or a reset) the full set is read again.  The digest is
+        the SHA-256 of the set in MySQL format without newlines, or None for
+        an empty set.  The text of each source up to its last interval is
+        kept, so only the last intervals are formatted to check a digest.
+
+    Methods:
+        __init__
+        get
+        rebase
+        advance
+        forget
+        digest
+        _heads
+        _digest
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the GtidTracker class.
+
+        Arguments:
+
+        """
+
+        self.sets = {}
+        self.unsupported = set()
+        self.stats = {"full": 0, "incremental": 0, "unchanged": 0}
+
+    def get(self, key):
+
+        """Method:  get
+
+        Description:  Return the tracked GTID set of a key.
+
+        Arguments:
+            (input) key -> Key of the GTID set, i.e. (slave name, field)
+            (output) GtidSet instance or None if the key is not tracked
+
+        """
+
+        entry = self.sets.get(key)
+
+        return entry[0] if entry else None
+
+    def rebase(self, key, gtids, digest):
+
+        """Method:  rebase
+
+        Description:  Parse a full GTID set read from the server and track it
+            if its digest matches the digest of the set on the server.  A set
+            whose digest does not match (i.e. a format the digest does not
+            cover) is not tracked, so it is read in full on each poll.
+
+        Arguments:
+            (input) key -> Key of the GTID set, i.e. (slave name, field)
+            (input) gtids -> GTID set string
+            (input) digest -> Digest of the set on the server
+            (output) gtids -> GtidSet instance
+
+        """
+
+        gtids = GtidSet(gtids)
+        heads = self._heads(gtids)
+        self.stats["full"] += 1
+
+        if digest == self._digest(gtids, heads):
+            self.sets[key] = (gtids, digest, heads)
+
+        else:
+            self.sets.pop(key, None)
+
+        return gtids
+
+    def advance(self, key, last, digest):
+
+        """Method:  advance
+
+        Description:  Advance the tracked GTID set of a key with the last
+            transactions from each source.  The transactions after the end of
+            the last interval of each source, up to the last transaction, are
+            added to the set.  The tracked set is not changed in place, the
+            advanced set shares the intervals of the sources with no new
+            transactions.
+
+        Arguments:
+            (input) key -> Key of the GTID set, i.e. (slave name, field)
+            (input) last -> Last transactions, as a GTID set string
+            (input) digest -> Digest of the set on the server
+            (output) gtids -> GtidSet instance or None if the set is not
+                tracked or the advanced set does not match the server
+
+        """
+
+        entry = self.sets.get(key)
+
+        if entry is None:
+            return None
+
+        if entry[1] == digest:
+            self.stats["unchanged"] += 1
+            return entry[0]
+
+        gtids = GtidSet()
+        gtids.gtids = dict(entry[0].gtids)
+        heads = dict(entry[2])
+
+        for uuid, bounds in GtidSet(last).gtids.items():
+            mine = gtids.gtids.get(uuid)
+            end = bounds[-1]
+
+            if not mine:
+                gtids.gtids[uuid] = array.array(
+                    "I" if end <= SMALL_MAX else "Q", [1, end])
+                heads[uuid] = uuid
+
+            elif end > mine[-1]:
+                mine = array.array(
+                    mine.typecode if end <= SMALL_MAX else "Q", mine)
+                mine[-1] = end
+                gtids.gtids[uuid] = mine
+
+        if digest is None or digest != self._digest(gtids, heads):
+            return None
+
+        self.sets[key] = (gtids, digest, heads)
+        self.stats["incremental"] += 1
+
+        return gtids
+
+    def forget(self, key):
+
+        """Method:  forget
+
+        Description:  Stop tracking the GTID set of a key.
+
+        Arguments:
+            (input) key -> Key of the GTID set, i.e. (slave name, field)
+
+        """
+
+        self.sets.pop(key, None)
+
+    @classmethod
+    def digest(cls, gtids):
+
+        """Method:  digest
+
+        Description:  Return the digest of a GTID set.
+
+        Arguments:
+            (input) gtids -> GtidSet instance
+            (output) SHA-256 hex digest or None for an empty set
+
+        """
+
+        return cls._digest(gtids, cls._heads(gtids))
+
+    @staticmethod
+    def _heads(gtids):
+
+        """Method:  _heads
+
+        Description:  Return the text of each source of a GTID set up to its
+            last interval.
+
+        Arguments:
+            (input) gtids -> GtidSet instance
+            (output) Dictionary of source to text
+
+        """
+
+        return {uuid: uuid + "".join(
+            f":{start}" if start == end else f":{start}-{end}"
+            for start, end in zip(bounds[:-2:2], bounds[1:-2:2]))
+            for uuid, bounds in gtids.gtids.items()}
+
+    @staticmethod
+    def _digest(gtids, heads):
+
+        """Method:  _digest
+
+        Description:  Return the digest of a GTID set from the text of each
+            source up to its last interval.
+
+        Arguments:
+            (input) gtids -> GtidSet instance
+            (input) heads -> Dictionary of source to text from _heads
+            (output) SHA-256 hex digest or None for an empty set
+
+        """
+
+        parts = []
+
+        for uuid in sorted(gtids.gtids):
+            start, end = gtids.gtids[uuid][-2:]
+            parts.append(heads[uuid] + (
+                f":{start}" if start == end else f":{start}-{end}"))
+
+        text = ",".join(parts)
+
+        return hashlib.sha256(text.encode()).hexdigest() if text else None
+
+
+class GtidMatrix():
+
+    """Class:  GtidMatrix
+
+    Description:  Class which is a representation of the containment and
+        difference matrix of a number of GTID sets, such as the sets of the
+        slaves of a replica set.  The intervals every set shares are dropped
+        and the rest of the intervals of all the sets are split on their
+        bounds into segments, so each set is a bit mask of the segments it
+        holds (a Python integer), with the running sum of the transaction
+        counts of the segments.
+        A set contains another set if the other set's mask has no bits
+        outside its own mask, so each cell of the matrix is one integer
+        operation over all the segments at once.
+
+    Methods:
+        __init__
+        _count
+        issuperset
+        missing
+        errant
+        complete
+
+    """
+
+    def __init__(self, gtid_sets):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the GtidMatrix class.
+
+        Arguments:
+            (input) gtid_sets -> List of GtidSet instances, the rows and the
+                columns of the matrix
+
+        """
+
+        gtid_sets = list(gtid_sets)
+        self.size = len(gtid_sets)
+        self.masks = [0] * self.size
+        self.sums = [0]
+
+        for uuid in sorted({uuid for gtids in gtid_sets
+                            for uuid in gtids.gtids}):
+            arrays = [gtids.gtids.get(uuid, ()) for gtids in gtid_sets]
+            shared = 2 * min(GtidSet._common(  # pylint:disable=W0212
+                arrays[0], bounds) for bounds in arrays)
+
+            # Segment points are the interval starts and the ends plus one.
+            points = sorted({bound + pos % 2 for bounds in arrays
+                             for pos, bound in enumerate(bounds[shared:])})
+            index = {point: pos for pos, point in enumerate(points)}
+            offset = len(self.sums) - 1
+
+            for low, high in zip(points, points[1:]):
+                self.sums.append(self.sums[-1] + high - low)
+
+            for row, bounds in enumerate(arrays):
+                for pos in range(shared, len(bounds), 2):
+                    low = index[bounds[pos]]
+                    high = index[bounds[pos + 1] + 1]
+                    self.masks[row] |= ((1 << (high - low)) - 1) \
+                        << (offset + low)
+
+    def _count(self, mask):
+
+        """Method:  _count
+
+        Description:  Return the number of transactions in the segments of a
+            bit mask, a run of set bits at a time.
+
+        Arguments:
+            (input) mask -> Bit mask of segments
+            (output) total -> Number of transactions
+
+        """
+
+        total = 0
+
+        # Adding the lowest bit of a run of bits carries to the end of it.
+        while mask:
+            low = (mask & -mask).bit_length() - 1
+            mask += 1 << low
+            high = (mask & -mask).bit_length() - 1
+            mask -= 1 << high
+            total += self.sums[high] - self.sums[low]
+
+        return total
+
+    def issuperset(self, row, col):
+
+        """Method:  issuperset
+
+        Description:  Check if a set contains every transaction of another
+            set.
+
+        Arguments:
+            (input) row -> Index of the set
+            (input) col -> Index of the other set
+            (output) True|False - If the set contains the other set
+
+        """
+
+        return not self.masks[col] & ~self.masks[row]
+
+    def missing(self, row, col):
+
+        """Method:  missing
+
+        Description:  Return the number of transactions of another set that
+            a set does not have.
+
+        Arguments:
+            (input) row -> Index of the set
+            (input) col -> Index of the other set
+            (output) Number of transactions
+
+        """
+
+        return self._count(self.masks[col] & ~self.masks[row])
+
+    def errant(self, row):
+
+        """Method:  errant
+
+        Description:  Return the sets with transactions a set does not have,
+            the errant transactions if the set is promoted.
+
+        Arguments:
+            (input) row -> Index of the set
+            (output) Dictionary of index to number of transactions
+
+        """
+
+        return {col: count
+                for col, count in ((col, self.missing(row, col))
+                                   for col in range(self.size))
+                if count}
+
+    def complete(self):
+
+        """Method:  complete
+
+        Description:  Return the sets that have every transaction of all the
+            sets.
+
+        Arguments:
+            (output) List of indexes
+
+        """
+
+        union = 0
+
+        for mask in self.masks:
+            union |= mask
+
+        return [row for row in range(self.size)
+                if not union & ~self.masks[row]]
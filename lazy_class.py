@@ -0,0 +1,164 @@
+# Classification (U)
+
+"""Program:  lazy_class.py
+
+    Description:  Class that has class definitions and methods for importing
+        modules on first use, and the stand-ins for the python-lib and
+        mysql-lib modules used by the program, so the database stack is only
+        imported by the commands that use it and -h and -v start quickly.
+
+    Classes:
+        LazyModule
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import importlib
+
+
+class LazyModule():
+
+    """Class:  LazyModule
+
+    Description:  Class which is a stand-in for a module that is imported on
+        the first attribute read, write or delete.  Attributes are read from,
+        written to and deleted from the module itself, so patching an
+        attribute through the stand-in patches the module.  The module is
+        imported relative to the package first when a package is given, as
+        when the program is run as part of a package, and by its absolute
+        name otherwise.
+
+    Methods:
+        __init__
+        __getattr__
+        __setattr__
+        __delattr__
+        __dir__
+        __repr__
+        _load
+
+    """
+
+    def __init__(self, name, package=None):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) name -> Name of the module
+            (input) package -> Package to import the module relative to
+
+        """
+
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "_package", package)
+        object.__setattr__(self, "_module", None)
+
+    def __getattr__(self, attr):
+
+        """Method:  __getattr__
+
+        Description:  Read an attribute of the module.
+
+        Arguments:
+            (input) attr -> Name of the attribute
+            (output) Value of the attribute
+
+        """
+
+        if attr.startswith("__") and attr.endswith("__"):
+            raise AttributeError(attr)
+
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr, value):
+
+        """Method:  __setattr__
+
+        Description:  Write an attribute of the module.
+
+        Arguments:
+            (input) attr -> Name of the attribute
+            (input) value -> Value of the attribute
+
+        """
+
+        setattr(self._load(), attr, value)
+
+    def __delattr__(self, attr):
+
+        """Method:  __delattr__
+
+        Description:  Delete an attribute of the module.
+
+        Arguments:
+            (input) attr -> Name of the attribute
+
+        """
+
+        delattr(self._load(), attr)
+
+    def __dir__(self):
+
+        """Method:  __dir__
+
+        Description:  List the attributes of the module.
+
+        Arguments:
+            (output) List of attribute names
+
+        """
+
+        return dir(self._load())
+
+    def __repr__(self):
+
+        """Method:  __repr__
+
+        Description:  Representation of the stand-in.
+
+        Arguments:
+            (output) Representation string
+
+        """
+
+        state = "loaded" if self._module else "not loaded"
+
+        return f"<LazyModule {self._name!r} ({state})>"
+
+    def _load(self):
+
+        """Method:  _load
+
+        Description:  Import the module, once.
+
+        Arguments:
+            (output) Module
+
+        """
+
+        if self._module is None:
+            module = None
+
+            if self._package:
+                try:
+                    module = importlib.import_module(
+                        "." + self._name, self._package)
+
+                except ImportError:
+                    module = None
+
+            module = module or importlib.import_module(self._name)
+            object.__setattr__(self, "_module", module)
+
+        return self._module
+
+
+# Modules imported on first use.
+gen_libs = LazyModule("lib.gen_libs", package=__package__)
+gen_class = LazyModule("lib.gen_class", package=__package__)
+mysql_libs = LazyModule("mysql_lib.mysql_libs", package=__package__)
+mysql_class = LazyModule("mysql_lib.mysql_class", package=__package__)
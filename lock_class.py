@@ -0,0 +1,122 @@
+# Classification (U)
+
+"""Program:  lock_class.py
+
+    Description:  Class that has class definitions and methods for sharing a
+        server instance between threads.
+
+    Classes:
+        LockedRep
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import functools
+import threading
+
+
+class LockedRep():
+
+    """Class:  LockedRep
+
+    Description:  Class which is a stand-in for a server instance (i.e.
+        mysql_class.MasterRep) shared between threads.  A database connection
+        is not thread safe, so each method call of the server instance holds
+        a lock and the queries the methods run over the connection are run
+        one at a time.  Attributes are read from and written to the server
+        instance itself, and the stand-in reports the class of the server
+        instance, so isinstance checks see the server instance.  The lock is
+        re-entrant, as methods of the server instance call each other.
+
+    Methods:
+        __init__
+        __getattr__
+        __setattr__
+        __class__
+        __repr__
+
+    """
+
+    def __init__(self, server, lock=None):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) server -> Server instance
+            (input) lock -> Lock to hold for each method call, default is a
+                new re-entrant lock
+
+        """
+
+        object.__setattr__(self, "_server", server)
+        object.__setattr__(self, "_lock", lock or threading.RLock())
+
+    def __getattr__(self, attr):
+
+        """Method:  __getattr__
+
+        Description:  Read an attribute of the server instance.  A method is
+            returned wrapped to hold the lock while it runs.
+
+        Arguments:
+            (input) attr -> Name of the attribute
+            (output) Value of the attribute
+
+        """
+
+        value = getattr(self._server, attr)
+
+        if not callable(value):
+            return value
+
+        @functools.wraps(value)
+        def _locked(*args, **kwargs):
+            with self._lock:
+                return value(*args, **kwargs)
+
+        return _locked
+
+    def __setattr__(self, attr, value):
+
+        """Method:  __setattr__
+
+        Description:  Write an attribute of the server instance.
+
+        Arguments:
+            (input) attr -> Name of the attribute
+            (input) value -> Value of the attribute
+
+        """
+
+        setattr(self._server, attr, value)
+
+    @property
+    def __class__(self):
+
+        """Method:  __class__
+
+        Description:  Return the class of the server instance.
+
+        Arguments:
+            (output) Class of the server instance
+
+        """
+
+        return type(self._server)
+
+    def __repr__(self):
+
+        """Method:  __repr__
+
+        Description:  Representation of the stand-in.
+
+        Arguments:
+            (output) Representation string
+
+        """
+
+        return f"<LockedRep {self._server!r}>"
@@ -19,18 +19,43 @@
         done outside the scope of this program.
 
     Usage:
-        mysql_rep_failover.py -s [path]file -d path
-            {-F | -G name | -B | -D}
-            [-y flavor_id] [-v | -h]
+        mysql_rep_failover.py
+            {-s [path]file | -m {dir | file,file,...} [-q count]}
+            -d path {-F [-f] | -G name [-f] | -B | -D | -M [-i seconds]}
+            [-p count] [-t seconds] [-w seconds]
+            [-W count [-j seconds] [-L seconds]] [-C seconds]
+            [-e milliseconds] [-n] [-P] [-r] [-o [path/]file]
+            [-k [path/]file [-l seconds]] [-y flavor_id] [-v | -h]
 
     Arguments:
         -s [path/]file => Slave config file.  Will be a text file.  Include the
             file extension with the name.  Can include the path or use the -d
-            option path.  Required arg.
+            option path.  Required arg unless the -m option is used.
+        -m {dir | file,file,...} => Batch mode.  Runs the -B, -D or -F
+            option for a number of replication sets at the same time, one
+            process for each set, up to the -q option count.  Takes a
+            directory of slave config files (files ending in .txt) or a comma
+            separated list of slave config files, which can use the -d option
+            path.  Each replication set has its own program lock (the -y
+            flavor id plus the slave config file name and path) and the
+            output of each set is displayed once the set is done.  With the
+            -r or -o options, the timing reports of the sets are combined
+            into one report.
+            -q count => Maximum number of replication sets run at the same
+                time.  Default is every set in the batch.
         -d dir path => Directory path to the config files. Required arg.
 
         -F => Select the best slave within the replication set and promote it
             to master and make all other slaves change to the new master.
+            The slaves are ranked on the transactions they will have once
+            their relay logs are applied and the best slave is not promoted
+            until it has applied its relay log (see -w option).  Slaves with
+            promote = False in the slave config file are never promoted,
+            and if more than one slave has every transaction, the best
+            slave is picked on the scoring criteria of the slave config file
+            (see NOTE 4 of the slave configuration file format).  If the
+            scoring criteria do not break the tie, no slave is promoted and
+            the tied slaves are displayed, unless the -f option is given.
 
         -G name => Take the designated name of the slave and promote it
             to master and make all other slaves change to the new master.
@@ -38,20 +63,130 @@
                 in the replication set as this option will override the best
                 slave promotion and could possibly make a slave which is
                 behind the rest of the slaves a master database.
+            If any other slave has transactions the designated slave does
+            not have (errant transactions), no slave is promoted and the
+            slaves with errant transactions and the slaves with every
+            transaction are displayed.  The executed plus retrieved GTID
+            sets of all the slaves are compared in one pass.
+            -f => Force the promotion of the designated slave when other
+                slaves have errant transactions.  The slaves with errant
+                transactions are displayed as a warning.  With the -F
+                option, force the promotion of the best slave when other
+                slaves are tied with it.
 
         -B => Displays the name of the current best slave in the
             replication set based on it's current positions compared
             with the other slaves in the set.
 
         -D => Shows the slaves in the replication set from best to
-            worst and displays the differences.
-
+            worst and displays the differences.  For each slave it shows
+            the count of transactions it is behind the best slave and the
+            missing transactions as a GTID set.
+
+        -M => Supervisor mode.  Runs until stopped, keeping the connections
+            to the slaves open and refreshing their GTID positions and the
+            best slave ranking on an interval.  Slaves that could not be
+            connected to or that fail a refresh are left out of the ranking
+            and connected to again on the next interval.  When the master
+            is declared down by sending the process a SIGUSR1 signal (also
+            while the slaves are first connected to), the slave positions
+            are refreshed once more over the open connections and the best
+            slave is promoted as with the -F option.  SIGTERM or SIGINT
+            stops the supervisor without a promotion.
+            Example:  kill -USR1 PID
+            -i seconds => Refresh interval.  Default is 5 seconds.
+
+        -p count => Maximum number of slaves to connect to or change to the
+            new master concurrently.  Default is 16.
+        -t seconds => Deadline for connecting to and reading the status of
+            each slave.  Slaves that do not respond within the deadline are
+            reported and excluded.  A connection attempt past its deadline
+            is left to finish in the background and does not count against
+            the -p option count.  Default is 30 seconds.
+        -e milliseconds => Deadline for the TCP connection to the host and
+            port of each slave, which is checked for all slaves at the same
+            time before connecting to MySQL.  Slaves whose host is down,
+            refuses the connection or does not answer within the deadline
+            are reported and excluded.  Default is 250 milliseconds.
+        -w seconds => Deadline for the best slave to apply its relay log
+            before being promoted by the -F option.  Default is 60 seconds.
+        -W count => Change the slaves to the new master in waves of count
+            slaves with the -F, -G and -M options, instead of all at once.
+            Before each wave, the program waits for the load of the new
+            master to settle:  the slaves already changed have their binlog
+            dump threads, the threads running are 32 or less and the send
+            rate is 64 MB/s or less.  The wait ends at the -L option
+            deadline.  This trades some total repoint time for a stable
+            write latency on the new master.
+            -j seconds => Maximum random delay before each wave.  Default
+                is no delay.
+            -L seconds => Deadline for the load of the new master to settle
+                before each wave.  Default is 30 seconds.
+        -C seconds => Deadline for the slaves to converge on the new master
+            after the -F, -G and -M options change them.  The slaves are
+            polled until each has its IO and SQL threads running, is
+            replicating from the new master and has executed the
+            transactions the new master had when the polling started.  The
+            time for each slave to converge and the p50 and p99 of the
+            slaves are displayed.  Slaves that do not converge within the
+            deadline are reported as an error.  Default is 60 seconds.
+        -n => Write the output of the -B and -D options as NDJSON (one JSON
+            record per line) instead of text.  A status record for each
+            slave is written as soon as its connection attempt is done,
+            followed by a ranking record once all slaves are done.  A slave
+            whose status read fails after it connected is written again as
+            an excluded slave record.  Errors are written as error records
+            and the -r option timing report is written as a report record.
+            Slave record:  {"type": "slave", "name", "status": "ok" or
+                "excluded", "seconds", and "gtid_mode" and "transactions"
+                or "error"}
+            Ranking record:  {"type": "ranking", "command", "best", "ties",
+                "divergent", "slaves"} where slaves is in best order and
+                for -D has the transactions behind the best slave.
+        -P => Plan mode.  A dry run of the -F or -G option which does not
+            change any server.  Displays the slave that would be promoted
+            and for each slave:  the transactions it is missing, the bytes
+            it is behind (from the source log positions, when in the same
+            source log file as the new master) and the predicted time to
+            catch up (from the slave's observed apply rate).  Also displays
+            the predicted catch up time of the failover:  the time for the
+            new master to apply its relay log plus the longest time for the
+            other slaves.  Slaves with transactions the new master does not
+            have (errant transactions) are displayed with the slaves with
+            every transaction.  The plan is added to the -r timing report.
+            Reads the retrieved GTID set and apply rate of the slaves with
+            one status query per slave after connecting.
+        -r => Display a timing report in JSON format once the program is
+            done.  The report has the wall time for each phase of the run
+            (tcp_probe, discovery, probe, snapshot, gtid_check, ranking,
+            errant_check, drain_wait, convert_to_master, repoint, wave_wait,
+            converge, disconnect), the wall time for each slave in the
+            tcp_probe, discovery, repoint and converge phases, the slowest
+            slave in each of these phases and the p50 and p99 converge
+            times.
+        -o [path/]file => Write the timing report to a file instead of
+            standard out.  Implies the -r option.
+        -k [path/]file => Snapshot file of the slaves and their ranking.  The
+            -B and -D options are answered from the snapshot file while it
+            is within its TTL and written to it otherwise.  The snapshot is
+            only used for the same slave config file and program version.
+            The -F, -G and -M options never use the snapshot and remove it
+            (except with the -P option).  When a snapshot is used, the -r
+            timing report has its file, age and ranking.  The snapshot file
+            is a fixed size header (write time, fingerprint and payload
+            length) followed by the slaves and ranking as JSON, which is
+            parsed in full when the snapshot is used.
+            -l seconds => Time to live of the snapshot file.  Default: 10.
         -y value => A flavor id for the program lock.  To create unique lock.
         -v => Display version of this program.
         -h => Help and usage message.
 
         NOTE 1:  -v or -h overrides the other options.
-        NOTE 2:  -F, -G, -B, and -D are XOR arguments.
+        NOTE 2:  -F, -G, -B, -D and -M are XOR arguments.
+        NOTE 3:  -m is XOR with the -s, -G and -M options.
+        NOTE 4:  -n is XOR with the -F, -G, -M and -m options.
+        NOTE 5:  -P is XOR with the -B, -D, -M and -n options.
+        NOTE 6:  -k is XOR with the -m option.
 
     Notes:
         Slave configuration file format (config/slave.txt.TEMPLATE)
@@ -84,6 +219,13 @@
             # Set what TLS versions are allowed in the connection set up:
             tls_versions = []
 
+            # Optional promotion settings:
+            promote = True
+            hw_class = 1
+            datacenter = DATACENTER
+            score_weights = lag:4,load:2,hw_class:1,datacenter:1
+            prefer_datacenter = DATACENTER
+
         NOTE 1:  Include the cfg_file even if running remotely as the file will
             be used in future releases.
         NOTE 2:  In MySQL 5.6 - it now gives warning if password is passed on
@@ -93,6 +235,22 @@
             format.
         NOTE 3:  The rep_user entry is the name of the Replication user that is
             used across the replication domain.
+        NOTE 4:  Having every transaction is a hard constraint for the best
+            slave, as is promote = False which excludes a slave from
+            promotion.  Between slaves with every transaction, the best
+            slave is the one with the highest weighted sum of the criteria
+            in score_weights, each scaled between the slaves from 0 (worst)
+            to 1 (best).  The score_weights and prefer_ entries are read
+            from the first slave entry that has them.  Criteria:
+                lag -> Replication lag, lower is better
+                load -> Threads running, lower is better
+                apply_rate -> Transactions applied per second, higher is
+                    better
+                hw_class -> The hw_class entry, higher is better
+                datacenter -> The datacenter entry matches the
+                    prefer_datacenter entry
+            The lag, load and apply_rate of the slaves are read with their
+            other status fields in a single query per slave.
 
         Defaults Extra File format (config/mysql.cfg.TEMPLATE):
             [client]
@@ -117,21 +275,37 @@
 
 # Standard
 import sys
+import time
+import signal
+import threading
+import datetime
 
 # Local
 try:
-    from .lib import gen_libs
-    from .lib import gen_class
-    from .mysql_lib import mysql_libs
-    from .mysql_lib import mysql_class
+    from .lazy_class import gen_libs, gen_class, mysql_libs
+    from . import gtid_class
     from . import version
+    from . import report_libs
+    from . import score_libs
+    from . import probe_libs
+    from . import discover_libs
+    from . import repoint_libs
+    from . import plan_libs
+    from . import snapshot_libs
+    from . import batch_libs
 
 except (ValueError, ImportError) as err:
-    import lib.gen_libs as gen_libs                     # pylint:disable=R0402
-    import lib.gen_class as gen_class                   # pylint:disable=R0402
-    import mysql_lib.mysql_libs as mysql_libs           # pylint:disable=R0402
-    import mysql_lib.mysql_class as mysql_class         # pylint:disable=R0402
+    from lazy_class import gen_libs, gen_class, mysql_libs
+    import gtid_class
     import version
+    import report_libs
+    import score_libs
+    import probe_libs
+    import discover_libs
+    import repoint_libs
+    import plan_libs
+    import snapshot_libs
+    import batch_libs
 
 __version__ = version.__version__
 
@@ -155,13 +329,21 @@ def show_slave_delays(slaves, args, **kwargs):          # pylint:disable=W0613
     """Function:  show_slave_delays
 
     Description:  Display the best slave followed by the next best slaves and
-        their GTID positions.
+        how far behind the best slave they are:  the count of transactions
+        they are missing, the missing transactions as a GTID set and the
+        count of any transactions the best slave does not have.  If there
+        is no single best slave, the slaves are compared to the slave with
+        the most transactions.
 
     Arguments:
         (input) slaves -> Slave instance array
         (input) args -> ArgParser class instance
         (input) kwargs:
             slv_key -> Dictionary of keys and data types
+            report -> Timing report dictionary
+            inventory -> Slave inventory dictionary
+            stream -> Function to write NDJSON records with
+            from_snapshot -> True if the slaves are from the snapshot file
         (output) err_flag -> True|False - if an error has occurred
         (output) err_msg -> Error message
 
@@ -170,12 +352,48 @@ def show_slave_delays(slaves, args, **kwargs):          # pylint:disable=W0613
     err_flag = False
     err_msg = None
     slaves = list(slaves)
-    slave_list = order_slaves_on_gtid(slaves)
-    gtid, slv = slave_list.pop(0)
-    print(f"Best Slave: {slv.name}\tGTID Pos: {gtid}")
+    selection = score_libs.select_candidates(
+        slaves, inventory=kwargs.get("inventory"))
+
+    with report_libs.time_phase(kwargs.get("report"), "snapshot"):
+        snapshot_libs.save_snapshot(
+            args, {"-D"}, slaves, selection=selection, **kwargs)
+
+    deltas = score_libs.slave_deltas(selection)
+    labels = {"best": "Best Slave", "most": "Most Trans",
+              "candidate": " Candidate", "slave": "     Slave"}
+
+    if kwargs.get("stream"):
+        kwargs["stream"](report_libs.ranking_record(
+            "-D", selection,
+            slaves=[dict(item, missing=str(item["missing"]))
+                    for item in deltas]))
+
+    else:
+        for item in deltas:
+            line = f'{labels[item["role"]]}: {item["name"]}'
+
+            if item["role"] in ["best", "most"]:
+                line += f'\tTransactions: {item["transactions"]}'
+
+            else:
+                line += f'\tBehind: {item["behind"]}'
+
+            if item["not_on_best"]:
+                line += \
+                    f'\tNot on {deltas[0]["name"]}: {item["not_on_best"]}'
+
+            if item["missing"]:
+                line += f'\tMissing: {item["missing"]}'
 
-    for gtid, slv in slave_list:
-        print(f"     Slave: {slv.name}\tGTID Pos: {gtid}")
+            print(line)
+
+        if selection["ties"]:
+            print(f"Tied with best slave: {selection['ties']}")
+
+    if selection["divergent"]:
+        err_flag = True
+        err_msg = score_libs.no_best_message(selection)
 
     return err_flag, err_msg
 
@@ -191,6 +409,10 @@ def show_best_slave(slaves, args, **kwargs):            # pylint:disable=W0613
         (input) args -> ArgParser class instance
         (input) kwargs:
             slv_key -> Dictionary of keys and data types
+            report -> Timing report dictionary
+            inventory -> Slave inventory dictionary
+            stream -> Function to write NDJSON records with
+            from_snapshot -> True if the slaves are from the snapshot file
         (output) err_flag -> True|False - if an error has occurred
         (output) err_msg -> Error message
 
@@ -199,8 +421,33 @@ def show_best_slave(slaves, args, **kwargs):            # pylint:disable=W0613
     err_flag = False
     err_msg = None
     slaves = list(slaves)
-    _, best_slv = order_slaves_on_gtid(slaves).pop(0)
-    print(f"Best Slave: {best_slv.name}")
+    selection = score_libs.select_candidates(
+        slaves, inventory=kwargs.get("inventory"))
+
+    with report_libs.time_phase(kwargs.get("report"), "snapshot"):
+        snapshot_libs.save_snapshot(
+            args, {"-B"}, slaves, selection=selection, **kwargs)
+
+    if kwargs.get("stream"):
+        kwargs["stream"](report_libs.ranking_record(
+            "-B", selection,
+            slaves=[slv.name for _, slv in selection["slave_list"]]))
+
+    elif selection["best"]:
+        print(f"Best Slave: {selection['best'].name}")
+
+        if selection["ties"]:
+            print(f"Tied with best slave: {selection['ties']}")
+
+        if selection.get("scores"):
+            print(f"Scores: {selection['scores']}")
+
+    if selection.get("excluded") and not kwargs.get("stream"):
+        print(f"Excluded from promotion: {selection['excluded']}")
+
+    if not selection["best"]:
+        err_flag = True
+        err_msg = score_libs.no_best_message(selection)
 
     return err_flag, err_msg
 
@@ -211,7 +458,9 @@ def promote_designated_slave(slaves, args, **kwargs):
 
     Description:  Promote a designated slave to the new master.  It will then
         change all of the other slaves in the replication set to point
-        to the new master.
+        to the new master.  If other slaves have transactions the designated
+        slave does not have (errant transactions), no slave is promoted
+        unless the -f option is given.
 
     NOTE:  No change to the slave thread on the new master is done.  This
         thread will still point to the old master.
@@ -221,6 +470,8 @@ def promote_designated_slave(slaves, args, **kwargs):
         (input) args -> ArgParser class instance
         (input) kwargs:
             slv_key -> Dictionary of keys and data types
+            report -> Timing report dictionary
+            inventory -> Slave inventory dictionary
         (output) err_flag -> True|False - if an error has occurred
         (output) err_msg -> Error message
 
@@ -229,12 +480,42 @@ def promote_designated_slave(slaves, args, **kwargs):
     slaves = list(slaves)
     err_flag = False
     err_msg = None
-    bad_slv = []
-    new_master = mysql_libs.find_name(slaves, args.get_val("-G"))
+    report = kwargs.get("report")
+
+    with report_libs.time_phase(report, "ranking"):
+        new_master = discover_libs.find_slave(
+            slaves, args.get_val("-G"), **kwargs)
+
+    errant = {"errant": {}, "complete": []}
 
     if new_master:
+        with report_libs.time_phase(report, "errant_check"):
+            errant = score_libs.errant_transactions(new_master, slaves)
+
+        if report is not None:
+            report["errant"] = errant["errant"]
+
         slaves.remove(new_master)
-        master = convert_to_master(new_master, args, **kwargs)
+
+    if not new_master:
+        err_flag = True
+        err_msg = f'Slave: {args.get_val("-G")} was not found in slave array'
+
+    elif errant["errant"] and not args.get_val("-f", def_val=False):
+        err_flag = True
+        err_msg = \
+            f"promote_designated_slave: Slaves have transactions" \
+            f" {new_master.name} does not have: {errant['errant']} Slaves" \
+            f" with every transaction: {errant['complete']} No slaves were" \
+            f" changed to new master."
+
+    else:
+        if errant["errant"]:
+            print(f"WARNING:  Promoting {new_master.name}, slaves have"
+                  f" transactions it does not have: {errant['errant']}")
+
+        with report_libs.time_phase(report, "convert_to_master"):
+            master = repoint_libs.convert_to_master(new_master, args, **kwargs)
 
         if master.conn_msg:
             err_flag = True
@@ -243,163 +524,287 @@ def promote_designated_slave(slaves, args, **kwargs):
                 f" {master.conn_msg} No slaves were changed to new master."
 
         else:
-            for slv in slaves:
-                status_flag = mysql_libs.switch_to_master(master, slv)
-
-                if status_flag == -1:
-                    err_flag = True
-                    bad_slv.append(slv.name)
-
-            if err_flag:
-                err_msg = \
-                    f"Slaves: {bad_slv} that did not change to new master."
-
-            mysql_libs.disconnect(master)
-
-    else:
-        err_flag = True
-        err_msg = f'Slave: {args.get_val("-G")} was not found in slave array'
+            err_flag, err_msg = repoint_libs.change_slaves(
+                master, slaves, args, **kwargs)
 
     return err_flag, err_msg
 
 
-def order_slaves_on_gtid(slaves):
+def promote_best_slave(slaves, args, **kwargs):
 
-    """Function:  order_slaves_on_gtid
+    """Function:  promote_best_slave
 
-    Description:  Take a Slave array and sort them on their GTID positions,
-        with the top(first) slave being the best Slave.
+    Description:  Finds the best slave within the replication set and promotes
+        it to the new master.  It will then change all of the other slaves
+        in the replication set to point to the new master.  If no single
+        slave contains the transactions of all the other slaves, then no
+        slave is promoted.  Neither is a slave promoted if other slaves are
+        tied with it and the scoring criteria do not break the tie, unless
+        the -f option is given.
+
+    NOTE:  No change to the slave thread on the new master is done.  This
+         thread will still point to the old master.
 
     Arguments:
         (input) slaves -> Slave instance array
-        (output) slave_list -> List of slaves in best order
+        (input) args -> ArgParser class instance
+        (input) kwargs:
+            slv_key -> Dictionary of keys and data types
+            report -> Timing report dictionary
+            inventory -> Slave inventory dictionary
+            selection -> Selection from select_candidates to use
+            tracker -> GtidTracker instance to advance the GTID sets with
+        (output) err_flag -> True|False - if an error has occurred
+        (output) err_msg -> Error message
 
     """
 
     slaves = list(slaves)
-    slave_list = []
-
-    for slv in slaves:
-        slave_list.append((slv.exe_gtidset, slv))
-
-    slave_list.sort(key=lambda item: item[0])
-
-    return slave_list
+    err_flag = False
+    err_msg = None
+    report = kwargs.get("report")
+    timeout = float(args.get_val("-w", def_val=60))
 
+    with report_libs.time_phase(report, "ranking"):
+        selection = kwargs.get("selection") or score_libs.select_candidates(
+            slaves, retrieved=True, inventory=kwargs.get("inventory"))
 
-def convert_to_master(slave, args, **kwargs):
+    new_master = selection["best"]
+    tied = [] if args.get_val("-f", def_val=False) \
+        else score_libs.unresolved_ties(selection)
 
-    """Function:  convert_to_master
+    with report_libs.time_phase(report, "drain_wait"):
+        is_drained = bool(new_master) and not tied and (
+            probe_libs.wait_for_drain(
+                new_master, selection["frontier"][0][0], timeout=timeout,
+                tracker=kwargs.get("tracker")))
 
-    Description:  Creates MasterRep instance from a SlaveRep instance.
+    if not new_master:
+        err_flag = True
+        err_msg = \
+            f"promote_best_slave: {score_libs.no_best_message(selection)}" \
+            f" No slaves were changed to new master."
 
-    Arguments:
-        (input) slaves -> Slave instance array
-        (input) args -> ArgParser class instance
-        (input) kwargs:
-            slv_key -> Dictionary of keys and data types
-        (output) master -> MasterRep instance
+    elif tied:
+        err_flag = True
+        err_msg = \
+            f"promote_best_slave: Slaves are tied with best slave" \
+            f" {new_master.name}: {tied} Use the -G option to pick the slave" \
+            f" to promote. No slaves were changed to new master."
 
-    """
+    elif not is_drained:
+        err_flag = True
+        err_msg = \
+            f"promote_best_slave: Slave {new_master.name} did not apply its" \
+            f" relay log within {timeout} seconds. No slaves were changed to" \
+            f" new master."
 
-    slv_array = gen_libs.create_cfg_array(
-        args.get_val("-s"), cfg_path=args.get_val("-d"))
-    slv_array = gen_libs.transpose_dict(slv_array, kwargs.get("slv_key", {}))
+    else:
+        slaves = [slv for _, slv in selection["slave_list"]
+                  if slv is not new_master]
 
-    for entry in slv_array:
-        if slave.name == entry["name"] and slave.port == int(entry["port"]):
-            rep_user = entry["rep_user"]
-            rep_japd = entry["rep_japd"]
-            break
+        with report_libs.time_phase(report, "convert_to_master"):
+            master = repoint_libs.convert_to_master(new_master, args, **kwargs)
 
-    master = mysql_class.MasterRep(
-        slave.name, slave.server_id, slave.sql_user, slave.sql_pass,
-        slave.machine, host=slave.host, port=slave.port,
-        defaults_file=slave.defaults_file, extra_def_file=slave.extra_def_file,
-        rep_user=rep_user, rep_japd=rep_japd)
-    master.connect()
+        if master.conn_msg:
+            err_flag = True
+            err_msg = \
+                f"promote_best_slave: Error on server {master.name}:" \
+                f"  {master.conn_msg} No slaves were changed to new master."
 
-    return master
+        else:
+            err_flag, err_msg = repoint_libs.change_slaves(
+                master, slaves, args, **kwargs)
 
+    return err_flag, err_msg
 
-def promote_best_slave(slaves, args, **kwargs):
 
-    """Function:  promote_best_slave
+def supervise(slaves, args, **kwargs):                   # pylint:disable=R0914
 
-    Description:  Finds the best slave within the replication set and promotes
-        it to the new master.  It will then change all of the other slaves
-        in the replication set to point to the new master.
+    """Function:  supervise
 
-    NOTE:  No change to the slave thread on the new master is done.  This
-         thread will still point to the old master.
+    Description:  Supervisor mode.  Keeps the slave connections open and
+        keeps the best slave ranking current by refreshing the GTID
+        positions of the slaves on an interval.  The GTID sets are advanced
+        with a GTID tracker instead of being read in full on each refresh.
+        Slaves that fail a refresh are dropped from the ranking, and the
+        slaves not in the ranking are reconnected on the later polls (see
+        rejoin_slaves).  On SIGUSR1 (master is down) the positions are
+        refreshed once more over the open connections and the best slave is
+        promoted.  On SIGTERM or SIGINT the supervisor stops without a
+        promotion.
 
     Arguments:
         (input) slaves -> Slave instance array
         (input) args -> ArgParser class instance
         (input) kwargs:
             slv_key -> Dictionary of keys and data types
+            inventory -> Slave inventory dictionary
+            report -> Timing report dictionary
+            signals -> Signal state from supervisor_signals, installed
+                before the slaves were created
         (output) err_flag -> True|False - if an error has occurred
         (output) err_msg -> Error message
 
     """
 
     slaves = list(slaves)
+    joined = []
     err_flag = False
     err_msg = None
-    bad_slv = []
-    slave_list = order_slaves_on_gtid(slaves)
+    interval = float(args.get_val("-i", def_val=5))
+    max_workers = int(args.get_val("-p", def_val=16))
+    signals = kwargs.get("signals") or supervisor_signals()
+    best = None
+    inventory = kwargs.get("inventory")
+    fields = score_libs.score_fields(
+        inventory.get("scoring") if inventory else None)
+    kwargs["tracker"] = gtid_class.GtidTracker()
+
+    if kwargs.get("report") is not None:
+        kwargs["report"]["gtid_reads"] = kwargs["tracker"].stats
+
+    try:
+        while signals["action"] is None:
+            slaves = probe_libs.refresh_slaves(
+                slaves, max_workers=max_workers, fields=fields,
+                tracker=kwargs["tracker"])
+            selection = score_libs.select_candidates(
+                slaves, retrieved=True, inventory=inventory)
+
+            if selection["best"] is not best:
+                best = selection["best"]
+                print(f"Supervisor:  Best slave:"
+                      f" {best.name if best else None}"
+                      f"  Divergent slaves: {selection['divergent']}")
+
+            signals["wake"].wait(interval)
+
+            if signals["action"] is None:
+                rejoined = rejoin_slaves(slaves, args, **kwargs)
+                slaves.extend(rejoined)
+                joined.extend(rejoined)
+
+    finally:
+        if signals is not kwargs.get("signals"):
+            restore_signals(signals)
+
+    if signals["action"] == "promote":
+        print("Supervisor:  Master declared down, promoting best slave")
+
+        with report_libs.time_phase(kwargs.get("report"), "refresh"):
+            healthy = probe_libs.refresh_slaves(
+                slaves, max_workers=max_workers, fields=fields,
+                tracker=kwargs["tracker"])
+
+        with report_libs.time_phase(kwargs.get("report"), "ranking"):
+            selection = score_libs.select_candidates(
+                healthy, retrieved=True, inventory=inventory)
+
+        if best and selection["best"] is not best:
+            print(f"Supervisor:  Best slave changed from {best.name} on the"
+                  f" final refresh")
+
+        kwargs["selection"] = selection
+        err_flag, err_msg = promote_best_slave(healthy, args, **kwargs)
+
+    if joined:
+        mysql_libs.disconnect(joined)
 
-    # Best slave (new master) will be at the top.
-    _, new_master = slave_list.pop(0)
-    master = convert_to_master(new_master, args, **kwargs)
+    return err_flag, err_msg
 
-    if master.conn_msg:
-        err_flag = True
-        err_msg = \
-            f"promote_best_slave: Error on server {master.name}:" \
-            f"  {master.conn_msg} No slaves were changed to new master."
 
-    else:
-        for _, slv in slave_list:
-            status_flag = mysql_libs.switch_to_master(master, slv)
+def supervisor_signals():
 
-            if status_flag == -1:
-                err_flag = True
-                bad_slv.append(slv.name)
+    """Function:  supervisor_signals
 
-        if err_flag:
-            err_msg = \
-                f"Slaves: {bad_slv} that did not change to new master."
+    Description:  Install the supervisor mode handlers for SIGUSR1 (promote
+        the best slave) and SIGTERM and SIGINT (stop).  A signal sets the
+        action and wakes the supervisor from its interval wait.
 
-        mysql_libs.disconnect(master)
+    Arguments:
+        (output) signals -> Signal state dictionary
+            action -> None, promote or stop
+            wake -> threading.Event set on a signal
+            prev -> Dictionary of signal number to the previous handler
 
-    return err_flag, err_msg
+    """
+
+    signals = {"action": None, "wake": threading.Event(), "prev": {}}
+
+    def _handler(signum, frame):                        # pylint:disable=W0613
+        signals["action"] = \
+            "promote" if signum == signal.SIGUSR1 else "stop"
+        signals["wake"].set()
+
+    for signum in (signal.SIGUSR1, signal.SIGTERM, signal.SIGINT):
+        signals["prev"][signum] = signal.signal(signum, _handler)
+
+    return signals
+
+
+def restore_signals(signals):
+
+    """Function:  restore_signals
+
+    Description:  Put back the signal handlers replaced by
+        supervisor_signals.
+
+    Arguments:
+        (input) signals -> Signal state from supervisor_signals
+
+    """
+
+    for signum, handler in signals["prev"].items():
+        signal.signal(signum, handler)
 
 
-def create_instances(args, **kwargs):
+def rejoin_slaves(slaves, args, **kwargs):
 
-    """Function:  create_instances
+    """Function:  rejoin_slaves
 
-    Description:  Create SlaveRep instances for the slaves.  The slave
-        instances will be appended to an array.
+    Description:  Reconnect the slaves in the slave config file which are
+        not in the slave array, i.e. excluded when connecting or probing or
+        dropped on a refresh.  The dropped slaves are removed from the slave
+        inventory index first.  Slaves which are not GTID enabled are left
+        out.
 
     Arguments:
+        (input) slaves -> Slave instance array
         (input) args -> ArgParser class instance
         (input) kwargs:
             slv_key -> Dictionary of keys and data types
-        (output) slaves -> List of slave instances
+            inventory -> Slave inventory dictionary
+        (output) rejoined -> List of the reconnected slave instances
 
     """
 
-    slaves = []
+    inventory = kwargs.get("inventory")
+
+    if not inventory:
+        return []
+
+    names = {slv.name for slv in slaves}
 
-    # Parse the slave config file.
-    slv_array = gen_libs.create_cfg_array(
-        args.get_val("-s"), cfg_path=args.get_val("-d"))
-    slv_array = gen_libs.transpose_dict(slv_array, kwargs.get("slv_key", {}))
-    slaves = mysql_libs.create_slv_array(slv_array)
+    for name in [name for name in inventory["slaves"] if name not in names]:
+        del inventory["slaves"][name]
 
-    return slaves
+    entries = [entry for entry in inventory["entries"]
+               if entry["name"] not in names]
+
+    if not entries:
+        return []
+
+    with gen_libs.no_std_out():
+        rejoined = [slv for slv in discover_libs.create_instances(
+            args, slv_key=kwargs.get("slv_key", {}), inventory=inventory,
+            entries=entries) if slv.gtid_mode]
+
+    if rejoined:
+        print(f"Supervisor:  Slaves rejoined:"
+              f" {[slv.name for slv in rejoined]}")
+
+    return rejoined
 
 
 def gtid_enabled(slaves):
@@ -424,37 +829,176 @@ def gtid_enabled(slaves):
     return is_enabled
 
 
+def valid_num(args, opt_num_list, opt_int_list=None):
+
+    """Function:  valid_num
+
+    Description:  Check that the values of the numeric options are positive
+        numbers and that the values of the integer options are positive
+        whole numbers.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) opt_num_list -> List of options which require numeric values
+        (input) opt_int_list -> List of options which require integer values
+        (output) status -> True|False - If all numeric options are valid
+
+    """
+
+    opt_num_list = list(opt_num_list)
+    opt_int_list = [] if opt_int_list is None else list(opt_int_list)
+    status = True
+
+    for opt in opt_num_list:
+        value = args.get_val(opt)
+
+        if value is None:
+            continue
+
+        kind = "integer" if opt in opt_int_list else "number"
+
+        try:
+            is_valid = (int(value) if kind == "integer" else float(value)) > 0
+
+        except (TypeError, ValueError):
+            is_valid = False
+
+        if not is_valid:
+            print(f"Error:  Option {opt} requires a positive {kind}: {value}")
+            status = False
+
+    return status
+
+
 def run_program(args, func_dict, **kwargs):
 
     """Function:  run_program
 
     Description:  Creates class instance(s) and controls flow of the program.
+        For supervisor mode, the signal handlers are installed before the
+        slaves are created, so a signal during the discovery is not lost.
 
     Arguments:
         (input) args -> ArgParser class instance
         (input) func_dict -> Dictionary list of functions and options
         (input) kwargs:
             slv_key -> Dictionary of keys and data types
+        (output) report -> Timing report dictionary
 
     """
 
     func_dict = dict(func_dict)
-    slaves = create_instances(args, **kwargs)
+    start = time.monotonic()
+    commands = set(args.get_args_keys()) & set(func_dict.keys())
+    report = {"program": "mysql_rep_failover", "version": __version__,
+              "start": datetime.datetime.now().isoformat(),
+              "slave_file": args.get_val("-s"),
+              "commands": sorted(commands), "status": "Success",
+              "phases": {}, "slaves": {}}
+    kwargs["report"] = report
+
+    if args.get_val("-n", def_val=False):
+        kwargs["stream"] = report_libs.emit_record
+
+    if "-M" in commands:
+        kwargs["signals"] = supervisor_signals()
+
+    with report_libs.time_phase(report, "discovery"):
+        kwargs["inventory"] = discover_libs.create_inventory(args, **kwargs)
+
+    slaves, connected = load_slaves(args, commands, **kwargs)
+    kwargs["from_snapshot"] = not connected
 
-    if slaves and gtid_enabled(slaves):
+    with report_libs.time_phase(report, "gtid_check"):
+        is_enabled = bool(slaves) and gtid_enabled(slaves)
+
+    if is_enabled:
 
         # Call function(s) - intersection of command line and function dict
-        for item in set(args.get_args_keys()) & set(func_dict.keys()):
+        for item in commands:
             err_flag, err_msg = func_dict[item](slaves, args, **kwargs)
 
             if err_flag:
-                print(err_msg)
+                report["status"] = err_msg
                 break
 
-        mysql_libs.disconnect(slaves)
+        if connected:
+            with report_libs.time_phase(report, "disconnect"):
+                mysql_libs.disconnect(connected)
 
     else:
-        print("Error:  Empty Slave array or Slave(s) not GTID enabled.")
+        report["status"] = "Empty Slave array or Slave(s) not GTID enabled."
+
+    if kwargs.get("signals"):
+        restore_signals(kwargs["signals"])
+
+    if report["status"] != "Success":
+        if kwargs.get("stream"):
+            report_libs.emit_record(
+                {"type": "error", "message": report["status"]})
+
+        elif is_enabled:
+            print(report["status"])
+
+        else:
+            print(f'Error:  {report["status"]}')
+
+    report["total"] = time.monotonic() - start
+
+    if kwargs.get("stream") and args.get_val("-r", def_val=False) \
+       and not args.get_val("-o"):
+        report_libs.emit_record(
+            dict(report_libs.add_slowest(report), type="report"))
+
+    elif args.get_val("-r", def_val=False) or args.get_val("-o"):
+        report_libs.write_report(report, args.get_val("-o"))
+
+    return report
+
+
+def load_slaves(args, commands, **kwargs):
+
+    """Function:  load_slaves
+
+    Description:  Create the slave instances and fetch the status fields the
+        commands need.  The read only -B and -D options take the slaves from
+        the snapshot file of the -k option instead while it is within its TTL
+        (see use_snapshot), and write the snapshot file with their ranking
+        otherwise (see save_snapshot).
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) commands -> Set of command options
+        (input) kwargs:
+            slv_key -> Dictionary of keys and data types
+            report -> Timing report dictionary
+            inventory -> Slave inventory dictionary
+            stream -> Function to write NDJSON records with
+        (output) slaves -> List of slave instances
+        (output) connected -> List of slaves with an open connection, empty
+            if the slaves are from the snapshot file
+
+    """
+
+    report = kwargs.get("report")
+
+    with report_libs.time_phase(report, "discovery"):
+        slaves = snapshot_libs.use_snapshot(args, commands, report=report)
+
+    if slaves is not None:
+        return slaves, []
+
+    with report_libs.time_phase(report, "discovery"):
+        slaves = discover_libs.create_instances(args, **kwargs)
+
+    with report_libs.time_phase(report, "probe"):
+        fields = score_libs.score_fields(kwargs["inventory"].get("scoring"))
+        slaves = probe_libs.probe_slaves(
+            slaves, probe_libs.probe_fields(args.get_args_keys()) | fields,
+            max_workers=int(args.get_val("-p", def_val=16)),
+            quiet=bool(kwargs.get("stream")), stream=kwargs.get("stream"))
+
+    return slaves, slaves
 
 
 def main():
@@ -467,6 +1011,8 @@ def main():
     Variables:
         dir_perms_chk -> contains directories and their octal permissions
         func_dict -> dictionary list for the function calls or other options
+        opt_int_list -> contains options which require integer values
+        opt_num_list -> contains options which require numeric values
         opt_req_list -> contains the options that are required for the program
         opt_val_list -> contains options which require values
         opt_xor_dict -> contains dict with key that is xor with it's values
@@ -479,11 +1025,23 @@ def main():
 
     dir_perms_chk = {"-d": 5}
     func_dict = {"-B": show_best_slave, "-D": show_slave_delays,
-                 "-F": promote_best_slave, "-G": promote_designated_slave}
+                 "-F": promote_best_slave, "-G": promote_designated_slave,
+                 "-M": supervise}
+    opt_num_list = ["-C", "-e", "-i", "-j", "-l", "-L", "-p", "-q", "-t",
+                    "-w", "-W"]
+    opt_int_list = ["-p", "-q", "-W"]
     opt_req_list = ["-d", "-s"]
-    opt_val_list = ["-d", "-s", "-G", "-y"]
-    opt_xor_dict = {"-B": ["-D", "-F", "-G"], "-D": ["-B", "-F", "-G"],
-                    "-F": ["-B", "-D", "-G"], "-G": ["-B", "-D", "-F"]}
+    opt_val_list = ["-C", "-d", "-e", "-s", "-G", "-i", "-j", "-k", "-l",
+                    "-L", "-m", "-o", "-p", "-q", "-t", "-w", "-W", "-y"]
+    opt_xor_dict = {"-B": ["-D", "-F", "-G", "-M"],
+                    "-D": ["-B", "-F", "-G", "-M"],
+                    "-F": ["-B", "-D", "-G", "-M"],
+                    "-G": ["-B", "-D", "-F", "-M"],
+                    "-M": ["-B", "-D", "-F", "-G"],
+                    "-k": ["-m"],
+                    "-m": ["-s", "-G", "-M"],
+                    "-n": ["-F", "-G", "-M", "-m"],
+                    "-P": ["-B", "-D", "-M", "-n"]}
     slv_key = {"sid": "int", "port": "int", "cfg_file": "None",
                "ssl_client_ca": "None", "ssl_ca_path": "None",
                "ssl_client_key": "None", "ssl_client_cert": "None",
@@ -494,20 +1052,36 @@ def main():
     args = gen_class.ArgParser(sys.argv, opt_val=opt_val_list)
 
     if args.arg_parse2()                                            \
-       and not gen_libs.help_func(args, __version__, help_message)  \
-       and args.arg_require(opt_req=opt_req_list)                   \
-       and args.arg_xor_dict(opt_xor_val=opt_xor_dict)              \
-       and args.arg_dir_chk(dir_perms_chk=dir_perms_chk):
-
-        try:
-            prog_lock = gen_class.ProgramLock(
-                sys.argv, args.get_val("-y", def_val=""))
-            run_program(args, func_dict, slv_key=slv_key)
-            del prog_lock
-
-        except gen_class.SingleInstanceException:
-            print(f'WARNING:  Lock in place for mysql_rep_failover with id:'
-                  f' {args.get_val("-y", def_val="")}')
+       and not gen_libs.help_func(args, __version__, help_message):
+
+        # Batch mode takes the slave config files from the -m option.
+        if args.get_val("-m"):
+            opt_req_list.remove("-s")
+
+        if args.arg_require(opt_req=opt_req_list)                       \
+           and args.arg_xor_dict(opt_xor_val=opt_xor_dict)              \
+           and valid_num(args, opt_num_list, opt_int_list)              \
+           and args.arg_dir_chk(dir_perms_chk=dir_perms_chk):
+
+            # Plan mode is a dry run of the -F and -G options.
+            if args.get_val("-P", def_val=False):
+                func_dict.update({"-F": plan_libs.plan_failover,
+                                  "-G": plan_libs.plan_failover})
+
+            if args.get_val("-m"):
+                batch_libs.run_batch(
+                    args, func_dict, run_program, slv_key=slv_key)
+
+            else:
+                try:
+                    prog_lock = gen_class.ProgramLock(
+                        sys.argv, args.get_val("-y", def_val=""))
+                    run_program(args, func_dict, slv_key=slv_key)
+                    del prog_lock
+
+                except gen_class.SingleInstanceException:
+                    print(f'WARNING:  Lock in place for mysql_rep_failover'
+                          f' with id: {args.get_val("-y", def_val="")}')
 
 
 if __name__ == "__main__":
@@ -0,0 +1,208 @@
+# Classification (U)
+
+"""Program:  plan_libs.py
+
+    Description:  Library of functions for the plan mode dry run of a failover.
+
+    Functions:
+        plan_failover
+        failover_plan
+        bytes_behind
+
+"""
+
+# Libraries and Global Variables
+
+# Local
+try:
+    from . import report_libs
+    from . import probe_libs
+    from . import score_libs
+    from . import discover_libs
+
+except (ValueError, ImportError) as err:
+    import report_libs
+    import probe_libs
+    import score_libs
+    import discover_libs
+
+
+def plan_failover(slaves, args, **kwargs):
+
+    """Function:  plan_failover
+
+    Description:  Dry run of the -F or -G option.  Selects the slave that
+        would be promoted and displays for each slave the transactions it
+        is missing, the bytes it is behind and the predicted time to catch
+        up, without changing any server.  The prediction for the failover
+        is the catch up time of the new master plus the longest catch up
+        time of the other slaves.  As for the -F option, slaves tied with
+        the best slave are reported as an error.
+
+    Arguments:
+        (input) slaves -> Slave instance array
+        (input) args -> ArgParser class instance
+        (input) kwargs:
+            slv_key -> Dictionary of keys and data types
+            inventory -> Slave inventory dictionary
+            report -> Timing report dictionary
+        (output) err_flag -> True|False - if an error has occurred
+        (output) err_msg -> Error message
+
+    """
+
+    err_flag = False
+    err_msg = None
+    slaves = list(slaves)
+    report = kwargs.get("report")
+
+    with report_libs.time_phase(report, "ranking"):
+        if args.get_val("-G"):
+            selection = {"divergent": []}
+            new_master = discover_libs.find_slave(
+                slaves, args.get_val("-G"), **kwargs)
+
+        else:
+            selection = score_libs.select_candidates(
+                slaves, retrieved=True, inventory=kwargs.get("inventory"))
+            new_master = selection["best"]
+
+    if new_master:
+        plan = failover_plan(new_master, slaves)
+        print(f"Plan:  Promote {new_master.name}, no servers were changed")
+
+        for item in plan["slaves"]:
+            label = " Candidate" if item is plan["slaves"][0] else "     Slave"
+            behind = report_libs.plan_value(item["bytes_behind"])
+            catch_up = report_libs.plan_value(item["catch_up"], "s")
+            line = f'{label}: {item["name"]}\tMissing: {item["missing"]}' \
+                   f'\tBytes behind: {behind}\tCatch-up: {catch_up}'
+
+            if item["not_on_candidate"]:
+                line += f'\tNot on {new_master.name}:' \
+                        f' {item["not_on_candidate"]}'
+
+            print(line)
+
+        print(f'Predicted catch-up:'
+              f' {report_libs.plan_value(plan["catch_up"], "s")}')
+
+        if plan["errant"]:
+            print(f'Errant transactions on: {list(plan["errant"])}'
+                  f'  Slaves with every transaction: {plan["complete"]}')
+
+        if report is not None:
+            report["plan"] = plan
+
+        tied = [] if args.get_val("-G") or args.get_val("-f", def_val=False) \
+            else score_libs.unresolved_ties(selection)
+
+        if tied:
+            err_flag = True
+            err_msg = f"Slaves are tied with best slave {new_master.name}:" \
+                      f" {tied} Use the -G option to pick the slave to" \
+                      f" promote."
+
+    elif args.get_val("-G"):
+        err_flag = True
+        err_msg = f'Slave: {args.get_val("-G")} was not found in slave array'
+
+    else:
+        err_flag = True
+        err_msg = score_libs.no_best_message(selection)
+
+    return err_flag, err_msg
+
+
+def failover_plan(new_master, slaves):
+
+    """Function:  failover_plan
+
+    Description:  Work out the catch up cost of each slave if the new master
+        is promoted.  Each slave must apply the transactions of the new
+        master (its executed plus retrieved GTID sets) that the slave has
+        not executed, at the slave's observed apply rate.  For the new
+        master these are the transactions in its relay log.
+
+    Arguments:
+        (input) new_master -> Slave instance to be promoted
+        (input) slaves -> Slave instance array
+        (output) plan -> Plan dictionary
+            candidate -> Name of the new master
+            slaves -> List of dictionaries in best order:
+                name -> Name of the slave
+                missing -> Count of transactions to apply
+                not_on_candidate -> Count of transactions the new master
+                    does not have (errant transactions)
+                bytes_behind -> Bytes to apply or None if not known
+                apply_rate -> Transactions per second or None if not known
+                catch_up -> Predicted seconds or None if not known
+            catch_up -> Predicted seconds for the failover or None
+            errant -> Dictionary of slave name to the count of its errant
+                transactions
+            complete -> Names of the slaves with every transaction
+
+    """
+
+    slave_list = score_libs.order_slaves_on_gtid(slaves, retrieved=True)
+    target = next(gtids for gtids, slv in slave_list if slv is new_master)
+    errant = score_libs.errant_transactions(
+        new_master, slaves, slave_list=slave_list)
+    plan = {"candidate": new_master.name, "slaves": [], "catch_up": None,
+            "errant": errant["errant"], "complete": errant["complete"]}
+
+    for _, slv in slave_list:
+        missing = target.subtract(probe_libs.slave_gtids(slv)).count()
+        rate = getattr(slv, "apply_rate", None)
+        catch_up = None
+
+        if not missing:
+            catch_up = 0.0
+
+        elif rate:
+            catch_up = missing / rate
+
+        item = {"name": slv.name, "missing": missing,
+                "not_on_candidate": errant["errant"].get(slv.name, 0),
+                "bytes_behind": bytes_behind(slv, new_master),
+                "apply_rate": rate, "catch_up": catch_up}
+
+        if slv is new_master:
+            plan["slaves"].insert(0, item)
+
+        else:
+            plan["slaves"].append(item)
+
+    times = [item["catch_up"] for item in plan["slaves"]]
+
+    if None not in times:
+        plan["catch_up"] = times[0] + max(times[1:], default=0.0)
+
+    return plan
+
+
+def bytes_behind(slave, new_master):
+
+    """Function:  bytes_behind
+
+    Description:  Bytes of the old master's binary log the slave has not
+        executed and the new master has read, from the source log positions
+        of the slaves.  Only known when the new master's read position and
+        the slave's executed position are in the same source log file.
+
+    Arguments:
+        (input) slave -> Slave instance
+        (input) new_master -> Slave instance to be promoted
+        (output) Bytes behind or None if not known
+
+    """
+
+    read_pos = getattr(new_master, "read_mst_pos", None)
+    exec_pos = getattr(slave, "exec_mst_pos", None)
+    mst_log = getattr(new_master, "mst_log", None)
+
+    if read_pos is None or exec_pos is None \
+       or mst_log != getattr(slave, "relay_mst_log", None):
+        return None
+
+    return max(0, int(read_pos) - int(exec_pos))
@@ -0,0 +1,432 @@
+# Classification (U)
+
+"""Program:  probe_libs.py
+
+    Description:  Library of functions for reading the status fields of the
+        slaves, beyond those read when connecting, with a single query per
+        slave.
+
+    Functions:
+        refresh_slaves
+        probe_slaves
+        probe_slave
+        probe_query
+        probe_value
+        slave_gtids
+        wait_for_drain
+        probe_fields
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import time
+
+# Local
+try:
+    from . import gtid_class
+    from . import engine_libs
+
+except (ValueError, ImportError) as err:
+    import gtid_class
+    import engine_libs
+
+# Slave status fields and the expressions to fetch them in a single query.
+PROBE_FIELDS = {
+    "gtid_mode": "@@GLOBAL.gtid_mode",
+    "exe_gtidset": "@@GLOBAL.gtid_executed",
+    "retrieved_gtidset":
+        "(SELECT RECEIVED_TRANSACTION_SET"
+        " FROM performance_schema.replication_connection_status"
+        " WHERE CHANNEL_NAME = '')",
+    "lag":
+        "(SELECT MAX(TIMESTAMPDIFF(MICROSECOND,"
+        " LAST_APPLIED_TRANSACTION_ORIGINAL_COMMIT_TIMESTAMP,"
+        " LAST_APPLIED_TRANSACTION_END_APPLY_TIMESTAMP)) / 1000000"
+        " FROM performance_schema.replication_applier_status_by_worker)",
+    "apply_rate":
+        "(SELECT COUNT(*) * COUNT(*) * 1000000"
+        " / SUM(TIMESTAMPDIFF(MICROSECOND,"
+        " LAST_APPLIED_TRANSACTION_START_APPLY_TIMESTAMP,"
+        " LAST_APPLIED_TRANSACTION_END_APPLY_TIMESTAMP))"
+        " FROM performance_schema.replication_applier_status_by_worker"
+        " WHERE LAST_APPLIED_TRANSACTION_END_APPLY_TIMESTAMP >"
+        " LAST_APPLIED_TRANSACTION_START_APPLY_TIMESTAMP)",
+    "io_running":
+        "(SELECT SERVICE_STATE"
+        " FROM performance_schema.replication_connection_status"
+        " WHERE CHANNEL_NAME = '')",
+    "sql_running":
+        "(SELECT SERVICE_STATE"
+        " FROM performance_schema.replication_applier_status"
+        " WHERE CHANNEL_NAME = '')",
+    "source_host":
+        "(SELECT HOST"
+        " FROM performance_schema.replication_connection_configuration"
+        " WHERE CHANNEL_NAME = '')",
+    "source_port":
+        "(SELECT PORT"
+        " FROM performance_schema.replication_connection_configuration"
+        " WHERE CHANNEL_NAME = '')",
+    "threads_running":
+        "(SELECT VARIABLE_VALUE FROM performance_schema.global_status"
+        " WHERE VARIABLE_NAME = 'Threads_running')"}
+
+# GTID set fields a GtidTracker advances between polls, with the
+# expressions to fetch the last transactions and the digest of the set
+# (SHA-256 of the set without newlines, NULL for an empty set).
+GTID_TRACKING = {
+    "exe_gtidset": (
+        "(SELECT GROUP_CONCAT(LAST_APPLIED_TRANSACTION)"
+        " FROM performance_schema.replication_applier_status_by_worker)",
+        "SHA2(NULLIF(REPLACE(@@GLOBAL.gtid_executed, '\\n', ''), ''), 256)"),
+    "retrieved_gtidset": (
+        "(SELECT LAST_QUEUED_TRANSACTION"
+        " FROM performance_schema.replication_connection_status"
+        " WHERE CHANNEL_NAME = '')",
+        "(SELECT SHA2(NULLIF(REPLACE(RECEIVED_TRANSACTION_SET, '\\n', ''),"
+        " ''), 256)"
+        " FROM performance_schema.replication_connection_status"
+        " WHERE CHANNEL_NAME = '')")}
+
+# GTID set fields and the slave instance attributes their parsed GtidSet is
+# set on.  The GTID set attributes of the slave instance itself are left as
+# mysql_class set them, as they are passed back to mysql_libs.
+GTID_ATTRS = {
+    "exe_gtidset": "exe_gtids", "retrieved_gtidset": "retrieved_gtids"}
+
+# Status fields each command needs beyond those read when connecting (the
+# GTID mode and the executed GTID set).
+PROBE_COMMANDS = {
+    "-B": (), "-D": (),
+    "-F": ("retrieved_gtidset",),
+    "-G": ("retrieved_gtidset",),
+    "-M": ("retrieved_gtidset",),
+    "-P": ("retrieved_gtidset", "apply_rate")}
+
+# Status fields re-read on each poll of the slaves.
+REFRESH_FIELDS = ("gtid_mode", "exe_gtidset", "retrieved_gtidset")
+
+
+def refresh_slaves(slaves, **kwargs):
+
+    """Function:  refresh_slaves
+
+    Description:  Refresh the GTID mode and the executed and retrieved GTID
+        sets of the slaves, and any other status fields, concurrently over
+        their open connections.  Slaves that fail to refresh are reported
+        and left out of the returned array.
+
+    Arguments:
+        (input) slaves -> Slave instance array
+        (input) kwargs:
+            max_workers -> Maximum number of slaves refreshed concurrently
+            fields -> Other status fields to refresh
+            tracker -> GtidTracker instance to advance the GTID sets with
+        (output) healthy -> List of slaves that were refreshed
+
+    """
+
+    return probe_slaves(
+        slaves, set(REFRESH_FIELDS) | set(kwargs.get("fields", ())),
+        max_workers=kwargs.get("max_workers", 16),
+        tracker=kwargs.get("tracker"))
+
+
+def probe_slaves(slaves, fields, **kwargs):
+
+    """Function:  probe_slaves
+
+    Description:  Fetch status fields of the slaves concurrently with a
+        single query per slave and set them as attributes of the slave
+        instances.  Slaves that fail the query are reported and left out of
+        the returned array.  When streaming, an excluded slave record is
+        written for each slave that fails.  See PROBE_FIELDS for the fields.
+
+    Arguments:
+        (input) slaves -> Slave instance array
+        (input) fields -> List of status fields to fetch
+        (input) kwargs:
+            max_workers -> Maximum number of slaves probed concurrently
+            quiet -> True to not print the slaves that failed
+            stream -> Function to write NDJSON records with
+            tracker -> GtidTracker instance to advance the GTID sets with
+        (output) healthy -> List of slaves that were probed
+
+    """
+
+    slaves = list(slaves)
+    fields = [field for field in PROBE_FIELDS if field in fields]
+    healthy = []
+
+    if not slaves or not fields:
+        return slaves
+
+    def _probe(slv):
+        start = time.monotonic()
+
+        try:
+            probe_slave(slv, fields, tracker=kwargs.get("tracker"))
+            err = None
+
+        except Exception as probe_err:              # pylint:disable=W0703
+            err = probe_err
+
+        return err, time.monotonic() - start
+
+    results = engine_libs.run_engine(
+        _probe, slaves, max_workers=kwargs.get("max_workers", 16))
+
+    for slv, (err, wall_time) in zip(slaves, results):
+        if err is None:
+            healthy.append(slv)
+            continue
+
+        if kwargs.get("stream"):
+            kwargs["stream"]({
+                "type": "slave", "name": slv.name, "status": "excluded",
+                "seconds": round(wall_time, 6), "error": str(err)})
+
+        if not kwargs.get("quiet", False):
+            print(f"Warning:  Slave {slv.name} failed to refresh: {err}")
+
+    return healthy
+
+
+def probe_slave(slave, fields, **kwargs):
+
+    """Function:  probe_slave
+
+    Description:  Fetch status fields of a slave with a single query and set
+        them as attributes of the slave instance (the GTID sets as GtidSet
+        instances, see GTID_ATTRS).  With a GTID tracker, the
+        GTID sets it already tracks for the slave are advanced with the last
+        transactions of the slave (see GTID_TRACKING) instead of being read
+        in full.  A set that cannot be advanced is read in full with a second
+        query, and if the slave has no last transaction information (i.e.
+        MySQL 5.7) the sets are read in full on each poll.
+
+    Arguments:
+        (input) slave -> Slave instance
+        (input) fields -> List of status fields to fetch
+        (input) kwargs:
+            tracker -> GtidTracker instance to advance the GTID sets with
+        (output) slave -> Slave instance
+
+    """
+
+    tracker = kwargs.get("tracker")
+    tracked = []
+
+    if tracker and slave.name not in tracker.unsupported:
+        tracked = [field for field in fields
+                   if tracker.get((slave.name, field)) is not None]
+
+    try:
+        row = slave.col_sql(probe_query(
+            fields, tracked=tracked, digest=bool(tracker)))[0]
+
+    except Exception:                               # pylint:disable=W0703
+        if not tracked:
+            raise
+
+        tracker.unsupported.add(slave.name)
+        tracked = []
+        row = slave.col_sql(probe_query(fields, digest=True))[0]
+
+    stale = []
+
+    for field in fields:
+        if field in tracked:
+            value = tracker.advance(
+                (slave.name, field), row.get(f"{field}_last"),
+                row.get(f"{field}_digest"))
+
+            if value is None:
+                stale.append(field)
+                continue
+
+        elif tracker and field in GTID_TRACKING:
+            value = tracker.rebase(
+                (slave.name, field), row[field], row.get(f"{field}_digest"))
+
+        else:
+            value = probe_value(field, row[field])
+
+        setattr(slave, GTID_ATTRS.get(field, field), value)
+
+    if stale:
+        row = slave.col_sql(probe_query(stale, digest=True))[0]
+
+        for field in stale:
+            setattr(slave, GTID_ATTRS[field], tracker.rebase(
+                (slave.name, field), row[field], row.get(f"{field}_digest")))
+
+    return slave
+
+
+def probe_query(fields, **kwargs):
+
+    """Function:  probe_query
+
+    Description:  Build the query that fetches the status fields.
+
+    Arguments:
+        (input) fields -> List of status fields to fetch
+        (input) kwargs:
+            tracked -> GTID set fields to fetch as their last transactions
+                and digest instead of in full
+            digest -> True to fetch the digest of the GTID set fields
+            columns -> Columns to fetch ahead of the status fields
+        (output) cmd -> SQL command
+
+    """
+
+    tracked = kwargs.get("tracked", ())
+    columns = list(kwargs.get("columns", ()))
+
+    for field in fields:
+        if field in tracked:
+            columns.append(f"{GTID_TRACKING[field][0]} AS {field}_last")
+
+        else:
+            columns.append(f"{PROBE_FIELDS[field]} AS {field}")
+
+        if field in tracked or kwargs.get("digest") \
+           and field in GTID_TRACKING:
+            columns.append(f"{GTID_TRACKING[field][1]} AS {field}_digest")
+
+    return "SELECT " + ", ".join(columns)
+
+
+def probe_value(field, value):
+
+    """Function:  probe_value
+
+    Description:  Convert a status field value from the server to the form
+        used by the slave instance attributes.  The GTID sets are parsed into
+        GtidSet instances.
+
+    Arguments:
+        (input) field -> Name of the status field
+        (input) value -> Value returned by the server
+        (output) Converted value
+
+    """
+
+    if field in ["gtid_mode", "io_running", "sql_running"]:
+        return str(value).upper() == "ON"
+
+    if field in ["lag", "apply_rate", "threads_running"]:
+        return None if value is None else float(value)
+
+    if field in GTID_ATTRS:
+        return gtid_class.GtidSet(value)
+
+    return "" if value is None else str(value)
+
+
+def slave_gtids(slave, field="exe_gtidset"):
+
+    """Function:  slave_gtids
+
+    Description:  Return a GTID set of a slave:  the set last probed or, if
+        the slave has not been probed, the set read when connecting.
+
+    Arguments:
+        (input) slave -> Slave instance
+        (input) field -> exe_gtidset|retrieved_gtidset
+        (output) GtidSet instance
+
+    """
+
+    gtids = getattr(slave, GTID_ATTRS[field], None)
+
+    if gtids is None:
+        gtids = gtid_class.GtidSet(getattr(slave, field, None))
+
+    return gtids
+
+
+def wait_for_drain(slave, gtids, **kwargs):
+
+    """Function:  wait_for_drain
+
+    Description:  Wait for a slave to apply its relay log up to a GTID set.
+        The wait is done server side with WAIT_FOR_EXECUTED_GTID_SET and if
+        that is not available, the executed GTID set is polled with an
+        adaptive backoff.  Either way the wait ends at the deadline and the
+        executed GTID set of the slave is refreshed:  the server side wait
+        reads it in the same query, after the wait.
+
+    Arguments:
+        (input) slave -> Slave instance
+        (input) gtids -> GtidSet instance the slave must contain
+        (input) kwargs:
+            timeout -> Deadline in seconds
+            tracker -> GtidTracker instance to advance the GTID set with
+        (output) status -> True|False - If the slave contains the GTID set
+
+    """
+
+    timeout = kwargs.get("timeout", 60)
+    deadline = time.monotonic() + timeout
+    tracker = kwargs.get("tracker")
+
+    if slave_gtids(slave).issuperset(gtids):
+        return True
+
+    print(f"Waiting for slave {slave.name} to apply its relay log")
+
+    try:
+        # The select list is evaluated in order, so the executed set is read
+        # once the wait returns.
+        row = slave.col_sql(probe_query(
+            ["exe_gtidset"], digest=bool(tracker), columns=[
+                f"WAIT_FOR_EXECUTED_GTID_SET('{gtids}', {timeout})"
+                f" AS status"]))[0]
+        slave.exe_gtids = tracker.rebase(
+            (slave.name, "exe_gtidset"), row["exe_gtidset"],
+            row.get("exe_gtidset_digest")) if tracker \
+            else probe_value("exe_gtidset", row["exe_gtidset"])
+
+        return int(row["status"]) == 0
+
+    except Exception as err:                        # pylint:disable=W0703
+        print(f"Warning:  Server side wait failed on {slave.name}: {err}")
+
+    tracker = tracker or gtid_class.GtidTracker()
+    delay = 0.01
+
+    while True:
+        probe_slave(slave, ["exe_gtidset"], tracker=tracker)
+
+        if slave.exe_gtids.issuperset(gtids):
+            return True
+
+        if time.monotonic() + delay > deadline:
+            return False
+
+        time.sleep(delay)
+        delay = min(delay * 2, 0.5)
+
+
+def probe_fields(commands):
+
+    """Function:  probe_fields
+
+    Description:  Return the status fields needed by the commands.
+
+    Arguments:
+        (input) commands -> List of command options
+        (output) fields -> Set of status fields
+
+    """
+
+    fields = set()
+
+    for cmd in commands:
+        fields.update(PROBE_COMMANDS.get(cmd, ()))
+
+    return fields
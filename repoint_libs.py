@@ -0,0 +1,318 @@
+# Classification (U)
+
+"""Program:  repoint_libs.py
+
+    Description:  Library of functions for converting the best slave to the new
+        master and changing the other slaves to replicate from it.
+
+    Functions:
+        change_slaves
+        convert_to_master
+        repoint_slaves
+        master_load
+        wait_for_load
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import time
+import random
+
+# Local
+try:
+    from .lazy_class import mysql_libs, mysql_class
+    from . import lock_class
+    from . import report_libs
+    from . import probe_libs
+    from . import engine_libs
+    from . import discover_libs
+    from . import converge_libs
+
+except (ValueError, ImportError) as err:
+    from lazy_class import mysql_libs, mysql_class
+    import lock_class
+    import report_libs
+    import probe_libs
+    import engine_libs
+    import discover_libs
+    import converge_libs
+
+# New master load fields and the expressions to fetch them in a single query.
+LOAD_FIELDS = {
+    "threads_running":
+        "(SELECT VARIABLE_VALUE FROM performance_schema.global_status"
+        " WHERE VARIABLE_NAME = 'Threads_running')",
+    "dump_threads":
+        "(SELECT COUNT(*) FROM performance_schema.threads"
+        " WHERE PROCESSLIST_COMMAND LIKE 'Binlog Dump%')",
+    "bytes_sent":
+        "(SELECT VARIABLE_VALUE FROM performance_schema.global_status"
+        " WHERE VARIABLE_NAME = 'Bytes_sent')"}
+
+# New master load limits before the next wave of slaves is repointed.
+WAVE_LIMITS = {"threads_running": 32, "send_rate": 64 * 1024 * 1024}
+
+
+def change_slaves(master, slaves, args, **kwargs):
+
+    """Function:  change_slaves
+
+    Description:  Change the slaves to the new master and verify that they
+        converge on it.
+
+    Arguments:
+        (input) master -> MasterRep instance of the new master
+        (input) slaves -> Slave instance array
+        (input) args -> ArgParser class instance
+        (input) kwargs:
+            report -> Timing report dictionary
+            tracker -> GtidTracker instance to advance the GTID sets with
+        (output) err_flag -> True|False - if an error has occurred
+        (output) err_msg -> Error message
+
+    """
+
+    err_flag = False
+    err_msg = None
+    report = kwargs.get("report")
+    max_workers = int(args.get_val("-p", def_val=16))
+    timeout = float(args.get_val("-C", def_val=60))
+
+    with report_libs.time_phase(report, "repoint"):
+        bad_slv = repoint_slaves(
+            master, slaves, max_workers=max_workers, report=report,
+            wave_size=int(args.get_val("-W", def_val=0)),
+            jitter=float(args.get_val("-j", def_val=0)),
+            timeout=float(args.get_val("-L", def_val=30)))
+
+    with report_libs.time_phase(report, "converge"):
+        not_converged = converge_libs.verify_convergence(
+            master, [slv for slv in slaves if slv.name not in bad_slv],
+            timeout=timeout, max_workers=max_workers, report=report,
+            tracker=kwargs.get("tracker"))
+
+    if bad_slv:
+        err_flag = True
+        err_msg = f"Slaves: {bad_slv} that did not change to new master."
+
+    elif not_converged:
+        err_flag = True
+        err_msg = f"Slaves: {not_converged} that did not converge on new" \
+                  f" master within {timeout} seconds."
+
+    return err_flag, err_msg
+
+
+def convert_to_master(slave, args, **kwargs):
+
+    """Function:  convert_to_master
+
+    Description:  Creates MasterRep instance from a SlaveRep instance.  The
+        MasterRep instance shares the open connection and the GTID state of
+        the SlaveRep instance, so no new connection is made and no status
+        queries are issued.  The executed GTID set is the one last read from
+        the slave, which is after the relay log was applied when the slave
+        was drained (see wait_for_drain), and is held as a
+        mysql_class.GTIDSet as when the MasterRep instance connects.  The
+        connection is closed with the slaves.
+
+    Arguments:
+        (input) slave -> Slave instance
+        (input) args -> ArgParser class instance
+        (input) kwargs:
+            slv_key -> Dictionary of keys and data types
+            inventory -> Slave inventory dictionary
+        (output) master -> MasterRep instance
+
+    """
+
+    inventory = kwargs.get("inventory") or discover_libs.create_inventory(
+        args, **kwargs)
+    entry = inventory["keys"][(slave.name, int(slave.port))]
+    rep_user = entry["rep_user"]
+    rep_japd = entry["rep_japd"]
+
+    master = mysql_class.MasterRep(
+        slave.name, slave.server_id, slave.sql_user, slave.sql_pass,
+        slave.machine, host=slave.host, port=slave.port,
+        defaults_file=slave.defaults_file, extra_def_file=slave.extra_def_file,
+        rep_user=rep_user, rep_japd=rep_japd)
+    master.conn = slave.conn
+    master.conn_msg = slave.conn_msg
+    master.gtid_mode = slave.gtid_mode
+    master.exe_gtid = mysql_class.GTIDSet(
+        str(probe_libs.slave_gtids(slave))) if slave.gtid_mode else None
+
+    return master
+
+
+def repoint_slaves(master, slaves, **kwargs):           # pylint:disable=R0914
+
+    """Function:  repoint_slaves
+
+    Description:  Change the slaves to the new master concurrently, with no
+        more than max_workers slaves being changed at the same time.  The
+        wall time for each slave is displayed once all slaves are done.  The
+        slaves share the new master instance and its connection (see
+        convert_to_master), which is not thread safe, so it is passed to
+        switch_to_master as a lock_class.LockedRep and any query on the new
+        master is run by one slave at a time.
+
+        With a wave size, the slaves are changed in waves of that many
+        slaves.  Before each wave after the first, there is a random delay
+        of up to the jitter and then a wait for the new master's load to
+        settle (see wait_for_load), so the new master is not hit by the
+        binlog dump threads and catch up reads of all slaves at once.
+
+    Arguments:
+        (input) master -> MasterRep instance of the new master
+        (input) slaves -> Slave instance array
+        (input) kwargs:
+            max_workers -> Maximum number of slaves changed concurrently
+            report -> Timing report dictionary
+            wave_size -> Number of slaves in each wave, 0 for one wave
+            jitter -> Maximum random delay in seconds before each wave
+            timeout -> Deadline in seconds for the load to settle
+        (output) bad_slv -> List of slave names that did not change
+
+    """
+
+    slaves = list(slaves)
+    bad_slv = []
+    results = []
+
+    if not slaves:
+        return bad_slv
+
+    wave_size = int(kwargs.get("wave_size") or len(slaves))
+    waves = [slaves[index:index + wave_size]
+             for index in range(0, len(slaves), wave_size)]
+    shared = lock_class.LockedRep(master)
+
+    def _switch(slv):
+        start = time.monotonic()
+
+        try:
+            status_flag = mysql_libs.switch_to_master(shared, slv)
+
+        except Exception as err:                    # pylint:disable=W0703
+            print(f"Error:  Slave {slv.name} raised: {err}")
+            status_flag = -1
+
+        return status_flag, time.monotonic() - start
+
+    for index, wave in enumerate(waves):
+        if index:
+            with report_libs.time_phase(kwargs.get("report"), "wave_wait"):
+                time.sleep(random.uniform(0, kwargs.get("jitter", 0)))
+                connected = sum(status_flag != -1
+                                for status_flag, _ in results)
+                is_settled, load = wait_for_load(
+                    master, connected, timeout=kwargs.get("timeout", 30))
+
+            print(f'Wave {index + 1}/{len(waves)}: {len(wave)} slaves'
+                  f'\tThreads running: {load["threads_running"]}'
+                  f'\tDump threads: {load["dump_threads"]}'
+                  f'\tSend rate: {load["send_rate"]:.0f} B/s')
+
+            if not is_settled:
+                print(f"Warning:  New master {master.name} load did not"
+                      f" settle within {kwargs.get('timeout', 30)} seconds")
+
+        results.extend(engine_libs.run_engine(
+            _switch, wave, max_workers=kwargs.get("max_workers", 16)))
+
+    for slv, (status_flag, wall_time) in zip(slaves, results):
+        print(f"Slave: {slv.name}\tRepoint time: {wall_time:.3f}s")
+        report_libs.slave_time(
+            kwargs.get("report"), slv.name, "repoint", wall_time)
+
+        if status_flag == -1:
+            bad_slv.append(slv.name)
+
+    return bad_slv
+
+
+def master_load(master, previous=None):
+
+    """Function:  master_load
+
+    Description:  Fetch the load of the new master with a single query:  the
+        threads running, the binlog dump threads and the bytes sent.  The
+        send rate is worked out from the previous load, if given.
+
+    Arguments:
+        (input) master -> MasterRep instance of the new master
+        (input) previous -> Previous load dictionary from master_load
+        (output) load -> Load dictionary
+            threads_running -> Number of threads running
+            dump_threads -> Number of binlog dump threads
+            bytes_sent -> Total bytes sent
+            send_rate -> Bytes sent per second since the previous load
+            time -> Monotonic time of the load
+
+    """
+
+    row = master.col_sql("SELECT " + ", ".join(
+        f"{expr} AS {field}" for field, expr in LOAD_FIELDS.items()))[0]
+    load = {field: int(row[field] or 0) for field in LOAD_FIELDS}
+    load["time"] = time.monotonic()
+    load["send_rate"] = 0.0
+
+    if previous and load["time"] > previous["time"]:
+        sent = load["bytes_sent"] - previous["bytes_sent"]
+        load["send_rate"] = max(0.0, sent / (load["time"] - previous["time"]))
+
+    return load
+
+
+def wait_for_load(master, connected, **kwargs):
+
+    """Function:  wait_for_load
+
+    Description:  Wait for the load of the new master to settle before the
+        next wave of slaves is changed to it.  The load is settled when the
+        slaves changed so far have their binlog dump threads and the threads
+        running and send rate are within their limits (see WAVE_LIMITS).
+        The load is polled with an adaptive backoff and the wait ends at the
+        deadline.  If the load cannot be read, the wait is skipped.
+
+    Arguments:
+        (input) master -> MasterRep instance of the new master
+        (input) connected -> Number of slaves changed to the new master
+        (input) kwargs:
+            timeout -> Deadline in seconds
+            limits -> Dictionary of load limits, default is WAVE_LIMITS
+        (output) is_settled -> True|False - If the load settled
+        (output) load -> Last load dictionary from master_load
+
+    """
+
+    limits = kwargs.get("limits", WAVE_LIMITS)
+    deadline = time.monotonic() + kwargs.get("timeout", 30)
+    delay = 0.1
+
+    try:
+        load = master_load(master)
+
+        while True:
+            time.sleep(delay)
+            load = master_load(master, load)
+
+            if load["dump_threads"] >= connected \
+               and load["threads_running"] <= limits["threads_running"] \
+               and load["send_rate"] <= limits["send_rate"]:
+                return True, load
+
+            if time.monotonic() + delay > deadline:
+                return False, load
+
+            delay = min(delay * 2, 1.0)
+
+    except Exception as err:                        # pylint:disable=W0703
+        print(f"Warning:  Load of new master {master.name} not read: {err}")
+
+        return True, {"threads_running": None, "dump_threads": None,
+                      "send_rate": 0.0}
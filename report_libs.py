@@ -0,0 +1,212 @@
+# Classification (U)
+
+"""Program:  report_libs.py
+
+    Description:  Library of functions for the timing report and the NDJSON
+        records of mysql_rep_failover.py.
+
+    Functions:
+        ranking_record
+        emit_record
+        percentile
+        plan_value
+        time_phase
+        slave_time
+        write_report
+        add_slowest
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import math
+import time
+import json
+import contextlib
+
+
+def ranking_record(command, selection, **kwargs):
+
+    """Function:  ranking_record
+
+    Description:  Create the NDJSON ranking record of a command.
+
+    Arguments:
+        (input) command -> Command option
+        (input) selection -> Selection from select_candidates
+        (input) kwargs:
+            slaves -> List of the slaves in best order
+        (output) NDJSON record dictionary
+
+    """
+
+    best = selection["best"]
+
+    return {"type": "ranking", "command": command,
+            "best": best.name if best else None, "ties": selection["ties"],
+            "divergent": selection["divergent"],
+            "slaves": kwargs.get("slaves", [])}
+
+
+def emit_record(record):
+
+    """Function:  emit_record
+
+    Description:  Write a record as a line of NDJSON to standard out and
+        flush it, so it can be read before the program is done.
+
+    Arguments:
+        (input) record -> Record dictionary
+
+    """
+
+    print(json.dumps(record), flush=True)
+
+
+def percentile(values, pct):
+
+    """Function:  percentile
+
+    Description:  Nearest rank percentile of a list of values.
+
+    Arguments:
+        (input) values -> List of numbers
+        (input) pct -> Percentile between 0 and 100
+        (output) Value at the percentile or None if there are no values
+
+    """
+
+    values = sorted(values)
+
+    if not values:
+        return None
+
+    index = max(0, min(len(values) - 1,
+                       math.ceil(pct / 100.0 * len(values)) - 1))
+
+    return values[index]
+
+
+def plan_value(value, unit=""):
+
+    """Function:  plan_value
+
+    Description:  Format a plan value for display.
+
+    Arguments:
+        (input) value -> Number or None if not known
+        (input) unit -> Unit to display after the value
+        (output) Formatted value
+
+    """
+
+    if value is None:
+        return "unknown"
+
+    if isinstance(value, float):
+        return f"{value:.3f}{unit}"
+
+    return f"{value}{unit}"
+
+
+@contextlib.contextmanager
+def time_phase(report, phase):
+
+    """Function:  time_phase
+
+    Description:  Context manager which adds the monotonic wall time of the
+        block to a phase of the timing report.  Time for a phase that is run
+        more than once is added together.
+
+    Arguments:
+        (input) report -> Timing report dictionary or None
+        (input) phase -> Name of the phase
+
+    """
+
+    start = time.monotonic()
+
+    try:
+        yield
+
+    finally:
+        if report is not None:
+            report["phases"][phase] = \
+                report["phases"].get(phase, 0) + time.monotonic() - start
+
+
+def slave_time(report, name, phase, seconds):
+
+    """Function:  slave_time
+
+    Description:  Add a slave's wall time for a phase to the timing report.
+
+    Arguments:
+        (input) report -> Timing report dictionary or None
+        (input) name -> Name of the slave
+        (input) phase -> Name of the phase
+        (input) seconds -> Wall time in seconds
+
+    """
+
+    if report is not None:
+        report["slaves"].setdefault(name, {})[phase] = seconds
+
+
+def write_report(report, out_file=None):
+
+    """Function:  write_report
+
+    Description:  Write the timing report in JSON format to a file or to
+        standard out.  For each per slave phase, the slave with the longest
+        time (the slave on the critical path) is added to the report.  For a
+        batch report, this is done for each replication set.
+
+    Arguments:
+        (input) report -> Timing report dictionary
+        (input) out_file -> Name of file to write the report to
+
+    """
+
+    if "sets" in report:
+        report = dict(report)
+        report["sets"] = [add_slowest(item) for item in report["sets"]]
+
+    else:
+        report = add_slowest(report)
+
+    data = json.dumps(report, indent=4)
+
+    if out_file:
+        with open(out_file, mode="w", encoding="UTF-8") as f_hdlr:
+            f_hdlr.write(data + "\n")
+
+    else:
+        print(data)
+
+
+def add_slowest(report):
+
+    """Function:  add_slowest
+
+    Description:  Return a copy of the timing report with the slave with the
+        longest time added for each per slave phase.
+
+    Arguments:
+        (input) report -> Timing report dictionary
+        (output) report -> Timing report dictionary with the slowest slaves
+
+    """
+
+    report = dict(report)
+    report["slowest"] = {}
+
+    for name, phases in report.get("slaves", {}).items():
+        for phase, seconds in phases.items():
+            slowest = report["slowest"].get(phase)
+
+            if not slowest or seconds > slowest["seconds"]:
+                report["slowest"][phase] = {"name": name, "seconds": seconds}
+
+    return report
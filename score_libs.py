@@ -0,0 +1,455 @@
+# Classification (U)
+
+"""Program:  score_libs.py
+
+    Description:  Library of functions for ranking the slaves on their GTID
+        sets and picking the best slave on the scoring criteria of the slave
+        config file.
+
+    Functions:
+        slave_deltas
+        errant_transactions
+        order_slaves_on_gtid
+        select_candidates
+        pick_candidate
+        score_slaves
+        criterion_value
+        score_settings
+        score_fields
+        no_best_message
+        unresolved_ties
+
+"""
+
+# Libraries and Global Variables
+
+# Local
+try:
+    from . import gtid_class
+    from . import probe_libs
+
+except (ValueError, ImportError) as err:
+    import gtid_class
+    import probe_libs
+
+# Candidate scoring criteria:  where the value is read from ("status" field
+# of the slave instance, "config" entry of the slave or "match" of the slave
+# config entry with the preferred value), the field and the direction (1 if
+# a higher value is better, -1 if a lower value is better).
+SCORE_CRITERIA = {
+    "lag": ("status", "lag", -1),
+    "load": ("status", "threads_running", -1),
+    "apply_rate": ("status", "apply_rate", 1),
+    "hw_class": ("config", "hw_class", 1),
+    "datacenter": ("match", "datacenter", 1)}
+
+
+def slave_deltas(selection):
+
+    """Function:  slave_deltas
+
+    Description:  Compare each slave with the best slave, or with the slave
+        with the most transactions if there is no single best slave.
+
+    Arguments:
+        (input) selection -> Selection from select_candidates
+        (output) deltas -> List of dictionaries in best order:
+            name -> Name of the slave
+            role -> best, most (most transactions), candidate or slave
+            transactions -> Count of transactions
+            behind -> Count of transactions missing from the slave
+            missing -> GtidSet of the transactions missing from the slave
+            not_on_best -> Count of transactions not on the best slave
+
+    """
+
+    deltas = []
+    candidates = [slv.name for _, slv in selection["frontier"]]
+    best = selection["best"] or \
+        next((slv for _, slv in selection["slave_list"]), None)
+    best_gtids = next((gtid for gtid, slv in selection["slave_list"]
+                       if slv is best), None)
+
+    for gtid, slv in selection["slave_list"]:
+        if slv is best:
+            role = "best" if selection["best"] else "most"
+
+        else:
+            role = "candidate" if slv.name in candidates else "slave"
+
+        missing = best_gtids.subtract(gtid)
+        deltas.append(
+            {"name": slv.name, "role": role, "transactions": gtid.count(),
+             "behind": missing.count(), "missing": missing,
+             "not_on_best": gtid.subtract(best_gtids).count()})
+
+    deltas.sort(key=lambda item: item["role"] not in ["best", "most"])
+
+    return deltas
+
+
+def errant_transactions(new_master, slaves, **kwargs):
+
+    """Function:  errant_transactions
+
+    Description:  Find the slaves with transactions a new master does not
+        have (errant transactions).  The new master never sends these
+        transactions, so a slave changed to the new master with them has
+        diverged from it, and replication breaks if they conflict with the
+        transactions of the new master.  The executed plus retrieved GTID
+        sets of the slaves are put in one containment and difference matrix
+        (see gtid_class.GtidMatrix), which also gives the slaves with every
+        transaction.
+
+    Arguments:
+        (input) new_master -> Slave instance to be promoted
+        (input) slaves -> Slave instance array, with the new master
+        (input) kwargs:
+            slave_list -> List of (GtidSet, slave) from order_slaves_on_gtid
+        (output) Dictionary of the errant transactions:
+            errant -> Dictionary of slave name to the number of its
+                transactions the new master does not have
+            complete -> Names of the slaves with every transaction
+
+    """
+
+    slave_list = kwargs.get("slave_list") \
+        or order_slaves_on_gtid(slaves, retrieved=True)
+    matrix = gtid_class.GtidMatrix([gtids for gtids, _ in slave_list])
+    row = next(pos for pos, (_, slv) in enumerate(slave_list)
+               if slv is new_master)
+
+    return {"errant": {slave_list[col][1].name: count
+                       for col, count in matrix.errant(row).items()},
+            "complete": [slave_list[pos][1].name
+                         for pos in matrix.complete()]}
+
+
+def order_slaves_on_gtid(slaves, **kwargs):
+
+    """Function:  order_slaves_on_gtid
+
+    Description:  Take a Slave array and sort them on their GTID positions,
+        with the top(first) slave being the best Slave.  Slaves are ranked
+        on their executed transaction count, which is consistent with
+        transaction containment:  a slave that contains every transaction of
+        another slave always ranks ahead of it.  Ties keep the slave array
+        order.  With retrieved set, slaves are ranked on the transactions
+        they will have once their relay logs are applied (executed set plus
+        retrieved set).
+
+    Arguments:
+        (input) slaves -> Slave instance array
+        (input) kwargs:
+            retrieved -> True|False - Include the retrieved GTID set
+        (output) slave_list -> List of (GtidSet, slave) in best order
+
+    """
+
+    slaves = list(slaves)
+    slave_list = []
+
+    for slv in slaves:
+        gtids = probe_libs.slave_gtids(slv)
+
+        if kwargs.get("retrieved", False):
+            gtids = gtids.union(
+                probe_libs.slave_gtids(slv, "retrieved_gtidset"))
+
+        slave_list.append((gtids, slv))
+
+    slave_list.sort(key=lambda item: item[0].count(), reverse=True)
+
+    return slave_list
+
+
+def select_candidates(slaves, **kwargs):
+
+    """Function:  select_candidates
+
+    Description:  Find the maximal slaves (the Pareto frontier) of the
+        partial order of GTID set containment in one pass over the ranked
+        slaves.  While a single slave contains every slave seen so far, each
+        slave costs one containment check against it.  If a single slave
+        contains all the others it is the best slave, and any slaves with an
+        identical GTID set are reported as ties (the best slave is the first
+        of them in slave array order).  If no single slave contains all the
+        others, there is no best slave and the maximal slaves are reported as
+        divergent.
+        With the slave inventory, the best slave is picked from the slaves
+        with every transaction (see pick_candidate).
+
+    Arguments:
+        (input) slaves -> Slave instance array
+        (input) kwargs:
+            retrieved -> True|False - Include the retrieved GTID set
+            inventory -> Slave inventory dictionary
+        (output) selection -> Dictionary of the selection:
+            best -> Best slave instance or None if the slaves diverge
+            ties -> Names of slaves with the same GTID set as the best slave
+            divergent -> Names of the maximal slaves if they diverge
+            frontier -> List of (GtidSet, slave) for the maximal slaves
+            slave_list -> List of (GtidSet, slave) in best order
+            excluded -> Names of slaves excluded from promotion
+            scores -> Dictionary of name to score of the scored slaves
+
+    """
+
+    slaves = list(slaves)
+    slave_list = order_slaves_on_gtid(slaves, **kwargs)
+    selection = {"best": None, "ties": [], "divergent": [], "frontier": [],
+                 "slave_list": slave_list, "excluded": [], "scores": {}}
+    frontier = selection["frontier"]
+
+    for gtids, slv in slave_list:
+        for top_gtids, top_slv in frontier:
+            if top_gtids.issuperset(gtids):
+                if top_slv is slave_list[0][1] and top_gtids == gtids:
+                    selection["ties"].append(slv.name)
+
+                break
+
+        else:
+            frontier.append((gtids, slv))
+
+    if len(frontier) == 1:
+        selection["best"] = frontier[0][1]
+
+    elif frontier:
+        selection["divergent"] = [slv.name for _, slv in frontier]
+        selection["ties"] = []
+
+    if selection["best"] and kwargs.get("inventory"):
+        pick_candidate(selection, kwargs["inventory"])
+
+    return selection
+
+
+def pick_candidate(selection, inventory):
+
+    """Function:  pick_candidate
+
+    Description:  Pick the best slave from the slaves with every transaction
+        (the best slave and its ties).  Having every transaction is a hard
+        constraint, as is the promote entry of the slave config:  slaves
+        with promote = False are excluded.  The remaining slaves are ranked
+        on the weighted sum of their scoring criteria (see score_slaves),
+        ties keeping the slave array order.  If every slave with every
+        transaction is excluded, there is no best slave.
+
+    Arguments:
+        (input) selection -> Selection from select_candidates, updated
+        (input) inventory -> Slave inventory dictionary
+        (output) selection -> Updated selection
+
+    """
+
+    complete = [slv for _, slv in selection["slave_list"]
+                if slv is selection["best"] or slv.name in selection["ties"]]
+    entries = [inventory["keys"].get((slv.name, int(slv.port)), {})
+               for slv in complete]
+    promote = [str(entry.get("promote", True)).lower() != "false"
+               for entry in entries]
+    eligible = [(slv, entry) for slv, entry, is_promote
+                in zip(complete, entries, promote) if is_promote]
+    scoring = inventory.get("scoring") or {"weights": {}, "prefer": {}}
+    selection["excluded"] = [slv.name for slv, is_promote
+                             in zip(complete, promote) if not is_promote]
+
+    if scoring["weights"]:
+        selection["scores"] = score_slaves(
+            [slv for slv, _ in eligible], [entry for _, entry in eligible],
+            scoring)
+
+    best = max((slv for slv, _ in eligible), default=None,
+               key=lambda slv: selection["scores"].get(slv.name, 0))
+    selection["best"] = best
+    selection["ties"] = [slv.name for slv in complete
+                         if best and slv is not best]
+
+    return selection
+
+
+def score_slaves(slaves, entries, scoring):
+
+    """Function:  score_slaves
+
+    Description:  Score the slaves on the weighted sum of their scoring
+        criteria.  Each criterion value is scaled between the slaves to 0
+        (worst) and 1 (best), a slave with an unknown value scores 0 and the
+        slaves score 1 if they all have the same value.  The status fields
+        of the criteria are read in the probe pass with the other status
+        fields (see score_fields) and cached on the slave instances, so
+        scoring does not query the slaves.
+
+    Arguments:
+        (input) slaves -> Slave instance array
+        (input) entries -> Slave config entry of each slave
+        (input) scoring -> Scoring settings from score_settings
+        (output) scores -> Dictionary of name to score
+
+    """
+
+    scores = {slv.name: 0.0 for slv in slaves}
+
+    for name, weight in scoring["weights"].items():
+        _, _, direction = SCORE_CRITERIA[name]
+        values = [criterion_value(slv, entry, name, scoring)
+                  for slv, entry in zip(slaves, entries)]
+        known = [value * direction for value in values if value is not None]
+        low, high = (min(known), max(known)) if known else (0.0, 0.0)
+
+        for slv, value in zip(slaves, values):
+            if value is not None:
+                scaled = (value * direction - low) / (high - low) \
+                    if high > low else 1.0
+                scores[slv.name] += weight * scaled
+
+    return scores
+
+
+def criterion_value(slave, entry, name, scoring):
+
+    """Function:  criterion_value
+
+    Description:  Return the value of a scoring criterion for a slave.
+
+    Arguments:
+        (input) slave -> Slave instance
+        (input) entry -> Slave config entry of the slave
+        (input) name -> Name of the criterion
+        (input) scoring -> Scoring settings from score_settings
+        (output) Value as a float or None if unknown
+
+    """
+
+    source, field, _ = SCORE_CRITERIA[name]
+
+    if source == "status":
+        value = getattr(slave, field, None)
+
+    elif source == "config":
+        value = entry.get(field)
+
+    else:
+        value = entry.get(field) is not None \
+            and str(entry[field]) == scoring["prefer"].get(field)
+
+    try:
+        return None if value is None else float(value)
+
+    except (TypeError, ValueError):
+        return None
+
+
+def score_settings(entries, **kwargs):
+
+    """Function:  score_settings
+
+    Description:  Read the scoring settings from the slave config entries:
+        the criteria weights from the first score_weights entry (a comma
+        separated list of criterion:weight) and the preferred value of each
+        match criterion from the first prefer_<field> entry.  Unknown
+        criteria and invalid weights are reported and ignored.
+
+    Arguments:
+        (input) entries -> List of slave configuration dictionaries
+        (input) kwargs:
+            quiet -> True to not print the ignored criteria
+        (output) scoring -> Dictionary of the scoring settings:
+            weights -> Dictionary of criterion name to weight
+            prefer -> Dictionary of field to preferred value
+
+    """
+
+    scoring = {"weights": {}, "prefer": {}}
+    declared = next((entry["score_weights"] for entry in entries
+                     if entry.get("score_weights")), "")
+
+    for item in [item for item in str(declared).split(",") if item.strip()]:
+        name, _, weight = [part.strip() for part in item.partition(":")]
+
+        try:
+            if name not in SCORE_CRITERIA:
+                raise ValueError("unknown criterion")
+
+            scoring["weights"][name] = float(weight)
+
+        except ValueError as err:
+            if not kwargs.get("quiet", False):
+                print(f"Warning:  Scoring criterion {item.strip()} ignored:"
+                      f" {err}")
+
+    for source, field, _ in SCORE_CRITERIA.values():
+        prefer = next((entry["prefer_" + field] for entry in entries
+                       if entry.get("prefer_" + field)), None)
+
+        if source == "match" and prefer is not None:
+            scoring["prefer"][field] = str(prefer)
+
+    return scoring
+
+
+def score_fields(scoring):
+
+    """Function:  score_fields
+
+    Description:  Return the status fields needed by the scoring criteria.
+
+    Arguments:
+        (input) scoring -> Scoring settings from score_settings or None
+        (output) fields -> Set of status fields
+
+    """
+
+    weights = scoring["weights"] if scoring else {}
+
+    return {SCORE_CRITERIA[name][1] for name in weights
+            if SCORE_CRITERIA[name][0] == "status"}
+
+
+def no_best_message(selection):
+
+    """Function:  no_best_message
+
+    Description:  Return why a selection has no best slave.
+
+    Arguments:
+        (input) selection -> Selection from select_candidates
+        (output) Error message
+
+    """
+
+    if selection["divergent"] or not selection.get("excluded"):
+        return f"No single best slave, divergent slaves:" \
+               f" {selection['divergent']}"
+
+    return f"No best slave, slaves with every transaction are excluded from" \
+           f" promotion: {selection['excluded']}"
+
+
+def unresolved_ties(selection):
+
+    """Function:  unresolved_ties
+
+    Description:  Return the slaves tied with the best slave which the
+        scoring criteria do not rank below it.  Slaves excluded from
+        promotion are left out.
+
+    Arguments:
+        (input) selection -> Selection from select_candidates
+        (output) List of the names of the tied slaves
+
+    """
+
+    best = selection["best"]
+    scores = selection.get("scores") or {}
+    excluded = selection.get("excluded", [])
+
+    if not best:
+        return []
+
+    top = scores.get(best.name, 0)
+
+    return [name for name in selection["ties"]
+            if name not in excluded and scores.get(name, 0) >= top]
@@ -0,0 +1,271 @@
+# Classification (U)
+
+"""Program:  snapshot_libs.py
+
+    Description:  Library of functions for the snapshot file of the slaves and
+        their ranking.
+
+    Functions:
+        snapshot_fingerprint
+        read_snapshot
+        write_snapshot
+        save_snapshot
+        snapshot_slave
+        snapshot_value
+        use_snapshot
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import os
+import time
+import json
+import types
+import struct
+import contextlib
+import hashlib
+
+# Local
+try:
+    from . import version
+    from . import score_libs
+    from . import probe_libs
+
+except (ValueError, ImportError) as err:
+    import version
+    import score_libs
+    import probe_libs
+
+# Snapshot file header:  magic, write time, slave config fingerprint and
+# payload length.  The header is followed by the payload in compact JSON,
+# which is parsed in full once the header shows the snapshot is usable.
+SNAPSHOT_HEADER = struct.Struct("<8sd32sI")
+SNAPSHOT_MAGIC = b"MRFSNAP1"
+
+# Slave attributes held in the snapshot file.
+SNAPSHOT_FIELDS = (
+    ("name", "host", "port", "server_id") + tuple(probe_libs.PROBE_FIELDS))
+
+
+def snapshot_fingerprint(args):
+
+    """Function:  snapshot_fingerprint
+
+    Description:  Fingerprint of the slave config file and the program
+        version, so a snapshot is not used once either has changed.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (output) SHA-256 digest or None if the slave config file is not read
+
+    """
+
+    slv_file = os.path.join(args.get_val("-d", def_val=""), args.get_val("-s"))
+
+    try:
+        with open(slv_file, mode="rb") as f_hdlr:
+            data = f_hdlr.read()
+
+    except OSError:
+        return None
+
+    return hashlib.sha256(version.__version__.encode() + b"\0" + data).digest()
+
+
+def read_snapshot(snap_file, fingerprint, ttl):
+
+    """Function:  read_snapshot
+
+    Description:  Read the slaves from a snapshot file written within the
+        TTL for the same slave config file.  The fixed size header is read
+        first to check the snapshot, and the JSON payload is only read and
+        parsed for a usable snapshot.
+
+    Arguments:
+        (input) snap_file -> Name of the snapshot file
+        (input) fingerprint -> Fingerprint from snapshot_fingerprint
+        (input) ttl -> Time to live of the snapshot in seconds
+        (output) snapshot -> Dictionary of the snapshot or None if it is
+            missing, stale, for another slave config file or not readable:
+            age -> Age of the snapshot in seconds
+            ranking -> Best slave ranking when the snapshot was written
+            slaves -> List of slave instances with the snapshot attributes
+
+    """
+
+    try:
+        with open(snap_file, mode="rb") as f_hdlr:
+            magic, written, digest, length = SNAPSHOT_HEADER.unpack(
+                f_hdlr.read(SNAPSHOT_HEADER.size))
+            age = time.time() - written
+
+            if magic != SNAPSHOT_MAGIC or digest != fingerprint \
+               or not 0 <= age <= ttl:
+                return None
+
+            payload = json.loads(f_hdlr.read(length))
+
+    except (OSError, ValueError, struct.error):
+        return None
+
+    return {"age": age, "ranking": payload["ranking"],
+            "slaves": [types.SimpleNamespace(**item)
+                       for item in payload["slaves"]]}
+
+
+def write_snapshot(snap_file, fingerprint, slaves, selection):
+
+    """Function:  write_snapshot
+
+    Description:  Write the slaves and their ranking to a snapshot file.
+        The file is written to a temporary file which replaces the snapshot
+        file, so a reader never sees a partly written snapshot.
+
+    Arguments:
+        (input) snap_file -> Name of the snapshot file
+        (input) fingerprint -> Fingerprint from snapshot_fingerprint
+        (input) slaves -> Slave instance array
+        (input) selection -> Selection of the slaves from select_candidates
+
+    """
+
+    best = selection["best"]
+    payload = json.dumps(
+        {"ranking": {"best": best.name if best else None,
+                     "ties": selection["ties"],
+                     "divergent": selection["divergent"],
+                     "order": [slv.name
+                               for _, slv in selection["slave_list"]]},
+         "slaves": [snapshot_slave(slv) for slv in slaves]},
+        separators=(",", ":")).encode()
+    tmp_file = f"{snap_file}.{os.getpid()}.tmp"
+
+    with open(tmp_file, mode="wb") as f_hdlr:
+        f_hdlr.write(SNAPSHOT_HEADER.pack(
+            SNAPSHOT_MAGIC, time.time(), fingerprint, len(payload)))
+        f_hdlr.write(payload)
+
+    os.replace(tmp_file, snap_file)
+
+
+def save_snapshot(args, commands, slaves, **kwargs):
+
+    """Function:  save_snapshot
+
+    Description:  Write the snapshot file of the -k option for the read only
+        -B and -D options, with the ranking of the command.  Slaves taken
+        from the snapshot file are not written back, so the snapshot expires
+        at its TTL.  A snapshot that cannot be written is reported and does
+        not stop the command.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) commands -> Set of command options
+        (input) slaves -> Slave instance array
+        (input) kwargs:
+            selection -> Selection from select_candidates to use
+            inventory -> Slave inventory dictionary
+            stream -> Function to write NDJSON records with
+            from_snapshot -> True if the slaves are from the snapshot file
+
+    """
+
+    snap_file = args.get_val("-k")
+    fingerprint = None
+
+    if snap_file and not kwargs.get("from_snapshot"):
+        fingerprint = snapshot_fingerprint(args)
+
+    if fingerprint and slaves and not commands - {"-B", "-D"}:
+        selection = kwargs.get("selection") \
+            or score_libs.select_candidates(
+                slaves, inventory=kwargs.get("inventory"))
+
+        try:
+            write_snapshot(snap_file, fingerprint, slaves, selection)
+
+        except OSError as err:
+            if not kwargs.get("stream"):
+                print(f"Warning:  Snapshot file {snap_file} not written:"
+                      f" {err}")
+
+
+def snapshot_slave(slave):
+
+    """Function:  snapshot_slave
+
+    Description:  Return the snapshot attributes of a slave.  The GTID sets
+        are the sets last probed (see probe_libs.slave_gtids).
+
+    Arguments:
+        (input) slave -> Slave instance
+        (output) Dictionary of the attributes as JSON types
+
+    """
+
+    return {field: snapshot_value(
+        probe_libs.slave_gtids(slave, field)
+        if field in probe_libs.GTID_ATTRS else getattr(slave, field, None))
+            for field in SNAPSHOT_FIELDS}
+
+
+def snapshot_value(value):
+
+    """Function:  snapshot_value
+
+    Description:  Convert a slave attribute to a value the snapshot can hold.
+
+    Arguments:
+        (input) value -> Value of the attribute
+        (output) Value as a JSON type
+
+    """
+
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+
+    return str(value)
+
+
+def use_snapshot(args, commands, **kwargs):
+
+    """Function:  use_snapshot
+
+    Description:  Answer the read only -B and -D options from the snapshot
+        file of the -k option if it is within the -l option TTL.  The -F, -G
+        and -M options never use the snapshot and remove it, as they change
+        the replication set (except in plan mode).
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) commands -> Set of command options
+        (input) kwargs:
+            report -> Timing report dictionary
+        (output) slaves -> List of slaves from the snapshot or None
+
+    """
+
+    snap_file = args.get_val("-k")
+    snapshot = None
+
+    if not snap_file:
+        return None
+
+    if commands - {"-B", "-D"}:
+        if not args.get_val("-P", def_val=False):
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(snap_file)
+
+    else:
+        snapshot = read_snapshot(
+            snap_file, snapshot_fingerprint(args),
+            float(args.get_val("-l", def_val=10)))
+
+    if snapshot and kwargs.get("report") is not None:
+        kwargs["report"]["snapshot"] = {
+            "file": snap_file, "age": snapshot["age"],
+            "ranking": snapshot["ranking"]}
+
+    return snapshot["slaves"] if snapshot else None
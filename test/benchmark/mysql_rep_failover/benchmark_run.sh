@@ -0,0 +1,9 @@
+#!/bin/bash
+# Benchmark program for the program module.
+# This will run the end to end failover benchmarks for this program.
+# Will need to run this from the base directory where the module file
+#   is located at.
+
+echo ""
+echo "Benchmark testing..."
+/usr/bin/python test/benchmark/mysql_rep_failover/failover_benchmark.py "$@"
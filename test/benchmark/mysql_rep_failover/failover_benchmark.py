@@ -0,0 +1,276 @@
+# Classification (U)
+
+"""Program:  failover_benchmark.py
+
+    Description:  End to end benchmark of run_program in
+        mysql_rep_failover.py for the -B, -D, -F and -G options against an
+        in-process simulated replica fleet (see sim_fleet.py) of 10, 100 and
+        1000 slaves.  For each fleet size and option it records the latency
+        of the run (min, p50, p99), the throughput in slaves handled per
+        second and the peak number of threads, and compares them against a
+        saved baseline.
+
+    Usage:
+        test/benchmark/mysql_rep_failover/failover_benchmark.py
+            [-n runs] [-s sizes] [-l latency] [-j jitter] [-f fail_rate]
+            [-i intervals] [-o file] [-b file] [-w]
+
+    Arguments:
+        -n runs => Number of runs for each fleet size and option.  Default 5.
+        -s sizes => Comma separated fleet sizes.  Default 10,100,1000.
+        -l latency => Simulated round trip time in seconds.  Default 0.001.
+        -j jitter => Simulated maximum extra round trip time in seconds.
+            Default 0.0005.
+        -f fail_rate => Fraction of slaves that fail to connect.  Default 0.
+        -i intervals => GTID intervals per source UUID.  Default 10.
+        -o file => Write the results to a file in JSON format.
+        -b file => Baseline file to compare the results against.
+            Default test/benchmark/mysql_rep_failover/baseline.json.
+        -w => Write the results as the new baseline.
+
+    Notes:
+        Run from the base directory where mysql_rep_failover.py is located.
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import io
+import json
+import math
+import time
+import argparse
+import contextlib
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import mysql_rep_failover                       # pylint:disable=E0401,C0413
+import sim_fleet                           # pylint:disable=E0401,C0413,C0411
+
+BASELINE = "test/benchmark/mysql_rep_failover/baseline.json"
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Stand-in for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_args_keys
+        get_val
+
+    """
+
+    def __init__(self, args_array):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) args_array -> Dictionary of options and values
+
+        """
+
+        self.args_array = dict(args_array)
+
+    def get_args_keys(self):
+
+        """Method:  get_args_keys
+
+        Description:  Return the options.
+
+        Arguments:
+
+        """
+
+        return list(self.args_array.keys())
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Return the value of an option.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+def percentile(values, pct):
+
+    """Function:  percentile
+
+    Description:  Nearest rank percentile of a list of values.
+
+    Arguments:
+        (input) values -> List of numbers
+        (input) pct -> Percentile between 0 and 100
+        (output) Value at the percentile
+
+    """
+
+    values = sorted(values)
+    index = max(0, min(len(values) - 1,
+                       math.ceil(pct / 100.0 * len(values)) - 1))
+
+    return values[index]
+
+
+@contextlib.contextmanager
+def simulated(fleet):
+
+    """Function:  simulated
+
+    Description:  Patch the database and configuration calls of
+        mysql_rep_failover with the simulated fleet.
+
+    Arguments:
+        (input) fleet -> SimFleet instance
+
+    """
+
+    with mock.patch.multiple(
+            "mysql_rep_failover.gen_libs", create_cfg_array=fleet.cfg_array,
+            transpose_dict=lambda data, keys: data), \
+        mock.patch.multiple(
+            "mysql_rep_failover.mysql_libs",
+            create_slv_array=fleet.create_slv_array,
+            switch_to_master=fleet.switch_to_master,
+            find_name=fleet.find_name, disconnect=fleet.disconnect), \
+        mock.patch.multiple(
+            "mysql_rep_failover.repoint_libs.mysql_class",
+            MasterRep=fleet.master_rep, GTIDSet=str), \
+        mock.patch("asyncio.open_connection", fleet.open_connection), \
+            contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+def bench(size, opt, runs, **kwargs):
+
+    """Function:  bench
+
+    Description:  Run one option end to end against a fleet size.
+
+    Arguments:
+        (input) size -> Number of slaves in the fleet
+        (input) opt -> Option to run (-B, -D, -F or -G)
+        (input) runs -> Number of runs
+        (input) kwargs -> Passed to SimFleet
+        (output) Dictionary of the results
+
+    """
+
+    func_dict = {"-B": mysql_rep_failover.show_best_slave,
+                 "-D": mysql_rep_failover.show_slave_delays,
+                 "-F": mysql_rep_failover.promote_best_slave,
+                 "-G": mysql_rep_failover.promote_designated_slave}
+    times = []
+    peak_threads = 0
+
+    for _ in range(runs):
+        fleet = sim_fleet.SimFleet(size, **kwargs)
+        args = ArgParser({"-s": "slaves.txt", "-d": "config",
+                          opt: fleet.names[-1] if opt == "-G" else True})
+
+        # The designated slave is behind and the best slave has ties, so force
+        # the promotion past the errant and tie checks.
+        if opt in ["-F", "-G"]:
+            args.args_array["-f"] = True
+
+        with simulated(fleet):
+            start = time.perf_counter()
+            mysql_rep_failover.run_program(args, func_dict, slv_key={})
+            times.append(time.perf_counter() - start)
+
+        peak_threads = max(peak_threads, fleet.peak_threads)
+
+    p50 = percentile(times, 50)
+
+    return {"size": size, "option": opt, "runs": runs,
+            "min": min(times), "p50": p50, "p99": percentile(times, 99),
+            "slaves_per_sec": size / p50, "peak_threads": peak_threads}
+
+
+def compare(results, baseline):
+
+    """Function:  compare
+
+    Description:  Print the results with the change in p50 latency from the
+        baseline.
+
+    Arguments:
+        (input) results -> List of result dictionaries
+        (input) baseline -> List of baseline result dictionaries
+
+    """
+
+    base = {(item["size"], item["option"]): item for item in baseline}
+    print(f'{"size":>6} {"opt":>4} {"p50 ms":>10} {"p99 ms":>10}'
+          f' {"slaves/s":>10} {"threads":>8} {"vs base":>8}')
+
+    for item in results:
+        old = base.get((item["size"], item["option"]))
+        change = f'{(item["p50"] / old["p50"] - 1) * 100:+7.1f}%' \
+            if old else "       -"
+        print(f'{item["size"]:>6} {item["option"]:>4}'
+              f' {item["p50"] * 1000:>10.2f} {item["p99"] * 1000:>10.2f}'
+              f' {item["slaves_per_sec"]:>10.0f} {item["peak_threads"]:>8}'
+              f' {change:>8}')
+
+
+def main():
+
+    """Function:  main
+
+    Description:  Process the command line and run the benchmarks.
+
+    Arguments:
+
+    """
+
+    parser = argparse.ArgumentParser(add_help=True)
+    parser.add_argument("-n", type=int, default=5)
+    parser.add_argument("-s", default="10,100,1000")
+    parser.add_argument("-l", type=float, default=0.001)
+    parser.add_argument("-j", type=float, default=0.0005)
+    parser.add_argument("-f", type=float, default=0.0)
+    parser.add_argument("-i", type=int, default=10)
+    parser.add_argument("-o")
+    parser.add_argument("-b", default=BASELINE)
+    parser.add_argument("-w", action="store_true")
+    opts = parser.parse_args()
+    results = []
+
+    for size in [int(size) for size in opts.s.split(",")]:
+        for opt in ["-B", "-D", "-F", "-G"]:
+            results.append(
+                bench(size, opt, opts.n, latency=opts.l, jitter=opts.j,
+                      fail_rate=opts.f, intervals=opts.i))
+
+    baseline = []
+
+    if os.path.isfile(opts.b):
+        with open(opts.b, encoding="UTF-8") as f_hdlr:
+            baseline = json.load(f_hdlr)
+
+    compare(results, baseline)
+
+    for out_file in [opts.o, opts.b if opts.w else None]:
+        if out_file:
+            with open(out_file, mode="w", encoding="UTF-8") as f_hdlr:
+                json.dump(results, f_hdlr, indent=4)
+                f_hdlr.write("\n")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
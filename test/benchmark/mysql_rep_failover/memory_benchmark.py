@@ -0,0 +1,203 @@
+# Classification (U)
+
+"""Program:  memory_benchmark.py
+
+    Description:  Memory benchmark of the GTID sets of a large replica
+        fleet in mysql_rep_failover.py.  Builds a GTID set string for each
+        replica, as held on each slave instance, and ranks the replicas with
+        order_slaves_on_gtid.  Records the memory of the strings and of the
+        slave list of GtidSet instances the ranking returns, as the sum of
+        the sizes of the objects they hold (objects shared between the
+        replicas, such as interned UUIDs, are counted once), the ranking
+        time and the peak resident memory of the process.  The memory of
+        the GTID sets held as dictionaries of lists of (start, end) tuples
+        (the previous GtidSet layout) is measured on a sample of the
+        replicas and scaled to the fleet size.
+
+    Usage:
+        test/benchmark/mysql_rep_failover/memory_benchmark.py
+            [-s size] [-u uuids] [-i intervals] [-n sample] [-o file]
+
+    Arguments:
+        -s size => Number of replicas in the fleet.  Default 10000.
+        -u uuids => Source UUIDs in each GTID set.  Default 3.
+        -i intervals => GTID intervals per source UUID.  Default 1000.
+        -n sample => Replicas measured with the tuple layout.  Default 100.
+        -o file => Write the results to a file in JSON format.
+
+    Notes:
+        Run from the base directory where mysql_rep_failover.py is located.
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import json
+import time
+import types
+import argparse
+import resource
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_failover                       # pylint:disable=E0401,C0413
+
+
+def fleet_gtids(size, uuids, intervals):
+
+    """Function:  fleet_gtids
+
+    Description:  Build the executed GTID set string of each replica.  The
+        sources have one transaction missing at the end of each interval, as
+        a parallel applier leaves, and each replica is a different number of
+        transactions behind in its last interval.
+
+    Arguments:
+        (input) size -> Number of replicas
+        (input) uuids -> Source UUIDs in each GTID set
+        (input) intervals -> GTID intervals per source UUID
+        (output) List of GTID set strings
+
+    """
+
+    heads = [f"{index:08x}-0000-11e1-9e33-c80aa9429562:" + "".join(
+        f"{pos * 1000 + 1}-{pos * 1000 + 999}:"
+        for pos in range(intervals - 1)) for index in range(uuids)]
+    last = (intervals - 1) * 1000 + 1
+
+    return [",".join(f"{head}{last}-{last + 998 - (pos * 7 + index) % 500}"
+                     for index, head in enumerate(heads))
+            for pos in range(size)]
+
+
+def footprint(obj, seen):
+
+    """Function:  footprint
+
+    Description:  Return the memory of an object and of the objects it holds
+        which have not been seen before.
+
+    Arguments:
+        (input) obj -> Object
+        (input) seen -> Set of the ids of the objects already counted
+        (output) size -> Memory in bytes
+
+    """
+
+    if id(obj) in seen:
+        return 0
+
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+
+    if isinstance(obj, dict):
+        size += sum(footprint(key, seen) + footprint(value, seen)
+                    for key, value in obj.items())
+
+    elif isinstance(obj, (list, tuple)):
+        size += sum(footprint(item, seen) for item in obj)
+
+    elif isinstance(obj, mysql_rep_failover.gtid_class.GtidSet):
+        size += footprint(obj.gtids, seen)
+
+    return size
+
+
+def bench(size, uuids, intervals, sample):
+
+    """Function:  bench
+
+    Description:  Measure the memory of the GTID sets of a fleet.
+
+    Arguments:
+        (input) size -> Number of replicas
+        (input) uuids -> Source UUIDs in each GTID set
+        (input) intervals -> GTID intervals per source UUID
+        (input) sample -> Replicas measured with the tuple layout
+        (output) Dictionary of the results
+
+    """
+
+    texts = fleet_gtids(size, uuids, intervals)
+    slaves = [types.SimpleNamespace(name=f"slave{pos:05d}", exe_gtidset=text)
+              for pos, text in enumerate(texts)]
+    sample = min(sample, size)
+    tuples = [mysql_rep_failover.gtid_class.GtidSet(text).intervals()
+              for text in texts[:sample]]
+    start = time.perf_counter()
+    slave_list = mysql_rep_failover.score_libs.order_slaves_on_gtid(slaves)
+    wall = time.perf_counter() - start
+
+    tuple_bytes = footprint(tuples, set()) - sys.getsizeof(tuples)
+
+    return {"size": size, "uuids": uuids, "intervals": intervals,
+            "strings": footprint(texts, set()) - sys.getsizeof(texts),
+            "tuples": tuple_bytes * size // sample,
+            "compact": footprint(slave_list, {id(slv) for slv in slaves}),
+            "ranking_secs": wall,
+            "max_rss": resource.getrusage(
+                resource.RUSAGE_SELF).ru_maxrss * 1024,
+            "best": slave_list[0][1].name}
+
+
+def show(result):
+
+    """Function:  show
+
+    Description:  Print the results.
+
+    Arguments:
+        (input) result -> Dictionary of the results
+
+    """
+
+    size = result["size"]
+    print(f'{size} replicas, {result["uuids"]} sources of'
+          f' {result["intervals"]} intervals each')
+    print(f'{"layout":<24} {"MiB":>10} {"KiB/replica":>12}')
+
+    for name, label in [("strings", "strings"),
+                        ("tuples", "tuples (scaled sample)"),
+                        ("compact", "GtidSet slave list"),
+                        ("max_rss", "peak resident memory")]:
+        print(f'{label:<24} {result[name] / 2 ** 20:>10.1f}'
+              f' {result[name] / size / 1024:>12.1f}')
+
+    print(f'ranking time {result["ranking_secs"]:.2f} s,'
+          f' best slave {result["best"]}')
+
+
+def main():
+
+    """Function:  main
+
+    Description:  Process the command line and run the benchmark.
+
+    Arguments:
+
+    """
+
+    parser = argparse.ArgumentParser(add_help=True)
+    parser.add_argument("-s", type=int, default=10000)
+    parser.add_argument("-u", type=int, default=3)
+    parser.add_argument("-i", type=int, default=1000)
+    parser.add_argument("-n", type=int, default=100)
+    parser.add_argument("-o")
+    opts = parser.parse_args()
+
+    result = bench(opts.s, opts.u, opts.i, opts.n)
+    show(result)
+
+    if opts.o:
+        with open(opts.o, mode="w", encoding="UTF-8") as f_hdlr:
+            json.dump(result, f_hdlr, indent=4)
+            f_hdlr.write("\n")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
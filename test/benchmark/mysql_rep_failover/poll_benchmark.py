@@ -0,0 +1,160 @@
+# Classification (U)
+
+"""Program:  poll_benchmark.py
+
+    Description:  Repeated poll benchmark of the GTID set refresh in
+        mysql_rep_failover.py, as done by the supervisor mode, the drain
+        wait and the convergence check.  The executed GTID sets of a
+        simulated replica fleet (see sim_fleet.py) are polled a number of
+        times with new transactions applied between the polls, once with
+        full reads of the sets and once with a GTID tracker.  For each GTID
+        set size it records the bytes the slaves send and the CPU time of
+        the program for each poll, and the number of full, incremental and
+        unchanged reads of the tracker.  The CPU time includes the GtidSet
+        the program makes of each executed set to rank or compare the
+        slaves.
+
+    Usage:
+        test/benchmark/mysql_rep_failover/poll_benchmark.py
+            [-n polls] [-s size] [-u uuids] [-i intervals] [-a count]
+            [-o file]
+
+    Arguments:
+        -n polls => Number of polls.  Default 20.
+        -s size => Number of slaves in the fleet.  Default 100.
+        -u uuids => Source UUIDs in each GTID set.  Default 3.
+        -i intervals => Comma separated GTID intervals per source UUID.
+            Default 10,100,1000.
+        -a count => Transactions applied on each slave between the polls.
+            Default 10.
+        -o file => Write the results to a file in JSON format.
+
+    Notes:
+        Run from the base directory where mysql_rep_failover.py is located.
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import json
+import time
+import argparse
+
+# Local
+sys.path.append(os.getcwd())
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import mysql_rep_failover                       # pylint:disable=E0401,C0413
+import sim_fleet                           # pylint:disable=E0401,C0413,C0411
+
+
+def bench(intervals, mode, **kwargs):
+
+    """Function:  bench
+
+    Description:  Poll the executed GTID sets of a fleet a number of times.
+
+    Arguments:
+        (input) intervals -> GTID intervals per source UUID
+        (input) mode -> full or tracked
+        (input) kwargs:
+            polls -> Number of polls
+            size -> Number of slaves in the fleet
+            uuids -> Source UUIDs in each GTID set
+            count -> Transactions applied between the polls
+        (output) Dictionary of the results
+
+    """
+
+    fleet = sim_fleet.SimFleet(
+        kwargs["size"], latency=0, jitter=0, handshake=0,
+        uuids=kwargs["uuids"], intervals=intervals)
+    slaves = fleet.create_slv_array(fleet.cfg_array())
+    tracker = mysql_rep_failover.gtid_class.GtidTracker() \
+        if mode == "tracked" else None
+    cpu = 0.0
+    fleet.bytes_sent = 0
+
+    for _ in range(kwargs["polls"]):
+        fleet.apply(slaves, kwargs["count"])
+        start = time.process_time()
+
+        for slv in slaves:
+            mysql_rep_failover.probe_libs.probe_slave(
+                slv, ["exe_gtidset"], tracker=tracker)
+
+        cpu += time.process_time() - start
+
+    polls = kwargs["polls"]
+
+    return {"intervals": intervals, "mode": mode, "polls": polls,
+            "set_bytes": len(str(slaves[0].exe_gtidset)),
+            "bytes_per_poll": fleet.bytes_sent / polls,
+            "cpu_ms_per_poll": cpu / polls * 1000,
+            "reads": dict(tracker.stats) if tracker else None}
+
+
+def compare(results):
+
+    """Function:  compare
+
+    Description:  Print the results with the change from full reads.
+
+    Arguments:
+        (input) results -> List of result dictionaries
+
+    """
+
+    full = {item["intervals"]: item
+            for item in results if item["mode"] == "full"}
+    print(f'{"intervals":>9} {"mode":>8} {"set bytes":>10}'
+          f' {"bytes/poll":>11} {"cpu ms/poll":>12} {"vs full":>8}'
+          f'  reads')
+
+    for item in results:
+        base = full[item["intervals"]]
+        change = (item["cpu_ms_per_poll"] / base["cpu_ms_per_poll"] - 1) \
+            * 100 if base["cpu_ms_per_poll"] else 0.0
+        print(f'{item["intervals"]:>9} {item["mode"]:>8}'
+              f' {item["set_bytes"]:>10} {item["bytes_per_poll"]:>11.0f}'
+              f' {item["cpu_ms_per_poll"]:>12.3f} {change:>+7.1f}%'
+              f'  {item["reads"] or "-"}')
+
+
+def main():
+
+    """Function:  main
+
+    Description:  Process the command line and run the benchmarks.
+
+    Arguments:
+
+    """
+
+    parser = argparse.ArgumentParser(add_help=True)
+    parser.add_argument("-n", type=int, default=20)
+    parser.add_argument("-s", type=int, default=100)
+    parser.add_argument("-u", type=int, default=3)
+    parser.add_argument("-i", default="10,100,1000")
+    parser.add_argument("-a", type=int, default=10)
+    parser.add_argument("-o")
+    opts = parser.parse_args()
+
+    results = [bench(int(intervals), mode, polls=opts.n, size=opts.s,
+                     uuids=opts.u, count=opts.a)
+               for intervals in opts.i.split(",")
+               for mode in ["full", "tracked"]]
+    compare(results)
+
+    if opts.o:
+        with open(opts.o, mode="w", encoding="UTF-8") as f_hdlr:
+            json.dump(results, f_hdlr, indent=4)
+            f_hdlr.write("\n")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
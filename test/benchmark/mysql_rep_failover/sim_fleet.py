@@ -0,0 +1,487 @@
+# Classification (U)
+
+"""Program:  sim_fleet.py
+
+    Description:  In-process simulated replica fleet for benchmarking
+        mysql_rep_failover.py.  Provides stand-ins for mysql_class.SlaveRep
+        and mysql_class.MasterRep, and for the mysql_libs and gen_libs
+        functions that talk to the database servers or read the slave
+        configuration file, with configurable latency, jitter, failures and
+        GTID set sizes.
+
+    Classes:
+        SimSlave
+        SimMaster
+        SimFleet
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import re
+import asyncio
+import hashlib
+import random
+import threading
+import time
+import types
+
+# Local
+import gtid_class                                   # pylint:disable=E0401
+
+
+class SimSlave():                                # pylint:disable=R0902,R0903
+
+    """Class:  SimSlave
+
+    Description:  Stand-in for mysql_class.SlaveRep with a simulated round
+        trip time on each server call.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self, fleet, entry):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) fleet -> SimFleet instance
+            (input) entry -> Slave configuration dictionary
+
+        """
+
+        self.fleet = fleet
+        self.name = entry["name"]
+        self.server_id = entry["sid"]
+        self.sql_user = entry["user"]
+        self.sql_pass = entry["japd"]
+        self.machine = entry["serv_os"]
+        self.host = entry["host"]
+        self.port = entry["port"]
+        self.defaults_file = entry["cfg_file"]
+        self.extra_def_file = entry["extra_def_file"]
+        self.conn = None
+        self.conn_msg = None
+        self.gtid_mode = True
+        self.exe_gtidset = fleet.gtids[self.name]
+        self.last_applied = fleet.last_transactions(self.exe_gtidset)
+        self.retrieved_gtidset = None
+        self.source = ("10.0.0.0", 3306)
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Answer the status queries issued by the program with
+            the columns named in the query.  The size of the values sent is
+            added to the fleet.
+
+        Arguments:
+            (input) cmd -> SQL command
+            (output) List of dictionaries of the results
+
+        """
+
+        self.fleet.round_trip()
+        values = {"status": 0, "gtid_mode": "ON",
+                  "exe_gtidset": self.exe_gtidset,
+                  "exe_gtidset_last": self.last_applied,
+                  "retrieved_gtidset": self.retrieved_gtidset,
+                  "retrieved_gtidset_last": None, "lag": 0,
+                  "apply_rate": 1000.0, "io_running": "ON",
+                  "sql_running": "ON", "source_host": self.source[0],
+                  "source_port": str(self.source[1])}
+        row = {}
+
+        for name in re.findall(r" AS (\w+)", cmd):
+            if name.endswith("_digest"):
+                row[name] = self.fleet.digest(values.get(name[:-7]))
+
+            else:
+                row[name] = values.get(name)
+
+        self.fleet.sent(row)
+
+        return [row]
+
+
+class SimMaster():                               # pylint:disable=R0902,R0903
+
+    """Class:  SimMaster
+
+    Description:  Stand-in for mysql_class.MasterRep.
+
+    Methods:
+        __init__
+        connect
+        col_sql
+
+    """
+
+    def __init__(                                       # pylint:disable=R0913
+            self, fleet, name, server_id, sql_user, sql_pass, machine,
+            **kwargs):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) fleet -> SimFleet instance
+            (input) name
+            (input) server_id
+            (input) sql_user
+            (input) sql_pass
+            (input) machine
+            (input) kwargs:
+                host, port, defaults_file, extra_def_file, rep_user, rep_japd
+
+        """
+
+        self.fleet = fleet
+        self.name = name
+        self.server_id = server_id
+        self.sql_user = sql_user
+        self.sql_pass = sql_pass
+        self.machine = machine
+        self.host = kwargs.get("host")
+        self.port = kwargs.get("port")
+        self.rep_user = kwargs.get("rep_user")
+        self.rep_japd = kwargs.get("rep_japd")
+        self.exe_gtid = None
+        self.conn = None
+        self.conn_msg = None
+
+    def connect(self):
+
+        """Method:  connect
+
+        Description:  Simulate the connection handshake.
+
+        Arguments:
+
+        """
+
+        self.fleet.round_trip(handshake=True)
+
+    def col_sql(self, cmd):                             # pylint:disable=W0613
+
+        """Method:  col_sql
+
+        Description:  Answer the executed set query of the new master.
+
+        Arguments:
+            (input) cmd -> SQL command
+            (output) List of dictionaries of the results
+
+        """
+
+        self.fleet.round_trip()
+
+        return [{"gtid_executed": self.exe_gtid}]
+
+
+class SimFleet():                                     # pylint:disable=R0902
+
+    """Class:  SimFleet
+
+    Description:  Simulated replica fleet.  Each slave is given a GTID set
+        of a number of source UUIDs with a number of intervals each.  The
+        first slave holds every transaction, the other slaves are missing a
+        random number of the latest transactions.
+
+    Methods:
+        __init__
+        round_trip
+        sent
+        digest
+        last_transactions
+        apply
+        open_connection
+        cfg_array
+        create_slv_array
+        switch_to_master
+        find_name
+        disconnect
+        master_rep
+
+    """
+
+    def __init__(self, size, **kwargs):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) size -> Number of slaves in the fleet
+            (input) kwargs:
+                latency -> Round trip time in seconds
+                jitter -> Maximum random extra round trip time in seconds
+                handshake -> Connection handshake time in round trips
+                fail_rate -> Fraction of slaves that fail to connect
+                uuids -> Number of source UUIDs in each GTID set
+                intervals -> Number of intervals for each UUID
+                seed -> Random seed
+
+        """
+
+        self.bytes_sent = 0
+        self.digests = {}
+
+        self.size = size
+        self.latency = kwargs.get("latency", 0.001)
+        self.jitter = kwargs.get("jitter", 0.0005)
+        self.handshake = kwargs.get("handshake", 3)
+        self.fail_rate = kwargs.get("fail_rate", 0.0)
+        self.random = random.Random(kwargs.get("seed", 1))
+        self.lock = threading.Lock()
+        self.peak_threads = threading.active_count()
+        self.names = [f"slave{index:04d}" for index in range(size)]
+        self.failed = {name for name in self.names[1:]
+                       if self.random.random() < self.fail_rate}
+        uuids = [f"{index:08x}-0000-11e1-9e33-c80aa9429562"
+                 for index in range(kwargs.get("uuids", 3))]
+        intervals = kwargs.get("intervals", 10)
+        self.gtids = {}
+
+        for pos, name in enumerate(self.names):
+            behind = 0 if pos == 0 else self.random.randint(0, 50)
+            parts = []
+
+            for uuid in uuids:
+                ranges = [f"{i * 100 + 1}-{i * 100 + 90}"
+                          for i in range(intervals - 1)]
+                last = (intervals - 1) * 100 + 1
+                ranges.append(f"{last}-{last + 1000 - behind}")
+                parts.append(uuid + ":" + ":".join(ranges))
+
+            self.gtids[name] = ",".join(parts)
+
+    def round_trip(self, handshake=False):
+
+        """Method:  round_trip
+
+        Description:  Sleep for one simulated round trip time, or for the
+            connection handshake time.  Records the peak number of threads.
+
+        Arguments:
+            (input) handshake -> True|False - Simulate a handshake
+
+        """
+
+        with self.lock:
+            jitter = self.random.uniform(0, self.jitter)
+            self.peak_threads = max(
+                self.peak_threads, threading.active_count())
+
+        trips = self.handshake if handshake else 1
+        time.sleep(trips * self.latency + jitter)
+
+    def sent(self, row):
+
+        """Method:  sent
+
+        Description:  Add the size of the values of a result row to the bytes
+            sent by the fleet.
+
+        Arguments:
+            (input) row -> Dictionary of the result row
+
+        """
+
+        with self.lock:
+            self.bytes_sent += sum(
+                len(str(value)) for value in row.values() if value is not None)
+
+    def digest(self, gtids):
+
+        """Method:  digest
+
+        Description:  Digest of a GTID set as the server returns it (SHA-256
+            of the set without newlines, None for an empty set).  The
+            digests are kept, as a server keeps its GTID set.
+
+        Arguments:
+            (input) gtids -> GTID set string
+            (output) SHA-256 hex digest or None
+
+        """
+
+        text = str(gtids or "").replace("\n", "")
+
+        if text and text not in self.digests:
+            self.digests[text] = hashlib.sha256(text.encode()).hexdigest()
+
+        return self.digests.get(text)
+
+    @staticmethod
+    def last_transactions(gtids):
+
+        """Method:  last_transactions
+
+        Description:  Last transaction of each source of a GTID set, as the
+            applier workers of a slave report it.
+
+        Arguments:
+            (input) gtids -> GTID set string
+            (output) GTID set string of the last transactions
+
+        """
+
+        return ",".join(
+            f"{uuid}:{bounds[-1]}"
+            for uuid, bounds in gtid_class.GtidSet(gtids).gtids.items())
+
+    def apply(self, slaves, count):
+
+        """Method:  apply
+
+        Description:  Apply a number of new transactions of the first source
+            on the slaves, as between two polls.
+
+        Arguments:
+            (input) slaves -> List of SimSlave instances
+            (input) count -> Number of transactions
+
+        """
+
+        for slv in slaves:
+            gtids = gtid_class.GtidSet(slv.exe_gtidset)
+            uuid = sorted(gtids.gtids)[0]
+            end = gtids.gtids[uuid][-1]
+            gtids.gtids[uuid][-1] = end + count
+            slv.exe_gtidset = str(gtids)
+            slv.last_applied = f"{uuid}:{end + count}"
+            self.digest(slv.exe_gtidset)
+
+    async def open_connection(self, host, port):     # pylint:disable=W0613
+
+        """Method:  open_connection
+
+        Description:  Stand-in for asyncio.open_connection.  Simulates the
+            TCP handshake of one round trip.
+
+        Arguments:
+            (input) host -> Host name
+            (input) port -> Port number
+            (output) (reader, writer) stand-ins
+
+        """
+
+        await asyncio.sleep(self.latency)
+
+        return None, types.SimpleNamespace(close=lambda: None)
+
+    def cfg_array(self, *args, **kwargs):               # pylint:disable=W0613
+
+        """Method:  cfg_array
+
+        Description:  Stand-in for gen_libs.create_cfg_array.
+
+        Arguments:
+            (output) List of slave configuration dictionaries
+
+        """
+
+        return [{"name": name, "sid": pos + 1, "user": "user", "japd": "japd",
+                 "rep_user": "rep", "rep_japd": "rep_japd",
+                 "host": f"10.0.{pos // 250}.{pos % 250 + 1}", "port": 3306,
+                 "cfg_file": None, "serv_os": "Linux",
+                 "extra_def_file": None}
+                for pos, name in enumerate(self.names)]
+
+    def create_slv_array(self, cfg_array):
+
+        """Method:  create_slv_array
+
+        Description:  Stand-in for mysql_libs.create_slv_array.
+
+        Arguments:
+            (input) cfg_array -> List of slave configuration dictionaries
+            (output) List of SimSlave instances
+
+        """
+
+        slaves = []
+
+        for entry in cfg_array:
+            self.round_trip(handshake=True)
+            slv = SimSlave(self, entry)
+
+            if slv.name in self.failed:
+                slv.conn_msg = "Can't connect to MySQL server"
+
+            slaves.append(slv)
+
+        return slaves
+
+    def switch_to_master(self, master, slave):
+
+        """Method:  switch_to_master
+
+        Description:  Stand-in for mysql_libs.switch_to_master.  Simulates
+            stop slave, change master and start slave round trips, after
+            which the slave replicates from and has caught up with the new
+            master.
+
+        Arguments:
+            (input) master -> SimMaster instance
+            (input) slave -> SimSlave instance
+            (output) Status flag
+
+        """
+
+        for _ in range(3):
+            self.round_trip()
+
+        slave.source = (master.host, master.port)
+        slave.exe_gtidset = master.exe_gtid
+        slave.last_applied = self.last_transactions(master.exe_gtid)
+
+        return 0
+
+    @staticmethod
+    def find_name(slaves, name):
+
+        """Method:  find_name
+
+        Description:  Stand-in for mysql_libs.find_name.
+
+        Arguments:
+            (input) slaves -> List of SimSlave instances
+            (input) name -> Name of the slave
+            (output) SimSlave instance or None
+
+        """
+
+        return next((slv for slv in slaves if slv.name == name), None)
+
+    def disconnect(self, *args):                        # pylint:disable=W0613
+
+        """Method:  disconnect
+
+        Description:  Stand-in for mysql_libs.disconnect.
+
+        Arguments:
+
+        """
+
+    def master_rep(self, *args, **kwargs):
+
+        """Method:  master_rep
+
+        Description:  Stand-in for the mysql_class.MasterRep class.
+
+        Arguments:
+            (output) SimMaster instance
+
+        """
+
+        return SimMaster(self, *args, **kwargs)
@@ -0,0 +1,248 @@
+# Classification (U)
+
+"""Program:  startup_benchmark.py
+
+    Description:  Startup benchmark of mysql_rep_failover.py for each command
+        path (-v, -h, -B, -D, -F, -G and -F -P).  Each run is a new Python
+        process which imports mysql_rep_failover and runs main for the path,
+        with the commands run against a simulated replica fleet (see
+        sim_fleet.py).  For each path it records the wall time of the
+        process, the time to import the program, the time in main until
+        the command is dispatched (or until done for -v and -h), the time
+        to import the database stack for the command, and the library
+        modules imported by the time the command is dispatched, and
+        compares them against a saved baseline.
+
+    Usage:
+        test/benchmark/mysql_rep_failover/startup_benchmark.py
+            [-n runs] [-p=paths] [-s size] [-o file] [-b file] [-w]
+
+    Arguments:
+        -n runs => Number of runs for each path.  Default 10.
+        -p=paths => Comma separated command paths, given with = as the
+            paths start with a dash.  Default -v,-h,-B,-D,-F,-G,-F -P.
+        -s size => Simulated fleet size for the commands.  Default 10.
+        -o file => Write the results to a file in JSON format.
+        -b file => Baseline file to compare the results against.  Default
+            test/benchmark/mysql_rep_failover/startup_baseline.json.
+        -w => Write the results as the new baseline.
+
+    Notes:
+        Run from the base directory where mysql_rep_failover.py is located.
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import io
+import json
+import time
+import argparse
+import contextlib
+import subprocess
+
+BASELINE = "test/benchmark/mysql_rep_failover/startup_baseline.json"
+
+# Library modules tracked on each command path.
+STACK = ("lib.gen_libs", "lib.gen_class", "mysql_lib.mysql_libs",
+         "mysql_lib.mysql_class", "mysql.connector")
+
+# Modules of the database stack.
+DB_STACK = ("mysql_lib.mysql_libs", "mysql_lib.mysql_class",
+            "mysql.connector")
+
+
+def child(path, size):
+
+    """Function:  child
+
+    Description:  Import the program and run main for one command path in
+        this process and print the timings as JSON.
+
+    Arguments:
+        (input) path -> Command path, such as -B or -F -P
+        (input) size -> Simulated fleet size for the commands
+
+    """
+
+    timings = {"import": None, "main": None, "stack": None, "modules": []}
+    start = time.perf_counter()
+
+    import mysql_rep_failover           # pylint:disable=E0401,C0415,C0413
+
+    timings["import"] = time.perf_counter() - start
+    run_program = mysql_rep_failover.run_program
+
+    def _dispatch(args, func_dict, **kwargs):
+        timings["main"] = time.perf_counter() - started
+        timings["modules"] = [name for name in STACK if name in sys.modules]
+        sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+        import failover_benchmark       # pylint:disable=E0401,C0415,C0413
+        import sim_fleet                # pylint:disable=E0401,C0415,C0413
+
+        loading = time.perf_counter()
+
+        with failover_benchmark.simulated(sim_fleet.SimFleet(size)):
+            timings["stack"] = time.perf_counter() - loading
+            run_program(args, func_dict, **kwargs)
+
+    sys.argv = ["mysql_rep_failover.py", "-s", "slaves.txt", "-d", "config"] \
+        + path.split()
+
+    if "-G" in sys.argv:
+        sys.argv.insert(sys.argv.index("-G") + 1, f"slave{size - 1:04d}")
+
+    started = time.perf_counter()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        mysql_rep_failover.run_program = _dispatch
+        mysql_rep_failover.main()
+
+    if timings["main"] is None:
+        timings["main"] = time.perf_counter() - started
+        timings["modules"] = [name for name in STACK if name in sys.modules]
+
+    print(json.dumps(timings))
+
+
+def percentile(values, pct):
+
+    """Function:  percentile
+
+    Description:  Nearest rank percentile of a list of values.
+
+    Arguments:
+        (input) values -> List of numbers
+        (input) pct -> Percentile between 0 and 100
+        (output) Value at the percentile or None if there are no values
+
+    """
+
+    values = sorted(value for value in values if value is not None)
+
+    if not values:
+        return None
+
+    index = max(0, min(len(values) - 1,
+                       int(round(pct / 100.0 * len(values) + 0.5)) - 1))
+
+    return values[index]
+
+
+def bench(path, runs, size):
+
+    """Function:  bench
+
+    Description:  Run a command path in a new Python process a number of
+        times.
+
+    Arguments:
+        (input) path -> Command path
+        (input) runs -> Number of runs
+        (input) size -> Simulated fleet size for the commands
+        (output) Dictionary of the results
+
+    """
+
+    walls = []
+    runs_timings = []
+
+    for _ in range(runs):
+        start = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), f"--child={path}",
+             "-s", str(size)],
+            capture_output=True, text=True, check=True)
+        walls.append(time.perf_counter() - start)
+        runs_timings.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+
+    modules = runs_timings[-1]["modules"]
+
+    return {"path": path, "runs": runs, "wall": percentile(walls, 50),
+            "import": percentile([item["import"] for item in runs_timings],
+                                 50),
+            "main": percentile([item["main"] for item in runs_timings], 50),
+            "stack": percentile([item["stack"] for item in runs_timings],
+                                50),
+            "modules": modules,
+            "db_stack": any(name in modules for name in DB_STACK)}
+
+
+def compare(results, baseline):
+
+    """Function:  compare
+
+    Description:  Print the results with the change in wall time from the
+        baseline.
+
+    Arguments:
+        (input) results -> List of result dictionaries
+        (input) baseline -> List of baseline result dictionaries
+
+    """
+
+    base = {item["path"]: item for item in baseline}
+    print(f'{"path":>6} {"wall ms":>9} {"import ms":>10} {"main ms":>9}'
+          f' {"stack ms":>9} {"db stack":>9} {"vs base":>8}')
+
+    for item in results:
+        old = base.get(item["path"])
+        change = f'{(item["wall"] / old["wall"] - 1) * 100:+7.1f}%' \
+            if old else "       -"
+        stack = f'{item["stack"] * 1000:>9.2f}' \
+            if item["stack"] is not None else f'{"-":>9}'
+        print(f'{item["path"]:>6} {item["wall"] * 1000:>9.2f}'
+              f' {item["import"] * 1000:>10.2f} {item["main"] * 1000:>9.2f}'
+              f' {stack} {"yes" if item["db_stack"] else "no":>9}'
+              f' {change:>8}')
+
+
+def main():
+
+    """Function:  main
+
+    Description:  Process the command line and run the benchmarks.
+
+    Arguments:
+
+    """
+
+    parser = argparse.ArgumentParser(add_help=True)
+    parser.add_argument("-n", type=int, default=10)
+    parser.add_argument("-p", default="-v,-h,-B,-D,-F,-G,-F -P")
+    parser.add_argument("-s", type=int, default=10)
+    parser.add_argument("-o")
+    parser.add_argument("-b", default=BASELINE)
+    parser.add_argument("-w", action="store_true")
+    parser.add_argument("--child")
+    opts = parser.parse_args()
+
+    if opts.child:
+        sys.path.insert(0, os.getcwd())
+        child(opts.child, opts.s)
+        return 0
+
+    results = [bench(path, opts.n, opts.s) for path in opts.p.split(",")]
+    baseline = []
+
+    if os.path.isfile(opts.b):
+        with open(opts.b, encoding="UTF-8") as f_hdlr:
+            baseline = json.load(f_hdlr)
+
+    compare(results, baseline)
+
+    for out_file in [opts.o, opts.b if opts.w else None]:
+        if out_file:
+            with open(out_file, mode="w", encoding="UTF-8") as f_hdlr:
+                json.dump(results, f_hdlr, indent=4)
+                f_hdlr.write("\n")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
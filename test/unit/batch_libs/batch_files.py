@@ -0,0 +1,134 @@
+# Classification (U)
+
+"""Program:  batch_files.py
+
+    Description:  Unit testing of batch_files in batch_libs.py.
+
+    Usage:
+        test/unit/batch_libs/batch_files.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import shutil
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import batch_libs                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_cfg_path
+        test_directory
+        test_no_batch
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg_path = "test/unit/batch_libs/tmp"
+        self.batch_dir = os.path.join(self.cfg_path, "batch")
+        os.makedirs(self.batch_dir, exist_ok=True)
+
+        for name in ["set2.txt", "set1.txt", "slave.txt.TEMPLATE"]:
+            with open(os.path.join(self.batch_dir, name), mode="w",
+                      encoding="UTF-8"):
+                pass
+
+        self.files = [os.path.abspath(os.path.join(self.batch_dir, name))
+                      for name in ["set1.txt", "set2.txt"]]
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.cfg_path)
+
+    def test_cfg_path(self):
+
+        """Function:  test_cfg_path
+
+        Description:  Test with a directory under the config path.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            batch_libs.batch_files("batch", self.cfg_path), self.files)
+
+    def test_directory(self):
+
+        """Function:  test_directory
+
+        Description:  Test with a directory of slave config files.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            batch_libs.batch_files(self.batch_dir), self.files)
+
+    def test_no_batch(self):
+
+        """Function:  test_no_batch
+
+        Description:  Test with no batch.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(batch_libs.batch_files(None), [])
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            batch_libs.batch_files("set1.txt, set2.txt"),
+            ["set1.txt", "set2.txt"])
+
+
+if __name__ == "__main__":
+    unittest.main()
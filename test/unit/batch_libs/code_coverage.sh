@@ -0,0 +1,19 @@
+#!/bin/bash
+# Unit test code coverage for library module.
+# This will run the Python code coverage module against all unit test modules.
+# This will show the amount of code that was tested and which lines of code
+#   that was skipped during the test.
+
+coverage erase
+
+echo ""
+echo "Running unit test modules in conjunction with coverage"
+coverage run -a --source=batch_libs test/unit/batch_libs/batch_files.py
+coverage run -a --source=batch_libs test/unit/batch_libs/run_batch.py
+coverage run -a --source=batch_libs test/unit/batch_libs/run_set.py
+coverage run -a --source=batch_libs test/unit/batch_libs/set_lock_id.py
+
+echo ""
+echo "Producing code coverage report"
+coverage combine
+coverage report -m
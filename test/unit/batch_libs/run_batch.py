@@ -0,0 +1,271 @@
+# Classification (U)
+
+"""Program:  run_batch.py
+
+    Description:  Unit testing of run_batch in batch_libs.py.
+
+    Usage:
+        test/unit/batch_libs/run_batch.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import io
+import concurrent.futures
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import batch_libs                               # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_args_keys
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_args_keys(self):
+
+        """Method:  get_args_keys
+
+        Description:  Method stub holder for gen_class.ArgParser.get_args_keys.
+
+        Arguments:
+
+        """
+
+        return list(self.args_array.keys())
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+def run_set(args, func_dict, run_func, slv_file,        # pylint:disable=W0613
+            **kwargs):
+
+    """Function:  run_set
+
+    Description:  Stub holder for batch_libs.run_set function.
+
+    Arguments:
+
+    """
+
+    status = "Failed" if "fail" in slv_file else "Success"
+
+    return f"Output {slv_file}\n", {"slave_file": slv_file, "status": status}
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_max_workers
+        test_default_workers
+        test_report
+        test_set_failed
+        test_no_files
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.args.args_array = {"-m": "BatchDir", "-d": "CfgDir", "-B": True}
+        self.func_dict = {"-B": "show_best_slave", "-D": "show_slave_delays"}
+        self.slv_files = ["set1.txt", "set2.txt"]
+        self.run_func = mock.Mock()
+
+    @mock.patch("batch_libs.concurrent.futures.ProcessPoolExecutor")
+    @mock.patch("batch_libs.run_set", mock.Mock(side_effect=run_set))
+    @mock.patch("batch_libs.batch_files")
+    def test_max_workers(self, mock_files, mock_pool):
+
+        """Function:  test_max_workers
+
+        Description:  Test the processes are limited to the -q option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-q"] = "1"
+        mock_files.return_value = self.slv_files
+        mock_pool.return_value = concurrent.futures.ThreadPoolExecutor(1)
+
+        with gen_libs.no_std_out():
+            batch_libs.run_batch(self.args, self.func_dict, self.run_func)
+
+        mock_pool.assert_called_once_with(max_workers=1)
+
+    @mock.patch("batch_libs.concurrent.futures.ProcessPoolExecutor")
+    @mock.patch("batch_libs.run_set", mock.Mock(side_effect=run_set))
+    @mock.patch("batch_libs.batch_files")
+    def test_default_workers(self, mock_files, mock_pool):
+
+        """Function:  test_default_workers
+
+        Description:  Test with a process for each replication set.
+
+        Arguments:
+
+        """
+
+        mock_files.return_value = self.slv_files
+        mock_pool.return_value = concurrent.futures.ThreadPoolExecutor(2)
+
+        with gen_libs.no_std_out():
+            batch_libs.run_batch(self.args, self.func_dict, self.run_func)
+
+        mock_pool.assert_called_once_with(max_workers=2)
+
+    @mock.patch("batch_libs.concurrent.futures.ProcessPoolExecutor",
+                concurrent.futures.ThreadPoolExecutor)
+    @mock.patch("batch_libs.run_set", mock.Mock(side_effect=run_set))
+    @mock.patch("batch_libs.batch_files")
+    @mock.patch("batch_libs.report_libs.write_report")
+    def test_report(self, mock_report, mock_files):
+
+        """Function:  test_report
+
+        Description:  Test with the combined timing report.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-r"] = True
+        mock_files.return_value = self.slv_files
+
+        with gen_libs.no_std_out():
+            batch_libs.run_batch(self.args, self.func_dict, self.run_func)
+
+        self.assertEqual(len(mock_report.call_args[0][0]["sets"]), 2)
+
+    @mock.patch("batch_libs.concurrent.futures.ProcessPoolExecutor",
+                concurrent.futures.ThreadPoolExecutor)
+    @mock.patch("batch_libs.run_set", mock.Mock(side_effect=run_set))
+    @mock.patch("batch_libs.batch_files")
+    def test_set_failed(self, mock_files):
+
+        """Function:  test_set_failed
+
+        Description:  Test with a replication set that failed.
+
+        Arguments:
+
+        """
+
+        mock_files.return_value = ["set1.txt", "fail.txt"]
+
+        with gen_libs.no_std_out():
+            report = batch_libs.run_batch(
+                self.args, self.func_dict, self.run_func)
+
+        self.assertEqual(
+            report["status"], "Replication sets failed: ['fail.txt']")
+
+    @mock.patch("batch_libs.batch_files")
+    def test_no_files(self, mock_files):
+
+        """Function:  test_no_files
+
+        Description:  Test with no slave config files in the batch.
+
+        Arguments:
+
+        """
+
+        mock_files.return_value = []
+
+        with gen_libs.no_std_out():
+            report = batch_libs.run_batch(
+                self.args, self.func_dict, self.run_func)
+
+        self.assertEqual(
+            report["status"], "No slave config files found for: BatchDir")
+
+    @mock.patch("batch_libs.concurrent.futures.ProcessPoolExecutor",
+                concurrent.futures.ThreadPoolExecutor)
+    @mock.patch("batch_libs.run_set", mock.Mock(side_effect=run_set))
+    @mock.patch("batch_libs.batch_files")
+    def test_default(self, mock_files):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        mock_files.return_value = self.slv_files
+
+        with mock.patch("sys.stdout", new_callable=io.StringIO) as mock_out:
+            report = batch_libs.run_batch(
+                self.args, self.func_dict, self.run_func)
+
+        self.assertEqual(report["status"], "Success")
+        self.assertEqual(report["commands"], ["-B"])
+        self.assertEqual(
+            mock_out.getvalue().splitlines(),
+            ["Replication set: set1.txt", "Output set1.txt",
+             "Replication set: set2.txt", "Output set2.txt"])
+
+
+if __name__ == "__main__":
+    unittest.main()
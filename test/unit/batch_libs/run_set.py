@@ -0,0 +1,186 @@
+# Classification (U)
+
+"""Program:  run_set.py
+
+    Description:  Unit testing of run_set in batch_libs.py.
+
+    Usage:
+        test/unit/batch_libs/run_set.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import batch_libs                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_args_keys
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_args_keys(self):
+
+        """Method:  get_args_keys
+
+        Description:  Method stub holder for gen_class.ArgParser.get_args_keys.
+
+        Arguments:
+
+        """
+
+        return list(self.args_array.keys())
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_lock
+        test_exception
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.args.args_array = {"-m": "BatchDir", "-d": "CfgDir", "-B": True,
+                                "-r": True, "-y": "Flavor"}
+        self.func_dict = {"-B": "show_best_slave"}
+        self.run_func = mock.Mock()
+
+    @mock.patch("batch_libs.set_lock_id",
+                mock.Mock(return_value="Flavor_set1.txt_0123"))
+    @mock.patch("batch_libs.gen_class.ProgramLock")
+    def test_lock(self, mock_lock):
+
+        """Function:  test_lock
+
+        Description:  Test with a lock in place for the replication set.
+
+        Arguments:
+
+        """
+
+        mock_lock.side_effect = \
+            batch_libs.gen_class.SingleInstanceException
+
+        output, report = batch_libs.run_set(
+            self.args, self.func_dict, self.run_func, "config/set1.txt")
+
+        self.assertEqual(
+            output, "WARNING:  Lock in place for mysql_rep_failover with id:"
+            " Flavor_set1.txt_0123\n")
+        self.assertEqual(report["status"], "Lock in place")
+
+    @mock.patch("batch_libs.gen_class.ProgramLock",
+                mock.Mock(return_value=True))
+    def test_exception(self):
+
+        """Function:  test_exception
+
+        Description:  Test with an exception raised by the set.
+
+        Arguments:
+
+        """
+
+        self.run_func.side_effect = ValueError("Bad config")
+
+        output, report = batch_libs.run_set(
+            self.args, self.func_dict, self.run_func, "config/set1.txt")
+
+        self.assertEqual(output, "Error:  Bad config\n")
+        self.assertEqual(report, {"slave_file": "config/set1.txt",
+                                  "status": "Bad config"})
+
+    @mock.patch("batch_libs.set_lock_id",
+                mock.Mock(return_value="Flavor_set1.txt_0123"))
+    @mock.patch("batch_libs.gen_class.ProgramLock")
+    def test_default(self, mock_lock):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        self.run_func.return_value = {"status": "Success"}
+
+        self.assertEqual(
+            batch_libs.run_set(
+                self.args, self.func_dict, self.run_func, "config/set1.txt"),
+            ("", {"status": "Success"}))
+
+        set_args = self.run_func.call_args[0][0]
+        self.assertEqual(
+            set_args.args_array,
+            {"-d": "CfgDir", "-B": True, "-y": "Flavor",
+             "-s": "config/set1.txt"})
+        self.assertEqual(mock_lock.call_args[0][1], "Flavor_set1.txt_0123")
+        self.assertIn("-m", self.args.args_array)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+# Classification (U)
+
+"""Program:  set_lock_id.py
+
+    Description:  Unit testing of set_lock_id in batch_libs.py.
+
+    Usage:
+        test/unit/batch_libs/set_lock_id.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import batch_libs                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_same_path
+        test_same_name
+        test_no_flavor
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.args.args_array = {"-d": "/etc/mysql", "-y": "Flavor"}
+
+    def test_same_path(self):
+
+        """Function:  test_same_path
+
+        Description:  Test with the same slave config file given by a
+            relative and an absolute path.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            batch_libs.set_lock_id(self.args, "east/set1.txt"),
+            batch_libs.set_lock_id(
+                self.args, "/etc/mysql/east/set1.txt"))
+
+    def test_same_name(self):
+
+        """Function:  test_same_name
+
+        Description:  Test with slave config files of the same name in
+            different directories.
+
+        Arguments:
+
+        """
+
+        self.assertNotEqual(
+            batch_libs.set_lock_id(self.args, "east/set1.txt"),
+            batch_libs.set_lock_id(self.args, "west/set1.txt"))
+
+    def test_no_flavor(self):
+
+        """Function:  test_no_flavor
+
+        Description:  Test with no flavor id.
+
+        Arguments:
+
+        """
+
+        del self.args.args_array["-y"]
+
+        self.assertRegex(
+            batch_libs.set_lock_id(self.args, "east/set1.txt"),
+            r"^set1\.txt_[0-9a-f]{12}$")
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        self.assertRegex(
+            batch_libs.set_lock_id(self.args, "east/set1.txt"),
+            r"^Flavor_set1\.txt_[0-9a-f]{12}$")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,12 @@
+#!/bin/bash
+# Unit testing program for the library module.
+# This will run all the units tests for this library.
+# Will need to run this from the base directory where the module file
+#   is located at.
+
+echo ""
+echo "Unit testing..."
+/usr/bin/python test/unit/batch_libs/batch_files.py
+/usr/bin/python test/unit/batch_libs/run_batch.py
+/usr/bin/python test/unit/batch_libs/run_set.py
+/usr/bin/python test/unit/batch_libs/set_lock_id.py
@@ -0,0 +1,221 @@
+# Classification (U)
+
+"""Program:  convergence_reason.py
+
+    Description:  Unit testing of convergence_reason in converge_libs.py.
+
+    Usage:
+        test/unit/converge_libs/convergence_reason.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import converge_libs                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class MasterRep():                                      # pylint:disable=R0903
+
+    """Class:  MasterRep
+
+    Description:  Class stub holder for mysql_class.MasterRep class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self, name, exe_gtid):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) name
+            (input) exe_gtid
+
+        """
+
+        self.name = name
+        self.host = "10.0.0.1"
+        self.port = 3306
+        self.exe_gtid = exe_gtid
+        self.error = None
+
+    def col_sql(self, cmd):                             # pylint:disable=W0613
+
+        """Method:  col_sql
+
+        Description:  Stub holder for mysql_class.Server.col_sql method.
+
+        Arguments:
+            (input) cmd
+
+        """
+
+        if self.error:
+            raise self.error
+
+        return [{"gtid_executed": self.exe_gtid}]
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, exe_gtidset):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) exe_gtidset
+
+        """
+
+        self.exe_gtidset = exe_gtidset
+        self.io_running = True
+        self.sql_running = True
+        self.source_host = "10.0.0.1"
+        self.source_port = "3306"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_missing
+        test_old_master
+        test_sql_thread
+        test_io_thread
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.uuid = "3e11fa47-71ca-11e1-9e33-c80aa9429562"
+        self.master = MasterRep("master", f"{self.uuid}:1-20")
+        self.target = converge_libs.gtid_class.GtidSet(
+            f"{self.uuid}:1-20")
+        self.slave = SlaveRep(f"{self.uuid}:1-25")
+
+    def test_missing(self):
+
+        """Function:  test_missing
+
+        Description:  Test with a slave missing transactions.
+
+        Arguments:
+
+        """
+
+        self.slave.exe_gtidset = f"{self.uuid}:1-15"
+
+        self.assertEqual(
+            converge_libs.convergence_reason(
+                self.slave, self.master, self.target),
+            "Missing 5 transactions")
+
+    def test_old_master(self):
+
+        """Function:  test_old_master
+
+        Description:  Test with a slave replicating from another master.
+
+        Arguments:
+
+        """
+
+        self.slave.source_port = "3307"
+
+        self.assertEqual(
+            converge_libs.convergence_reason(
+                self.slave, self.master, self.target),
+            "Replicating from 10.0.0.1:3307")
+
+    def test_sql_thread(self):
+
+        """Function:  test_sql_thread
+
+        Description:  Test with the SQL thread not running.
+
+        Arguments:
+
+        """
+
+        self.slave.sql_running = False
+
+        self.assertEqual(
+            converge_libs.convergence_reason(
+                self.slave, self.master, self.target),
+            "SQL thread not running")
+
+    def test_io_thread(self):
+
+        """Function:  test_io_thread
+
+        Description:  Test with the IO thread not running.
+
+        Arguments:
+
+        """
+
+        self.slave.io_running = False
+
+        self.assertEqual(
+            converge_libs.convergence_reason(
+                self.slave, self.master, self.target),
+            "IO thread not running")
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(
+            converge_libs.convergence_reason(
+                self.slave, self.master, self.target))
+
+
+if __name__ == "__main__":
+    unittest.main()
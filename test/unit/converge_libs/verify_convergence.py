@@ -0,0 +1,302 @@
+# Classification (U)
+
+"""Program:  verify_convergence.py
+
+    Description:  Unit testing of verify_convergence in converge_libs.py.
+
+    Usage:
+        test/unit/converge_libs/verify_convergence.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import io
+import time
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import converge_libs                            # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class MasterRep():                                      # pylint:disable=R0903
+
+    """Class:  MasterRep
+
+    Description:  Class stub holder for mysql_class.MasterRep class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self, name, exe_gtid):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) name
+            (input) exe_gtid
+
+        """
+
+        self.name = name
+        self.host = "10.0.0.1"
+        self.port = 3306
+        self.exe_gtid = exe_gtid
+        self.error = None
+
+    def col_sql(self, cmd):                             # pylint:disable=W0613
+
+        """Method:  col_sql
+
+        Description:  Stub holder for mysql_class.Server.col_sql method.
+
+        Arguments:
+            (input) cmd
+
+        """
+
+        if self.error:
+            raise self.error
+
+        return [{"gtid_executed": self.exe_gtid}]
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self, name, rows):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) name
+            (input) rows -> Status rows returned by each poll
+
+        """
+
+        self.name = name
+        self.rows = rows
+
+    def col_sql(self, cmd):                             # pylint:disable=W0613
+
+        """Method:  col_sql
+
+        Description:  Stub holder for mysql_class.Server.col_sql method.
+
+        Arguments:
+            (input) cmd
+
+        """
+
+        row = self.rows.pop(0) if len(self.rows) > 1 else self.rows[0]
+
+        if isinstance(row, Exception):
+            raise row
+
+        return [row]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_tracker
+        test_master_not_read
+        test_probe_fails
+        test_deadline
+        test_report
+        test_no_slaves
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.uuid = "3e11fa47-71ca-11e1-9e33-c80aa9429562"
+        self.master = MasterRep("master", f"{self.uuid}:1-20")
+        self.done = {"exe_gtidset": f"{self.uuid}:1-20", "io_running": "ON",
+                     "sql_running": "ON", "source_host": "10.0.0.1",
+                     "source_port": 3306}
+        self.behind = dict(self.done, exe_gtidset=f"{self.uuid}:1-15")
+        self.old = dict(self.done, source_host="10.0.0.9")
+
+    def test_tracker(self):
+
+        """Function:  test_tracker
+
+        Description:  Test with the GTID tracker given.
+
+        Arguments:
+
+        """
+
+        tracker = converge_libs.gtid_class.GtidTracker()
+        report = {"phases": {}, "slaves": {}}
+        slaves = [SlaveRep("slave1", [self.behind, self.done])]
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                converge_libs.verify_convergence(
+                    self.master, slaves, report=report, tracker=tracker), [])
+
+        self.assertEqual(tracker.stats["full"], 2)
+        self.assertIs(report["gtid_reads"], tracker.stats)
+
+    def test_master_not_read(self):
+
+        """Function:  test_master_not_read
+
+        Description:  Test with the new master executed set not read.
+
+        Arguments:
+
+        """
+
+        self.master.error = ValueError("Lost connection")
+        slaves = [SlaveRep("slave1", [self.done])]
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                converge_libs.verify_convergence(self.master, slaves), [])
+
+    def test_probe_fails(self):
+
+        """Function:  test_probe_fails
+
+        Description:  Test with a slave whose status cannot be read.
+
+        Arguments:
+
+        """
+
+        slaves = [SlaveRep("slave1", [ValueError("Lost connection")])]
+
+        with mock.patch("sys.stdout", new_callable=io.StringIO) as mock_out:
+            self.assertEqual(
+                converge_libs.verify_convergence(
+                    self.master, slaves, timeout=0.1), ["slave1"])
+
+        self.assertIn("slave1\tNot converged: Status not read",
+                      mock_out.getvalue())
+
+    def test_deadline(self):
+
+        """Function:  test_deadline
+
+        Description:  Test with a slave which does not converge within the
+            deadline.
+
+        Arguments:
+
+        """
+
+        slaves = [SlaveRep("slave1", [self.done]),
+                  SlaveRep("slave2", [self.old])]
+        start = time.monotonic()
+
+        with mock.patch("sys.stdout", new_callable=io.StringIO) as mock_out:
+            self.assertEqual(
+                converge_libs.verify_convergence(
+                    self.master, slaves, timeout=0.2), ["slave2"])
+
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertIn("slave2\tNot converged: Replicating from 10.0.0.9:3306",
+                      mock_out.getvalue())
+        self.assertIn("Converged: 1/2 slaves", mock_out.getvalue())
+
+    def test_report(self):
+
+        """Function:  test_report
+
+        Description:  Test the converge times are added to the timing report.
+
+        Arguments:
+
+        """
+
+        report = {"phases": {}, "slaves": {}}
+        slaves = [SlaveRep("slave1", [self.behind, self.done]),
+                  SlaveRep("slave2", [self.done])]
+
+        with gen_libs.no_std_out():
+            converge_libs.verify_convergence(
+                self.master, slaves, report=report)
+
+        self.assertEqual(report["convergence"]["converged"], 2)
+        self.assertGreater(report["slaves"]["slave1"]["converge"],
+                           report["slaves"]["slave2"]["converge"])
+        self.assertEqual(report["convergence"]["p99"],
+                         report["slaves"]["slave1"]["converge"])
+
+    def test_no_slaves(self):
+
+        """Function:  test_no_slaves
+
+        Description:  Test with no slaves.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            converge_libs.verify_convergence(self.master, []), [])
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        slaves = [SlaveRep("slave1", [self.behind, self.behind, self.done]),
+                  SlaveRep("slave2", [self.done])]
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                converge_libs.verify_convergence(self.master, slaves), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,21 @@
+#!/bin/bash
+# Unit test code coverage for library module.
+# This will run the Python code coverage module against all unit test modules.
+# This will show the amount of code that was tested and which lines of code
+#   that was skipped during the test.
+
+coverage erase
+
+echo ""
+echo "Running unit test modules in conjunction with coverage"
+coverage run -a --source=discover_libs test/unit/discover_libs/create_instances.py
+coverage run -a --source=discover_libs test/unit/discover_libs/create_inventory.py
+coverage run -a --source=discover_libs test/unit/discover_libs/discover_slaves.py
+coverage run -a --source=discover_libs test/unit/discover_libs/find_slave.py
+coverage run -a --source=discover_libs test/unit/discover_libs/probe_reachable.py
+coverage run -a --source=discover_libs test/unit/discover_libs/slave_records.py
+
+echo ""
+echo "Producing code coverage report"
+coverage combine
+coverage report -m
@@ -0,0 +1,309 @@
+# Classification (U)
+
+"""Program:  create_instances.py
+
+    Description:  Unit testing of create_instances in
+        mysql_rep_failover.py.
+
+    Usage:
+        test/unit/discover_libs/create_instances.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import discover_libs                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class SlaveRep():
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+        remove
+        append
+
+    """
+
+    def __init__(self, name, exe_gtidset, gtid_mode):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) name
+            (input) exe_gtidset
+            (input) gtid_mode
+
+        """
+
+        self.name = name
+        self.exe_gtidset = exe_gtidset
+        self.gtid_mode = gtid_mode
+        self.master = None
+        self.slave = None
+
+    def remove(self, master):
+
+        """Method:  remove
+
+        Description:  Stub holder for mysql_class.SlaveRep.remove method.
+
+        Arguments:
+            (input) master
+
+        """
+
+        self.master = master
+
+        return True
+
+    def append(self, slave):
+
+        """Method:  append
+
+        Description:  Stub holder for mysql_class.SlaveRep.append method.
+
+        Arguments:
+            (input) slave
+
+        """
+
+        self.slave = slave
+
+        return True
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_entries
+        test_unreachable
+        test_stream
+        test_inventory
+        test_no_slave
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.args.args_array = {"-s": "CfgFile", "-d": "CfgDir"}
+        self.slave1 = SlaveRep("slave1", "20", True)
+        self.slave2 = SlaveRep("slave2", "10", True)
+        self.slave3 = SlaveRep("slave3", "15", True)
+        self.slavearray = []
+        self.slavearray.append(self.slave1)
+        self.slavearray.append(self.slave2)
+        self.slavearray.append(self.slave3)
+
+    @mock.patch("discover_libs.probe_reachable",
+                mock.Mock(side_effect=lambda entries, **kwargs: entries))
+    @mock.patch("discover_libs.discover_slaves")
+    def test_entries(self, mock_slv):
+
+        """Function:  test_entries
+
+        Description:  Test with only some of the slave config entries.
+
+        Arguments:
+
+        """
+
+        inventory = {"entries": ["Entry1", "Entry2"], "slaves": {}}
+        mock_slv.return_value = [self.slave2]
+
+        self.assertEqual(
+            discover_libs.create_instances(
+                self.args, inventory=inventory, entries=["Entry2"]),
+            [self.slave2])
+        self.assertEqual(mock_slv.call_args[0][0], ["Entry2"])
+
+    @mock.patch("discover_libs.probe_reachable")
+    @mock.patch("discover_libs.gen_libs.create_cfg_array")
+    @mock.patch("discover_libs.discover_slaves")
+    def test_unreachable(self, mock_slv, mock_cfg, mock_probe):
+
+        """Function:  test_unreachable
+
+        Description:  Test the unreachable slaves are not connected to.
+
+        Arguments:
+
+        """
+
+        inventory = {"entries": ["Entry1", "Entry2"], "slaves": {}}
+        self.args.args_array["-e"] = "50"
+        mock_probe.return_value = ["Entry2"]
+        mock_slv.return_value = [self.slave2]
+
+        self.assertEqual(
+            discover_libs.create_instances(
+                self.args, inventory=inventory),
+            [self.slave2])
+        self.assertFalse(mock_cfg.called)
+        self.assertEqual(mock_probe.call_args[1]["timeout"], 0.05)
+        self.assertEqual(mock_slv.call_args[0][0], ["Entry2"])
+
+    @mock.patch("discover_libs.probe_reachable",
+                mock.Mock(side_effect=lambda entries, **kwargs: entries))
+    @mock.patch("discover_libs.gen_libs.create_cfg_array")
+    @mock.patch("discover_libs.discover_slaves")
+    def test_stream(self, mock_slv, mock_cfg):
+
+        """Function:  test_stream
+
+        Description:  Test the stream function is passed to discovery.
+
+        Arguments:
+
+        """
+
+        inventory = {"entries": ["Entries"], "slaves": {}}
+        mock_slv.return_value = self.slavearray
+
+        discover_libs.create_instances(
+            self.args, inventory=inventory, stream=print)
+
+        self.assertFalse(mock_cfg.called)
+        self.assertEqual(mock_slv.call_args[1]["stream"], print)
+
+    @mock.patch("discover_libs.probe_reachable",
+                mock.Mock(side_effect=lambda entries, **kwargs: entries))
+    @mock.patch("discover_libs.gen_libs.create_cfg_array")
+    @mock.patch("discover_libs.discover_slaves")
+    def test_inventory(self, mock_slv, mock_cfg):
+
+        """Function:  test_inventory
+
+        Description:  Test with a parsed slave inventory.
+
+        Arguments:
+
+        """
+
+        inventory = {"entries": ["Entries"], "slaves": {}}
+        mock_slv.return_value = self.slavearray
+
+        self.assertEqual(
+            discover_libs.create_instances(
+                self.args, inventory=inventory), self.slavearray)
+        self.assertFalse(mock_cfg.called)
+        self.assertEqual(mock_slv.call_args[0][0], ["Entries"])
+        self.assertEqual(inventory["slaves"]["slave2"], self.slave2)
+
+    @mock.patch("discover_libs.probe_reachable",
+                mock.Mock(side_effect=lambda entries, **kwargs: entries))
+    @mock.patch("discover_libs.gen_libs.transpose_dict")
+    @mock.patch("discover_libs.discover_slaves")
+    @mock.patch("discover_libs.gen_libs.create_cfg_array")
+    def test_no_slave(self, mock_cfg, mock_slv, mock_trans):
+
+        """Function:  test_no_slave
+
+        Description:  Test with no slaves in list.
+
+        Arguments:
+
+        """
+
+        mock_cfg.return_value = []
+        mock_slv.return_value = []
+        mock_trans.return_value = []
+
+        self.assertEqual(discover_libs.create_instances(self.args), [])
+
+    @mock.patch("discover_libs.probe_reachable",
+                mock.Mock(side_effect=lambda entries, **kwargs: entries))
+    @mock.patch("discover_libs.gen_libs.transpose_dict")
+    @mock.patch("discover_libs.discover_slaves")
+    @mock.patch("discover_libs.gen_libs.create_cfg_array")
+    def test_default(self, mock_cfg, mock_slv, mock_trans):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        mock_cfg.return_value = self.slavearray
+        mock_slv.return_value = self.slavearray
+        mock_trans.return_value = []
+
+        self.assertEqual(
+            discover_libs.create_instances(self.args), self.slavearray)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+# Classification (U)
+
+"""Program:  create_inventory.py
+
+    Description:  Unit testing of create_inventory in discover_libs.py.
+
+    Usage:
+        test/unit/discover_libs/create_inventory.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import discover_libs                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_duplicate_name
+        test_no_slaves
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.args.args_array = {"-s": "CfgFile", "-d": "CfgDir"}
+        self.entry1 = {"name": "slave1", "port": 3306, "rep_user": "repuser"}
+        self.entry2 = {"name": "slave2", "port": "3306", "rep_user": "repuser"}
+        self.entry3 = {"name": "slave1", "port": 3307, "rep_user": "repuser"}
+
+    @mock.patch("discover_libs.gen_libs.transpose_dict")
+    @mock.patch("discover_libs.gen_libs.create_cfg_array")
+    def test_duplicate_name(self, mock_cfg, mock_trans):
+
+        """Function:  test_duplicate_name
+
+        Description:  Test with a name on more than one port.
+
+        Arguments:
+
+        """
+
+        mock_cfg.return_value = []
+        mock_trans.return_value = [self.entry1, self.entry2, self.entry3]
+
+        inventory = discover_libs.create_inventory(self.args)
+
+        self.assertEqual(inventory["names"]["slave1"], self.entry1)
+        self.assertEqual(inventory["keys"][("slave1", 3307)], self.entry3)
+
+    @mock.patch("discover_libs.gen_libs.transpose_dict")
+    @mock.patch("discover_libs.gen_libs.create_cfg_array")
+    def test_no_slaves(self, mock_cfg, mock_trans):
+
+        """Function:  test_no_slaves
+
+        Description:  Test with an empty slave config file.
+
+        Arguments:
+
+        """
+
+        mock_cfg.return_value = []
+        mock_trans.return_value = []
+
+        self.assertEqual(
+            discover_libs.create_inventory(self.args),
+            {"entries": [], "names": {}, "keys": {}, "slaves": {},
+             "scoring": {"weights": {}, "prefer": {}}})
+
+    @mock.patch("discover_libs.gen_libs.transpose_dict")
+    @mock.patch("discover_libs.gen_libs.create_cfg_array")
+    def test_default(self, mock_cfg, mock_trans):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        mock_cfg.return_value = []
+        mock_trans.return_value = [self.entry1, self.entry2]
+
+        inventory = discover_libs.create_inventory(self.args)
+
+        self.assertEqual(inventory["entries"], [self.entry1, self.entry2])
+        self.assertEqual(inventory["names"]["slave2"], self.entry2)
+        self.assertEqual(inventory["keys"][("slave1", 3306)], self.entry1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,345 @@
+# Classification (U)
+
+"""Program:  discover_slaves.py
+
+    Description:  Unit testing of discover_slaves in discover_libs.py.
+
+    Usage:
+        test/unit/discover_libs/discover_slaves.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import io
+import time
+import subprocess
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import discover_libs                            # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, name, conn_msg=None):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) name
+            (input) conn_msg
+
+        """
+
+        self.name = name
+        self.conn_msg = conn_msg
+        self.gtid_mode = True
+        self.exe_gtidset = ""
+
+
+def create_slv_array(cfg_array):
+
+    """Function:  create_slv_array
+
+    Description:  Stub holder for mysql_libs.create_slv_array function.
+
+    Arguments:
+        (input) cfg_array
+
+    """
+
+    entry = cfg_array[0]
+
+    if entry.get("delay"):
+        time.sleep(entry["delay"])
+
+    if entry.get("raise"):
+        raise ValueError("Driver error")
+
+    return [SlaveRep(entry["name"], entry.get("conn_msg"))]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_stream
+        test_exception
+        test_exit
+        test_abandoned
+        test_replacement
+        test_deadline
+        test_conn_failed
+        test_order
+        test_no_slaves
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.slv_array = [{"name": "slave1"}, {"name": "slave2"},
+                          {"name": "slave3"}]
+
+    @mock.patch("discover_libs.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("discover_libs.mysql_libs.create_slv_array",
+                mock.Mock(side_effect=create_slv_array))
+    def test_stream(self):
+
+        """Function:  test_stream
+
+        Description:  Test the slave records are streamed as each slave is
+            done, with the excluded slaves not printed.
+
+        Arguments:
+
+        """
+
+        stream = mock.Mock()
+        self.slv_array[0]["delay"] = 0.2
+        self.slv_array[1]["delay"] = 1.0
+        self.slv_array[2]["conn_msg"] = "Connection refused"
+
+        with mock.patch("sys.stdout", new_callable=io.StringIO) as mock_out:
+            slaves = discover_libs.discover_slaves(
+                self.slv_array, timeout=0.5, stream=stream)
+
+        records = [item[0][0] for item in stream.call_args_list]
+
+        self.assertEqual([slv.name for slv in slaves], ["slave1"])
+        self.assertEqual([record["name"] for record in records],
+                         ["slave3", "slave1", "slave2"])
+        self.assertEqual([record["status"] for record in records],
+                         ["excluded", "ok", "excluded"])
+        self.assertEqual(mock_out.getvalue(), "")
+
+    @mock.patch("discover_libs.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("discover_libs.mysql_libs.create_slv_array",
+                mock.Mock(side_effect=create_slv_array))
+    def test_exception(self):
+
+        """Function:  test_exception
+
+        Description:  Test with an exception raised for one slave.
+
+        Arguments:
+
+        """
+
+        self.slv_array[0]["raise"] = True
+
+        with gen_libs.no_std_out():
+            slaves = discover_libs.discover_slaves(self.slv_array)
+
+        self.assertEqual([slv.name for slv in slaves], ["slave2", "slave3"])
+
+    def test_exit(self):
+
+        """Function:  test_exit
+
+        Description:  Test the program exits without waiting for an
+            abandoned connection attempt.
+
+        Arguments:
+
+        """
+
+        script = (
+            "import time, types, discover_libs\n"
+            "discover_libs.mysql_libs = types.SimpleNamespace(\n"
+            "    create_slv_array=lambda cfg: time.sleep(5),\n"
+            "    disconnect=lambda slaves: None)\n"
+            "print(discover_libs.discover_slaves(\n"
+            "    [{'name': 'slave1'}], timeout=0.2))\n")
+        start = time.monotonic()
+        proc = subprocess.run(
+            [sys.executable, "-c", script], cwd=os.getcwd(),
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False,
+            timeout=10)
+
+        self.assertEqual(proc.returncode, 0)
+        self.assertIn(b"[]", proc.stdout)
+        self.assertLess(time.monotonic() - start, 3)
+
+    @mock.patch("discover_libs.mysql_libs.disconnect")
+    @mock.patch("discover_libs.mysql_libs.create_slv_array",
+                mock.Mock(side_effect=create_slv_array))
+    def test_abandoned(self, mock_disconnect):
+
+        """Function:  test_abandoned
+
+        Description:  Test a slave that connects after its deadline is
+            disconnected.
+
+        Arguments:
+
+        """
+
+        self.slv_array = [{"name": "slave1", "delay": 0.3}]
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                discover_libs.discover_slaves(self.slv_array, timeout=0.1),
+                [])
+
+        self.assertFalse(mock_disconnect.called)
+        time.sleep(0.4)
+        self.assertEqual(
+            mock_disconnect.call_args[0][0][0].name, "slave1")
+
+    @mock.patch("discover_libs.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("discover_libs.mysql_libs.create_slv_array",
+                mock.Mock(side_effect=create_slv_array))
+    def test_replacement(self):
+
+        """Function:  test_replacement
+
+        Description:  Test an abandoned attempt does not hold up the other
+            slaves when there is one worker.
+
+        Arguments:
+
+        """
+
+        self.slv_array[0]["delay"] = 1.0
+        start = time.monotonic()
+
+        with gen_libs.no_std_out():
+            slaves = discover_libs.discover_slaves(
+                self.slv_array, max_workers=1, timeout=0.2)
+
+        self.assertLess(time.monotonic() - start, 0.9)
+        self.assertEqual([slv.name for slv in slaves], ["slave2", "slave3"])
+
+    @mock.patch("discover_libs.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("discover_libs.mysql_libs.create_slv_array",
+                mock.Mock(side_effect=create_slv_array))
+    def test_deadline(self):
+
+        """Function:  test_deadline
+
+        Description:  Test with one slave exceeding its deadline.
+
+        Arguments:
+
+        """
+
+        self.slv_array[1]["delay"] = 1.0
+        start = time.monotonic()
+
+        with gen_libs.no_std_out():
+            slaves = discover_libs.discover_slaves(
+                self.slv_array, timeout=0.2)
+
+        self.assertLess(time.monotonic() - start, 0.9)
+        self.assertEqual([slv.name for slv in slaves], ["slave1", "slave3"])
+
+    @mock.patch("discover_libs.mysql_libs.create_slv_array",
+                mock.Mock(side_effect=create_slv_array))
+    def test_conn_failed(self):
+
+        """Function:  test_conn_failed
+
+        Description:  Test with a connection failure for one slave.
+
+        Arguments:
+
+        """
+
+        self.slv_array[2]["conn_msg"] = "Connection refused"
+
+        with gen_libs.no_std_out():
+            slaves = discover_libs.discover_slaves(self.slv_array)
+
+        self.assertEqual([slv.name for slv in slaves], ["slave1", "slave2"])
+
+    @mock.patch("discover_libs.mysql_libs.create_slv_array",
+                mock.Mock(side_effect=create_slv_array))
+    def test_order(self):
+
+        """Function:  test_order
+
+        Description:  Test slaves are returned in configuration order.
+
+        Arguments:
+
+        """
+
+        self.slv_array[0]["delay"] = 0.2
+
+        slaves = discover_libs.discover_slaves(
+            self.slv_array, max_workers=3)
+
+        self.assertEqual(
+            [slv.name for slv in slaves], ["slave1", "slave2", "slave3"])
+
+    def test_no_slaves(self):
+
+        """Function:  test_no_slaves
+
+        Description:  Test with no slaves in the configuration.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(discover_libs.discover_slaves([]), [])
+
+    @mock.patch("discover_libs.mysql_libs.create_slv_array",
+                mock.Mock(side_effect=create_slv_array))
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        slaves = discover_libs.discover_slaves(self.slv_array)
+
+        self.assertEqual(len(slaves), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
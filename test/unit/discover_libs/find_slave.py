@@ -0,0 +1,147 @@
+# Classification (U)
+
+"""Program:  find_slave.py
+
+    Description:  Unit testing of find_slave in discover_libs.py.
+
+    Usage:
+        test/unit/discover_libs/find_slave.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import discover_libs                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, name):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) name
+
+        """
+
+        self.name = name
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_probed
+        test_not_found
+        test_no_inventory
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.slave1 = SlaveRep("slave1")
+        self.slave2 = SlaveRep("slave2")
+        self.slaves = [self.slave1, self.slave2]
+        self.inventory = {
+            "slaves": {"slave1": self.slave1, "slave2": self.slave2}}
+
+    def test_not_probed(self):
+
+        """Function:  test_not_probed
+
+        Description:  Test with a slave in the inventory which is not in the
+            slave array.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(
+            discover_libs.find_slave(
+                [self.slave1], "slave2", inventory=self.inventory))
+
+    def test_not_found(self):
+
+        """Function:  test_not_found
+
+        Description:  Test with a slave not in the inventory.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(
+            discover_libs.find_slave(
+                self.slaves, "slave3", inventory=self.inventory))
+
+    @mock.patch("discover_libs.mysql_libs.find_name")
+    def test_no_inventory(self, mock_find):
+
+        """Function:  test_no_inventory
+
+        Description:  Test with no slave inventory.
+
+        Arguments:
+
+        """
+
+        mock_find.return_value = self.slave2
+
+        self.assertEqual(
+            discover_libs.find_slave(self.slaves, "slave2"), self.slave2)
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            discover_libs.find_slave(
+                self.slaves, "slave2", inventory=self.inventory), self.slave2)
+
+
+if __name__ == "__main__":
+    unittest.main()
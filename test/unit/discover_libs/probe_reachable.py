@@ -0,0 +1,171 @@
+# Classification (U)
+
+"""Program:  probe_reachable.py
+
+    Description:  Unit testing of probe_reachable in discover_libs.py.
+
+    Usage:
+        test/unit/discover_libs/probe_reachable.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import io
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import discover_libs                            # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+async def probe_tcp(addresses, **kwargs):            # pylint:disable=W0613
+
+    """Function:  probe_tcp
+
+    Description:  Stub holder for engine_libs.probe_tcp function.
+        Port 3307 is not reachable.
+
+    Arguments:
+        (input) addresses
+        (input) kwargs
+
+    """
+
+    return [(None if port != 3307 else f"Host {host}:{port} is not"
+             f" reachable: Connection refused", 0.01)
+            for host, port in addresses]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_stream
+        test_no_host
+        test_report
+        test_unreachable
+        test_no_slaves
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.slv_array = [{"name": "slave1", "host": "host1", "port": 3306},
+                          {"name": "slave2", "host": "host2", "port": "3307"},
+                          {"name": "slave3", "host": "host3", "port": 3306}]
+
+    @mock.patch("discover_libs.engine_libs.probe_tcp", probe_tcp)
+    def test_stream(self):
+
+        """Function:  test_stream
+
+        Description:  Test the unreachable slaves are written as records.
+
+        Arguments:
+
+        """
+
+        stream = mock.Mock()
+
+        with mock.patch("sys.stdout", new_callable=io.StringIO) as mock_out:
+            entries = discover_libs.probe_reachable(
+                self.slv_array, stream=stream)
+
+        self.assertEqual(entries, [self.slv_array[0], self.slv_array[2]])
+        self.assertEqual(mock_out.getvalue(), "")
+        self.assertEqual(stream.call_args[0][0]["name"], "slave2")
+        self.assertEqual(stream.call_args[0][0]["status"], "excluded")
+
+    @mock.patch("discover_libs.engine_libs.probe_tcp", probe_tcp)
+    def test_no_host(self):
+
+        """Function:  test_no_host
+
+        Description:  Test with a slave which has no host.
+
+        Arguments:
+
+        """
+
+        del self.slv_array[1]["host"]
+
+        self.assertEqual(
+            discover_libs.probe_reachable(self.slv_array), self.slv_array)
+
+    @mock.patch("discover_libs.engine_libs.probe_tcp", probe_tcp)
+    def test_report(self):
+
+        """Function:  test_report
+
+        Description:  Test the probe times are added to the timing report.
+
+        Arguments:
+
+        """
+
+        report = {"phases": {}, "slaves": {}}
+
+        with gen_libs.no_std_out():
+            discover_libs.probe_reachable(self.slv_array, report=report)
+
+        self.assertEqual(report["slaves"]["slave2"]["tcp_probe"], 0.01)
+
+    @mock.patch("discover_libs.engine_libs.probe_tcp", probe_tcp)
+    def test_unreachable(self):
+
+        """Function:  test_unreachable
+
+        Description:  Test the unreachable slaves are excluded.
+
+        Arguments:
+
+        """
+
+        with mock.patch("sys.stdout", new_callable=io.StringIO) as mock_out:
+            self.assertEqual(
+                discover_libs.probe_reachable(self.slv_array),
+                [self.slv_array[0], self.slv_array[2]])
+
+        self.assertEqual(
+            mock_out.getvalue(),
+            "Warning:  Slave slave2 excluded: Host host2:3307 is not"
+            " reachable: Connection refused\n")
+
+    def test_no_slaves(self):
+
+        """Function:  test_no_slaves
+
+        Description:  Test with no slaves.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(discover_libs.probe_reachable([]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
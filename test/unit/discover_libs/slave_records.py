@@ -0,0 +1,137 @@
+# Classification (U)
+
+"""Program:  slave_records.py
+
+    Description:  Unit testing of slave_records in discover_libs.py.
+
+    Usage:
+        test/unit/discover_libs/slave_records.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import discover_libs                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, name, exe_gtidset="", conn_msg=None):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) name
+            (input) exe_gtidset
+            (input) conn_msg
+
+        """
+
+        self.name = name
+        self.exe_gtidset = exe_gtidset
+        self.conn_msg = conn_msg
+        self.gtid_mode = True
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_exception
+        test_conn_failed
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.entry = {"name": "slave1"}
+        self.slave = SlaveRep(
+            "slave1", "3e11fa47-71ca-11e1-9e33-c80aa9429562:1-20")
+
+    def test_exception(self):
+
+        """Function:  test_exception
+
+        Description:  Test with an error instead of a slave list.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            discover_libs.slave_records(
+                self.entry, ValueError("Driver error"), 0.25),
+            [{"type": "slave", "name": "slave1", "status": "excluded",
+              "seconds": 0.25, "error": "Driver error"}])
+
+    def test_conn_failed(self):
+
+        """Function:  test_conn_failed
+
+        Description:  Test with a slave which failed to connect.
+
+        Arguments:
+
+        """
+
+        self.slave.conn_msg = "Connection refused"
+
+        self.assertEqual(
+            discover_libs.slave_records(self.entry, [self.slave], 0.25),
+            [{"type": "slave", "name": "slave1", "status": "excluded",
+              "seconds": 0.25, "error": "Connection refused"}])
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            discover_libs.slave_records(self.entry, [self.slave], 0.25),
+            [{"type": "slave", "name": "slave1", "status": "ok",
+              "seconds": 0.25, "gtid_mode": True, "transactions": 20}])
+
+
+if __name__ == "__main__":
+    unittest.main()
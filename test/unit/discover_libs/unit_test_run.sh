@@ -0,0 +1,14 @@
+#!/bin/bash
+# Unit testing program for the library module.
+# This will run all the units tests for this library.
+# Will need to run this from the base directory where the module file
+#   is located at.
+
+echo ""
+echo "Unit testing..."
+/usr/bin/python test/unit/discover_libs/create_instances.py
+/usr/bin/python test/unit/discover_libs/create_inventory.py
+/usr/bin/python test/unit/discover_libs/discover_slaves.py
+/usr/bin/python test/unit/discover_libs/find_slave.py
+/usr/bin/python test/unit/discover_libs/probe_reachable.py
+/usr/bin/python test/unit/discover_libs/slave_records.py
@@ -0,0 +1,18 @@
+#!/bin/bash
+# Unit test code coverage for library module.
+# This will run the Python code coverage module against all unit test modules.
+# This will show the amount of code that was tested and which lines of code
+#   that was skipped during the test.
+
+coverage erase
+
+echo ""
+echo "Running unit test modules in conjunction with coverage"
+coverage run -a --source=engine_libs test/unit/engine_libs/probe_tcp.py
+coverage run -a --source=engine_libs test/unit/engine_libs/run_coroutine.py
+coverage run -a --source=engine_libs test/unit/engine_libs/run_engine.py
+
+echo ""
+echo "Producing code coverage report"
+coverage combine
+coverage report -m
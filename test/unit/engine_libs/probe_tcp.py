@@ -0,0 +1,166 @@
+# Classification (U)
+
+"""Program:  probe_tcp.py
+
+    Description:  Unit testing of probe_tcp in engine_libs.py.
+
+    Usage:
+        test/unit/engine_libs/probe_tcp.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import time
+import socket
+import asyncio
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import engine_libs                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+async def slow_connection(host, port):               # pylint:disable=W0613
+
+    """Function:  slow_connection
+
+    Description:  Stub holder for asyncio.open_connection function for a
+        host which does not answer.
+
+    Arguments:
+        (input) host
+        (input) port
+
+    """
+
+    await asyncio.sleep(5)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_deadline
+        test_refused
+        test_no_addresses
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server.bind(("127.0.0.1", 0))
+        self.server.listen(8)
+        self.port = self.server.getsockname()[1]
+
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as closed:
+            closed.bind(("127.0.0.1", 0))
+            self.closed_port = closed.getsockname()[1]
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.server.close()
+
+    def test_deadline(self):
+
+        """Function:  test_deadline
+
+        Description:  Test with a host which does not answer within the
+            deadline.
+
+        Arguments:
+
+        """
+
+        start = time.monotonic()
+
+        with mock.patch("asyncio.open_connection", slow_connection):
+            results = engine_libs.run_coroutine(
+                engine_libs.probe_tcp(
+                    [("10.0.0.1", 3306), ("10.0.0.2", 3306)], timeout=0.05))
+
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertEqual(
+            results[0][0], "Host 10.0.0.1:3306 did not accept a TCP connection"
+            " within 50 ms")
+
+    def test_refused(self):
+
+        """Function:  test_refused
+
+        Description:  Test with a port which refuses the connection.
+
+        Arguments:
+
+        """
+
+        results = engine_libs.run_coroutine(
+            engine_libs.probe_tcp(
+                [("127.0.0.1", self.closed_port)], timeout=1))
+
+        self.assertIn("is not reachable", results[0][0])
+
+    def test_no_addresses(self):
+
+        """Function:  test_no_addresses
+
+        Description:  Test with no addresses.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(engine_libs.run_coroutine(
+            engine_libs.probe_tcp([])), [])
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        results = engine_libs.run_coroutine(
+            engine_libs.probe_tcp(
+                [("127.0.0.1", self.port), ("127.0.0.1", self.port)]))
+
+        self.assertEqual([err for err, _ in results], [None, None])
+
+
+if __name__ == "__main__":
+    unittest.main()
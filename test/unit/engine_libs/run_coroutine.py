@@ -0,0 +1,125 @@
+# Classification (U)
+
+"""Program:  run_coroutine.py
+
+    Description:  Unit testing of run_coroutine in engine_libs.py.
+
+    Usage:
+        test/unit/engine_libs/run_coroutine.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import asyncio
+import threading
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import engine_libs                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+async def delayed(value):
+
+    """Function:  delayed
+
+    Description:  Coroutine which returns a value after a short sleep.
+
+    Arguments:
+        (input) value
+
+    """
+
+    await asyncio.sleep(0.01)
+
+    if isinstance(value, Exception):
+        raise value
+
+    return value
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_thread
+        test_exception
+        test_loop_closed
+        test_default
+
+    """
+
+    def test_thread(self):
+
+        """Function:  test_thread
+
+        Description:  Test with the coroutine run from a thread other than
+            the main thread.
+
+        Arguments:
+
+        """
+
+        results = []
+        thr = threading.Thread(
+            target=lambda: results.append(
+                engine_libs.run_coroutine(delayed(5))))
+        thr.start()
+        thr.join()
+
+        self.assertEqual(results, [5])
+
+    def test_exception(self):
+
+        """Function:  test_exception
+
+        Description:  Test with a coroutine raising an exception.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(ValueError):
+            engine_libs.run_coroutine(delayed(ValueError("Lost")))
+
+    def test_loop_closed(self):
+
+        """Function:  test_loop_closed
+
+        Description:  Test the coroutines are run on a new event loop each
+            time.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(engine_libs.run_coroutine(delayed(1)), 1)
+        self.assertEqual(engine_libs.run_coroutine(delayed(2)), 2)
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(engine_libs.run_coroutine(delayed(3)), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
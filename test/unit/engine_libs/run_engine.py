@@ -0,0 +1,89 @@
+# Classification (U)
+
+"""Program:  run_engine.py
+
+    Description:  Unit testing of run_engine in engine_libs.py.
+
+    Usage:
+        test/unit/engine_libs/run_engine.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import time
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import engine_libs                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def delayed(item):
+
+    """Function:  delayed
+
+    Description:  Blocking function which sleeps for the item seconds.
+
+    Arguments:
+        (input) item -> Seconds to sleep or an exception to raise
+
+    """
+
+    if isinstance(item, Exception):
+        raise item
+
+    time.sleep(item)
+
+    return item
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_no_items
+        test_default
+
+    """
+
+    def test_no_items(self):
+
+        """Function:  test_no_items
+
+        Description:  Test with no items.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(engine_libs.run_engine(delayed, []), [])
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            engine_libs.run_engine(
+                delayed, [0.1, 0, 0.05], max_workers=2), [0.1, 0, 0.05])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,11 @@
+#!/bin/bash
+# Unit testing program for the library module.
+# This will run all the units tests for this library.
+# Will need to run this from the base directory where the module file
+#   is located at.
+
+echo ""
+echo "Unit testing..."
+/usr/bin/python test/unit/engine_libs/probe_tcp.py
+/usr/bin/python test/unit/engine_libs/run_coroutine.py
+/usr/bin/python test/unit/engine_libs/run_engine.py
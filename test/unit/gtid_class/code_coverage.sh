@@ -0,0 +1,34 @@
+#!/bin/bash
+# Unit test code coverage for class module.
+# This will run the Python code coverage module against all unit test modules.
+# This will show the amount of code that was tested and which lines of code
+#   that was skipped during the test.
+
+coverage erase
+
+echo ""
+echo "Running unit test modules in conjunction with coverage"
+coverage run -a --source=gtid_class test/unit/gtid_class/gtidmatrix_complete.py
+coverage run -a --source=gtid_class test/unit/gtid_class/gtidmatrix_errant.py
+coverage run -a --source=gtid_class test/unit/gtid_class/gtidmatrix_init.py
+coverage run -a --source=gtid_class test/unit/gtid_class/gtidmatrix_issuperset.py
+coverage run -a --source=gtid_class test/unit/gtid_class/gtidmatrix_missing.py
+coverage run -a --source=gtid_class test/unit/gtid_class/gtidset_common.py
+coverage run -a --source=gtid_class test/unit/gtid_class/gtidset_count.py
+coverage run -a --source=gtid_class test/unit/gtid_class/gtidset_init.py
+coverage run -a --source=gtid_class test/unit/gtid_class/gtidset_intervals.py
+coverage run -a --source=gtid_class test/unit/gtid_class/gtidset_issuperset.py
+coverage run -a --source=gtid_class test/unit/gtid_class/gtidset_str.py
+coverage run -a --source=gtid_class test/unit/gtid_class/gtidset_subtract.py
+coverage run -a --source=gtid_class test/unit/gtid_class/gtidset_union.py
+coverage run -a --source=gtid_class test/unit/gtid_class/gtidtracker_advance.py
+coverage run -a --source=gtid_class test/unit/gtid_class/gtidtracker_digest.py
+coverage run -a --source=gtid_class test/unit/gtid_class/gtidtracker_forget.py
+coverage run -a --source=gtid_class test/unit/gtid_class/gtidtracker_get.py
+coverage run -a --source=gtid_class test/unit/gtid_class/gtidtracker_init.py
+coverage run -a --source=gtid_class test/unit/gtid_class/gtidtracker_rebase.py
+
+echo ""
+echo "Producing code coverage report"
+coverage combine
+coverage report -m
@@ -0,0 +1,91 @@
+# Classification (U)
+
+"""Program:  gtidmatrix_complete.py
+
+    Description:  Unit testing of GtidMatrix.complete in gtid_class.py.
+
+    Usage:
+        test/unit/gtid_class/gtidmatrix_complete.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import gtid_class                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_one
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.uuid = "3e11fa47-71ca-11e1-9e33-c80aa9429562"
+        self.uuid2 = "4a2c7d11-71ca-11e1-9e33-c80aa9429562"
+        self.matrix = gtid_class.GtidMatrix([
+            gtid_class.GtidSet(f"{self.uuid}:1-100:102-200"),
+            gtid_class.GtidSet(f"{self.uuid}:1-100:102-150"),
+            gtid_class.GtidSet(f"{self.uuid}:1-100:102-150,{self.uuid2}:1-3"),
+            gtid_class.GtidSet(f"{self.uuid}:1-101")])
+
+    def test_one(self):
+
+        """Function:  test_one
+
+        Description:  Test with a set which contains the other sets.
+
+        Arguments:
+
+        """
+
+        matrix = gtid_class.GtidMatrix([
+            gtid_class.GtidSet(f"{self.uuid}:1-5"),
+            gtid_class.GtidSet(f"{self.uuid}:1-9"),
+            gtid_class.GtidSet(f"{self.uuid}:1-9")])
+
+        self.assertEqual(matrix.complete(), [1, 2])
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.matrix.complete(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+# Classification (U)
+
+"""Program:  gtidmatrix_init.py
+
+    Description:  Unit testing of GtidMatrix.__init__ in gtid_class.py.
+
+    Usage:
+        test/unit/gtid_class/gtidmatrix_init.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import gtid_class                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_shared
+        test_large
+        test_empty
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.uuid = "3e11fa47-71ca-11e1-9e33-c80aa9429562"
+        self.uuid2 = "4a2c7d11-71ca-11e1-9e33-c80aa9429562"
+        self.matrix = gtid_class.GtidMatrix([
+            gtid_class.GtidSet(f"{self.uuid}:1-100:102-200"),
+            gtid_class.GtidSet(f"{self.uuid}:1-100:102-150"),
+            gtid_class.GtidSet(f"{self.uuid}:1-100:102-150,{self.uuid2}:1-3"),
+            gtid_class.GtidSet(f"{self.uuid}:1-101")])
+
+    def test_shared(self):
+
+        """Function:  test_shared
+
+        Description:  Test the intervals every set shares are dropped.
+
+        Arguments:
+
+        """
+
+        matrix = gtid_class.GtidMatrix([
+            gtid_class.GtidSet(f"{self.uuid}:1-100:102-200"),
+            gtid_class.GtidSet(f"{self.uuid}:1-100:102-150")])
+
+        self.assertEqual(matrix.sums, [0, 49, 99])
+        self.assertEqual(matrix.masks, [3, 1])
+
+    def test_large(self):
+
+        """Function:  test_large
+
+        Description:  Test with transactions past the 32 bit bounds.
+
+        Arguments:
+
+        """
+
+        matrix = gtid_class.GtidMatrix([
+            gtid_class.GtidSet(f"{self.uuid}:1-4294967296"),
+            gtid_class.GtidSet(f"{self.uuid}:1-10")])
+
+        self.assertEqual(matrix.missing(1, 0), 4294967286)
+
+    def test_empty(self):
+
+        """Function:  test_empty
+
+        Description:  Test with no sets.
+
+        Arguments:
+
+        """
+
+        matrix = gtid_class.GtidMatrix([])
+
+        self.assertEqual((matrix.size, matrix.masks), (0, []))
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.matrix.size, 4)
+        self.assertEqual(len(self.matrix.masks), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
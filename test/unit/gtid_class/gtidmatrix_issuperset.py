@@ -0,0 +1,101 @@
+# Classification (U)
+
+"""Program:  gtidmatrix_issuperset.py
+
+    Description:  Unit testing of GtidMatrix.issuperset in gtid_class.py.
+
+    Usage:
+        test/unit/gtid_class/gtidmatrix_issuperset.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import gtid_class                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_divergent
+        test_same
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.uuid = "3e11fa47-71ca-11e1-9e33-c80aa9429562"
+        self.uuid2 = "4a2c7d11-71ca-11e1-9e33-c80aa9429562"
+        self.matrix = gtid_class.GtidMatrix([
+            gtid_class.GtidSet(f"{self.uuid}:1-100:102-200"),
+            gtid_class.GtidSet(f"{self.uuid}:1-100:102-150"),
+            gtid_class.GtidSet(f"{self.uuid}:1-100:102-150,{self.uuid2}:1-3"),
+            gtid_class.GtidSet(f"{self.uuid}:1-101")])
+
+    def test_divergent(self):
+
+        """Function:  test_divergent
+
+        Description:  Test with sets which diverge.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(self.matrix.issuperset(0, 2))
+        self.assertFalse(self.matrix.issuperset(2, 0))
+
+    def test_same(self):
+
+        """Function:  test_same
+
+        Description:  Test with a set and itself.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(self.matrix.issuperset(3, 3))
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(self.matrix.issuperset(0, 1))
+        self.assertFalse(self.matrix.issuperset(1, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
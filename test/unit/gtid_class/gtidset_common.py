@@ -0,0 +1,153 @@
+# Classification (U)
+
+"""Program:  gtidset_common.py
+
+    Description:  Unit testing of GtidSet._common in gtid_class.py.
+
+    Usage:
+        test/unit/gtid_class/gtidset_common.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import array
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import gtid_class                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_typecodes
+        test_prefix
+        test_end_differs
+        test_none_shared
+        test_empty
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.mine = array.array("I", [1, 5, 7, 9, 11, 20])
+
+    def test_typecodes(self):
+
+        """Function:  test_typecodes
+
+        Description:  Test with arrays of different typecodes.
+
+        Arguments:
+
+        """
+
+        theirs = array.array("Q", [1, 5, 7, 9, 11, 2 ** 40])
+
+        self.assertEqual(
+            gtid_class.GtidSet._common(                 # pylint:disable=W0212
+                self.mine, theirs), 2)
+
+    def test_prefix(self):
+
+        """Function:  test_prefix
+
+        Description:  Test with one array the start of the other.
+
+        Arguments:
+
+        """
+
+        theirs = array.array("I", [1, 5, 7, 9])
+
+        self.assertEqual(
+            gtid_class.GtidSet._common(                 # pylint:disable=W0212
+                self.mine, theirs), 2)
+
+    def test_end_differs(self):
+
+        """Function:  test_end_differs
+
+        Description:  Test with intervals which differ in their end bound.
+
+        Arguments:
+
+        """
+
+        theirs = array.array("I", [1, 5, 7, 10, 11, 20])
+
+        self.assertEqual(
+            gtid_class.GtidSet._common(                 # pylint:disable=W0212
+                self.mine, theirs), 1)
+
+    def test_none_shared(self):
+
+        """Function:  test_none_shared
+
+        Description:  Test with no shared intervals.
+
+        Arguments:
+
+        """
+
+        theirs = array.array("I", [2, 5, 7, 9, 11, 20])
+
+        self.assertEqual(
+            gtid_class.GtidSet._common(                 # pylint:disable=W0212
+                self.mine, theirs), 0)
+
+    def test_empty(self):
+
+        """Function:  test_empty
+
+        Description:  Test with an empty array.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            gtid_class.GtidSet._common(                 # pylint:disable=W0212
+                self.mine, array.array("I")), 0)
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            gtid_class.GtidSet._common(                 # pylint:disable=W0212
+                self.mine, array.array("I", self.mine)), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
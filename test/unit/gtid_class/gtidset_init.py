@@ -0,0 +1,183 @@
+# Classification (U)
+
+"""Program:  gtidset_init.py
+
+    Description:  Unit testing of GtidSet.__init__ in gtid_class.py.
+
+    Usage:
+        test/unit/gtid_class/gtidset_init.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import gtid_class                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_interned
+        test_packed
+        test_large
+        test_copy
+        test_tagged
+        test_merge
+        test_none
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.uuid = "3e11fa47-71ca-11e1-9e33-c80aa9429562"
+        self.uuid2 = "4a2c7d11-71ca-11e1-9e33-c80aa9429562"
+
+    def test_interned(self):
+
+        """Function:  test_interned
+
+        Description:  Test the source UUIDs of two sets are shared.
+
+        Arguments:
+
+        """
+
+        gtids = gtid_class.GtidSet(f"{self.uuid}:1-5")
+        gtids2 = gtid_class.GtidSet(f"{self.uuid.upper()}:1-5")
+
+        self.assertIs(list(gtids.gtids)[0], list(gtids2.gtids)[0])
+
+    def test_packed(self):
+
+        """Function:  test_packed
+
+        Description:  Test the intervals are packed in an array of bounds.
+
+        Arguments:
+
+        """
+
+        gtids = gtid_class.GtidSet(f"{self.uuid}:1-5:7")
+
+        self.assertEqual(gtids.gtids[self.uuid].tolist(), [1, 5, 7, 7])
+
+    def test_large(self):
+
+        """Function:  test_large
+
+        Description:  Test with transactions past the 32 bit bounds.
+
+        Arguments:
+
+        """
+
+        gtids = gtid_class.GtidSet(f"{self.uuid}:1-5:4294967296")
+
+        self.assertEqual(
+            (gtids.gtids[self.uuid].typecode, gtids.intervals()),
+            ("Q", {self.uuid: [(1, 5), (4294967296, 4294967296)]}))
+
+    def test_copy(self):
+
+        """Function:  test_copy
+
+        Description:  Test with a GtidSet instance passed.
+
+        Arguments:
+
+        """
+
+        gtids = gtid_class.GtidSet(f"{self.uuid}:1-5")
+        gtids2 = gtid_class.GtidSet(gtids)
+        gtids2.gtids[self.uuid][-1] = 7
+
+        self.assertEqual(gtids.intervals(), {self.uuid: [(1, 5)]})
+
+    def test_tagged(self):
+
+        """Function:  test_tagged
+
+        Description:  Test with a tagged GTID set.
+
+        Arguments:
+
+        """
+
+        gtids = gtid_class.GtidSet(f"{self.uuid}:1-3:Tag1:5")
+
+        self.assertEqual(
+            gtids.intervals(),
+            {self.uuid: [(1, 3)], f"{self.uuid}:tag1": [(5, 5)]})
+
+    def test_merge(self):
+
+        """Function:  test_merge
+
+        Description:  Test with overlapping and adjacent intervals.
+
+        Arguments:
+
+        """
+
+        gtids = gtid_class.GtidSet(
+            f"{self.uuid}:7-9:1-5:6:12,\n{self.uuid}:3-4")
+
+        self.assertEqual(
+            gtids.intervals(), {self.uuid: [(1, 9), (12, 12)]})
+
+    def test_none(self):
+
+        """Function:  test_none
+
+        Description:  Test with no GTID set passed.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(gtid_class.GtidSet().intervals(), {})
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        gtids = gtid_class.GtidSet(f"{self.uuid}:1-5,{self.uuid2}:3")
+
+        self.assertEqual(
+            gtids.intervals(), {self.uuid: [(1, 5)], self.uuid2: [(3, 3)]})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+# Classification (U)
+
+"""Program:  gtidset_intervals.py
+
+    Description:  Unit testing of GtidSet.intervals in gtid_class.py.
+
+    Usage:
+        test/unit/gtid_class/gtidset_intervals.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import gtid_class                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_empty
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.uuid = "3e11fa47-71ca-11e1-9e33-c80aa9429562"
+        self.uuid2 = "4a2c7d11-71ca-11e1-9e33-c80aa9429562"
+
+    def test_empty(self):
+
+        """Function:  test_empty
+
+        Description:  Test with an empty GTID set.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(gtid_class.GtidSet().intervals(), {})
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        gtids = gtid_class.GtidSet(
+            f"{self.uuid}:1-5:9,{self.uuid2}:1-10")
+
+        self.assertEqual(
+            gtids.intervals(),
+            {self.uuid: [(1, 5), (9, 9)], self.uuid2: [(1, 10)]})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+# Classification (U)
+
+"""Program:  gtidset_issuperset.py
+
+    Description:  Unit testing of GtidSet.issuperset in gtid_class.py.
+
+    Usage:
+        test/unit/gtid_class/gtidset_issuperset.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import gtid_class                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_shared
+        test_shared_behind
+        test_missing_uuid
+        test_gap
+        test_spans_gap
+        test_empty
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.uuid = "3e11fa47-71ca-11e1-9e33-c80aa9429562"
+        self.uuid2 = "4a2c7d11-71ca-11e1-9e33-c80aa9429562"
+        self.gtids = gtid_class.GtidSet(
+            f"{self.uuid}:1-10:15-20,{self.uuid2}:1-3")
+
+    def test_shared(self):
+
+        """Function:  test_shared
+
+        Description:  Test with a set that shares the leading intervals.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(self.gtids.issuperset(
+            gtid_class.GtidSet(f"{self.uuid}:1-10:15-18,{self.uuid2}:1-3")))
+
+    def test_shared_behind(self):
+
+        """Function:  test_shared_behind
+
+        Description:  Test with a set that shares the leading intervals and has
+            more transactions in its last interval.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(self.gtids.issuperset(
+            gtid_class.GtidSet(f"{self.uuid}:1-10:15-21")))
+
+    def test_missing_uuid(self):
+
+        """Function:  test_missing_uuid
+
+        Description:  Test with a source missing from the set.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(self.gtids.issuperset(gtid_class.GtidSet(
+            "5b3e9c20-71ca-11e1-9e33-c80aa9429562:1")))
+
+    def test_gap(self):
+
+        """Function:  test_gap
+
+        Description:  Test with a transaction in a gap of the set.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(self.gtids.issuperset(
+            gtid_class.GtidSet(f"{self.uuid}:2-4:12")))
+
+    def test_spans_gap(self):
+
+        """Function:  test_spans_gap
+
+        Description:  Test with an interval spanning a gap of the set.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(self.gtids.issuperset(
+            gtid_class.GtidSet(f"{self.uuid}:8-16")))
+
+    def test_empty(self):
+
+        """Function:  test_empty
+
+        Description:  Test with an empty set.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(self.gtids.issuperset(gtid_class.GtidSet()))
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(self.gtids.issuperset(
+            gtid_class.GtidSet(f"{self.uuid}:2-4:15,{self.uuid2}:1")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+# Classification (U)
+
+"""Program:  gtidset_str.py
+
+    Description:  Unit testing of GtidSet.__str__ in gtid_class.py.
+
+    Usage:
+        test/unit/gtid_class/gtidset_str.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import gtid_class                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_empty
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.uuid = "3e11fa47-71ca-11e1-9e33-c80aa9429562"
+        self.uuid2 = "4a2c7d11-71ca-11e1-9e33-c80aa9429562"
+
+    def test_empty(self):
+
+        """Function:  test_empty
+
+        Description:  Test with an empty GTID set.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(str(gtid_class.GtidSet("")), "")
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        gtids = gtid_class.GtidSet(f"{self.uuid2}:3,{self.uuid}:1-5:9")
+
+        self.assertEqual(str(gtids), f"{self.uuid}:1-5:9,{self.uuid2}:3")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+# Classification (U)
+
+"""Program:  gtidset_subtract.py
+
+    Description:  Unit testing of GtidSet.subtract in gtid_class.py.
+
+    Usage:
+        test/unit/gtid_class/gtidset_subtract.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import gtid_class                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_shared
+        test_split
+        test_all
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.uuid = "3e11fa47-71ca-11e1-9e33-c80aa9429562"
+        self.uuid2 = "4a2c7d11-71ca-11e1-9e33-c80aa9429562"
+        self.gtids = gtid_class.GtidSet(
+            f"{self.uuid}:1-10:15-20,{self.uuid2}:1-3")
+
+    def test_shared(self):
+
+        """Function:  test_shared
+
+        Description:  Test with a set that shares the leading intervals.
+
+        Arguments:
+
+        """
+
+        gtids = self.gtids.subtract(
+            gtid_class.GtidSet(f"{self.uuid}:1-10:15-17,{self.uuid2}:1-3"))
+
+        self.assertEqual(str(gtids), f"{self.uuid}:18-20")
+
+    def test_split(self):
+
+        """Function:  test_split
+
+        Description:  Test with an interval split by the other set.
+
+        Arguments:
+
+        """
+
+        gtids = self.gtids.subtract(
+            gtid_class.GtidSet(f"{self.uuid}:3-4:8:16-30"))
+
+        self.assertEqual(
+            str(gtids), f"{self.uuid}:1-2:5-7:9-10:15,{self.uuid2}:1-3")
+
+    def test_all(self):
+
+        """Function:  test_all
+
+        Description:  Test with every transaction removed.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(self.gtids.subtract(self.gtids))
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        gtids = self.gtids.subtract(
+            gtid_class.GtidSet(f"{self.uuid2}:1-5"))
+
+        self.assertEqual(str(gtids), f"{self.uuid}:1-10:15-20")
+
+
+if __name__ == "__main__":
+    unittest.main()
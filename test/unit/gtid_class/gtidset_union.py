@@ -0,0 +1,118 @@
+# Classification (U)
+
+"""Program:  gtidset_union.py
+
+    Description:  Unit testing of GtidSet.union in gtid_class.py.
+
+    Usage:
+        test/unit/gtid_class/gtidset_union.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import gtid_class                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_shared
+        test_mixed
+        test_no_change
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.uuid = "3e11fa47-71ca-11e1-9e33-c80aa9429562"
+        self.uuid2 = "4a2c7d11-71ca-11e1-9e33-c80aa9429562"
+        self.gtids = gtid_class.GtidSet(f"{self.uuid}:1-10:15-20")
+
+    def test_shared(self):
+
+        """Function:  test_shared
+
+        Description:  Test with sets that share their leading intervals.
+
+        Arguments:
+
+        """
+
+        gtids = self.gtids.union(gtid_class.GtidSet(f"{self.uuid}:1-10:15-25"))
+
+        self.assertEqual(str(gtids), f"{self.uuid}:1-10:15-25")
+
+    def test_mixed(self):
+
+        """Function:  test_mixed
+
+        Description:  Test with intervals past the 32 bit bounds.
+
+        Arguments:
+
+        """
+
+        gtids = self.gtids.union(gtid_class.GtidSet(f"{self.uuid}:4294967296"))
+
+        self.assertEqual(
+            str(gtids), f"{self.uuid}:1-10:15-20:4294967296")
+
+    def test_no_change(self):
+
+        """Function:  test_no_change
+
+        Description:  Test the original set is not changed.
+
+        Arguments:
+
+        """
+
+        self.gtids.union(gtid_class.GtidSet(f"{self.uuid}:11-14"))
+
+        self.assertEqual(str(self.gtids), f"{self.uuid}:1-10:15-20")
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        gtids = self.gtids.union(
+            gtid_class.GtidSet(f"{self.uuid}:11-14,{self.uuid2}:1"))
+
+        self.assertEqual(str(gtids), f"{self.uuid}:1-20,{self.uuid2}:1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,242 @@
+# Classification (U)
+
+"""Program:  gtidtracker_advance.py
+
+    Description:  Unit testing of GtidTracker.advance in gtid_class.py.
+
+    Usage:
+        test/unit/gtid_class/gtidtracker_advance.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import gtid_class                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def digest(gtids):
+
+    """Function:  digest
+
+    Description:  Digest of a GTID set string.
+
+    Arguments:
+        (input) gtids -> GTID set string
+        (output) SHA-256 hex digest or None for an empty set
+
+    """
+
+    return gtid_class.GtidTracker.digest(gtid_class.GtidSet(gtids))
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_large
+        test_not_tracked
+        test_unchanged
+        test_gap
+        test_local
+        test_empty
+        test_new_source
+        test_workers
+        test_no_change
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.uuid = "3e11fa47-71ca-11e1-9e33-c80aa9429562"
+        self.uuid2 = "4a2c7d11-71ca-11e1-9e33-c80aa9429562"
+        self.key = ("slave1", "exe_gtidset")
+        self.tracker = gtid_class.GtidTracker()
+        gtids = f"{self.uuid}:1-10,{self.uuid2}:1-5"
+        self.digest = digest(gtids)
+        self.tracker.rebase(self.key, gtids, self.digest)
+
+    def test_large(self):
+
+        """Function:  test_large
+
+        Description:  Test with transactions past the 32 bit bounds.
+
+        Arguments:
+
+        """
+
+        gtids = f"{self.uuid}:1-4294967296,{self.uuid2}:1-5"
+
+        self.assertEqual(
+            str(self.tracker.advance(
+                self.key, f"{self.uuid}:4294967296", digest(gtids))), gtids)
+
+    def test_not_tracked(self):
+
+        """Function:  test_not_tracked
+
+        Description:  Test with a key which is not tracked.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(self.tracker.advance(
+            ("slave2", "exe_gtidset"), f"{self.uuid}:12", self.digest))
+
+    def test_unchanged(self):
+
+        """Function:  test_unchanged
+
+        Description:  Test with a set which has not changed.
+
+        Arguments:
+
+        """
+
+        gtids = self.tracker.advance(self.key, f"{self.uuid}:10", self.digest)
+
+        self.assertIs(gtids, self.tracker.get(self.key))
+        self.assertEqual(self.tracker.stats["unchanged"], 1)
+
+    def test_gap(self):
+
+        """Function:  test_gap
+
+        Description:  Test with a gap left by a parallel applier.
+
+        Arguments:
+
+        """
+
+        gtids = f"{self.uuid}:1-10:13,{self.uuid2}:1-5"
+
+        self.assertIsNone(self.tracker.advance(
+            self.key, f"{self.uuid}:13", digest(gtids)))
+        self.assertEqual(str(self.tracker.get(self.key)),
+                         f"{self.uuid}:1-10,{self.uuid2}:1-5")
+
+    def test_local(self):
+
+        """Function:  test_local
+
+        Description:  Test with a local transaction on the slave.
+
+        Arguments:
+
+        """
+
+        uuid3 = "5b3d8e22-71ca-11e1-9e33-c80aa9429562"
+        gtids = f"{self.uuid}:1-12,{self.uuid2}:1-5,{uuid3}:1"
+
+        self.assertIsNone(self.tracker.advance(
+            self.key, f"{self.uuid}:12", digest(gtids)))
+
+    def test_empty(self):
+
+        """Function:  test_empty
+
+        Description:  Test with a set which is now empty.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(self.tracker.advance(self.key, "", None))
+
+    def test_new_source(self):
+
+        """Function:  test_new_source
+
+        Description:  Test with a transaction from a new source.
+
+        Arguments:
+
+        """
+
+        uuid3 = "5b3d8e22-71ca-11e1-9e33-c80aa9429562"
+        gtids = f"{self.uuid}:1-10,{self.uuid2}:1-5,{uuid3}:1-3"
+
+        self.assertEqual(
+            str(self.tracker.advance(
+                self.key, f"{uuid3}:3", digest(gtids))), gtids)
+
+    def test_workers(self):
+
+        """Function:  test_workers
+
+        Description:  Test with the last transactions of several workers.
+
+        Arguments:
+
+        """
+
+        gtids = f"{self.uuid}:1-14,{self.uuid2}:1-7"
+
+        self.assertEqual(
+            str(self.tracker.advance(
+                self.key, f"{self.uuid}:12,{self.uuid}:14,{self.uuid2}:7",
+                digest(gtids))), gtids)
+
+    def test_no_change(self):
+
+        """Function:  test_no_change
+
+        Description:  Test the tracked set is not changed in place.
+
+        Arguments:
+
+        """
+
+        before = self.tracker.get(self.key)
+        gtids = f"{self.uuid}:1-12,{self.uuid2}:1-5"
+        self.tracker.advance(self.key, f"{self.uuid}:12", digest(gtids))
+
+        self.assertEqual(str(before), f"{self.uuid}:1-10,{self.uuid2}:1-5")
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        gtids = f"{self.uuid}:1-12,{self.uuid2}:1-5"
+        result = self.tracker.advance(
+            self.key, f"{self.uuid}:12", digest(gtids))
+
+        self.assertEqual(str(result), gtids)
+        self.assertIs(self.tracker.get(self.key), result)
+        self.assertEqual(self.tracker.stats["incremental"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+# Classification (U)
+
+"""Program:  gtidtracker_digest.py
+
+    Description:  Unit testing of GtidTracker.digest in gtid_class.py.
+
+    Usage:
+        test/unit/gtid_class/gtidtracker_digest.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import hashlib
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import gtid_class                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_empty
+        test_format
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.uuid = "3e11fa47-71ca-11e1-9e33-c80aa9429562"
+        self.uuid2 = "4a2c7d11-71ca-11e1-9e33-c80aa9429562"
+        self.key = ("slave1", "exe_gtidset")
+        self.tracker = gtid_class.GtidTracker()
+
+    def test_empty(self):
+
+        """Function:  test_empty
+
+        Description:  Test with an empty set.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(gtid_class.GtidTracker.digest(gtid_class.GtidSet()))
+
+    def test_format(self):
+
+        """Function:  test_format
+
+        Description:  Test the digest is of the set in MySQL format.
+
+        Arguments:
+
+        """
+
+        gtids = gtid_class.GtidSet(f"{self.uuid2}:1-5,\n{self.uuid}:1-10:12")
+
+        self.assertEqual(
+            gtid_class.GtidTracker.digest(gtids),
+            hashlib.sha256(
+                f"{self.uuid}:1-10:12,{self.uuid2}:1-5".encode()).hexdigest())
+
+
+if __name__ == "__main__":
+    unittest.main()
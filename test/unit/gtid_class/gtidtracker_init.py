@@ -0,0 +1,59 @@
+# Classification (U)
+
+"""Program:  gtidtracker_init.py
+
+    Description:  Unit testing of GtidTracker.__init__ in gtid_class.py.
+
+    Usage:
+        test/unit/gtid_class/gtidtracker_init.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import gtid_class                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_default
+
+    """
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        tracker = gtid_class.GtidTracker()
+
+        self.assertEqual(tracker.sets, {})
+        self.assertEqual(tracker.unsupported, set())
+        self.assertEqual(tracker.stats,
+                         {"full": 0, "incremental": 0, "unchanged": 0})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+# Classification (U)
+
+"""Program:  gtidtracker_rebase.py
+
+    Description:  Unit testing of GtidTracker.rebase in gtid_class.py.
+
+    Usage:
+        test/unit/gtid_class/gtidtracker_rebase.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import gtid_class                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def digest(gtids):
+
+    """Function:  digest
+
+    Description:  Digest of a GTID set string.
+
+    Arguments:
+        (input) gtids -> GTID set string
+        (output) SHA-256 hex digest or None for an empty set
+
+    """
+
+    return gtid_class.GtidTracker.digest(gtid_class.GtidSet(gtids))
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_retrack
+        test_mismatch
+        test_empty
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.uuid = "3e11fa47-71ca-11e1-9e33-c80aa9429562"
+        self.uuid2 = "4a2c7d11-71ca-11e1-9e33-c80aa9429562"
+        self.key = ("slave1", "exe_gtidset")
+        self.tracker = gtid_class.GtidTracker()
+
+    def test_retrack(self):
+
+        """Function:  test_retrack
+
+        Description:  Test a key is no longer tracked on a mismatch.
+
+        Arguments:
+
+        """
+
+        gtids = f"{self.uuid}:1-10"
+        self.tracker.rebase(self.key, gtids, digest(gtids))
+        self.tracker.rebase(self.key, gtids, "0" * 64)
+
+        self.assertIsNone(self.tracker.get(self.key))
+
+    def test_mismatch(self):
+
+        """Function:  test_mismatch
+
+        Description:  Test with a digest which does not match.
+
+        Arguments:
+
+        """
+
+        gtids = self.tracker.rebase(self.key, f"{self.uuid}:1-10", "0" * 64)
+
+        self.assertEqual(str(gtids), f"{self.uuid}:1-10")
+        self.assertIsNone(self.tracker.get(self.key))
+        self.assertEqual(self.tracker.stats["full"], 1)
+
+    def test_empty(self):
+
+        """Function:  test_empty
+
+        Description:  Test with an empty set.
+
+        Arguments:
+
+        """
+
+        gtids = self.tracker.rebase(self.key, "", None)
+
+        self.assertFalse(gtids)
+        self.assertIs(self.tracker.get(self.key), gtids)
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        gtids = self.tracker.rebase(
+            self.key, f"{self.uuid}:1-10", digest(f"{self.uuid}:1-10"))
+
+        self.assertEqual(str(gtids), f"{self.uuid}:1-10")
+        self.assertIs(self.tracker.get(self.key), gtids)
+        self.assertEqual(self.tracker.stats["full"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
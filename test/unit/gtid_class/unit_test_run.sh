@@ -0,0 +1,27 @@
+#!/bin/bash
+# Unit testing program for the class module.
+# This will run all the units tests for this class.
+# Will need to run this from the base directory where the module file
+#   is located at.
+
+echo ""
+echo "Unit testing..."
+/usr/bin/python test/unit/gtid_class/gtidmatrix_complete.py
+/usr/bin/python test/unit/gtid_class/gtidmatrix_errant.py
+/usr/bin/python test/unit/gtid_class/gtidmatrix_init.py
+/usr/bin/python test/unit/gtid_class/gtidmatrix_issuperset.py
+/usr/bin/python test/unit/gtid_class/gtidmatrix_missing.py
+/usr/bin/python test/unit/gtid_class/gtidset_common.py
+/usr/bin/python test/unit/gtid_class/gtidset_count.py
+/usr/bin/python test/unit/gtid_class/gtidset_init.py
+/usr/bin/python test/unit/gtid_class/gtidset_intervals.py
+/usr/bin/python test/unit/gtid_class/gtidset_issuperset.py
+/usr/bin/python test/unit/gtid_class/gtidset_str.py
+/usr/bin/python test/unit/gtid_class/gtidset_subtract.py
+/usr/bin/python test/unit/gtid_class/gtidset_union.py
+/usr/bin/python test/unit/gtid_class/gtidtracker_advance.py
+/usr/bin/python test/unit/gtid_class/gtidtracker_digest.py
+/usr/bin/python test/unit/gtid_class/gtidtracker_forget.py
+/usr/bin/python test/unit/gtid_class/gtidtracker_get.py
+/usr/bin/python test/unit/gtid_class/gtidtracker_init.py
+/usr/bin/python test/unit/gtid_class/gtidtracker_rebase.py
@@ -0,0 +1,22 @@
+#!/bin/bash
+# Unit test code coverage for class module.
+# This will run the Python code coverage module against all unit test modules.
+# This will show the amount of code that was tested and which lines of code
+#   that was skipped during the test.
+
+coverage erase
+
+echo ""
+echo "Running unit test modules in conjunction with coverage"
+coverage run -a --source=lazy_class test/unit/lazy_class/lazymodule_delattr.py
+coverage run -a --source=lazy_class test/unit/lazy_class/lazymodule_dir.py
+coverage run -a --source=lazy_class test/unit/lazy_class/lazymodule_getattr.py
+coverage run -a --source=lazy_class test/unit/lazy_class/lazymodule_init.py
+coverage run -a --source=lazy_class test/unit/lazy_class/lazymodule_load.py
+coverage run -a --source=lazy_class test/unit/lazy_class/lazymodule_repr.py
+coverage run -a --source=lazy_class test/unit/lazy_class/lazymodule_setattr.py
+
+echo ""
+echo "Producing code coverage report"
+coverage combine
+coverage report -m
@@ -0,0 +1,85 @@
+# Classification (U)
+
+"""Program:  lazymodule_delattr.py
+
+    Description:  Unit testing of LazyModule.__delattr__ in lazy_class.py.
+
+    Usage:
+        test/unit/lazy_class/lazymodule_delattr.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import types
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import lazy_class                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.module = types.SimpleNamespace(value=1)
+        sys.modules["lazy_test_mod"] = self.module
+        self.lazy = lazy_class.LazyModule("lazy_test_mod")
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        sys.modules.pop("lazy_test_mod", None)
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        del self.lazy.value
+
+        self.assertFalse(hasattr(self.module, "value"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+# Classification (U)
+
+"""Program:  lazymodule_init.py
+
+    Description:  Unit testing of LazyModule.__init__ in lazy_class.py.
+
+    Usage:
+        test/unit/lazy_class/lazymodule_init.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import types
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import lazy_class                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_not_imported
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.module = types.SimpleNamespace(value=1)
+        sys.modules["lazy_test_mod"] = self.module
+        self.lazy = lazy_class.LazyModule("lazy_test_mod")
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        sys.modules.pop("lazy_test_mod", None)
+
+    def test_not_imported(self):
+
+        """Function:  test_not_imported
+
+        Description:  Test the module is not imported on initialization.
+
+        Arguments:
+
+        """
+
+        sys.modules.pop("lazy_test_mod")
+        lazy = lazy_class.LazyModule("lazy_test_mod")
+
+        self.assertNotIn("lazy_test_mod", sys.modules)
+        self.assertEqual(
+            repr(lazy), "<LazyModule 'lazy_test_mod' (not loaded)>")
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        lazy = lazy_class.LazyModule("lazy_test_mod", package="lazy_test_pkg")
+
+        self.assertEqual(
+            repr(lazy), "<LazyModule 'lazy_test_mod' (not loaded)>")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+# Classification (U)
+
+"""Program:  lazymodule_load.py
+
+    Description:  Unit testing of LazyModule._load in lazy_class.py.
+
+    Usage:
+        test/unit/lazy_class/lazymodule_load.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import types
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import lazy_class                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_package
+        test_not_found
+        test_once
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.module = types.SimpleNamespace(value=1)
+        sys.modules["lazy_test_mod"] = self.module
+        self.lazy = lazy_class.LazyModule("lazy_test_mod")
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        sys.modules.pop("lazy_test_mod", None)
+
+    def test_package(self):
+
+        """Function:  test_package
+
+        Description:  Test with the module not in the package.
+
+        Arguments:
+
+        """
+
+        lazy = lazy_class.LazyModule("lazy_test_mod", package="lazy_test_pkg")
+
+        self.assertEqual(lazy.value, 1)
+
+    def test_not_found(self):
+
+        """Function:  test_not_found
+
+        Description:  Test with a module that does not exist.
+
+        Arguments:
+
+        """
+
+        lazy = lazy_class.LazyModule("lazy_test_missing")
+
+        with self.assertRaises(ImportError):
+            _ = lazy.value
+
+    def test_once(self):
+
+        """Function:  test_once
+
+        Description:  Test the module is imported once.
+
+        Arguments:
+
+        """
+
+        _ = self.lazy.value
+        sys.modules.pop("lazy_test_mod")
+
+        self.assertEqual(self.lazy.value, 1)
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(dir(self.lazy), dir(self.module))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+# Classification (U)
+
+"""Program:  lazymodule_setattr.py
+
+    Description:  Unit testing of LazyModule.__setattr__ in lazy_class.py.
+
+    Usage:
+        test/unit/lazy_class/lazymodule_setattr.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import types
+import mock
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import lazy_class                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_patch
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.module = types.SimpleNamespace(value=1)
+        sys.modules["lazy_test_mod"] = self.module
+        self.lazy = lazy_class.LazyModule("lazy_test_mod")
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        sys.modules.pop("lazy_test_mod", None)
+
+    def test_patch(self):
+
+        """Function:  test_patch
+
+        Description:  Test patching an attribute through the stand-in.
+
+        Arguments:
+
+        """
+
+        with mock.patch.object(self.lazy, "value", 2):
+            self.assertEqual(self.module.value, 2)
+
+        self.assertEqual(self.module.value, 1)
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        self.lazy.value = 3
+
+        self.assertEqual(self.module.value, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,15 @@
+#!/bin/bash
+# Unit testing program for the class module.
+# This will run all the units tests for this class.
+# Will need to run this from the base directory where the module file
+#   is located at.
+
+echo ""
+echo "Unit testing..."
+/usr/bin/python test/unit/lazy_class/lazymodule_delattr.py
+/usr/bin/python test/unit/lazy_class/lazymodule_dir.py
+/usr/bin/python test/unit/lazy_class/lazymodule_getattr.py
+/usr/bin/python test/unit/lazy_class/lazymodule_init.py
+/usr/bin/python test/unit/lazy_class/lazymodule_load.py
+/usr/bin/python test/unit/lazy_class/lazymodule_repr.py
+/usr/bin/python test/unit/lazy_class/lazymodule_setattr.py
@@ -0,0 +1,20 @@
+#!/bin/bash
+# Unit test code coverage for class module.
+# This will run the Python code coverage module against all unit test modules.
+# This will show the amount of code that was tested and which lines of code
+#   that was skipped during the test.
+
+coverage erase
+
+echo ""
+echo "Running unit test modules in conjunction with coverage"
+coverage run -a --source=lock_class test/unit/lock_class/lockedrep_class.py
+coverage run -a --source=lock_class test/unit/lock_class/lockedrep_getattr.py
+coverage run -a --source=lock_class test/unit/lock_class/lockedrep_init.py
+coverage run -a --source=lock_class test/unit/lock_class/lockedrep_repr.py
+coverage run -a --source=lock_class test/unit/lock_class/lockedrep_setattr.py
+
+echo ""
+echo "Producing code coverage report"
+coverage combine
+coverage report -m
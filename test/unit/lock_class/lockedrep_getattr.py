@@ -0,0 +1,149 @@
+# Classification (U)
+
+"""Program:  lockedrep_getattr.py
+
+    Description:  Unit testing of LockedRep.__getattr__ in lock_class.py.
+
+    Usage:
+        test/unit/lock_class/lockedrep_getattr.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import threading
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import lock_class                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class MasterRep():                                      # pylint:disable=R0903
+
+    """Class:  MasterRep
+
+    Description:  Class stub holder for mysql_class.MasterRep class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "master"
+        self.conn = "Connection"
+        self.locked = None
+        self.lock = None
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Stub holder for mysql_class.MasterRep.col_sql method.
+            Records if the lock is held while it runs.
+
+        Arguments:
+            (input) cmd
+
+        """
+
+        self.locked = self.lock is not None and not self.lock.acquire(
+            blocking=False)
+
+        if not self.locked and self.lock is not None:
+            self.lock.release()
+
+        return [{"cmd": cmd}]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_method
+        test_missing
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = MasterRep()
+        self.lock = threading.Lock()
+        self.master.lock = self.lock
+        self.locked = lock_class.LockedRep(self.master, self.lock)
+
+    def test_method(self):
+
+        """Function:  test_method
+
+        Description:  Test a method holds the lock while it runs.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.locked.col_sql("SELECT 1"),
+                         [{"cmd": "SELECT 1"}])
+        self.assertTrue(self.master.locked)
+        self.assertTrue(self.lock.acquire(blocking=False))
+        self.lock.release()
+
+    def test_missing(self):
+
+        """Function:  test_missing
+
+        Description:  Test with an attribute the server does not have.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(hasattr(self.locked, "missing"))
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.locked.conn, "Connection")
+
+
+if __name__ == "__main__":
+    unittest.main()
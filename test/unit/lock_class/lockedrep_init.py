@@ -0,0 +1,138 @@
+# Classification (U)
+
+"""Program:  lockedrep_init.py
+
+    Description:  Unit testing of LockedRep.__init__ in lock_class.py.
+
+    Usage:
+        test/unit/lock_class/lockedrep_init.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import threading
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import lock_class                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class MasterRep():                                      # pylint:disable=R0903
+
+    """Class:  MasterRep
+
+    Description:  Class stub holder for mysql_class.MasterRep class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "master"
+        self.conn = "Connection"
+        self.locked = None
+        self.lock = None
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Stub holder for mysql_class.MasterRep.col_sql method.
+            Records if the lock is held while it runs.
+
+        Arguments:
+            (input) cmd
+
+        """
+
+        self.locked = self.lock is not None and not self.lock.acquire(
+            blocking=False)
+
+        if not self.locked and self.lock is not None:
+            self.lock.release()
+
+        return [{"cmd": cmd}]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_lock
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = MasterRep()
+        self.lock = threading.Lock()
+        self.master.lock = self.lock
+        self.locked = lock_class.LockedRep(self.master, self.lock)
+
+    def test_lock(self):
+
+        """Function:  test_lock
+
+        Description:  Test with a lock given.
+
+        Arguments:
+
+        """
+
+        self.assertIs(self.locked._lock,         # pylint:disable=W0212
+                      self.lock)
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        locked = lock_class.LockedRep(self.master)
+        lock = locked._lock                         # pylint:disable=W0212
+
+        self.assertIs(locked._server, self.master)  # pylint:disable=W0212
+        self.assertTrue(lock.acquire(blocking=False))
+        lock.release()
+
+
+if __name__ == "__main__":
+    unittest.main()
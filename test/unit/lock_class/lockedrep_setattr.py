@@ -0,0 +1,121 @@
+# Classification (U)
+
+"""Program:  lockedrep_setattr.py
+
+    Description:  Unit testing of LockedRep.__setattr__ in lock_class.py.
+
+    Usage:
+        test/unit/lock_class/lockedrep_setattr.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import threading
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import lock_class                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class MasterRep():                                      # pylint:disable=R0903
+
+    """Class:  MasterRep
+
+    Description:  Class stub holder for mysql_class.MasterRep class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "master"
+        self.conn = "Connection"
+        self.locked = None
+        self.lock = None
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Stub holder for mysql_class.MasterRep.col_sql method.
+            Records if the lock is held while it runs.
+
+        Arguments:
+            (input) cmd
+
+        """
+
+        self.locked = self.lock is not None and not self.lock.acquire(
+            blocking=False)
+
+        if not self.locked and self.lock is not None:
+            self.lock.release()
+
+        return [{"cmd": cmd}]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = MasterRep()
+        self.lock = threading.Lock()
+        self.master.lock = self.lock
+        self.locked = lock_class.LockedRep(self.master, self.lock)
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test the attribute is written to the server.
+
+        Arguments:
+
+        """
+
+        self.locked.exe_gtid = "GTID"
+
+        self.assertEqual(self.master.exe_gtid, "GTID")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,13 @@
+#!/bin/bash
+# Unit testing program for the class module.
+# This will run all the units tests for this class.
+# Will need to run this from the base directory where the module file
+#   is located at.
+
+echo ""
+echo "Unit testing..."
+/usr/bin/python test/unit/lock_class/lockedrep_class.py
+/usr/bin/python test/unit/lock_class/lockedrep_getattr.py
+/usr/bin/python test/unit/lock_class/lockedrep_init.py
+/usr/bin/python test/unit/lock_class/lockedrep_repr.py
+/usr/bin/python test/unit/lock_class/lockedrep_setattr.py
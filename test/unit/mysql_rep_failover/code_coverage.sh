@@ -8,17 +8,20 @@ coverage erase
 
 echo ""
 echo "Running unit test modules in conjunction with coverage"
-coverage run -a --source=mysql_rep_failover test/unit/mysql_rep_failover/convert_to_master.py
-coverage run -a --source=mysql_rep_failover test/unit/mysql_rep_failover/create_instances.py
 coverage run -a --source=mysql_rep_failover test/unit/mysql_rep_failover/gtid_enabled.py
 coverage run -a --source=mysql_rep_failover test/unit/mysql_rep_failover/help_message.py
+coverage run -a --source=mysql_rep_failover test/unit/mysql_rep_failover/load_slaves.py
 coverage run -a --source=mysql_rep_failover test/unit/mysql_rep_failover/main.py
-coverage run -a --source=mysql_rep_failover test/unit/mysql_rep_failover/order_slaves_on_gtid.py
 coverage run -a --source=mysql_rep_failover test/unit/mysql_rep_failover/promote_best_slave.py
 coverage run -a --source=mysql_rep_failover test/unit/mysql_rep_failover/promote_designated_slave.py
+coverage run -a --source=mysql_rep_failover test/unit/mysql_rep_failover/rejoin_slaves.py
+coverage run -a --source=mysql_rep_failover test/unit/mysql_rep_failover/restore_signals.py
 coverage run -a --source=mysql_rep_failover test/unit/mysql_rep_failover/run_program.py
 coverage run -a --source=mysql_rep_failover test/unit/mysql_rep_failover/show_best_slave.py
 coverage run -a --source=mysql_rep_failover test/unit/mysql_rep_failover/show_slave_delays.py
+coverage run -a --source=mysql_rep_failover test/unit/mysql_rep_failover/supervise.py
+coverage run -a --source=mysql_rep_failover test/unit/mysql_rep_failover/supervisor_signals.py
+coverage run -a --source=mysql_rep_failover test/unit/mysql_rep_failover/valid_num.py
 
 echo ""
 echo "Producing code coverage report"
@@ -0,0 +1,219 @@
+# Classification (U)
+
+"""Program:  load_slaves.py
+
+    Description:  Unit testing of load_slaves in mysql_rep_failover.py.
+
+    Usage:
+        test/unit/mysql_rep_failover/load_slaves.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_failover                       # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_args_keys
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_args_keys(self):
+
+        """Method:  get_args_keys
+
+        Description:  Method stub holder for gen_class.ArgParser.get_args_keys.
+
+        Arguments:
+
+        """
+
+        return list(self.args_array.keys())
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_snapshot
+        test_stream
+        test_workers
+        test_load
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.args.args_array = {"-d": "config", "-s": "slaves.txt", "-B": True}
+        self.slaves = ["slave1", "slave2"]
+        self.report = {"phases": {}, "slaves": {}}
+
+    @mock.patch("mysql_rep_failover.snapshot_libs.use_snapshot")
+    @mock.patch("mysql_rep_failover.discover_libs.create_instances")
+    @mock.patch("mysql_rep_failover.probe_libs.probe_slaves")
+    @mock.patch("mysql_rep_failover.snapshot_libs.save_snapshot")
+    def test_snapshot(self, mock_save, mock_probe, mock_instance,
+                      mock_snapshot):
+
+        """Function:  test_snapshot
+
+        Description:  Test with the slaves from the snapshot file.
+
+        Arguments:
+
+        """
+
+        mock_snapshot.return_value = self.slaves
+
+        self.assertEqual(
+            mysql_rep_failover.load_slaves(
+                self.args, {"-B"}, report=self.report, inventory={}),
+            (self.slaves, []))
+        self.assertFalse(mock_instance.called)
+        self.assertFalse(mock_probe.called)
+        self.assertFalse(mock_save.called)
+        self.assertIn("discovery", self.report["phases"])
+
+    @mock.patch("mysql_rep_failover.snapshot_libs.use_snapshot")
+    @mock.patch("mysql_rep_failover.discover_libs.create_instances")
+    @mock.patch("mysql_rep_failover.probe_libs.probe_slaves")
+    @mock.patch("mysql_rep_failover.snapshot_libs.save_snapshot")
+    def test_stream(self, mock_save, mock_probe, mock_instance,
+                    mock_snapshot):
+
+        """Function:  test_stream
+
+        Description:  Test the probe failures are streamed and not printed
+            with the -n option.
+
+        Arguments:
+
+        """
+
+        stream = mock.Mock()
+        mock_snapshot.return_value = None
+        mock_instance.return_value = self.slaves
+        mock_probe.return_value = self.slaves
+
+        mysql_rep_failover.load_slaves(
+            self.args, {"-B"}, inventory={}, stream=stream)
+
+        self.assertTrue(mock_probe.call_args[1]["quiet"])
+        self.assertIs(mock_probe.call_args[1]["stream"], stream)
+
+    @mock.patch("mysql_rep_failover.snapshot_libs.use_snapshot")
+    @mock.patch("mysql_rep_failover.discover_libs.create_instances")
+    @mock.patch("mysql_rep_failover.probe_libs.probe_slaves")
+    @mock.patch("mysql_rep_failover.snapshot_libs.save_snapshot")
+    def test_workers(self, mock_save, mock_probe, mock_instance,
+                     mock_snapshot):
+
+        """Function:  test_workers
+
+        Description:  Test with the -p option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-p"] = "4"
+        mock_snapshot.return_value = None
+        mock_instance.return_value = self.slaves
+        mock_probe.return_value = self.slaves
+
+        mysql_rep_failover.load_slaves(self.args, {"-B"}, inventory={})
+
+        self.assertEqual(mock_probe.call_args[1]["max_workers"], 4)
+
+    @mock.patch("mysql_rep_failover.snapshot_libs.use_snapshot")
+    @mock.patch("mysql_rep_failover.discover_libs.create_instances")
+    @mock.patch("mysql_rep_failover.probe_libs.probe_slaves")
+    @mock.patch("mysql_rep_failover.snapshot_libs.save_snapshot")
+    def test_load(self, mock_save, mock_probe, mock_instance,
+                  mock_snapshot):
+
+        """Function:  test_load
+
+        Description:  Test with the slaves created and probed, with the
+            snapshot file left to the -B and -D options.
+
+        Arguments:
+
+        """
+
+        mock_snapshot.return_value = None
+        mock_instance.return_value = self.slaves
+        mock_probe.return_value = self.slaves
+
+        self.assertEqual(
+            mysql_rep_failover.load_slaves(
+                self.args, {"-B"}, report=self.report, inventory={}),
+            (self.slaves, self.slaves))
+        self.assertFalse(mock_save.called)
+        self.assertEqual(mock_probe.call_args[1]["max_workers"], 16)
+        self.assertFalse(mock_probe.call_args[1]["quiet"])
+        self.assertIn("probe", self.report["phases"])
+
+
+if __name__ == "__main__":
+    unittest.main()
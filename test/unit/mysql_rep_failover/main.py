@@ -165,12 +165,14 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_plan
         test_arg_parse2_false
         test_arg_parse2_true
         test_programlock_id
         test_programlock_false
         test_programlock_true
         test_run_program
+        test_batch
         test_arg_dir_chk_crt_true
         test_arg_dir_chk_crt_false
         test_arg_xor_dict_true
@@ -199,6 +201,34 @@ class UnitTest(unittest.TestCase):
             "-c": "CfgFile", "-d": "CfgDir", "-y": "Flavor"}
         self.proglock = ProgramLock(["cmdline"], "FlavorID")
 
+    @mock.patch("mysql_rep_failover.run_program")
+    @mock.patch("mysql_rep_failover.gen_class.ProgramLock")
+    @mock.patch("mysql_rep_failover.gen_libs.help_func")
+    @mock.patch("mysql_rep_failover.gen_class.ArgParser")
+    def test_plan(self, mock_arg, mock_help, mock_lock, mock_run):
+
+        """Function:  test_plan
+
+        Description:  Test plan mode replaces the -F and -G functions.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-P"] = True
+        mock_arg.return_value = self.args
+        mock_help.return_value = False
+        mock_lock.return_value = self.proglock
+
+        self.assertFalse(mysql_rep_failover.main())
+
+        func_dict = mock_run.call_args[0][1]
+
+        self.assertEqual(
+            func_dict["-F"], mysql_rep_failover.plan_libs.plan_failover)
+        self.assertEqual(
+            func_dict["-G"], mysql_rep_failover.plan_libs.plan_failover)
+
     @mock.patch("mysql_rep_failover.gen_class.ArgParser")
     def test_arg_parse2_false(self, mock_arg):
 
@@ -315,6 +345,29 @@ class UnitTest(unittest.TestCase):
 
         self.assertFalse(mysql_rep_failover.main())
 
+    @mock.patch("mysql_rep_failover.batch_libs.run_batch")
+    @mock.patch("mysql_rep_failover.gen_class.ProgramLock")
+    @mock.patch("mysql_rep_failover.gen_libs.help_func")
+    @mock.patch("mysql_rep_failover.gen_class.ArgParser")
+    def test_batch(self, mock_arg, mock_help, mock_lock, mock_batch):
+
+        """Function:  test_batch
+
+        Description:  Test with batch mode.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-m"] = "BatchDir"
+        mock_arg.return_value = self.args
+        mock_help.return_value = False
+
+        self.assertFalse(mysql_rep_failover.main())
+        self.assertTrue(mock_batch.called)
+        self.assertFalse(mock_lock.called)
+        self.assertEqual(self.args.opt_req, ["-d"])
+
     @mock.patch("mysql_rep_failover.run_program", mock.Mock(return_value=True))
     @mock.patch("mysql_rep_failover.gen_class.ProgramLock")
     @mock.patch("mysql_rep_failover.gen_libs.help_func")
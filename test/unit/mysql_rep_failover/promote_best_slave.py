@@ -23,6 +23,7 @@ import mock
 # Local
 sys.path.append(os.getcwd())
 import mysql_rep_failover                       # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
 import version                                  # pylint:disable=E0401,C0413
 
 __version__ = version.__version__
@@ -36,6 +37,7 @@ class ArgParser():                                      # pylint:disable=R0903
 
     Methods:
         __init__
+        get_val
 
     """
 
@@ -52,6 +54,18 @@ class ArgParser():                                      # pylint:disable=R0903
         self.cmdline = None
         self.args_array = {}
 
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
 
 class MasterRep():                                      # pylint:disable=R0903
 
@@ -149,6 +163,11 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_tied
+        test_tied_force
+        test_not_drained
+        test_retrieved
+        test_divergent
         test_failed_master
         test_one_failed_switch
         test_failed_all_switch
@@ -172,9 +191,10 @@ class UnitTest(unittest.TestCase):
         self.args.args_array = {"-G": "slave1"}
         self.args2.args_array = {"-G": "slave0"}
         self.master = MasterRep()
-        self.slave1 = SlaveRep("slave1", "20", True)
-        self.slave2 = SlaveRep("slave2", "10", True)
-        self.slave3 = SlaveRep("slave3", "15", True)
+        uuid = "3e11fa47-71ca-11e1-9e33-c80aa9429562"
+        self.slave1 = SlaveRep("slave1", f"{uuid}:1-20", True)
+        self.slave2 = SlaveRep("slave2", f"{uuid}:1-10", True)
+        self.slave3 = SlaveRep("slave3", f"{uuid}:1-15", True)
         self.slavearray = []
         self.slavearray2 = []
         self.slavearray.append(self.slave1)
@@ -182,13 +202,137 @@ class UnitTest(unittest.TestCase):
         self.slavearray.append(self.slave3)
         self.slavearray2.append(self.slave1)
         self.results = \
-            "Slaves: ['slave3', 'slave1'] that did not change to new master."
+            "Slaves: ['slave3', 'slave2'] that did not change to new master."
         self.results2 = "Slaves: ['slave3'] that did not change to new master."
         self.results4 = \
             "promote_best_slave: Error on server MySQL_Name:  Error "
         self.results4 = self.results4 + "No slaves were changed to new master."
+        self.results5 = \
+            "promote_best_slave: No single best slave, divergent slaves:" \
+            " ['slave1', 'slave4'] No slaves were changed to new master."
+        self.results6 = \
+            "promote_best_slave: Slave slave1 did not apply its relay log" \
+            " within 60.0 seconds. No slaves were changed to new master."
+
+        self.results7 = \
+            "promote_best_slave: Slaves are tied with best slave slave1:" \
+            " ['slave4'] Use the -G option to pick the slave to promote. No" \
+            " slaves were changed to new master."
+
+    @mock.patch("mysql_rep_failover.repoint_libs.convert_to_master")
+    def test_tied(self, mock_master):
+
+        """Function:  test_tied
+
+        Description:  Test with a slave tied with the best slave.
+
+        Arguments:
+
+        """
+
+        slave4 = SlaveRep("slave4", self.slave1.exe_gtidset, True)
+        self.slavearray.append(slave4)
+
+        self.assertEqual(
+            mysql_rep_failover.promote_best_slave(self.slavearray, self.args),
+            (True, self.results7))
+        self.assertFalse(mock_master.called)
+
+    @mock.patch("converge_libs.verify_convergence",
+                mock.Mock(return_value=[]))
+    @mock.patch("mysql_rep_failover.repoint_libs.convert_to_master")
+    @mock.patch("mysql_rep_failover.mysql_libs.switch_to_master")
+    def test_tied_force(self, mock_switch, mock_master):
+
+        """Function:  test_tied_force
+
+        Description:  Test with a slave tied with the best slave and the
+            -f option.
+
+        Arguments:
+
+        """
+
+        slave4 = SlaveRep("slave4", self.slave1.exe_gtidset, True)
+        self.slavearray.append(slave4)
+        self.args.args_array["-f"] = True
+
+        mock_switch.return_value = 0
+        mock_master.return_value = self.master
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_rep_failover.promote_best_slave(
+                    self.slavearray, self.args), (False, None))
+
+        self.assertEqual(mock_master.call_args[0][0], self.slave1)
+
+    @mock.patch("mysql_rep_failover.probe_libs.wait_for_drain",
+                mock.Mock(return_value=False))
+    def test_not_drained(self):
+
+        """Function:  test_not_drained
+
+        Description:  Test with best slave not applying its relay log.
+
+        Arguments:
 
-    @mock.patch("mysql_rep_failover.convert_to_master")
+        """
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_rep_failover.promote_best_slave(
+                    self.slavearray, self.args), (True, self.results6))
+
+    @mock.patch("converge_libs.verify_convergence",
+                mock.Mock(return_value=[]))
+    @mock.patch("mysql_rep_failover.probe_libs.wait_for_drain")
+    @mock.patch("mysql_rep_failover.repoint_libs.convert_to_master")
+    @mock.patch("mysql_rep_failover.mysql_libs.switch_to_master")
+    def test_retrieved(self, mock_switch, mock_master, mock_drain):
+
+        """Function:  test_retrieved
+
+        Description:  Test with best slave chosen on its retrieved set.
+
+        Arguments:
+
+        """
+
+        self.slave2.retrieved_gtidset = \
+            "3e11fa47-71ca-11e1-9e33-c80aa9429562:8-25"
+
+        mock_switch.return_value = 0
+        mock_master.return_value = self.master
+        mock_drain.return_value = True
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_rep_failover.promote_best_slave(
+                    self.slavearray, self.args), (False, None))
+
+        self.assertEqual(mock_master.call_args[0][0], self.slave2)
+        self.assertEqual(mock_drain.call_args[0][0], self.slave2)
+
+    def test_divergent(self):
+
+        """Function:  test_divergent
+
+        Description:  Test with divergent slaves and no best slave.
+
+        Arguments:
+
+        """
+
+        slave4 = SlaveRep(
+            "slave4", "4a2c7d11-71ca-11e1-9e33-c80aa9429562:1-5", True)
+        self.slavearray.append(slave4)
+
+        self.assertEqual(
+            mysql_rep_failover.promote_best_slave(
+                self.slavearray, self.args), (True, self.results5))
+
+    @mock.patch("mysql_rep_failover.repoint_libs.convert_to_master")
     def test_failed_master(self, mock_master):
 
         """Function:  test_failed_master
@@ -203,13 +347,14 @@ class UnitTest(unittest.TestCase):
 
         mock_master.return_value = self.master
 
-        self.assertEqual(
-            mysql_rep_failover.promote_best_slave(
-                self.slavearray, self.args), (True, self.results4))
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_rep_failover.promote_best_slave(
+                    self.slavearray, self.args), (True, self.results4))
 
-    @mock.patch("mysql_rep_failover.mysql_libs.disconnect",
-                mock.Mock(return_value=True))
-    @mock.patch("mysql_rep_failover.convert_to_master",
+    @mock.patch("converge_libs.verify_convergence",
+                mock.Mock(return_value=[]))
+    @mock.patch("mysql_rep_failover.repoint_libs.convert_to_master",
                 mock.Mock(return_value=MasterRep()))
     @mock.patch("mysql_rep_failover.mysql_libs.switch_to_master")
     def test_one_failed_switch(self, mock_switch):
@@ -222,15 +367,17 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_switch.side_effect = [-1, 0]
+        mock_switch.side_effect = \
+            lambda master, slv: -1 if slv.name == "slave3" else 0
 
-        self.assertEqual(
-            mysql_rep_failover.promote_best_slave(
-                self.slavearray, self.args), (True, self.results2))
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_rep_failover.promote_best_slave(
+                    self.slavearray, self.args), (True, self.results2))
 
-    @mock.patch("mysql_rep_failover.mysql_libs.disconnect",
-                mock.Mock(return_value=True))
-    @mock.patch("mysql_rep_failover.convert_to_master",
+    @mock.patch("converge_libs.verify_convergence",
+                mock.Mock(return_value=[]))
+    @mock.patch("mysql_rep_failover.repoint_libs.convert_to_master",
                 mock.Mock(return_value=MasterRep()))
     @mock.patch("mysql_rep_failover.mysql_libs.switch_to_master")
     def test_failed_all_switch(self, mock_switch):
@@ -245,13 +392,14 @@ class UnitTest(unittest.TestCase):
 
         mock_switch.return_value = -1
 
-        self.assertEqual(
-            mysql_rep_failover.promote_best_slave(
-                self.slavearray, self.args), (True, self.results))
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_rep_failover.promote_best_slave(
+                    self.slavearray, self.args), (True, self.results))
 
-    @mock.patch("mysql_rep_failover.mysql_libs.disconnect",
-                mock.Mock(return_value=True))
-    @mock.patch("mysql_rep_failover.convert_to_master",
+    @mock.patch("converge_libs.verify_convergence",
+                mock.Mock(return_value=[]))
+    @mock.patch("mysql_rep_failover.repoint_libs.convert_to_master",
                 mock.Mock(return_value=MasterRep()))
     @mock.patch("mysql_rep_failover.mysql_libs.switch_to_master")
     def test_one_slave(self, mock_switch):
@@ -266,13 +414,14 @@ class UnitTest(unittest.TestCase):
 
         mock_switch.return_value = 0
 
-        self.assertEqual(
-            mysql_rep_failover.promote_best_slave(
-                self.slavearray2, self.args), (False, None))
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_rep_failover.promote_best_slave(
+                    self.slavearray2, self.args), (False, None))
 
-    @mock.patch("mysql_rep_failover.mysql_libs.disconnect",
-                mock.Mock(return_value=True))
-    @mock.patch("mysql_rep_failover.convert_to_master",
+    @mock.patch("converge_libs.verify_convergence",
+                mock.Mock(return_value=[]))
+    @mock.patch("mysql_rep_failover.repoint_libs.convert_to_master",
                 mock.Mock(return_value=MasterRep()))
     @mock.patch("mysql_rep_failover.mysql_libs.switch_to_master")
     def test_default(self, mock_switch):
@@ -287,9 +436,10 @@ class UnitTest(unittest.TestCase):
 
         mock_switch.return_value = 0
 
-        self.assertEqual(
-            mysql_rep_failover.promote_best_slave(
-                self.slavearray, self.args), (False, None))
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_rep_failover.promote_best_slave(
+                    self.slavearray, self.args), (False, None))
 
 
 if __name__ == "__main__":
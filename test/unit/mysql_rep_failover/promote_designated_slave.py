@@ -17,12 +17,14 @@
 # Standard
 import sys
 import os
+import io
 import unittest
 import mock
 
 # Local
 sys.path.append(os.getcwd())
 import mysql_rep_failover                       # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
 import version                                  # pylint:disable=E0401,C0413
 
 __version__ = version.__version__
@@ -161,6 +163,9 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_not_probed
+        test_errant
+        test_errant_forced
         test_failed_master
         test_one_failed_switch
         test_failed_all_switch
@@ -210,8 +215,86 @@ class UnitTest(unittest.TestCase):
         self.results4 = \
             "promote_designated_slave: Error on server MySQL_Name: Error "
         self.results4 = self.results4 + "No slaves were changed to new master."
+        self.uuid = "3e11fa47-71ca-11e1-9e33-c80aa9429562"
+        self.results5 = \
+            "promote_designated_slave: Slaves have transactions slave1 does" \
+            " not have: {'slave2': 5} Slaves with every transaction:" \
+            " ['slave2'] No slaves were changed to new master."
 
-    @mock.patch("mysql_rep_failover.convert_to_master")
+    @mock.patch("mysql_rep_failover.repoint_libs.convert_to_master")
+    def test_not_probed(self, mock_master):
+
+        """Function:  test_not_probed
+
+        Description:  Test with a designated slave which was excluded when its
+            status fields were probed.
+
+        Arguments:
+
+        """
+
+        inventory = {"slaves": {"slave0": SlaveRep("slave0", "", True)}}
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_rep_failover.promote_designated_slave(
+                    self.slavearray, self.args2, inventory=inventory),
+                (True, self.results3))
+
+        mock_master.assert_not_called()
+
+    @mock.patch("mysql_rep_failover.repoint_libs.convert_to_master")
+    def test_errant(self, mock_master):
+
+        """Function:  test_errant
+
+        Description:  Test with slaves with errant transactions.
+
+        Arguments:
+
+        """
+
+        self.slave1.exe_gtidset = f"{self.uuid}:1-10"
+        self.slave2.exe_gtidset = f"{self.uuid}:1-15"
+        report = {"phases": {}}
+
+        self.assertEqual(
+            mysql_rep_failover.promote_designated_slave(
+                self.slavearray, self.args, report=report),
+            (True, self.results5))
+        self.assertEqual(report["errant"], {"slave2": 5})
+        mock_master.assert_not_called()
+
+    @mock.patch("converge_libs.verify_convergence",
+                mock.Mock(return_value=[]))
+    @mock.patch("mysql_rep_failover.repoint_libs.convert_to_master",
+                mock.Mock(return_value=MasterRep()))
+    @mock.patch("mysql_rep_failover.mysql_libs.switch_to_master")
+    def test_errant_forced(self, mock_switch):
+
+        """Function:  test_errant_forced
+
+        Description:  Test with errant transactions and the -f option.
+
+        Arguments:
+
+        """
+
+        mock_switch.return_value = 0
+        self.args.args_array["-f"] = True
+        self.slave1.exe_gtidset = f"{self.uuid}:1-10"
+        self.slave2.exe_gtidset = f"{self.uuid}:1-15"
+
+        with mock.patch("sys.stdout", new_callable=io.StringIO) as mock_out:
+            self.assertEqual(
+                mysql_rep_failover.promote_designated_slave(
+                    self.slavearray, self.args), (False, None))
+
+        self.assertIn(
+            "WARNING:  Promoting slave1, slaves have transactions it does not"
+            " have: {'slave2': 5}", mock_out.getvalue())
+
+    @mock.patch("mysql_rep_failover.repoint_libs.convert_to_master")
     def test_failed_master(self, mock_master):
 
         """Function:  test_failed_master
@@ -226,13 +309,14 @@ class UnitTest(unittest.TestCase):
 
         mock_master.return_value = self.master
 
-        self.assertEqual(
-            mysql_rep_failover.promote_designated_slave(
-                self.slavearray, self.args), (True, self.results4))
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_rep_failover.promote_designated_slave(
+                    self.slavearray, self.args), (True, self.results4))
 
-    @mock.patch("mysql_rep_failover.mysql_libs.disconnect",
-                mock.Mock(return_value=True))
-    @mock.patch("mysql_rep_failover.convert_to_master",
+    @mock.patch("converge_libs.verify_convergence",
+                mock.Mock(return_value=[]))
+    @mock.patch("mysql_rep_failover.repoint_libs.convert_to_master",
                 mock.Mock(return_value=MasterRep()))
     @mock.patch("mysql_rep_failover.mysql_libs.switch_to_master")
     def test_one_failed_switch(self, mock_switch):
@@ -245,15 +329,17 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_switch.side_effect = [-1, 0]
+        mock_switch.side_effect = \
+            lambda master, slv: -1 if slv.name == "slave2" else 0
 
-        self.assertEqual(
-            mysql_rep_failover.promote_designated_slave(
-                self.slavearray, self.args), (True, self.results2))
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_rep_failover.promote_designated_slave(
+                    self.slavearray, self.args), (True, self.results2))
 
-    @mock.patch("mysql_rep_failover.mysql_libs.disconnect",
-                mock.Mock(return_value=True))
-    @mock.patch("mysql_rep_failover.convert_to_master",
+    @mock.patch("converge_libs.verify_convergence",
+                mock.Mock(return_value=[]))
+    @mock.patch("mysql_rep_failover.repoint_libs.convert_to_master",
                 mock.Mock(return_value=MasterRep()))
     @mock.patch("mysql_rep_failover.mysql_libs.switch_to_master")
     def test_failed_all_switch(self, mock_switch):
@@ -268,12 +354,13 @@ class UnitTest(unittest.TestCase):
 
         mock_switch.return_value = -1
 
-        self.assertEqual(
-            mysql_rep_failover.promote_designated_slave(
-                self.slavearray, self.args), (True, self.results))
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_rep_failover.promote_designated_slave(
+                    self.slavearray, self.args), (True, self.results))
 
-    @mock.patch("mysql_rep_failover.mysql_libs.disconnect",
-                mock.Mock(return_value=True))
+    @mock.patch("converge_libs.verify_convergence",
+                mock.Mock(return_value=[]))
     @mock.patch("mysql_rep_failover.mysql_libs.switch_to_master")
     def test_slv_not_found(self, mock_switch):
 
@@ -287,13 +374,14 @@ class UnitTest(unittest.TestCase):
 
         mock_switch.return_value = 0
 
-        self.assertEqual(
-            mysql_rep_failover.promote_designated_slave(
-                self.slavearray, self.args2), (True, self.results3))
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_rep_failover.promote_designated_slave(
+                    self.slavearray, self.args2), (True, self.results3))
 
-    @mock.patch("mysql_rep_failover.mysql_libs.disconnect",
-                mock.Mock(return_value=True))
-    @mock.patch("mysql_rep_failover.convert_to_master",
+    @mock.patch("converge_libs.verify_convergence",
+                mock.Mock(return_value=[]))
+    @mock.patch("mysql_rep_failover.repoint_libs.convert_to_master",
                 mock.Mock(return_value=MasterRep()))
     @mock.patch("mysql_rep_failover.mysql_libs.switch_to_master")
     def test_one_slave(self, mock_switch):
@@ -308,13 +396,14 @@ class UnitTest(unittest.TestCase):
 
         mock_switch.return_value = 0
 
-        self.assertEqual(
-            mysql_rep_failover.promote_designated_slave(
-                self.slavearray2, self.args), (False, None))
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_rep_failover.promote_designated_slave(
+                    self.slavearray2, self.args), (False, None))
 
-    @mock.patch("mysql_rep_failover.mysql_libs.disconnect",
-                mock.Mock(return_value=True))
-    @mock.patch("mysql_rep_failover.convert_to_master",
+    @mock.patch("converge_libs.verify_convergence",
+                mock.Mock(return_value=[]))
+    @mock.patch("mysql_rep_failover.repoint_libs.convert_to_master",
                 mock.Mock(return_value=MasterRep()))
     @mock.patch("mysql_rep_failover.mysql_libs.switch_to_master")
     def test_default(self, mock_switch):
@@ -329,9 +418,10 @@ class UnitTest(unittest.TestCase):
 
         mock_switch.return_value = 0
 
-        self.assertEqual(
-            mysql_rep_failover.promote_designated_slave(
-                self.slavearray, self.args), (False, None))
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_rep_failover.promote_designated_slave(
+                    self.slavearray, self.args), (False, None))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,219 @@
+# Classification (U)
+
+"""Program:  rejoin_slaves.py
+
+    Description:  Unit testing of rejoin_slaves in mysql_rep_failover.py.
+
+    Usage:
+        test/unit/mysql_rep_failover/rejoin_slaves.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_failover                       # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, name, gtid_mode=True):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) name
+            (input) gtid_mode
+
+        """
+
+        self.name = name
+        self.gtid_mode = gtid_mode
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_gtid_enabled
+        test_dropped
+        test_excluded
+        test_none_missing
+        test_no_inventory
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.slave1 = SlaveRep("slave1")
+        self.slave2 = SlaveRep("slave2")
+        self.slave3 = SlaveRep("slave3")
+        self.entries = [{"name": "slave1"}, {"name": "slave2"},
+                        {"name": "slave3"}]
+        self.inventory = {"entries": self.entries,
+                          "slaves": {"slave1": self.slave1,
+                                     "slave2": self.slave2}}
+
+    @mock.patch("mysql_rep_failover.discover_libs.create_instances")
+    def test_not_gtid_enabled(self, mock_create):
+
+        """Function:  test_not_gtid_enabled
+
+        Description:  Test a slave which is not GTID enabled is left out.
+
+        Arguments:
+
+        """
+
+        mock_create.return_value = [SlaveRep("slave3", False)]
+
+        self.assertEqual(
+            mysql_rep_failover.rejoin_slaves(
+                [self.slave1, self.slave2], self.args,
+                inventory=self.inventory), [])
+
+    @mock.patch("mysql_rep_failover.discover_libs.create_instances")
+    def test_dropped(self, mock_create):
+
+        """Function:  test_dropped
+
+        Description:  Test a slave dropped on a refresh is removed from the
+            inventory and reconnected.
+
+        Arguments:
+
+        """
+
+        slave2 = SlaveRep("slave2")
+        mock_create.return_value = [slave2, self.slave3]
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_rep_failover.rejoin_slaves(
+                    [self.slave1], self.args, inventory=self.inventory),
+                [slave2, self.slave3])
+
+        self.assertEqual(mock_create.call_args[1]["entries"],
+                         self.entries[1:])
+        self.assertEqual(list(self.inventory["slaves"]), ["slave1"])
+
+    @mock.patch("mysql_rep_failover.discover_libs.create_instances")
+    def test_excluded(self, mock_create):
+
+        """Function:  test_excluded
+
+        Description:  Test a slave excluded when connecting is reconnected.
+
+        Arguments:
+
+        """
+
+        mock_create.return_value = [self.slave3]
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_rep_failover.rejoin_slaves(
+                    [self.slave1, self.slave2], self.args,
+                    inventory=self.inventory), [self.slave3])
+
+        self.assertEqual(mock_create.call_args[1]["entries"],
+                         [self.entries[2]])
+        self.assertIs(mock_create.call_args[1]["inventory"], self.inventory)
+
+    @mock.patch("mysql_rep_failover.discover_libs.create_instances")
+    def test_none_missing(self, mock_create):
+
+        """Function:  test_none_missing
+
+        Description:  Test with every slave in the slave array.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_failover.rejoin_slaves(
+                [self.slave1, self.slave2, self.slave3], self.args,
+                inventory=self.inventory), [])
+        self.assertFalse(mock_create.called)
+
+    @mock.patch("mysql_rep_failover.discover_libs.create_instances")
+    def test_no_inventory(self, mock_create):
+
+        """Function:  test_no_inventory
+
+        Description:  Test without a slave inventory.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_failover.rejoin_slaves([self.slave1], self.args), [])
+        self.assertFalse(mock_create.called)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+# Classification (U)
+
+"""Program:  restore_signals.py
+
+    Description:  Unit testing of restore_signals in
+        mysql_rep_failover.py.
+
+    Usage:
+        test/unit/mysql_rep_failover/restore_signals.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import signal
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_failover                       # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_handlers
+        test_restore
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.signals = {"action": None, "wake": None,
+                        "prev": {signal.SIGUSR1: None,
+                                 signal.SIGINT: "PrevHandler"}}
+
+    @mock.patch("mysql_rep_failover.signal.signal")
+    def test_no_handlers(self, mock_signal):
+
+        """Function:  test_no_handlers
+
+        Description:  Test with no handlers to put back.
+
+        Arguments:
+
+        """
+
+        self.signals["prev"] = {}
+
+        mysql_rep_failover.restore_signals(self.signals)
+
+        self.assertFalse(mock_signal.called)
+
+    @mock.patch("mysql_rep_failover.signal.signal")
+    def test_restore(self, mock_signal):
+
+        """Function:  test_restore
+
+        Description:  Test the previous handlers are put back.
+
+        Arguments:
+
+        """
+
+        mysql_rep_failover.restore_signals(self.signals)
+
+        mock_signal.assert_has_calls(
+            [mock.call(signal.SIGUSR1, None),
+             mock.call(signal.SIGINT, "PrevHandler")])
+
+
+if __name__ == "__main__":
+    unittest.main()
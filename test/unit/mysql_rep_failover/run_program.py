@@ -22,13 +22,14 @@ import mock
 # Local
 sys.path.append(os.getcwd())
 import mysql_rep_failover                       # pylint:disable=E0401,C0413
+import lazy_class                               # pylint:disable=E0401,C0413
 import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
 import version                                  # pylint:disable=E0401,C0413
 
 __version__ = version.__version__
 
 
-def show_slave_delays(slaves, args_array):
+def show_slave_delays(slaves, args_array, **kwargs):
 
     """Method:  show_slave_delays
 
@@ -37,18 +38,19 @@ def show_slave_delays(slaves, args_array):
     Arguments:
         (input) slaves
         (input) args_array
+        (input) kwargs
 
     """
 
     status = True
 
-    if slaves and args_array:
+    if slaves and args_array and kwargs:
         status = True
 
     return status, "Error Message"
 
 
-def show_best_slave(slaves, args_array):
+def show_best_slave(slaves, args_array, **kwargs):
 
     """Method:  show_best_slave
 
@@ -57,12 +59,13 @@ def show_best_slave(slaves, args_array):
     Arguments:
         (input) slaves
         (input) args_array
+        (input) kwargs
 
     """
 
     status = False
 
-    if slaves and args_array:
+    if slaves and args_array and kwargs:
         status = False
 
     return status, None
@@ -77,6 +80,7 @@ class ArgParser():                                      # pylint:disable=R0903
     Methods:
         __init__
         get_args_keys
+        get_val
 
     """
 
@@ -105,6 +109,18 @@ class ArgParser():                                      # pylint:disable=R0903
 
         return list(self.args_array.keys())
 
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
 
 class SlaveRep():                                       # pylint:disable=R0903
 
@@ -143,6 +159,12 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_supervisor_signals
+        test_snapshot_no_import
+        test_snapshot
+        test_stream_report
+        test_stream_error
+        test_report
         test_function_fails
         test_not_gtid_enabled
         test_no_slaves
@@ -174,12 +196,193 @@ class UnitTest(unittest.TestCase):
         self.slavearray.append(self.slave3)
         self.func_dict = {"-B": show_best_slave}
         self.func_dict2 = {"-D": show_slave_delays}
+        self.results = "Empty Slave array or Slave(s) not GTID enabled."
+
+    @mock.patch("mysql_rep_failover.gtid_enabled",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_failover.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_failover.restore_signals")
+    @mock.patch("mysql_rep_failover.supervisor_signals")
+    @mock.patch("mysql_rep_failover.discover_libs.create_inventory")
+    @mock.patch("mysql_rep_failover.load_slaves")
+    def test_supervisor_signals(self, mock_load, mock_inventory,
+                                mock_signals, mock_restore):
+
+        """Function:  test_supervisor_signals
+
+        Description:  Test the supervisor signal handlers are installed
+            before the slaves are created and put back at the end.
+
+        Arguments:
+
+        """
+
+        supervise = mock.Mock(return_value=(False, None))
+        self.args.args_array = {"-M": True}
+        mock_signals.return_value = "Signals"
+        mock_inventory.side_effect = \
+            lambda args, **kwargs: self.assertTrue(mock_signals.called)
+        mock_load.return_value = (self.slavearray, self.slavearray)
+
+        mysql_rep_failover.run_program(self.args, {"-M": supervise})
+
+        self.assertTrue(mock_inventory.called)
+        self.assertEqual(supervise.call_args[1]["signals"], "Signals")
+        mock_restore.assert_called_once_with("Signals")
+
+    @mock.patch("mysql_rep_failover.discover_libs.create_inventory",
+                mock.Mock(return_value={}))
+    @mock.patch("mysql_rep_failover.gtid_enabled",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_failover.mysql_libs",
+                lazy_class.LazyModule("lazy_test_mysql_libs"))
+    @mock.patch("mysql_rep_failover.snapshot_libs.use_snapshot")
+    def test_snapshot_no_import(self, mock_snapshot):
+
+        """Function:  test_snapshot_no_import
+
+        Description:  Test that the slaves from the snapshot file do not
+            import mysql_libs.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-k"] = "snapshot.bin"
+
+        mock_snapshot.return_value = self.slavearray
+
+        self.assertEqual(
+            mysql_rep_failover.run_program(
+                self.args, self.func_dict)["status"], "Success")
+        self.assertNotIn("lazy_test_mysql_libs", sys.modules)
+
+    @mock.patch("mysql_rep_failover.discover_libs.create_inventory",
+                mock.Mock(return_value={}))
+    @mock.patch("mysql_rep_failover.gtid_enabled",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_failover.mysql_libs.disconnect")
+    @mock.patch("mysql_rep_failover.snapshot_libs.use_snapshot")
+    @mock.patch("mysql_rep_failover.discover_libs.create_instances")
+    def test_snapshot(self, mock_instance, mock_snapshot, mock_disconnect):
+
+        """Function:  test_snapshot
+
+        Description:  Test with the slaves from the snapshot file.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-k"] = "snapshot.bin"
+
+        mock_snapshot.return_value = self.slavearray
+
+        self.assertEqual(
+            mysql_rep_failover.run_program(
+                self.args, self.func_dict)["status"], "Success")
+        self.assertFalse(mock_instance.called)
+        self.assertFalse(mock_disconnect.called)
+
+    @mock.patch("mysql_rep_failover.discover_libs.create_inventory",
+                mock.Mock(return_value={}))
+    @mock.patch("mysql_rep_failover.gtid_enabled",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_failover.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_failover.report_libs.write_report")
+    @mock.patch("mysql_rep_failover.report_libs.emit_record")
+    @mock.patch("mysql_rep_failover.discover_libs.create_instances")
+    def test_stream_report(self, mock_instance, mock_emit, mock_report):
+
+        """Function:  test_stream_report
+
+        Description:  Test the timing report is written as a report record
+            when streaming.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-n"] = True
+        self.args.args_array["-r"] = True
+
+        mock_instance.return_value = self.slavearray
+
+        mysql_rep_failover.run_program(self.args, self.func_dict)
+
+        self.assertEqual(mock_emit.call_args[0][0]["type"], "report")
+        self.assertIn("slowest", mock_emit.call_args[0][0])
+        self.assertFalse(mock_report.called)
+        self.assertEqual(mock_instance.call_args[1]["stream"], mock_emit)
+
+    @mock.patch("mysql_rep_failover.discover_libs.create_inventory",
+                mock.Mock(return_value={}))
+    @mock.patch("mysql_rep_failover.gtid_enabled",
+                mock.Mock(return_value=False))
+    @mock.patch("mysql_rep_failover.report_libs.emit_record")
+    @mock.patch("mysql_rep_failover.discover_libs.create_instances")
+    def test_stream_error(self, mock_instance, mock_emit):
+
+        """Function:  test_stream_error
+
+        Description:  Test an error is written as an error record when
+            streaming.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-n"] = True
+
+        mock_instance.return_value = self.slavearray
+
+        mysql_rep_failover.run_program(self.args, self.func_dict)
+
+        mock_emit.assert_called_once_with(
+            {"type": "error", "message": self.results})
+
+    @mock.patch("mysql_rep_failover.discover_libs.create_inventory",
+                mock.Mock(return_value={}))
+    @mock.patch("mysql_rep_failover.gtid_enabled",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_failover.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_failover.report_libs.write_report")
+    @mock.patch("mysql_rep_failover.discover_libs.create_instances")
+    def test_report(self, mock_instance, mock_report):
+
+        """Function:  test_report
+
+        Description:  Test with the timing report requested.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-r"] = True
+
+        mock_instance.return_value = self.slavearray
+
+        self.assertEqual(
+            mysql_rep_failover.run_program(
+                self.args, self.func_dict)["status"], "Success")
+
+        report = mock_report.call_args[0][0]
+
+        self.assertEqual(report["commands"], ["-B"])
+        self.assertEqual(report["status"], "Success")
+        self.assertIn("discovery", report["phases"])
+        self.assertIn("disconnect", report["phases"])
 
+    @mock.patch("mysql_rep_failover.discover_libs.create_inventory",
+                mock.Mock(return_value={}))
     @mock.patch("mysql_rep_failover.gtid_enabled",
                 mock.Mock(return_value=True))
     @mock.patch("mysql_rep_failover.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
-    @mock.patch("mysql_rep_failover.create_instances")
+    @mock.patch("mysql_rep_failover.discover_libs.create_instances")
     def test_function_fails(self, mock_instance):
 
         """Function:  test_function_fails
@@ -193,12 +396,15 @@ class UnitTest(unittest.TestCase):
         mock_instance.return_value = self.slavearray
 
         with gen_libs.no_std_out():
-            self.assertFalse(
-                mysql_rep_failover.run_program(self.args2, self.func_dict2))
+            self.assertNotEqual(
+                mysql_rep_failover.run_program(
+                    self.args2, self.func_dict2)["status"], "Success")
 
+    @mock.patch("mysql_rep_failover.discover_libs.create_inventory",
+                mock.Mock(return_value={}))
     @mock.patch("mysql_rep_failover.gtid_enabled",
                 mock.Mock(return_value=False))
-    @mock.patch("mysql_rep_failover.create_instances")
+    @mock.patch("mysql_rep_failover.discover_libs.create_instances")
     def test_not_gtid_enabled(self, mock_instance):
 
         """Function:  test_not_gtid_enabled
@@ -212,12 +418,15 @@ class UnitTest(unittest.TestCase):
         mock_instance.return_value = self.slavearray
 
         with gen_libs.no_std_out():
-            self.assertFalse(
-                mysql_rep_failover.run_program(self.args, self.func_dict))
+            self.assertEqual(
+                mysql_rep_failover.run_program(
+                    self.args, self.func_dict)["status"], self.results)
 
+    @mock.patch("mysql_rep_failover.discover_libs.create_inventory",
+                mock.Mock(return_value={}))
     @mock.patch("mysql_rep_failover.gtid_enabled",
                 mock.Mock(return_value=True))
-    @mock.patch("mysql_rep_failover.create_instances")
+    @mock.patch("mysql_rep_failover.discover_libs.create_instances")
     def test_no_slaves(self, mock_instance):
 
         """Function:  test_no_slaves
@@ -231,14 +440,17 @@ class UnitTest(unittest.TestCase):
         mock_instance.return_value = []
 
         with gen_libs.no_std_out():
-            self.assertFalse(
-                mysql_rep_failover.run_program(self.args, self.func_dict))
+            self.assertEqual(
+                mysql_rep_failover.run_program(
+                    self.args, self.func_dict)["status"], self.results)
 
+    @mock.patch("mysql_rep_failover.discover_libs.create_inventory",
+                mock.Mock(return_value={}))
     @mock.patch("mysql_rep_failover.gtid_enabled",
                 mock.Mock(return_value=True))
     @mock.patch("mysql_rep_failover.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
-    @mock.patch("mysql_rep_failover.create_instances")
+    @mock.patch("mysql_rep_failover.discover_libs.create_instances")
     def test_run_program(self, mock_instance):
 
         """Function:  test_run_program
@@ -251,8 +463,9 @@ class UnitTest(unittest.TestCase):
 
         mock_instance.return_value = self.slavearray
 
-        self.assertFalse(
-            mysql_rep_failover.run_program(self.args, self.func_dict))
+        self.assertEqual(
+            mysql_rep_failover.run_program(
+                self.args, self.func_dict)["status"], "Success")
 
 
 if __name__ == "__main__":
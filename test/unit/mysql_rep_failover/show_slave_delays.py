@@ -16,6 +16,7 @@
 # Standard
 import sys
 import os
+import io
 import unittest
 import mock
 
@@ -28,7 +29,7 @@ import version                                  # pylint:disable=E0401,C0413
 __version__ = version.__version__
 
 
-class ArgParser():                                      # pylint:disable=R0903
+class ArgParser():
 
     """Class:  ArgParser
 
@@ -36,6 +37,7 @@ class ArgParser():                                      # pylint:disable=R0903
 
     Methods:
         __init__
+        get_val
 
     """
 
@@ -52,6 +54,18 @@ class ArgParser():                                      # pylint:disable=R0903
         self.cmdline = None
         self.args_array = {}
 
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
 
 class SlaveRep():                                       # pylint:disable=R0903
 
@@ -90,6 +104,12 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_snapshot
+        test_stream
+        test_delta_divergent
+        test_delta
+        test_divergent
+        test_tie
         test_one_slave
         test_default
 
@@ -115,18 +135,172 @@ class UnitTest(unittest.TestCase):
         self.slavearray.append(self.slave2)
         self.slavearray.append(self.slave3)
         self.slavearray2.append(self.slave1)
-        self.slaveorder = []
-        self.slaveorder2 = []
-        slv0 = self.slavearray[0]
-        slv1 = self.slavearray[1]
-        slv2 = self.slavearray[2]
-        self.slaveorder.append((slv1.exe_gtidset, slv1))
-        self.slaveorder.append((slv2.exe_gtidset, slv2))
-        self.slaveorder.append((slv0.exe_gtidset, slv0))
-        self.slaveorder2.append((slv1.exe_gtidset, slv1))
-
-    @mock.patch("mysql_rep_failover.order_slaves_on_gtid")
-    def test_one_slave(self, mock_order):
+        self.uuid = "3e11fa47-71ca-11e1-9e33-c80aa9429562"
+        self.gtids = mysql_rep_failover.gtid_class.GtidSet(
+            f"{self.uuid}:1-20")
+        self.gtids2 = mysql_rep_failover.gtid_class.GtidSet(
+            f"{self.uuid}:1-10")
+        self.selection = {
+            "best": self.slave1, "ties": [], "divergent": [],
+            "frontier": [(self.gtids, self.slave1)],
+            "slave_list": [(self.gtids, self.slave1),
+                           (self.gtids2, self.slave2),
+                           (self.gtids2, self.slave3)]}
+        self.selection2 = {
+            "best": self.slave1, "ties": [], "divergent": [],
+            "frontier": [(self.gtids, self.slave1)],
+            "slave_list": [(self.gtids, self.slave1)]}
+        self.selection3 = {
+            "best": None, "ties": [], "divergent": ["slave1", "slave2"],
+            "frontier": [(self.gtids, self.slave1),
+                         (self.gtids2, self.slave2)],
+            "slave_list": [(self.gtids, self.slave1),
+                           (self.gtids2, self.slave2)]}
+        self.results = \
+            "No single best slave, divergent slaves: ['slave1', 'slave2']"
+
+    @mock.patch("mysql_rep_failover.snapshot_libs.save_snapshot")
+    @mock.patch("mysql_rep_failover.score_libs.select_candidates")
+    def test_snapshot(self, mock_select, mock_save):
+
+        """Function:  test_snapshot
+
+        Description:  Test the snapshot file is written with the ranking of
+            the command.
+
+        Arguments:
+
+        """
+
+        mock_select.return_value = self.selection
+        report = {"phases": {}, "slaves": {}}
+
+        with mock.patch("sys.stdout", new_callable=io.StringIO):
+            mysql_rep_failover.show_slave_delays(
+                self.slavearray, self.args, report=report)
+
+        mock_select.assert_called_once()
+        mock_save.assert_called_once_with(
+            self.args, {"-D"}, self.slavearray,
+            selection=self.selection, report=report)
+        self.assertIn("snapshot", report["phases"])
+
+    @mock.patch("mysql_rep_failover.score_libs.select_candidates")
+    def test_stream(self, mock_select):
+
+        """Function:  test_stream
+
+        Description:  Test writing the ranking record instead of text.
+
+        Arguments:
+
+        """
+
+        stream = mock.Mock()
+        mock_select.return_value = self.selection
+
+        with mock.patch("sys.stdout", new_callable=io.StringIO) as mock_out:
+            mysql_rep_failover.show_slave_delays(
+                self.slavearray, self.args, stream=stream)
+
+        record = stream.call_args[0][0]
+
+        self.assertEqual(mock_out.getvalue(), "")
+        self.assertEqual(record["command"], "-D")
+        self.assertEqual(
+            record["slaves"][1],
+            {"name": "slave2", "role": "slave", "transactions": 10,
+             "behind": 10, "missing": f"{self.uuid}:11-20", "not_on_best": 0})
+
+    @mock.patch("mysql_rep_failover.score_libs.select_candidates")
+    def test_delta_divergent(self, mock_select):
+
+        """Function:  test_delta_divergent
+
+        Description:  Test the missing transactions with divergent slaves.
+
+        Arguments:
+
+        """
+
+        uuid2 = "4e11fa47-71ca-11e1-9e33-c80aa9429562"
+        self.selection3["slave_list"][1] = (
+            self.gtids2.union(
+                mysql_rep_failover.gtid_class.GtidSet(f"{uuid2}:1-3")),
+            self.slave2)
+        mock_select.return_value = self.selection3
+
+        with mock.patch("sys.stdout", new_callable=io.StringIO) as mock_out:
+            mysql_rep_failover.show_slave_delays(self.slavearray, self.args)
+
+        self.assertEqual(
+            mock_out.getvalue().splitlines(),
+            ["Most Trans: slave1\tTransactions: 20",
+             f" Candidate: slave2\tBehind: 10\tNot on slave1: 3"
+             f"\tMissing: {self.uuid}:11-20"])
+
+    @mock.patch("mysql_rep_failover.score_libs.select_candidates")
+    def test_delta(self, mock_select):
+
+        """Function:  test_delta
+
+        Description:  Test the missing transactions and counts.
+
+        Arguments:
+
+        """
+
+        mock_select.return_value = self.selection
+
+        with mock.patch("sys.stdout", new_callable=io.StringIO) as mock_out:
+            mysql_rep_failover.show_slave_delays(self.slavearray, self.args)
+
+        self.assertEqual(
+            mock_out.getvalue().splitlines(),
+            ["Best Slave: slave1\tTransactions: 20",
+             f"     Slave: slave2\tBehind: 10\tMissing: {self.uuid}:11-20",
+             f"     Slave: slave3\tBehind: 10\tMissing: {self.uuid}:11-20"])
+
+    @mock.patch("mysql_rep_failover.score_libs.select_candidates")
+    def test_divergent(self, mock_select):
+
+        """Function:  test_divergent
+
+        Description:  Test with divergent slaves and no best slave.
+
+        Arguments:
+
+        """
+
+        mock_select.return_value = self.selection3
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_rep_failover.show_slave_delays(
+                    self.slavearray, self.args), (True, self.results))
+
+    @mock.patch("mysql_rep_failover.score_libs.select_candidates")
+    def test_tie(self, mock_select):
+
+        """Function:  test_tie
+
+        Description:  Test with slaves tied with the best slave.
+
+        Arguments:
+
+        """
+
+        self.selection["ties"] = ["slave3"]
+
+        mock_select.return_value = self.selection
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_rep_failover.show_slave_delays(
+                    self.slavearray, self.args), (False, None))
+
+    @mock.patch("mysql_rep_failover.score_libs.select_candidates")
+    def test_one_slave(self, mock_select):
 
         """Function:  test_one_slave
 
@@ -136,17 +310,17 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_order.return_value = self.slaveorder2
+        mock_select.return_value = self.selection2
 
         with gen_libs.no_std_out():
             self.assertEqual(
                 mysql_rep_failover.show_slave_delays(
                     self.slavearray2, self.args), (False, None))
 
-    @mock.patch("mysql_rep_failover.order_slaves_on_gtid")
-    def test_default(self, mock_order):
+    @mock.patch("mysql_rep_failover.score_libs.select_candidates")
+    def test_default(self, mock_select):
 
-        """Function:  test_show_slave_delays
+        """Function:  test_default
 
         Description:  Test with default arguments only.
 
@@ -154,7 +328,7 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        mock_order.return_value = self.slaveorder
+        mock_select.return_value = self.selection
 
         with gen_libs.no_std_out():
             self.assertEqual(
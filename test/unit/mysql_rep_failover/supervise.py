@@ -0,0 +1,393 @@
+# Classification (U)
+
+"""Program:  supervise.py
+
+    Description:  Unit testing of supervise in mysql_rep_failover.py.
+
+    Usage:
+        test/unit/mysql_rep_failover/supervise.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import signal
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_failover                       # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+        upd_gtid_pos
+
+    """
+
+    def __init__(self, name, exe_gtidset, fail=False):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) name
+            (input) exe_gtidset
+            (input) fail
+
+        """
+
+        self.name = name
+        self.exe_gtidset = exe_gtidset
+        self.fail = fail
+        self.refreshed = 0
+
+    def upd_gtid_pos(self):
+
+        """Method:  upd_gtid_pos
+
+        Description:  Stub holder for mysql_class.SlaveRep.upd_gtid_pos.
+
+        Arguments:
+
+        """
+
+        if self.fail:
+            raise ValueError("Lost connection")
+
+        self.refreshed += 1
+
+
+class Signals():                                        # pylint:disable=R0903
+
+    """Class:  Signals
+
+    Description:  Class stub holder for signal.signal to capture the signal
+        handlers and send a signal on a refresh.
+
+    Methods:
+        __init__
+        signal
+        refresh
+
+    """
+
+    def __init__(self, signum):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) signum -> Signal sent on the second refresh
+
+        """
+
+        self.signum = signum
+        self.handlers = {}
+        self.refreshes = 0
+        self.trackers = []
+
+    def signal(self, signum, handler):
+
+        """Method:  signal
+
+        Description:  Stub holder for signal.signal function.
+
+        Arguments:
+            (input) signum
+            (input) handler
+
+        """
+
+        prev = self.handlers.get(signum)
+        self.handlers[signum] = handler
+
+        return prev
+
+    def refresh(self, slaves, **kwargs):            # pylint:disable=W0613
+
+        """Method:  refresh
+
+        Description:  Stub holder for probe_libs.refresh_slaves.
+
+        Arguments:
+            (input) slaves
+            (input) kwargs
+
+        """
+
+        self.refreshes += 1
+        self.trackers.append(kwargs.get("tracker"))
+
+        if self.refreshes == 2:
+            self.handlers[self.signum](self.signum, None)
+
+        return slaves
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_signals_given
+        test_rejoin
+        test_tracker
+        test_stop
+        test_promote
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.args.args_array = {"-M": True, "-i": "0.01"}
+        uuid = "3e11fa47-71ca-11e1-9e33-c80aa9429562"
+        self.slave1 = SlaveRep("slave1", f"{uuid}:1-20")
+        self.slave2 = SlaveRep("slave2", f"{uuid}:1-10")
+        self.slaves = [self.slave2, self.slave1]
+
+    @mock.patch("mysql_rep_failover.promote_best_slave")
+    def test_signals_given(self, mock_promote):
+
+        """Function:  test_signals_given
+
+        Description:  Test with the signal handlers installed before the
+            slaves were created and a signal already received.
+
+        Arguments:
+
+        """
+
+        signals = Signals(signal.SIGUSR1)
+        given = {"action": "stop", "wake": mock.Mock(), "prev": {}}
+
+        with mock.patch("mysql_rep_failover.signal.signal",
+                        signals.signal), \
+                mock.patch("mysql_rep_failover.probe_libs.refresh_slaves",
+                           signals.refresh):
+            self.assertEqual(
+                mysql_rep_failover.supervise(
+                    self.slaves, self.args, signals=given), (False, None))
+
+        self.assertEqual(signals.refreshes, 0)
+        self.assertEqual(signals.handlers, {})
+        self.assertFalse(mock_promote.called)
+
+    @mock.patch("mysql_rep_failover.mysql_libs.disconnect")
+    @mock.patch("mysql_rep_failover.rejoin_slaves")
+    @mock.patch("mysql_rep_failover.promote_best_slave")
+    def test_rejoin(self, mock_promote, mock_rejoin, mock_disconnect):
+
+        """Function:  test_rejoin
+
+        Description:  Test a slave dropped on a refresh is rejoined on a
+            later poll and disconnected after the promotion.
+
+        Arguments:
+
+        """
+
+        signals = Signals(signal.SIGUSR1)
+        slave3 = SlaveRep("slave3", self.slave1.exe_gtidset)
+        mock_promote.return_value = (False, None)
+        mock_rejoin.side_effect = [[slave3], []]
+        polled = []
+
+        def _refresh(slaves, **kwargs):
+            polled.append([slv.name for slv in slaves])
+
+            return signals.refresh(
+                [slv for slv in slaves if slv is not self.slave2], **kwargs)
+
+        with mock.patch("mysql_rep_failover.signal.signal",
+                        signals.signal), \
+                mock.patch("mysql_rep_failover.probe_libs.refresh_slaves",
+                           _refresh):
+            with gen_libs.no_std_out():
+                mysql_rep_failover.supervise(self.slaves, self.args)
+
+        self.assertEqual(
+            polled, [["slave2", "slave1"], ["slave1", "slave3"],
+                     ["slave1", "slave3"]])
+        self.assertEqual(mock_promote.call_args[0][0], [self.slave1, slave3])
+        mock_disconnect.assert_called_once_with([slave3])
+
+    @mock.patch("mysql_rep_failover.promote_best_slave")
+    def test_tracker(self, mock_promote):
+
+        """Function:  test_tracker
+
+        Description:  Test the GTID sets are tracked across the refreshes
+            and the promotion.
+
+        Arguments:
+
+        """
+
+        signals = Signals(signal.SIGUSR1)
+        mock_promote.return_value = (False, None)
+        report = {"phases": {}, "slaves": {}}
+
+        with mock.patch("mysql_rep_failover.signal.signal",
+                        signals.signal), \
+                mock.patch("mysql_rep_failover.probe_libs.refresh_slaves",
+                           signals.refresh):
+            with gen_libs.no_std_out():
+                mysql_rep_failover.supervise(
+                    self.slaves, self.args, report=report)
+
+        tracker = signals.trackers[0]
+
+        self.assertIsInstance(
+            tracker, mysql_rep_failover.gtid_class.GtidTracker)
+        self.assertEqual(signals.trackers, [tracker] * 3)
+        self.assertIs(mock_promote.call_args[1]["tracker"], tracker)
+        self.assertIs(report["gtid_reads"], tracker.stats)
+
+    @mock.patch("mysql_rep_failover.promote_best_slave")
+    def test_stop(self, mock_promote):
+
+        """Function:  test_stop
+
+        Description:  Test with the supervisor stopped by a signal.
+
+        Arguments:
+
+        """
+
+        signals = Signals(signal.SIGTERM)
+
+        with mock.patch("mysql_rep_failover.signal.signal",
+                        signals.signal), \
+                mock.patch("mysql_rep_failover.probe_libs.refresh_slaves",
+                           signals.refresh):
+            with gen_libs.no_std_out():
+                self.assertEqual(
+                    mysql_rep_failover.supervise(self.slaves, self.args),
+                    (False, None))
+
+        self.assertFalse(mock_promote.called)
+        self.assertIsNone(signals.handlers[signal.SIGTERM])
+
+    @mock.patch("mysql_rep_failover.promote_best_slave")
+    def test_promote(self, mock_promote):
+
+        """Function:  test_promote
+
+        Description:  Test with the master declared down.
+
+        Arguments:
+
+        """
+
+        signals = Signals(signal.SIGUSR1)
+        mock_promote.return_value = (False, None)
+
+        with mock.patch("mysql_rep_failover.signal.signal",
+                        signals.signal), \
+                mock.patch("mysql_rep_failover.probe_libs.refresh_slaves",
+                           signals.refresh):
+            with gen_libs.no_std_out():
+                self.assertEqual(
+                    mysql_rep_failover.supervise(self.slaves, self.args),
+                    (False, None))
+
+        self.assertEqual(signals.refreshes, 3)
+        self.assertEqual(
+            mock_promote.call_args[1]["selection"]["best"], self.slave1)
+
+    @mock.patch("mysql_rep_failover.promote_best_slave")
+    def test_default(self, mock_promote):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        signals = Signals(signal.SIGUSR1)
+        mock_promote.return_value = (True, "Error Message")
+
+        with mock.patch("mysql_rep_failover.signal.signal",
+                        signals.signal), \
+                mock.patch("mysql_rep_failover.probe_libs.refresh_slaves",
+                           signals.refresh):
+            with gen_libs.no_std_out():
+                self.assertEqual(
+                    mysql_rep_failover.supervise(self.slaves, self.args),
+                    (True, "Error Message"))
+
+
+if __name__ == "__main__":
+    unittest.main()
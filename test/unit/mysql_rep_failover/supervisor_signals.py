@@ -0,0 +1,162 @@
+# Classification (U)
+
+"""Program:  supervisor_signals.py
+
+    Description:  Unit testing of supervisor_signals in
+        mysql_rep_failover.py.
+
+    Usage:
+        test/unit/mysql_rep_failover/supervisor_signals.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import signal
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_failover                       # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Signals():                                        # pylint:disable=R0903
+
+    """Class:  Signals
+
+    Description:  Class stub holder for signal.signal to capture the signal
+        handlers.
+
+    Methods:
+        __init__
+        signal
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.handlers = {signal.SIGINT: "PrevHandler"}
+
+    def signal(self, signum, handler):
+
+        """Method:  signal
+
+        Description:  Stub holder for signal.signal function.
+
+        Arguments:
+            (input) signum
+            (input) handler
+
+        """
+
+        prev = self.handlers.get(signum)
+        self.handlers[signum] = handler
+
+        return prev
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_stop
+        test_promote
+        test_installed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.signals = Signals()
+
+    def test_stop(self):
+
+        """Function:  test_stop
+
+        Description:  Test SIGTERM sets the stop action.
+
+        Arguments:
+
+        """
+
+        with mock.patch("mysql_rep_failover.signal.signal",
+                        self.signals.signal):
+            signals = mysql_rep_failover.supervisor_signals()
+
+        self.signals.handlers[signal.SIGTERM](signal.SIGTERM, None)
+
+        self.assertEqual(signals["action"], "stop")
+        self.assertTrue(signals["wake"].is_set())
+
+    def test_promote(self):
+
+        """Function:  test_promote
+
+        Description:  Test SIGUSR1 sets the promote action.
+
+        Arguments:
+
+        """
+
+        with mock.patch("mysql_rep_failover.signal.signal",
+                        self.signals.signal):
+            signals = mysql_rep_failover.supervisor_signals()
+
+        self.signals.handlers[signal.SIGUSR1](signal.SIGUSR1, None)
+
+        self.assertEqual(signals["action"], "promote")
+        self.assertTrue(signals["wake"].is_set())
+
+    def test_installed(self):
+
+        """Function:  test_installed
+
+        Description:  Test the handlers are installed and the previous
+            handlers are kept.
+
+        Arguments:
+
+        """
+
+        with mock.patch("mysql_rep_failover.signal.signal",
+                        self.signals.signal):
+            signals = mysql_rep_failover.supervisor_signals()
+
+        self.assertIsNone(signals["action"])
+        self.assertFalse(signals["wake"].is_set())
+        self.assertEqual(
+            signals["prev"], {signal.SIGUSR1: None, signal.SIGTERM: None,
+                              signal.SIGINT: "PrevHandler"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,14 +6,17 @@
 
 echo ""
 echo "Unit testing..."
-/usr/bin/python test/unit/mysql_rep_failover/convert_to_master.py
-/usr/bin/python test/unit/mysql_rep_failover/create_instances.py
 /usr/bin/python test/unit/mysql_rep_failover/gtid_enabled.py
 /usr/bin/python test/unit/mysql_rep_failover/help_message.py
+/usr/bin/python test/unit/mysql_rep_failover/load_slaves.py
 /usr/bin/python test/unit/mysql_rep_failover/main.py
-/usr/bin/python test/unit/mysql_rep_failover/order_slaves_on_gtid.py
 /usr/bin/python test/unit/mysql_rep_failover/promote_best_slave.py
 /usr/bin/python test/unit/mysql_rep_failover/promote_designated_slave.py
+/usr/bin/python test/unit/mysql_rep_failover/rejoin_slaves.py
+/usr/bin/python test/unit/mysql_rep_failover/restore_signals.py
 /usr/bin/python test/unit/mysql_rep_failover/run_program.py
 /usr/bin/python test/unit/mysql_rep_failover/show_best_slave.py
 /usr/bin/python test/unit/mysql_rep_failover/show_slave_delays.py
+/usr/bin/python test/unit/mysql_rep_failover/supervise.py
+/usr/bin/python test/unit/mysql_rep_failover/supervisor_signals.py
+/usr/bin/python test/unit/mysql_rep_failover/valid_num.py
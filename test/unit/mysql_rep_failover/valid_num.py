@@ -0,0 +1,216 @@
+# Classification (U)
+
+"""Program:  valid_num.py
+
+    Description:  Unit testing of valid_num in mysql_rep_failover.py.
+
+    Usage:
+        test/unit/mysql_rep_failover/valid_num.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_failover                       # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_integer
+        test_wave_not_integer
+        test_float_number
+        test_negative
+        test_not_number
+        test_not_present
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.opt_num_list = ["-p", "-t", "-W"]
+        self.opt_int_list = ["-p", "-W"]
+
+    def test_not_integer(self):
+
+        """Function:  test_not_integer
+
+        Description:  Test with a float value for an integer option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-p": "2.5"}
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                mysql_rep_failover.valid_num(
+                    self.args, self.opt_num_list, self.opt_int_list))
+
+    def test_wave_not_integer(self):
+
+        """Function:  test_wave_not_integer
+
+        Description:  Test with a float value for the wave size.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-W": "0.5"}
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                mysql_rep_failover.valid_num(
+                    self.args, self.opt_num_list, self.opt_int_list))
+
+    def test_float_number(self):
+
+        """Function:  test_float_number
+
+        Description:  Test with a float value for a numeric option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-t": "0.5"}
+
+        self.assertTrue(
+            mysql_rep_failover.valid_num(
+                self.args, self.opt_num_list, self.opt_int_list))
+
+    def test_negative(self):
+
+        """Function:  test_negative
+
+        Description:  Test with a negative number.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-p": "-4"}
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                mysql_rep_failover.valid_num(
+                    self.args, self.opt_num_list, self.opt_int_list))
+
+    def test_not_number(self):
+
+        """Function:  test_not_number
+
+        Description:  Test with a value that is not a number.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-t": "abc"}
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                mysql_rep_failover.valid_num(
+                    self.args, self.opt_num_list, self.opt_int_list))
+
+    def test_not_present(self):
+
+        """Function:  test_not_present
+
+        Description:  Test with no numeric options passed.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(
+            mysql_rep_failover.valid_num(
+                self.args, self.opt_num_list, self.opt_int_list))
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-p": "8", "-t": "2.5"}
+
+        self.assertTrue(
+            mysql_rep_failover.valid_num(
+                self.args, self.opt_num_list, self.opt_int_list))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+# Classification (U)
+
+"""Program:  bytes_behind.py
+
+    Description:  Unit testing of bytes_behind in plan_libs.py.
+
+    Usage:
+        test/unit/plan_libs/bytes_behind.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import plan_libs                                # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, name, exe_gtidset, retrieved_gtidset=""):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) name
+            (input) exe_gtidset
+            (input) retrieved_gtidset
+
+        """
+
+        self.name = name
+        self.exe_gtidset = exe_gtidset
+        self.retrieved_gtidset = retrieved_gtidset
+        self.apply_rate = None
+        self.mst_log = "mysql-bin.000010"
+        self.relay_mst_log = "mysql-bin.000010"
+        self.read_mst_pos = None
+        self.exec_mst_pos = None
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_other_log
+        test_no_positions
+        test_new_master
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.slave1 = SlaveRep("slave1", "")
+        self.slave2 = SlaveRep("slave2", "")
+        self.slave1.read_mst_pos = "5000"
+        self.slave1.exec_mst_pos = "4000"
+        self.slave2.exec_mst_pos = 1000
+
+    def test_other_log(self):
+
+        """Function:  test_other_log
+
+        Description:  Test with the positions in different source log
+            files.
+
+        Arguments:
+
+        """
+
+        self.slave2.relay_mst_log = "mysql-bin.000009"
+
+        self.assertIsNone(
+            plan_libs.bytes_behind(self.slave2, self.slave1))
+
+    def test_no_positions(self):
+
+        """Function:  test_no_positions
+
+        Description:  Test with no source log positions.
+
+        Arguments:
+
+        """
+
+        self.slave1.read_mst_pos = None
+
+        self.assertIsNone(
+            plan_libs.bytes_behind(self.slave2, self.slave1))
+
+    def test_new_master(self):
+
+        """Function:  test_new_master
+
+        Description:  Test with the new master's own relay log.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            plan_libs.bytes_behind(self.slave1, self.slave1), 1000)
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            plan_libs.bytes_behind(self.slave2, self.slave1), 4000)
+
+
+if __name__ == "__main__":
+    unittest.main()
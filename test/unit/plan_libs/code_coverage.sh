@@ -0,0 +1,18 @@
+#!/bin/bash
+# Unit test code coverage for library module.
+# This will run the Python code coverage module against all unit test modules.
+# This will show the amount of code that was tested and which lines of code
+#   that was skipped during the test.
+
+coverage erase
+
+echo ""
+echo "Running unit test modules in conjunction with coverage"
+coverage run -a --source=plan_libs test/unit/plan_libs/bytes_behind.py
+coverage run -a --source=plan_libs test/unit/plan_libs/failover_plan.py
+coverage run -a --source=plan_libs test/unit/plan_libs/plan_failover.py
+
+echo ""
+echo "Producing code coverage report"
+coverage combine
+coverage report -m
@@ -0,0 +1,187 @@
+# Classification (U)
+
+"""Program:  failover_plan.py
+
+    Description:  Unit testing of failover_plan in plan_libs.py.
+
+    Usage:
+        test/unit/plan_libs/failover_plan.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import plan_libs                                # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, name, exe_gtidset, retrieved_gtidset=""):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) name
+            (input) exe_gtidset
+            (input) retrieved_gtidset
+
+        """
+
+        self.name = name
+        self.exe_gtidset = exe_gtidset
+        self.retrieved_gtidset = retrieved_gtidset
+        self.apply_rate = None
+        self.mst_log = "mysql-bin.000010"
+        self.relay_mst_log = "mysql-bin.000010"
+        self.read_mst_pos = None
+        self.exec_mst_pos = None
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_errant
+        test_unknown_rate
+        test_not_on_candidate
+        test_one_slave
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.uuid = "3e11fa47-71ca-11e1-9e33-c80aa9429562"
+        self.slave1 = SlaveRep(
+            "slave1", f"{self.uuid}:1-20", f"{self.uuid}:18-30")
+        self.slave2 = SlaveRep("slave2", f"{self.uuid}:1-10")
+        self.slave3 = SlaveRep("slave3", f"{self.uuid}:1-25")
+        self.slave1.apply_rate = 5.0
+        self.slave2.apply_rate = 10.0
+        self.slave3.apply_rate = 1.0
+        self.slaves = [self.slave2, self.slave1, self.slave3]
+
+    def test_errant(self):
+
+        """Function:  test_errant
+
+        Description:  Test the errant transactions and the slaves with every
+            transaction.
+
+        Arguments:
+
+        """
+
+        plan = plan_libs.failover_plan(self.slave3, self.slaves)
+
+        self.assertEqual(plan["errant"], {"slave1": 5})
+        self.assertEqual(plan["complete"], ["slave1"])
+
+    def test_unknown_rate(self):
+
+        """Function:  test_unknown_rate
+
+        Description:  Test with a slave with no apply rate.
+
+        Arguments:
+
+        """
+
+        self.slave2.apply_rate = None
+
+        plan = plan_libs.failover_plan(self.slave1, self.slaves)
+
+        self.assertIsNone(plan["slaves"][2]["catch_up"])
+        self.assertIsNone(plan["catch_up"])
+
+    def test_not_on_candidate(self):
+
+        """Function:  test_not_on_candidate
+
+        Description:  Test with a slave which has transactions the new
+            master does not have.
+
+        Arguments:
+
+        """
+
+        plan = plan_libs.failover_plan(self.slave3, self.slaves)
+
+        self.assertEqual(plan["slaves"][0]["name"], "slave3")
+        self.assertEqual(plan["slaves"][0]["missing"], 0)
+        self.assertEqual(plan["slaves"][1]["not_on_candidate"], 5)
+        self.assertEqual(plan["slaves"][1]["catch_up"], 1.0)
+
+    def test_one_slave(self):
+
+        """Function:  test_one_slave
+
+        Description:  Test with only the new master.
+
+        Arguments:
+
+        """
+
+        plan = plan_libs.failover_plan(self.slave1, [self.slave1])
+
+        self.assertEqual(plan["catch_up"], 2.0)
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        plan = plan_libs.failover_plan(self.slave1, self.slaves)
+
+        self.assertEqual(plan["candidate"], "slave1")
+        self.assertEqual([item["name"] for item in plan["slaves"]],
+                         ["slave1", "slave3", "slave2"])
+        self.assertEqual([item["missing"] for item in plan["slaves"]],
+                         [10, 5, 20])
+        self.assertEqual([item["catch_up"] for item in plan["slaves"]],
+                         [2.0, 5.0, 2.0])
+        self.assertEqual(plan["catch_up"], 7.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
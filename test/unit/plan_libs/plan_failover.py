@@ -0,0 +1,323 @@
+# Classification (U)
+
+"""Program:  plan_failover.py
+
+    Description:  Unit testing of plan_failover in plan_libs.py.
+
+    Usage:
+        test/unit/plan_libs/plan_failover.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import io
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import plan_libs                                # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, name, exe_gtidset, retrieved_gtidset=""):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) name
+            (input) exe_gtidset
+            (input) retrieved_gtidset
+
+        """
+
+        self.name = name
+        self.exe_gtidset = exe_gtidset
+        self.retrieved_gtidset = retrieved_gtidset
+        self.apply_rate = None
+        self.mst_log = "mysql-bin.000010"
+        self.relay_mst_log = "mysql-bin.000010"
+        self.read_mst_pos = None
+        self.exec_mst_pos = None
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_probed
+        test_errant
+        test_report
+        test_divergent
+        test_tied
+        test_tied_force
+        test_not_found
+        test_designated
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.uuid2 = "4e11fa47-71ca-11e1-9e33-c80aa9429562"
+        self.uuid = "3e11fa47-71ca-11e1-9e33-c80aa9429562"
+        self.slave1 = SlaveRep(
+            "slave1", f"{self.uuid}:1-20", f"{self.uuid}:18-30")
+        self.slave2 = SlaveRep("slave2", f"{self.uuid}:1-10")
+        self.slave3 = SlaveRep("slave3", f"{self.uuid}:1-25")
+        self.slave1.apply_rate = 5.0
+        self.slave2.apply_rate = 10.0
+        self.slave3.apply_rate = 1.0
+        self.slaves = [self.slave2, self.slave1, self.slave3]
+
+    def test_not_probed(self):
+
+        """Function:  test_not_probed
+
+        Description:  Test with a designated slave which was excluded when its
+            status fields were probed.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-G"] = "slave9"
+        inventory = {"slaves": {"slave9": SlaveRep("slave9", "")}}
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                plan_libs.plan_failover(
+                    self.slaves, self.args, inventory=inventory),
+                (True, "Slave: slave9 was not found in slave array"))
+
+    def test_errant(self):
+
+        """Function:  test_errant
+
+        Description:  Test with slaves with errant transactions.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-G"] = "slave2"
+
+        with mock.patch("sys.stdout", new_callable=io.StringIO) as mock_out:
+            plan_libs.plan_failover(self.slaves, self.args)
+
+        self.assertIn(
+            "Errant transactions on: ['slave1', 'slave3']  Slaves with every"
+            " transaction: ['slave1']", mock_out.getvalue())
+
+    def test_report(self):
+
+        """Function:  test_report
+
+        Description:  Test the plan is added to the timing report.
+
+        Arguments:
+
+        """
+
+        report = {"phases": {}, "slaves": {}}
+
+        with gen_libs.no_std_out():
+            plan_libs.plan_failover(
+                self.slaves, self.args, report=report)
+
+        self.assertEqual(report["plan"]["candidate"], "slave1")
+        self.assertIn("ranking", report["phases"])
+
+    def test_divergent(self):
+
+        """Function:  test_divergent
+
+        Description:  Test with divergent slaves and no best slave.
+
+        Arguments:
+
+        """
+
+        self.slave3.exe_gtidset = f"{self.uuid}:1-25,{self.uuid2}:1"
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                plan_libs.plan_failover(self.slaves, self.args),
+                (True, "No single best slave, divergent slaves:"
+                       " ['slave1', 'slave3']"))
+
+    def test_tied(self):
+
+        """Function:  test_tied
+
+        Description:  Test with a slave tied with the best slave.
+
+        Arguments:
+
+        """
+
+        self.slave2.exe_gtidset = f"{self.uuid}:1-30"
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                plan_libs.plan_failover(self.slaves, self.args),
+                (True, "Slaves are tied with best slave slave2: ['slave1']"
+                       " Use the -G option to pick the slave to promote."))
+
+    def test_tied_force(self):
+
+        """Function:  test_tied_force
+
+        Description:  Test with a slave tied with the best slave and the -f
+            option.
+
+        Arguments:
+
+        """
+
+        self.slave2.exe_gtidset = f"{self.uuid}:1-30"
+        self.args.args_array["-f"] = True
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                plan_libs.plan_failover(self.slaves, self.args),
+                (False, None))
+
+    def test_not_found(self):
+
+        """Function:  test_not_found
+
+        Description:  Test with the designated slave not found.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-G"] = "slave9"
+
+        self.assertEqual(
+            plan_libs.plan_failover(self.slaves, self.args),
+            (True, "Slave: slave9 was not found in slave array"))
+
+    def test_designated(self):
+
+        """Function:  test_designated
+
+        Description:  Test with the designated slave.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-G"] = "slave2"
+
+        with mock.patch("sys.stdout", new_callable=io.StringIO) as mock_out:
+            self.assertEqual(
+                plan_libs.plan_failover(self.slaves, self.args),
+                (False, None))
+
+        self.assertIn("Plan:  Promote slave2", mock_out.getvalue())
+        self.assertIn("Not on slave2: 20", mock_out.getvalue())
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        with mock.patch("sys.stdout", new_callable=io.StringIO) as mock_out:
+            self.assertEqual(
+                plan_libs.plan_failover(self.slaves, self.args),
+                (False, None))
+
+        self.assertEqual(
+            mock_out.getvalue().splitlines(),
+            ["Plan:  Promote slave1, no servers were changed",
+             " Candidate: slave1\tMissing: 10\tBytes behind: unknown"
+             "\tCatch-up: 2.000s",
+             "     Slave: slave3\tMissing: 5\tBytes behind: unknown"
+             "\tCatch-up: 5.000s",
+             "     Slave: slave2\tMissing: 20\tBytes behind: unknown"
+             "\tCatch-up: 2.000s",
+             "Predicted catch-up: 7.000s"])
+
+
+if __name__ == "__main__":
+    unittest.main()
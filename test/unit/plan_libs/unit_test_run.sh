@@ -0,0 +1,11 @@
+#!/bin/bash
+# Unit testing program for the library module.
+# This will run all the units tests for this library.
+# Will need to run this from the base directory where the module file
+#   is located at.
+
+echo ""
+echo "Unit testing..."
+/usr/bin/python test/unit/plan_libs/bytes_behind.py
+/usr/bin/python test/unit/plan_libs/failover_plan.py
+/usr/bin/python test/unit/plan_libs/plan_failover.py
@@ -0,0 +1,23 @@
+#!/bin/bash
+# Unit test code coverage for library module.
+# This will run the Python code coverage module against all unit test modules.
+# This will show the amount of code that was tested and which lines of code
+#   that was skipped during the test.
+
+coverage erase
+
+echo ""
+echo "Running unit test modules in conjunction with coverage"
+coverage run -a --source=probe_libs test/unit/probe_libs/probe_fields.py
+coverage run -a --source=probe_libs test/unit/probe_libs/probe_query.py
+coverage run -a --source=probe_libs test/unit/probe_libs/probe_slave.py
+coverage run -a --source=probe_libs test/unit/probe_libs/probe_slaves.py
+coverage run -a --source=probe_libs test/unit/probe_libs/probe_value.py
+coverage run -a --source=probe_libs test/unit/probe_libs/refresh_slaves.py
+coverage run -a --source=probe_libs test/unit/probe_libs/slave_gtids.py
+coverage run -a --source=probe_libs test/unit/probe_libs/wait_for_drain.py
+
+echo ""
+echo "Producing code coverage report"
+coverage combine
+coverage report -m
@@ -0,0 +1,111 @@
+# Classification (U)
+
+"""Program:  probe_fields.py
+
+    Description:  Unit testing of probe_fields in probe_libs.py.
+
+    Usage:
+        test/unit/probe_libs/probe_fields.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import probe_libs                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_plan
+        test_designated
+        test_no_fields
+        test_no_commands
+        test_default
+
+    """
+
+    def test_plan(self):
+
+        """Function:  test_plan
+
+        Description:  Test with the -P option.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            probe_libs.probe_fields(["-P"]),
+            {"retrieved_gtidset", "apply_rate"})
+
+    def test_designated(self):
+
+        """Function:  test_designated
+
+        Description:  Test with the -G option.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            probe_libs.probe_fields(["-G"]), {"retrieved_gtidset"})
+
+    def test_no_fields(self):
+
+        """Function:  test_no_fields
+
+        Description:  Test with a command which needs no fields.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(probe_libs.probe_fields(["-B"]), set())
+
+    def test_no_commands(self):
+
+        """Function:  test_no_commands
+
+        Description:  Test with no commands.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(probe_libs.probe_fields([]), set())
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            probe_libs.probe_fields(["-F", "-y"]),
+            {"retrieved_gtidset"})
+
+
+if __name__ == "__main__":
+    unittest.main()
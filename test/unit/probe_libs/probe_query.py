@@ -0,0 +1,97 @@
+# Classification (U)
+
+"""Program:  probe_query.py
+
+    Description:  Unit testing of probe_query in probe_libs.py.
+
+    Usage:
+        test/unit/probe_libs/probe_query.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import probe_libs                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_tracked
+        test_digest
+        test_default
+
+    """
+
+    def test_tracked(self):
+
+        """Function:  test_tracked
+
+        Description:  Test with a field fetched as its last transactions.
+
+        Arguments:
+
+        """
+
+        cmd = probe_libs.probe_query(
+            ["gtid_mode", "exe_gtidset", "retrieved_gtidset"],
+            tracked=["exe_gtidset"], digest=True)
+
+        self.assertNotIn("@@GLOBAL.gtid_executed AS exe_gtidset", cmd)
+        self.assertIn("AS exe_gtidset_last", cmd)
+        self.assertIn("AS exe_gtidset_digest", cmd)
+        self.assertIn("AS retrieved_gtidset,", cmd)
+        self.assertIn("AS retrieved_gtidset_digest", cmd)
+        self.assertNotIn("retrieved_gtidset_last", cmd)
+
+    def test_digest(self):
+
+        """Function:  test_digest
+
+        Description:  Test with the digest of the GTID sets.
+
+        Arguments:
+
+        """
+
+        cmd = probe_libs.probe_query(
+            ["gtid_mode", "exe_gtidset"], digest=True)
+
+        self.assertIn("@@GLOBAL.gtid_executed AS exe_gtidset,", cmd)
+        self.assertIn("AS exe_gtidset_digest", cmd)
+        self.assertNotIn("gtid_mode_digest", cmd)
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            probe_libs.probe_query(["gtid_mode", "exe_gtidset"]),
+            "SELECT @@GLOBAL.gtid_mode AS gtid_mode,"
+            " @@GLOBAL.gtid_executed AS exe_gtidset")
+
+
+if __name__ == "__main__":
+    unittest.main()
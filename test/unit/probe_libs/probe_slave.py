@@ -0,0 +1,247 @@
+# Classification (U)
+
+"""Program:  probe_slave.py
+
+    Description:  Unit testing of probe_slave in probe_libs.py.
+
+    Usage:
+        test/unit/probe_libs/probe_slave.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import probe_libs                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self, name, polls):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) name
+            (input) polls -> Executed set of the slave on each poll
+
+        """
+
+        self.name = name
+        self.polls = polls
+        self.exe_gtidset = None
+        self.gtid_mode = None
+        self.last_error = None
+        self.cmds = []
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Stub holder for mysql_class.SlaveRep.col_sql method.
+
+        Arguments:
+            (input) cmd
+
+        """
+
+        self.cmds.append(cmd)
+
+        if "LAST_APPLIED_TRANSACTION" in cmd and self.last_error:
+            raise self.last_error
+
+        gtids = probe_libs.gtid_class.GtidSet(
+            self.polls.pop(0) if len(self.polls) > 1 else self.polls[0])
+        uuid, ranges = list(gtids.intervals().items())[0]
+
+        return [{"gtid_mode": "ON", "exe_gtidset": str(gtids),
+                 "exe_gtidset_last": f"{uuid}:{ranges[-1][1]}",
+                 "exe_gtidset_digest":
+                     probe_libs.gtid_class.GtidTracker.digest(gtids)}]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_supported
+        test_failed
+        test_stale
+        test_unchanged
+        test_tracker
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.uuid = "3e11fa47-71ca-11e1-9e33-c80aa9429562"
+        self.slave = SlaveRep(
+            "slave1",
+            [f"{self.uuid}:1-10", f"{self.uuid}:1-12", f"{self.uuid}:1-15"])
+        self.fields = ["gtid_mode", "exe_gtidset"]
+        self.tracker = probe_libs.gtid_class.GtidTracker()
+
+    def test_not_supported(self):
+
+        """Function:  test_not_supported
+
+        Description:  Test with a slave with no last applied transactions
+            (MySQL 5.7).
+
+        Arguments:
+
+        """
+
+        self.slave.last_error = ValueError("Unknown column")
+        probe_libs.probe_slave(
+            self.slave, self.fields, tracker=self.tracker)
+        probe_libs.probe_slave(
+            self.slave, self.fields, tracker=self.tracker)
+        probe_libs.probe_slave(
+            self.slave, self.fields, tracker=self.tracker)
+
+        self.assertEqual(str(self.slave.exe_gtids), f"{self.uuid}:1-15")
+        self.assertEqual(self.tracker.unsupported, {"slave1"})
+        self.assertEqual(len(self.slave.cmds), 4)
+        self.assertNotIn("LAST_APPLIED_TRANSACTION", self.slave.cmds[3])
+
+    def test_failed(self):
+
+        """Function:  test_failed
+
+        Description:  Test with a query which fails.
+
+        Arguments:
+
+        """
+
+        self.slave.col_sql = mock.Mock(
+            side_effect=ValueError("Lost connection"))
+
+        with self.assertRaises(ValueError):
+            probe_libs.probe_slave(
+                self.slave, self.fields, tracker=self.tracker)
+
+    def test_stale(self):
+
+        """Function:  test_stale
+
+        Description:  Test with a set which cannot be advanced.
+
+        Arguments:
+
+        """
+
+        self.slave.polls = [f"{self.uuid}:1-10", f"{self.uuid}:1-10:13",
+                            f"{self.uuid}:1-10:13"]
+        probe_libs.probe_slave(
+            self.slave, self.fields, tracker=self.tracker)
+        probe_libs.probe_slave(
+            self.slave, self.fields, tracker=self.tracker)
+
+        self.assertEqual(str(self.slave.exe_gtids), f"{self.uuid}:1-10:13")
+        self.assertEqual(len(self.slave.cmds), 3)
+        self.assertIn("@@GLOBAL.gtid_executed AS", self.slave.cmds[2])
+        self.assertEqual(self.tracker.stats,
+                         {"full": 2, "incremental": 0, "unchanged": 0})
+
+    def test_unchanged(self):
+
+        """Function:  test_unchanged
+
+        Description:  Test with a set which has not changed.
+
+        Arguments:
+
+        """
+
+        self.slave.polls = [f"{self.uuid}:1-10"]
+        probe_libs.probe_slave(
+            self.slave, self.fields, tracker=self.tracker)
+        probe_libs.probe_slave(
+            self.slave, self.fields, tracker=self.tracker)
+
+        self.assertEqual(self.tracker.stats,
+                         {"full": 1, "incremental": 0, "unchanged": 1})
+
+    def test_tracker(self):
+
+        """Function:  test_tracker
+
+        Description:  Test with the later polls advanced.
+
+        Arguments:
+
+        """
+
+        probe_libs.probe_slave(
+            self.slave, self.fields, tracker=self.tracker)
+        probe_libs.probe_slave(
+            self.slave, self.fields, tracker=self.tracker)
+        probe_libs.probe_slave(
+            self.slave, self.fields, tracker=self.tracker)
+
+        self.assertEqual(str(self.slave.exe_gtids), f"{self.uuid}:1-15")
+        self.assertTrue(self.slave.gtid_mode)
+        self.assertEqual(len(self.slave.cmds), 3)
+        self.assertIn("exe_gtidset_digest", self.slave.cmds[0])
+        self.assertNotIn("@@GLOBAL.gtid_executed AS", self.slave.cmds[1])
+        self.assertEqual(self.tracker.stats,
+                         {"full": 1, "incremental": 2, "unchanged": 0})
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        self.assertIs(probe_libs.probe_slave(
+            self.slave, self.fields), self.slave)
+        self.assertEqual(str(self.slave.exe_gtids), f"{self.uuid}:1-10")
+        self.assertIsNone(self.slave.exe_gtidset)
+        self.assertNotIn("exe_gtidset_digest", self.slave.cmds[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
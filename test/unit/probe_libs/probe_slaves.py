@@ -0,0 +1,263 @@
+# Classification (U)
+
+"""Program:  probe_slaves.py
+
+    Description:  Unit testing of probe_slaves in probe_libs.py.
+
+    Usage:
+        test/unit/probe_libs/probe_slaves.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import io
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import probe_libs                               # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class SlaveRep():                                # pylint:disable=R0902,R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self, name, row=None):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) name
+            (input) row -> Row returned by col_sql or None to raise
+
+        """
+
+        self.name = name
+        self.row = row
+        self.gtid_mode = None
+        self.exe_gtidset = None
+        self.threads_running = None
+        self.lag = None
+        self.cmds = []
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Stub holder for mysql_class.SlaveRep.col_sql.
+
+        Arguments:
+            (input) cmd
+
+        """
+
+        if self.row is None:
+            raise ValueError("Lost connection")
+
+        self.cmds.append(cmd)
+
+        return [self.row]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_tracker
+        test_stream
+        test_quiet
+        test_single_query
+        test_failed
+        test_no_fields
+        test_no_slaves
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.gtids = "3e11fa47-71ca-11e1-9e33-c80aa9429562:1-20"
+        self.slave1 = SlaveRep(
+            "slave1", {"gtid_mode": "ON", "exe_gtidset": self.gtids,
+                       "threads_running": "4", "lag": "0.500000"})
+        self.slave2 = SlaveRep("slave2")
+        self.slaves = [self.slave1, self.slave2]
+
+    def test_tracker(self):
+
+        """Function:  test_tracker
+
+        Description:  Test the slaves are probed with the GTID tracker.
+
+        Arguments:
+
+        """
+
+        tracker = probe_libs.gtid_class.GtidTracker()
+
+        with mock.patch("probe_libs.probe_slave") as mock_probe:
+            probe_libs.probe_slaves(
+                [self.slave1], ["exe_gtidset"], tracker=tracker)
+
+        mock_probe.assert_called_once_with(
+            self.slave1, ["exe_gtidset"], tracker=tracker)
+
+    def test_stream(self):
+
+        """Function:  test_stream
+
+        Description:  Test an excluded slave record is streamed for a slave
+            that fails the query.
+
+        Arguments:
+
+        """
+
+        stream = mock.Mock()
+
+        with mock.patch("sys.stdout", new_callable=io.StringIO) as mock_out:
+            self.assertEqual(
+                probe_libs.probe_slaves(
+                    self.slaves, ["gtid_mode"], quiet=True, stream=stream),
+                [self.slave1])
+
+        record = stream.call_args[0][0]
+
+        self.assertEqual(stream.call_count, 1)
+        self.assertEqual(
+            (record["type"], record["name"], record["status"],
+             record["error"]), ("slave", "slave2", "excluded",
+                                "Lost connection"))
+        self.assertIn("seconds", record)
+        self.assertEqual(mock_out.getvalue(), "")
+
+    def test_quiet(self):
+
+        """Function:  test_quiet
+
+        Description:  Test with the failed slaves not printed.
+
+        Arguments:
+
+        """
+
+        with mock.patch("sys.stdout", new_callable=io.StringIO) as mock_out:
+            probe_libs.probe_slaves(
+                self.slaves, ["gtid_mode"], quiet=True)
+
+        self.assertEqual(mock_out.getvalue(), "")
+
+    def test_single_query(self):
+
+        """Function:  test_single_query
+
+        Description:  Test with all fields fetched in one query.
+
+        Arguments:
+
+        """
+
+        probe_libs.probe_slaves(
+            [self.slave1], ["threads_running", "gtid_mode", "lag"])
+
+        self.assertEqual(len(self.slave1.cmds), 1)
+        self.assertTrue(self.slave1.cmds[0].startswith(
+            "SELECT @@GLOBAL.gtid_mode AS gtid_mode, (SELECT MAX("))
+
+    def test_failed(self):
+
+        """Function:  test_failed
+
+        Description:  Test with a slave that fails the query.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                probe_libs.probe_slaves(self.slaves, ["gtid_mode"]),
+                [self.slave1])
+
+    def test_no_fields(self):
+
+        """Function:  test_no_fields
+
+        Description:  Test with no fields to fetch.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            probe_libs.probe_slaves(self.slaves, []), self.slaves)
+        self.assertEqual(self.slave1.cmds, [])
+
+    def test_no_slaves(self):
+
+        """Function:  test_no_slaves
+
+        Description:  Test with no slaves.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            probe_libs.probe_slaves([], ["gtid_mode"]), [])
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        probe_libs.probe_slaves(
+            [self.slave1],
+            ["gtid_mode", "exe_gtidset", "threads_running", "lag"])
+
+        self.assertEqual(
+            (self.slave1.gtid_mode, str(self.slave1.exe_gtids),
+             self.slave1.threads_running, self.slave1.lag),
+            (True, self.gtids, 4.0, 0.5))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,171 @@
+# Classification (U)
+
+"""Program:  probe_value.py
+
+    Description:  Unit testing of probe_value in probe_libs.py.
+
+    Usage:
+        test/unit/probe_libs/probe_value.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import probe_libs                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_threads_running
+        test_thread_state
+        test_apply_rate
+        test_lag
+        test_null
+        test_string
+        test_gtid_mode
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.gtids = "3e11fa47-71ca-11e1-9e33-c80aa9429562:1-20"
+
+    def test_threads_running(self):
+
+        """Function:  test_threads_running
+
+        Description:  Test with the threads running field.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            probe_libs.probe_value("threads_running", "12"), 12.0)
+
+    def test_thread_state(self):
+
+        """Function:  test_thread_state
+
+        Description:  Test with the replication thread state fields.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(probe_libs.probe_value("io_running", "ON"))
+        self.assertFalse(probe_libs.probe_value("sql_running", "OFF"))
+        self.assertFalse(probe_libs.probe_value("sql_running", None))
+
+    def test_apply_rate(self):
+
+        """Function:  test_apply_rate
+
+        Description:  Test with the apply rate field.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(probe_libs.probe_value("apply_rate", None))
+        self.assertEqual(
+            probe_libs.probe_value("apply_rate", "250.0"), 250.0)
+
+    def test_lag(self):
+
+        """Function:  test_lag
+
+        Description:  Test with the lag field.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(probe_libs.probe_value("lag", None))
+        self.assertEqual(probe_libs.probe_value("lag", "1.5"), 1.5)
+
+    def test_null(self):
+
+        """Function:  test_null
+
+        Description:  Test with a NULL GTID set.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(probe_libs.probe_value("retrieved_gtidset", None))
+
+    def test_string(self):
+
+        """Function:  test_string
+
+        Description:  Test with a string field.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(probe_libs.probe_value("source_host", None), "")
+        self.assertEqual(
+            probe_libs.probe_value("source_port", 3306), "3306")
+
+    def test_gtid_mode(self):
+
+        """Function:  test_gtid_mode
+
+        Description:  Test with the gtid_mode field.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(probe_libs.probe_value("gtid_mode", "ON"))
+        self.assertFalse(
+            probe_libs.probe_value("gtid_mode", "ON_PERMISSIVE"))
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        gtids = probe_libs.probe_value("exe_gtidset", self.gtids)
+
+        self.assertIsInstance(gtids, probe_libs.gtid_class.GtidSet)
+        self.assertEqual(str(gtids), self.gtids)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,176 @@
+# Classification (U)
+
+"""Program:  refresh_slaves.py
+
+    Description:  Unit testing of refresh_slaves in probe_libs.py.
+
+    Usage:
+        test/unit/probe_libs/refresh_slaves.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import probe_libs                               # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self, name, exe_gtidset, fail=False):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) name
+            (input) exe_gtidset
+            (input) fail
+
+        """
+
+        self.name = name
+        self.exe_gtidset = None
+        self.retrieved_gtidset = None
+        self.server_gtidset = exe_gtidset
+        self.fail = fail
+        self.cmds = []
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Stub holder for mysql_class.SlaveRep.col_sql.
+
+        Arguments:
+            (input) cmd
+
+        """
+
+        if self.fail:
+            raise ValueError("Lost connection")
+
+        self.cmds.append(cmd)
+
+        return [{"gtid_mode": "ON", "exe_gtidset": self.server_gtidset,
+                 "retrieved_gtidset": None}]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_fields
+        test_failed
+        test_no_slaves
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        uuid = "3e11fa47-71ca-11e1-9e33-c80aa9429562"
+        self.slave1 = SlaveRep("slave1", f"{uuid}:1-20")
+        self.slave2 = SlaveRep("slave2", f"{uuid}:1-10")
+        self.slaves = [self.slave1, self.slave2]
+
+    def test_fields(self):
+
+        """Function:  test_fields
+
+        Description:  Test with other status fields to refresh.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            probe_libs.refresh_slaves(self.slaves, fields=["lag"])
+
+        self.assertIn(" AS lag", self.slave1.cmds[0])
+
+    def test_failed(self):
+
+        """Function:  test_failed
+
+        Description:  Test with a slave that fails to refresh.
+
+        Arguments:
+
+        """
+
+        self.slave2.fail = True
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                probe_libs.refresh_slaves(self.slaves), [self.slave1])
+
+    def test_no_slaves(self):
+
+        """Function:  test_no_slaves
+
+        Description:  Test with no slaves.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(probe_libs.refresh_slaves([]), [])
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            probe_libs.refresh_slaves(self.slaves, max_workers=2),
+            self.slaves)
+        self.assertEqual(len(self.slave1.cmds), 1)
+        self.assertEqual(
+            str(self.slave1.exe_gtids), self.slave1.server_gtidset)
+        self.assertFalse(self.slave1.retrieved_gtids)
+        self.assertIsNone(self.slave1.exe_gtidset)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+# Classification (U)
+
+"""Program:  slave_gtids.py
+
+    Description:  Unit testing of slave_gtids in probe_libs.py.
+
+    Usage:
+        test/unit/probe_libs/slave_gtids.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import probe_libs                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "slave1"
+        self.exe_gtidset = "3e11fa47-71ca-11e1-9e33-c80aa9429562:1-20"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_probed
+        test_not_read
+        test_retrieved
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.slave = SlaveRep()
+        self.probed = probe_libs.gtid_class.GtidSet(
+            "3e11fa47-71ca-11e1-9e33-c80aa9429562:1-25")
+
+    def test_probed(self):
+
+        """Function:  test_probed
+
+        Description:  Test with a probed GTID set, which leaves the set read
+            when connecting as it is.
+
+        Arguments:
+
+        """
+
+        self.slave.exe_gtids = self.probed
+
+        self.assertIs(probe_libs.slave_gtids(self.slave), self.probed)
+        self.assertEqual(
+            self.slave.exe_gtidset,
+            "3e11fa47-71ca-11e1-9e33-c80aa9429562:1-20")
+
+    def test_not_read(self):
+
+        """Function:  test_not_read
+
+        Description:  Test with a GTID set that was never read.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(
+            probe_libs.slave_gtids(self.slave, "retrieved_gtidset"))
+
+    def test_retrieved(self):
+
+        """Function:  test_retrieved
+
+        Description:  Test with the probed retrieved GTID set.
+
+        Arguments:
+
+        """
+
+        self.slave.retrieved_gtids = self.probed
+
+        self.assertIs(
+            probe_libs.slave_gtids(self.slave, "retrieved_gtidset"),
+            self.probed)
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            str(probe_libs.slave_gtids(self.slave)),
+            "3e11fa47-71ca-11e1-9e33-c80aa9429562:1-20")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,16 @@
+#!/bin/bash
+# Unit testing program for the library module.
+# This will run all the units tests for this library.
+# Will need to run this from the base directory where the module file
+#   is located at.
+
+echo ""
+echo "Unit testing..."
+/usr/bin/python test/unit/probe_libs/probe_fields.py
+/usr/bin/python test/unit/probe_libs/probe_query.py
+/usr/bin/python test/unit/probe_libs/probe_slave.py
+/usr/bin/python test/unit/probe_libs/probe_slaves.py
+/usr/bin/python test/unit/probe_libs/probe_value.py
+/usr/bin/python test/unit/probe_libs/refresh_slaves.py
+/usr/bin/python test/unit/probe_libs/slave_gtids.py
+/usr/bin/python test/unit/probe_libs/wait_for_drain.py
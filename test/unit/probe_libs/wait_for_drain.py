@@ -0,0 +1,280 @@
+# Classification (U)
+
+"""Program:  wait_for_drain.py
+
+    Description:  Unit testing of wait_for_drain in probe_libs.py.
+
+    Usage:
+        test/unit/probe_libs/wait_for_drain.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import probe_libs                               # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self, name, exe_gtidset):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) name
+            (input) exe_gtidset
+
+        """
+
+        self.name = name
+        self.exe_gtidset = exe_gtidset
+        self.wait_status = 0
+        self.drained = exe_gtidset
+        self.polls = []
+        self.cmds = []
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Stub holder for mysql_class.SlaveRep.col_sql method.
+
+        Arguments:
+            (input) cmd
+
+        """
+
+        self.cmds.append(cmd)
+
+        if "WAIT_FOR_EXECUTED_GTID_SET" in cmd:
+            if self.wait_status is None:
+                raise ValueError("FUNCTION does not exist")
+
+            return [{"status": self.wait_status,
+                     "exe_gtidset": self.drained}]
+
+        gtids = probe_libs.gtid_class.GtidSet(self.polls.pop(0))
+        uuid, ranges = list(gtids.intervals().items())[0]
+
+        return [{"exe_gtidset": str(gtids),
+                 "exe_gtidset_last": f"{uuid}:{ranges[-1][1]}",
+                 "exe_gtidset_digest":
+                     probe_libs.gtid_class.GtidTracker.digest(gtids)}]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_poll_tracked
+        test_poll_timeout
+        test_poll
+        test_server_timeout
+        test_server_refresh_tracked
+        test_server_refresh
+        test_drained
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.uuid = "3e11fa47-71ca-11e1-9e33-c80aa9429562"
+        self.slave = SlaveRep("slave1", f"{self.uuid}:1-10")
+        self.gtids = probe_libs.gtid_class.GtidSet(f"{self.uuid}:1-20")
+
+    def test_poll_tracked(self):
+
+        """Function:  test_poll_tracked
+
+        Description:  Test the later polls read the last applied transactions
+            instead of the executed set.
+
+        Arguments:
+
+        """
+
+        tracker = probe_libs.gtid_class.GtidTracker()
+        self.slave.wait_status = None
+        self.slave.polls = [f"{self.uuid}:1-12", f"{self.uuid}:1-15",
+                            f"{self.uuid}:1-20"]
+
+        with gen_libs.no_std_out():
+            self.assertTrue(probe_libs.wait_for_drain(
+                self.slave, self.gtids, timeout=5, tracker=tracker))
+
+        self.assertIn("@@GLOBAL.gtid_executed AS", self.slave.cmds[1])
+        self.assertIn("LAST_APPLIED_TRANSACTION", self.slave.cmds[3])
+        self.assertEqual(tracker.stats,
+                         {"full": 1, "incremental": 2, "unchanged": 0})
+
+    def test_poll_timeout(self):
+
+        """Function:  test_poll_timeout
+
+        Description:  Test with polling that reaches the deadline.
+
+        Arguments:
+
+        """
+
+        self.slave.wait_status = None
+        self.slave.polls = [f"{self.uuid}:1-10"] * 100
+
+        with gen_libs.no_std_out():
+            self.assertFalse(probe_libs.wait_for_drain(
+                self.slave, self.gtids, timeout=0.05))
+
+    def test_poll(self):
+
+        """Function:  test_poll
+
+        Description:  Test with polling when the server side wait fails.
+
+        Arguments:
+
+        """
+
+        self.slave.wait_status = None
+        self.slave.polls = [f"{self.uuid}:1-12", f"{self.uuid}:1-20"]
+
+        with gen_libs.no_std_out():
+            self.assertTrue(probe_libs.wait_for_drain(
+                self.slave, self.gtids, timeout=5))
+
+        self.assertEqual(len(self.slave.cmds), 3)
+
+    def test_server_timeout(self):
+
+        """Function:  test_server_timeout
+
+        Description:  Test with the server side wait timing out.
+
+        Arguments:
+
+        """
+
+        self.slave.wait_status = 1
+
+        with gen_libs.no_std_out():
+            self.assertFalse(probe_libs.wait_for_drain(
+                self.slave, self.gtids, timeout=1))
+
+    def test_server_refresh_tracked(self):
+
+        """Function:  test_server_refresh_tracked
+
+        Description:  Test the executed set read after the server side wait
+            is tracked.
+
+        Arguments:
+
+        """
+
+        tracker = probe_libs.gtid_class.GtidTracker()
+        self.slave.drained = f"{self.uuid}:1-25"
+
+        with gen_libs.no_std_out():
+            self.assertTrue(probe_libs.wait_for_drain(
+                self.slave, self.gtids, tracker=tracker))
+
+        self.assertIn("exe_gtidset_digest", self.slave.cmds[0])
+        self.assertEqual(str(self.slave.exe_gtids), f"{self.uuid}:1-25")
+        self.assertEqual(tracker.stats["full"], 1)
+
+    def test_server_refresh(self):
+
+        """Function:  test_server_refresh
+
+        Description:  Test the executed set is read in the same query as the
+            server side wait, after the wait.
+
+        Arguments:
+
+        """
+
+        self.slave.drained = f"{self.uuid}:1-25"
+
+        with gen_libs.no_std_out():
+            self.assertTrue(
+                probe_libs.wait_for_drain(self.slave, self.gtids))
+
+        self.assertEqual(len(self.slave.cmds), 1)
+        self.assertLess(
+            self.slave.cmds[0].index("WAIT_FOR_EXECUTED_GTID_SET"),
+            self.slave.cmds[0].index("@@GLOBAL.gtid_executed"))
+        self.assertEqual(str(self.slave.exe_gtids), f"{self.uuid}:1-25")
+        self.assertEqual(self.slave.exe_gtidset, f"{self.uuid}:1-10")
+
+    def test_drained(self):
+
+        """Function:  test_drained
+
+        Description:  Test with the relay log already applied.
+
+        Arguments:
+
+        """
+
+        self.slave.exe_gtidset = f"{self.uuid}:1-20"
+
+        self.assertTrue(
+            probe_libs.wait_for_drain(self.slave, self.gtids))
+        self.assertEqual(self.slave.cmds, [])
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            self.assertTrue(
+                probe_libs.wait_for_drain(self.slave, self.gtids))
+
+        self.assertIn(f"{self.uuid}:1-20", self.slave.cmds[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
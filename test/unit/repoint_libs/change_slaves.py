@@ -0,0 +1,233 @@
+# Classification (U)
+
+"""Program:  change_slaves.py
+
+    Description:  Unit testing of change_slaves in repoint_libs.py.
+
+    Usage:
+        test/unit/repoint_libs/change_slaves.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import repoint_libs                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, name):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) name
+
+        """
+
+        self.name = name
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_wave_timeout
+        test_not_converged
+        test_bad_slaves
+        test_report
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.master = "Master"
+        self.slaves = [SlaveRep("slave1"), SlaveRep("slave2")]
+
+    @mock.patch("repoint_libs.converge_libs.verify_convergence")
+    @mock.patch("repoint_libs.repoint_slaves")
+    def test_wave_timeout(self, mock_repoint, mock_verify):
+
+        """Function:  test_wave_timeout
+
+        Description:  Test the load settle deadline is from the -L option.
+
+        Arguments:
+
+        """
+
+        mock_repoint.return_value = []
+        mock_verify.return_value = []
+        self.args.args_array["-t"] = "10"
+        self.args.args_array["-L"] = "5"
+
+        self.assertEqual(
+            repoint_libs.change_slaves(
+                self.master, self.slaves, self.args), (False, None))
+        self.assertEqual(mock_repoint.call_args[1]["timeout"], 5.0)
+
+    @mock.patch("repoint_libs.converge_libs.verify_convergence")
+    @mock.patch("repoint_libs.repoint_slaves")
+    def test_not_converged(self, mock_repoint, mock_verify):
+
+        """Function:  test_not_converged
+
+        Description:  Test with slaves that do not converge.
+
+        Arguments:
+
+        """
+
+        mock_repoint.return_value = []
+        mock_verify.return_value = ["slave2"]
+        self.args.args_array["-C"] = "5"
+
+        self.assertEqual(
+            repoint_libs.change_slaves(
+                self.master, self.slaves, self.args),
+            (True, "Slaves: ['slave2'] that did not converge on new master"
+                   " within 5.0 seconds."))
+        self.assertEqual(mock_verify.call_args[1]["timeout"], 5.0)
+
+    @mock.patch("repoint_libs.converge_libs.verify_convergence")
+    @mock.patch("repoint_libs.repoint_slaves")
+    def test_bad_slaves(self, mock_repoint, mock_verify):
+
+        """Function:  test_bad_slaves
+
+        Description:  Test with slaves that did not change.
+
+        Arguments:
+
+        """
+
+        mock_repoint.return_value = ["slave1"]
+        mock_verify.return_value = []
+
+        self.assertEqual(
+            repoint_libs.change_slaves(
+                self.master, self.slaves, self.args),
+            (True, "Slaves: ['slave1'] that did not change to new master."))
+        self.assertEqual(mock_verify.call_args[0][1], [self.slaves[1]])
+
+    @mock.patch("repoint_libs.converge_libs.verify_convergence")
+    @mock.patch("repoint_libs.repoint_slaves")
+    def test_report(self, mock_repoint, mock_verify):
+
+        """Function:  test_report
+
+        Description:  Test the phases are added to the timing report.
+
+        Arguments:
+
+        """
+
+        report = {"phases": {}, "slaves": {}}
+        mock_repoint.return_value = []
+        mock_verify.return_value = []
+
+        repoint_libs.change_slaves(
+            self.master, self.slaves, self.args, report=report)
+
+        self.assertIn("repoint", report["phases"])
+        self.assertIn("converge", report["phases"])
+
+    @mock.patch("repoint_libs.converge_libs.verify_convergence")
+    @mock.patch("repoint_libs.repoint_slaves")
+    def test_default(self, mock_repoint, mock_verify):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        mock_repoint.return_value = []
+        mock_verify.return_value = []
+
+        self.assertEqual(
+            repoint_libs.change_slaves(
+                self.master, self.slaves, self.args),
+            (False, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
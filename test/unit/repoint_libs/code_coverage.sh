@@ -0,0 +1,20 @@
+#!/bin/bash
+# Unit test code coverage for library module.
+# This will run the Python code coverage module against all unit test modules.
+# This will show the amount of code that was tested and which lines of code
+#   that was skipped during the test.
+
+coverage erase
+
+echo ""
+echo "Running unit test modules in conjunction with coverage"
+coverage run -a --source=repoint_libs test/unit/repoint_libs/change_slaves.py
+coverage run -a --source=repoint_libs test/unit/repoint_libs/convert_to_master.py
+coverage run -a --source=repoint_libs test/unit/repoint_libs/master_load.py
+coverage run -a --source=repoint_libs test/unit/repoint_libs/repoint_slaves.py
+coverage run -a --source=repoint_libs test/unit/repoint_libs/wait_for_load.py
+
+echo ""
+echo "Producing code coverage report"
+coverage combine
+coverage report -m
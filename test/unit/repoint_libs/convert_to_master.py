@@ -2,10 +2,10 @@
 
 """Program:  convert_to_master.py
 
-    Description:  Unit testing of convert_to_master in mysql_rep_failover.py.
+    Description:  Unit testing of convert_to_master in repoint_libs.py.
 
     Usage:
-        test/unit/mysql_rep_failover/convert_to_master.py
+        test/unit/repoint_libs/convert_to_master.py
 
     Arguments:
 
@@ -21,7 +21,7 @@ import mock
 
 # Local
 sys.path.append(os.getcwd())
-import mysql_rep_failover                       # pylint:disable=E0401,C0413
+import repoint_libs                             # pylint:disable=E0401,C0413
 import version                                  # pylint:disable=E0401,C0413
 
 __version__ = version.__version__
@@ -65,6 +65,31 @@ class ArgParser():                                      # pylint:disable=R0903
         return self.args_array.get(skey, def_val)
 
 
+class GTIDSet():                                        # pylint:disable=R0903
+
+    """Class:  GTIDSet
+
+    Description:  Class stub holder for mysql_class.GTIDSet class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, gtids):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) gtids
+
+        """
+
+        self.gtids = gtids
+
+
 class MasterRep():                                      # pylint:disable=R0903
 
     """Class:  MasterRep
@@ -111,6 +136,11 @@ class MasterRep():                                      # pylint:disable=R0903
         self.extra_def_file = kwargs.get("extra_def_file", None)
         self.rep_user = kwargs.get("rep_user", None)
         self.rep_japd = kwargs.get("rep_japd", None)
+        self.conn = None
+        self.conn_msg = None
+        self.gtid_mode = None
+        self.exe_gtid = None
+        self.connected = False
 
     def connect(self):
 
@@ -122,6 +152,8 @@ class MasterRep():                                      # pylint:disable=R0903
 
         """
 
+        self.connected = True
+
         return True
 
 
@@ -166,6 +198,10 @@ class SlaveRep():                                       # pylint:disable=R0903
         self.port = kwargs.get("port", 3306)
         self.defaults_file = kwargs.get("defaults_file", None)
         self.extra_def_file = kwargs.get("extra_def_file", None)
+        self.conn = "Connection"
+        self.conn_msg = None
+        self.gtid_mode = True
+        self.exe_gtidset = "3e11fa47-71ca-11e1-9e33-c80aa9429562:1-20"
 
 
 class UnitTest(unittest.TestCase):
@@ -176,6 +212,9 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_inventory
+        test_shared_state
+        test_no_connect
         test_default
 
     """
@@ -217,12 +256,81 @@ class UnitTest(unittest.TestCase):
         self.slv_array = {"name": name, "port": port, "rep_user": rep_user,
                           "rep_japd": rep_japd}
 
-    @mock.patch("mysql_rep_failover.gen_libs.transpose_dict")
-    @mock.patch("mysql_rep_failover.mysql_class.MasterRep")
-    @mock.patch("mysql_rep_failover.gen_libs.create_cfg_array")
+    @mock.patch("repoint_libs.mysql_class.MasterRep")
+    @mock.patch("repoint_libs.discover_libs.gen_libs.create_cfg_array")
+    def test_inventory(self, mock_array, mock_master):
+
+        """Function:  test_inventory
+
+        Description:  Test with the replication user from the inventory.
+
+        Arguments:
+
+        """
+
+        mock_master.return_value = self.master
+        inventory = {"keys": {(self.slave.name, 3306): self.slv_array}}
+
+        repoint_libs.convert_to_master(
+            self.slave, self.args, inventory=inventory)
+
+        self.assertFalse(mock_array.called)
+        self.assertEqual(
+            mock_master.call_args[1]["rep_user"], "Replication user name")
+
+    @mock.patch("repoint_libs.mysql_class.GTIDSet", GTIDSet)
+    @mock.patch("repoint_libs.discover_libs.gen_libs.transpose_dict")
+    @mock.patch("repoint_libs.mysql_class.MasterRep")
+    @mock.patch("repoint_libs.discover_libs.gen_libs.create_cfg_array")
+    def test_shared_state(self, mock_array, mock_master, mock_trans):
+
+        """Function:  test_shared_state
+
+        Description:  Test with the slave connection and GTID state shared.
+
+        Arguments:
+
+        """
+
+        mock_array.return_value = [self.slv_array]
+        mock_master.return_value = self.master
+        mock_trans.return_value = [self.slv_array]
+
+        master = repoint_libs.convert_to_master(self.slave, self.args)
+
+        self.assertEqual(
+            (master.conn, master.conn_msg, master.gtid_mode),
+            (self.slave.conn, self.slave.conn_msg, self.slave.gtid_mode))
+        self.assertIsInstance(master.exe_gtid, GTIDSet)
+        self.assertEqual(master.exe_gtid.gtids, self.slave.exe_gtidset)
+
+    @mock.patch("repoint_libs.discover_libs.gen_libs.transpose_dict")
+    @mock.patch("repoint_libs.mysql_class.MasterRep")
+    @mock.patch("repoint_libs.discover_libs.gen_libs.create_cfg_array")
+    def test_no_connect(self, mock_array, mock_master, mock_trans):
+
+        """Function:  test_no_connect
+
+        Description:  Test with no new connection made.
+
+        Arguments:
+
+        """
+
+        mock_array.return_value = [self.slv_array]
+        mock_master.return_value = self.master
+        mock_trans.return_value = [self.slv_array]
+
+        master = repoint_libs.convert_to_master(self.slave, self.args)
+
+        self.assertFalse(master.connected)
+
+    @mock.patch("repoint_libs.discover_libs.gen_libs.transpose_dict")
+    @mock.patch("repoint_libs.mysql_class.MasterRep")
+    @mock.patch("repoint_libs.discover_libs.gen_libs.create_cfg_array")
     def test_default(self, mock_array, mock_master, mock_trans):
 
-        """Function:  test_promote_best_slave
+        """Function:  test_default
 
         Description:  Test with default arguments only.
 
@@ -234,7 +342,7 @@ class UnitTest(unittest.TestCase):
         mock_master.return_value = self.master
         mock_trans.return_value = [self.slv_array]
 
-        master = mysql_rep_failover.convert_to_master(self.slave, self.args)
+        master = repoint_libs.convert_to_master(self.slave, self.args)
 
         self.assertIsInstance(master, MasterRep)
 
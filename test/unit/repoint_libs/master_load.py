@@ -0,0 +1,159 @@
+# Classification (U)
+
+"""Program:  master_load.py
+
+    Description:  Unit testing of master_load in repoint_libs.py.
+
+    Usage:
+        test/unit/repoint_libs/master_load.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import time
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import repoint_libs                             # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class MasterRep():                                      # pylint:disable=R0903
+
+    """Class:  MasterRep
+
+    Description:  Class stub holder for mysql_class.MasterRep class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self, name):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) name
+
+        """
+
+        self.name = name
+        self.rows = []
+        self.cmd = None
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Stub holder for mysql_class.Server.col_sql method.
+
+        Arguments:
+            (input) cmd
+
+        """
+
+        self.cmd = cmd
+
+        if isinstance(self.rows, Exception):
+            raise self.rows
+
+        return [self.rows.pop(0) if len(self.rows) > 1 else self.rows[0]]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_send_rate
+        test_null_values
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = MasterRep("master")
+        self.master.rows = [{"threads_running": "5", "dump_threads": 2,
+                             "bytes_sent": "2000"}]
+
+    def test_send_rate(self):
+
+        """Function:  test_send_rate
+
+        Description:  Test the send rate from the previous load.
+
+        Arguments:
+
+        """
+
+        previous = {"bytes_sent": 1000, "time": time.monotonic() - 2}
+
+        load = repoint_libs.master_load(self.master, previous)
+
+        self.assertGreater(load["send_rate"], 400)
+        self.assertLess(load["send_rate"], 500.1)
+
+    def test_null_values(self):
+
+        """Function:  test_null_values
+
+        Description:  Test with null values from the server.
+
+        Arguments:
+
+        """
+
+        self.master.rows = [{"threads_running": None, "dump_threads": 0,
+                             "bytes_sent": None}]
+
+        load = repoint_libs.master_load(self.master)
+
+        self.assertEqual(load["threads_running"], 0)
+        self.assertEqual(load["bytes_sent"], 0)
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        load = repoint_libs.master_load(self.master)
+
+        self.assertEqual(load["threads_running"], 5)
+        self.assertEqual(load["dump_threads"], 2)
+        self.assertEqual(load["bytes_sent"], 2000)
+        self.assertEqual(load["send_rate"], 0.0)
+        self.assertIn("Binlog Dump", self.master.cmd)
+
+
+if __name__ == "__main__":
+    unittest.main()
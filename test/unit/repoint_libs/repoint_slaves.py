@@ -0,0 +1,327 @@
+# Classification (U)
+
+"""Program:  repoint_slaves.py
+
+    Description:  Unit testing of repoint_slaves in repoint_libs.py.
+
+    Usage:
+        test/unit/repoint_libs/repoint_slaves.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import io
+import time
+import threading
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import repoint_libs                             # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, name):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) name
+
+        """
+
+        self.name = name
+
+
+class MasterRep():                                      # pylint:disable=R0903
+
+    """Class:  MasterRep
+
+    Description:  Class stub holder for mysql_class.MasterRep class.
+
+    Methods:
+        __init__
+        upd_mst_status
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "master"
+        self.in_flight = 0
+        self.most = 0
+        self.lock = threading.Lock()
+
+    def upd_mst_status(self):
+
+        """Method:  upd_mst_status
+
+        Description:  Stub holder for mysql_class.MasterRep.upd_mst_status
+            method.  Records the most calls running at the same time.
+
+        Arguments:
+
+        """
+
+        with self.lock:
+            self.in_flight += 1
+            self.most = max(self.most, self.in_flight)
+
+        time.sleep(0.05)
+
+        with self.lock:
+            self.in_flight -= 1
+
+
+def master_query(master, slave):                        # pylint:disable=W0613
+
+    """Function:  master_query
+
+    Description:  Stub holder for mysql_libs.switch_to_master function which
+        queries the master.
+
+    Arguments:
+        (input) master
+        (input) slave
+
+    """
+
+    master.upd_mst_status()
+    time.sleep(0.2)
+
+    return 0
+
+
+def switch_to_master(master, slave):                    # pylint:disable=W0613
+
+    """Function:  switch_to_master
+
+    Description:  Stub holder for mysql_libs.switch_to_master function.
+
+    Arguments:
+        (input) master
+        (input) slave
+
+    """
+
+    time.sleep(0.2)
+
+    if slave.name == "slave2":
+        raise ValueError("Lost connection")
+
+    return -1 if slave.name == "slave4" else 0
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_master_locked
+        test_waves
+        test_wave_not_settled
+        test_concurrent
+        test_failed_slaves
+        test_no_slaves
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = "Master"
+        self.load = {"threads_running": 4, "dump_threads": 1,
+                     "send_rate": 0.0}
+        self.slaves = [SlaveRep("slave1"), SlaveRep("slave3")]
+        self.slaves2 = [SlaveRep("slave1"), SlaveRep("slave2"),
+                        SlaveRep("slave3"), SlaveRep("slave4")]
+
+    @mock.patch("repoint_libs.mysql_libs.switch_to_master",
+                mock.Mock(side_effect=switch_to_master))
+    @mock.patch("repoint_libs.wait_for_load")
+    def test_waves(self, mock_wait):
+
+        """Function:  test_waves
+
+        Description:  Test the slaves are changed in waves with a wait for
+            the new master load before each wave after the first.
+
+        Arguments:
+
+        """
+
+        mock_wait.return_value = (True, self.load)
+        report = {"phases": {}, "slaves": {}}
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                repoint_libs.repoint_slaves(
+                    self.master, self.slaves2, wave_size=2, max_workers=4,
+                    jitter=0.01, timeout=5, report=report),
+                ["slave2", "slave4"])
+
+        mock_wait.assert_called_once_with(self.master, 1, timeout=5)
+        self.assertIn("wave_wait", report["phases"])
+        self.assertEqual(len(report["slaves"]), 4)
+
+    @mock.patch("repoint_libs.mysql_libs.switch_to_master",
+                mock.Mock(side_effect=switch_to_master))
+    @mock.patch("repoint_libs.wait_for_load")
+    def test_wave_not_settled(self, mock_wait):
+
+        """Function:  test_wave_not_settled
+
+        Description:  Test with the new master load not settling before
+            a wave.
+
+        Arguments:
+
+        """
+
+        mock_wait.return_value = (False, self.load)
+
+        with mock.patch("sys.stdout", new_callable=io.StringIO) as mock_out:
+            self.assertEqual(
+                repoint_libs.repoint_slaves(
+                    SlaveRep("master"), self.slaves, wave_size=1), [])
+
+        self.assertIn("Warning:  New master master load did not settle",
+                      mock_out.getvalue())
+
+    @mock.patch("repoint_libs.mysql_libs.switch_to_master",
+                mock.Mock(side_effect=master_query))
+    def test_master_locked(self):
+
+        """Function:  test_master_locked
+
+        Description:  Test the queries on the new master are run one at a
+            time while the slaves are changed concurrently.
+
+        Arguments:
+
+        """
+
+        master = MasterRep()
+        start = time.monotonic()
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                repoint_libs.repoint_slaves(
+                    master, self.slaves2, max_workers=4), [])
+
+        self.assertEqual(master.most, 1)
+        self.assertLess(time.monotonic() - start, 0.6)
+
+    @mock.patch("repoint_libs.mysql_libs.switch_to_master",
+                mock.Mock(side_effect=switch_to_master))
+    def test_concurrent(self):
+
+        """Function:  test_concurrent
+
+        Description:  Test the slaves are changed concurrently.
+
+        Arguments:
+
+        """
+
+        start = time.monotonic()
+
+        with gen_libs.no_std_out():
+            repoint_libs.repoint_slaves(
+                self.master, self.slaves2, max_workers=4)
+
+        self.assertLess(time.monotonic() - start, 0.6)
+
+    @mock.patch("repoint_libs.mysql_libs.switch_to_master",
+                mock.Mock(side_effect=switch_to_master))
+    def test_failed_slaves(self):
+
+        """Function:  test_failed_slaves
+
+        Description:  Test with slaves that fail or raise an exception.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                repoint_libs.repoint_slaves(
+                    self.master, self.slaves2, max_workers=2),
+                ["slave2", "slave4"])
+
+    def test_no_slaves(self):
+
+        """Function:  test_no_slaves
+
+        Description:  Test with no slaves to change.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            repoint_libs.repoint_slaves(self.master, []), [])
+
+    @mock.patch("repoint_libs.mysql_libs.switch_to_master",
+                mock.Mock(side_effect=switch_to_master))
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                repoint_libs.repoint_slaves(self.master, self.slaves),
+                [])
+
+
+if __name__ == "__main__":
+    unittest.main()
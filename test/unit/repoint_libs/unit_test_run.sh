@@ -0,0 +1,13 @@
+#!/bin/bash
+# Unit testing program for the library module.
+# This will run all the units tests for this library.
+# Will need to run this from the base directory where the module file
+#   is located at.
+
+echo ""
+echo "Unit testing..."
+/usr/bin/python test/unit/repoint_libs/change_slaves.py
+/usr/bin/python test/unit/repoint_libs/convert_to_master.py
+/usr/bin/python test/unit/repoint_libs/master_load.py
+/usr/bin/python test/unit/repoint_libs/repoint_slaves.py
+/usr/bin/python test/unit/repoint_libs/wait_for_load.py
@@ -0,0 +1,198 @@
+# Classification (U)
+
+"""Program:  wait_for_load.py
+
+    Description:  Unit testing of wait_for_load in repoint_libs.py.
+
+    Usage:
+        test/unit/repoint_libs/wait_for_load.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import time
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import repoint_libs                             # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class MasterRep():                                      # pylint:disable=R0903
+
+    """Class:  MasterRep
+
+    Description:  Class stub holder for mysql_class.MasterRep class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self, name):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) name
+
+        """
+
+        self.name = name
+        self.rows = []
+        self.cmd = None
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Stub holder for mysql_class.Server.col_sql method.
+
+        Arguments:
+            (input) cmd
+
+        """
+
+        self.cmd = cmd
+
+        if isinstance(self.rows, Exception):
+            raise self.rows
+
+        return [self.rows.pop(0) if len(self.rows) > 1 else self.rows[0]]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_load_error
+        test_deadline
+        test_dump_threads
+        test_settles
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = MasterRep("master")
+        self.idle = {"threads_running": 3, "dump_threads": 2,
+                     "bytes_sent": 100}
+        self.busy = {"threads_running": 50, "dump_threads": 2,
+                     "bytes_sent": 100}
+
+    def test_load_error(self):
+
+        """Function:  test_load_error
+
+        Description:  Test with the load not able to be read.
+
+        Arguments:
+
+        """
+
+        self.master.rows = ValueError("Access denied")
+
+        with gen_libs.no_std_out():
+            is_settled, _ = repoint_libs.wait_for_load(self.master, 2)
+
+        self.assertTrue(is_settled)
+
+    def test_deadline(self):
+
+        """Function:  test_deadline
+
+        Description:  Test with the load over the limits until the deadline.
+
+        Arguments:
+
+        """
+
+        self.master.rows = [self.busy]
+        start = time.monotonic()
+
+        is_settled, load = repoint_libs.wait_for_load(
+            self.master, 2, timeout=0.5)
+
+        self.assertFalse(is_settled)
+        self.assertEqual(load["threads_running"], 50)
+        self.assertLess(time.monotonic() - start, 1.0)
+
+    def test_dump_threads(self):
+
+        """Function:  test_dump_threads
+
+        Description:  Test waiting for the dump threads of the slaves.
+
+        Arguments:
+
+        """
+
+        self.master.rows = [self.idle, self.idle, self.idle]
+
+        is_settled, _ = repoint_libs.wait_for_load(
+            self.master, 3, timeout=0.5)
+
+        self.assertFalse(is_settled)
+
+    def test_settles(self):
+
+        """Function:  test_settles
+
+        Description:  Test with the load settling after the first poll.
+
+        Arguments:
+
+        """
+
+        self.master.rows = [self.busy, self.busy, self.idle]
+
+        is_settled, load = repoint_libs.wait_for_load(
+            self.master, 2, timeout=5)
+
+        self.assertTrue(is_settled)
+        self.assertEqual(load["threads_running"], 3)
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        self.master.rows = [self.idle]
+
+        self.assertTrue(
+            repoint_libs.wait_for_load(self.master, 2)[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
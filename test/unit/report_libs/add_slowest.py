@@ -0,0 +1,90 @@
+# Classification (U)
+
+"""Program:  add_slowest.py
+
+    Description:  Unit testing of add_slowest in report_libs.py.
+
+    Usage:
+        test/unit/report_libs/add_slowest.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import report_libs                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_slaves
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.report = {
+            "slaves": {"slave1": {"discovery": 0.4, "repoint": 0.3},
+                       "slave2": {"discovery": 1.2, "repoint": 0.1}}}
+
+    def test_no_slaves(self):
+
+        """Function:  test_no_slaves
+
+        Description:  Test with a report with no slaves.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            report_libs.add_slowest({"status": "Lock in place"}),
+            {"status": "Lock in place", "slowest": {}})
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        report = report_libs.add_slowest(self.report)
+
+        self.assertEqual(
+            report["slowest"],
+            {"discovery": {"name": "slave2", "seconds": 1.2},
+             "repoint": {"name": "slave1", "seconds": 0.3}})
+        self.assertNotIn("slowest", self.report)
+
+
+if __name__ == "__main__":
+    unittest.main()
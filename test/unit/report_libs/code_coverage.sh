@@ -0,0 +1,23 @@
+#!/bin/bash
+# Unit test code coverage for library module.
+# This will run the Python code coverage module against all unit test modules.
+# This will show the amount of code that was tested and which lines of code
+#   that was skipped during the test.
+
+coverage erase
+
+echo ""
+echo "Running unit test modules in conjunction with coverage"
+coverage run -a --source=report_libs test/unit/report_libs/add_slowest.py
+coverage run -a --source=report_libs test/unit/report_libs/emit_record.py
+coverage run -a --source=report_libs test/unit/report_libs/percentile.py
+coverage run -a --source=report_libs test/unit/report_libs/plan_value.py
+coverage run -a --source=report_libs test/unit/report_libs/ranking_record.py
+coverage run -a --source=report_libs test/unit/report_libs/slave_time.py
+coverage run -a --source=report_libs test/unit/report_libs/time_phase.py
+coverage run -a --source=report_libs test/unit/report_libs/write_report.py
+
+echo ""
+echo "Producing code coverage report"
+coverage combine
+coverage report -m
@@ -0,0 +1,76 @@
+# Classification (U)
+
+"""Program:  emit_record.py
+
+    Description:  Unit testing of emit_record in report_libs.py.
+
+    Usage:
+        test/unit/report_libs/emit_record.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import io
+import json
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import report_libs                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.record = {"type": "slave", "name": "slave1", "status": "ok"}
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        with mock.patch("sys.stdout", new_callable=io.StringIO) as mock_out:
+            report_libs.emit_record(self.record)
+            report_libs.emit_record(self.record)
+
+        self.assertEqual(
+            [json.loads(line) for line in mock_out.getvalue().splitlines()],
+            [self.record, self.record])
+
+
+if __name__ == "__main__":
+    unittest.main()
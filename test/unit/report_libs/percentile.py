@@ -0,0 +1,119 @@
+# Classification (U)
+
+"""Program:  percentile.py
+
+    Description:  Unit testing of percentile in report_libs.py.
+
+    Usage:
+        test/unit/report_libs/percentile.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import report_libs                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_ten_values
+        test_two_values
+        test_no_values
+        test_p99
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.values = list(range(100, 0, -1))
+
+    def test_ten_values(self):
+
+        """Function:  test_ten_values
+
+        Description:  Test the p50 of ten values.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(report_libs.percentile(range(1, 11), 50), 5)
+
+    def test_two_values(self):
+
+        """Function:  test_two_values
+
+        Description:  Test the p50 of two values.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(report_libs.percentile([2, 1], 50), 1)
+
+    def test_no_values(self):
+
+        """Function:  test_no_values
+
+        Description:  Test with no values.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(report_libs.percentile([], 50))
+
+    def test_p99(self):
+
+        """Function:  test_p99
+
+        Description:  Test the 99th percentile.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(report_libs.percentile(self.values, 99), 99)
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(report_libs.percentile(self.values, 50), 50)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+# Classification (U)
+
+"""Program:  plan_value.py
+
+    Description:  Unit testing of plan_value in report_libs.py.
+
+    Usage:
+        test/unit/report_libs/plan_value.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import report_libs                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_unknown
+        test_float
+        test_default
+
+    """
+
+    def test_unknown(self):
+
+        """Function:  test_unknown
+
+        Description:  Test with a value that is not known.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(report_libs.plan_value(None, "s"), "unknown")
+
+    def test_float(self):
+
+        """Function:  test_float
+
+        Description:  Test with a float value.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(report_libs.plan_value(1.5, "s"), "1.500s")
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(report_libs.plan_value(4000), "4000")
+
+
+if __name__ == "__main__":
+    unittest.main()
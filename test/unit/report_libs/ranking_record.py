@@ -0,0 +1,140 @@
+# Classification (U)
+
+"""Program:  ranking_record.py
+
+    Description:  Unit testing of ranking_record in report_libs.py.
+
+    Usage:
+        test/unit/report_libs/ranking_record.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import gtid_class                               # pylint:disable=E0401,C0413
+import report_libs                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, name, exe_gtidset="", conn_msg=None):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) name
+            (input) exe_gtidset
+            (input) conn_msg
+
+        """
+
+        self.name = name
+        self.exe_gtidset = exe_gtidset
+        self.conn_msg = conn_msg
+        self.gtid_mode = True
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_divergent
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.uuid = "3e11fa47-71ca-11e1-9e33-c80aa9429562"
+        self.uuid2 = "4e11fa47-71ca-11e1-9e33-c80aa9429562"
+        self.slave1 = SlaveRep("slave1")
+        self.slave2 = SlaveRep("slave2")
+        self.slave3 = SlaveRep("slave3")
+        self.gtids = gtid_class.GtidSet(
+            f"{self.uuid}:1-20")
+        self.gtids2 = gtid_class.GtidSet(
+            f"{self.uuid}:1-10")
+        self.gtids3 = gtid_class.GtidSet(
+            f"{self.uuid}:1-15,{self.uuid2}:1-3")
+        self.selection = {
+            "best": self.slave1, "ties": [], "divergent": [],
+            "frontier": [(self.gtids, self.slave1)],
+            "slave_list": [(self.gtids, self.slave1),
+                           (self.gtids2, self.slave2)]}
+        self.selection2 = {
+            "best": None, "ties": [], "divergent": ["slave1", "slave3"],
+            "frontier": [(self.gtids, self.slave1),
+                         (self.gtids3, self.slave3)],
+            "slave_list": [(self.gtids, self.slave1),
+                           (self.gtids3, self.slave3),
+                           (self.gtids2, self.slave2)]}
+
+    def test_divergent(self):
+
+        """Function:  test_divergent
+
+        Description:  Test with no single best slave.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            report_libs.ranking_record("-D", self.selection2),
+            {"type": "ranking", "command": "-D", "best": None, "ties": [],
+             "divergent": ["slave1", "slave3"], "slaves": []})
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            report_libs.ranking_record(
+                "-B", self.selection, slaves=["slave1", "slave2"]),
+            {"type": "ranking", "command": "-B", "best": "slave1", "ties": [],
+             "divergent": [], "slaves": ["slave1", "slave2"]})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+# Classification (U)
+
+"""Program:  slave_time.py
+
+    Description:  Unit testing of slave_time in report_libs.py.
+
+    Usage:
+        test/unit/report_libs/slave_time.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import report_libs                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_second_phase
+        test_no_report
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.report = {"phases": {}, "slaves": {}}
+
+    def test_second_phase(self):
+
+        """Function:  test_second_phase
+
+        Description:  Test with a second phase for a slave.
+
+        Arguments:
+
+        """
+
+        report_libs.slave_time(self.report, "slave1", "discovery", 0.5)
+        report_libs.slave_time(self.report, "slave1", "repoint", 0.2)
+
+        self.assertEqual(self.report["slaves"],
+                         {"slave1": {"discovery": 0.5, "repoint": 0.2}})
+
+    def test_no_report(self):
+
+        """Function:  test_no_report
+
+        Description:  Test with no timing report.
+
+        Arguments:
+
+        """
+
+        report_libs.slave_time(None, "slave1", "discovery", 0.5)
+
+        self.assertEqual(self.report["slaves"], {})
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        report_libs.slave_time(self.report, "slave1", "discovery", 0.5)
+
+        self.assertEqual(self.report["slaves"], {"slave1": {"discovery": 0.5}})
+
+
+if __name__ == "__main__":
+    unittest.main()
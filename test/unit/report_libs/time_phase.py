@@ -0,0 +1,123 @@
+# Classification (U)
+
+"""Program:  time_phase.py
+
+    Description:  Unit testing of time_phase in report_libs.py.
+
+    Usage:
+        test/unit/report_libs/time_phase.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import time
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import report_libs                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_exception
+        test_repeated
+        test_no_report
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.report = {"phases": {}, "slaves": {}}
+
+    def test_exception(self):
+
+        """Function:  test_exception
+
+        Description:  Test the time is added when the block raises.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(ValueError):
+            with report_libs.time_phase(self.report, "ranking"):
+                raise ValueError("Error")
+
+        self.assertIn("ranking", self.report["phases"])
+
+    def test_repeated(self):
+
+        """Function:  test_repeated
+
+        Description:  Test a phase that is run more than once.
+
+        Arguments:
+
+        """
+
+        with report_libs.time_phase(self.report, "repoint"):
+            time.sleep(0.02)
+
+        with report_libs.time_phase(self.report, "repoint"):
+            time.sleep(0.02)
+
+        self.assertGreaterEqual(self.report["phases"]["repoint"], 0.04)
+
+    def test_no_report(self):
+
+        """Function:  test_no_report
+
+        Description:  Test with no timing report.
+
+        Arguments:
+
+        """
+
+        with report_libs.time_phase(None, "ranking"):
+            pass
+
+        self.assertEqual(self.report["phases"], {})
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        with report_libs.time_phase(self.report, "discovery"):
+            time.sleep(0.02)
+
+        self.assertGreaterEqual(self.report["phases"]["discovery"], 0.02)
+
+
+if __name__ == "__main__":
+    unittest.main()
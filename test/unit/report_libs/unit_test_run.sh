@@ -0,0 +1,16 @@
+#!/bin/bash
+# Unit testing program for the library module.
+# This will run all the units tests for this library.
+# Will need to run this from the base directory where the module file
+#   is located at.
+
+echo ""
+echo "Unit testing..."
+/usr/bin/python test/unit/report_libs/add_slowest.py
+/usr/bin/python test/unit/report_libs/emit_record.py
+/usr/bin/python test/unit/report_libs/percentile.py
+/usr/bin/python test/unit/report_libs/plan_value.py
+/usr/bin/python test/unit/report_libs/ranking_record.py
+/usr/bin/python test/unit/report_libs/slave_time.py
+/usr/bin/python test/unit/report_libs/time_phase.py
+/usr/bin/python test/unit/report_libs/write_report.py
@@ -0,0 +1,155 @@
+# Classification (U)
+
+"""Program:  write_report.py
+
+    Description:  Unit testing of write_report in report_libs.py.
+
+    Usage:
+        test/unit/report_libs/write_report.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import json
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import report_libs                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_batch
+        test_file
+        test_slowest
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.out_file = "test/unit/report_libs/tmp/report.json"
+        self.report = {
+            "phases": {"discovery": 1.5},
+            "slaves": {"slave1": {"discovery": 0.4, "repoint": 0.3},
+                       "slave2": {"discovery": 1.2, "repoint": 0.1}}}
+        os.makedirs(os.path.dirname(self.out_file), exist_ok=True)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        if os.path.isfile(self.out_file):
+            os.remove(self.out_file)
+
+        os.rmdir(os.path.dirname(self.out_file))
+
+    def test_batch(self):
+
+        """Function:  test_batch
+
+        Description:  Test with a batch report of replication sets.
+
+        Arguments:
+
+        """
+
+        report_libs.write_report(
+            {"sets": [self.report, {"status": "Lock in place"}]},
+            self.out_file)
+
+        with open(self.out_file, encoding="UTF-8") as f_hdlr:
+            data = json.load(f_hdlr)
+
+        self.assertEqual(
+            data["sets"][0]["slowest"]["discovery"]["name"], "slave2")
+        self.assertEqual(data["sets"][1]["slowest"], {})
+
+    def test_file(self):
+
+        """Function:  test_file
+
+        Description:  Test with the report written to a file.
+
+        Arguments:
+
+        """
+
+        report_libs.write_report(self.report, self.out_file)
+
+        with open(self.out_file, encoding="UTF-8") as f_hdlr:
+            data = json.load(f_hdlr)
+
+        self.assertEqual(data["phases"], {"discovery": 1.5})
+
+    def test_slowest(self):
+
+        """Function:  test_slowest
+
+        Description:  Test the slowest slave of each phase.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            report_libs.write_report(self.report, self.out_file)
+
+        with open(self.out_file, encoding="UTF-8") as f_hdlr:
+            data = json.load(f_hdlr)
+
+        self.assertEqual(
+            data["slowest"],
+            {"discovery": {"name": "slave2", "seconds": 1.2},
+             "repoint": {"name": "slave1", "seconds": 0.3}})
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            report_libs.write_report(self.report)
+
+        self.assertNotIn("slowest", self.report)
+
+
+if __name__ == "__main__":
+    unittest.main()
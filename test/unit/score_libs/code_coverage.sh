@@ -0,0 +1,26 @@
+#!/bin/bash
+# Unit test code coverage for library module.
+# This will run the Python code coverage module against all unit test modules.
+# This will show the amount of code that was tested and which lines of code
+#   that was skipped during the test.
+
+coverage erase
+
+echo ""
+echo "Running unit test modules in conjunction with coverage"
+coverage run -a --source=score_libs test/unit/score_libs/criterion_value.py
+coverage run -a --source=score_libs test/unit/score_libs/errant_transactions.py
+coverage run -a --source=score_libs test/unit/score_libs/no_best_message.py
+coverage run -a --source=score_libs test/unit/score_libs/order_slaves_on_gtid.py
+coverage run -a --source=score_libs test/unit/score_libs/pick_candidate.py
+coverage run -a --source=score_libs test/unit/score_libs/score_fields.py
+coverage run -a --source=score_libs test/unit/score_libs/score_settings.py
+coverage run -a --source=score_libs test/unit/score_libs/score_slaves.py
+coverage run -a --source=score_libs test/unit/score_libs/select_candidates.py
+coverage run -a --source=score_libs test/unit/score_libs/slave_deltas.py
+coverage run -a --source=score_libs test/unit/score_libs/unresolved_ties.py
+
+echo ""
+echo "Producing code coverage report"
+coverage combine
+coverage report -m
@@ -0,0 +1,181 @@
+# Classification (U)
+
+"""Program:  criterion_value.py
+
+    Description:  Unit testing of criterion_value in score_libs.py.
+
+    Usage:
+        test/unit/score_libs/criterion_value.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import score_libs                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, name, exe_gtidset, lag=None):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) name
+            (input) exe_gtidset
+            (input) lag
+
+        """
+
+        self.name = name
+        self.port = 3306
+        self.exe_gtidset = exe_gtidset
+        self.lag = lag
+        self.threads_running = None
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_invalid
+        test_unknown
+        test_no_match
+        test_match
+        test_config
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.slave = SlaveRep(
+            "slave1", "3e11fa47-71ca-11e1-9e33-c80aa9429562:1-20", lag=0.5)
+        self.scoring = {"weights": {}, "prefer": {"datacenter": "east"}}
+
+    def test_invalid(self):
+
+        """Function:  test_invalid
+
+        Description:  Test with an invalid value.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(
+            score_libs.criterion_value(
+                self.slave, {"hw_class": "large"}, "hw_class", self.scoring))
+
+    def test_unknown(self):
+
+        """Function:  test_unknown
+
+        Description:  Test with an unknown value.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(
+            score_libs.criterion_value(
+                self.slave, {}, "load", self.scoring))
+
+    def test_no_match(self):
+
+        """Function:  test_no_match
+
+        Description:  Test with a match criterion that does not match.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            score_libs.criterion_value(
+                self.slave, {"datacenter": "west"}, "datacenter",
+                self.scoring),
+            0.0)
+
+    def test_match(self):
+
+        """Function:  test_match
+
+        Description:  Test with a match criterion.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            score_libs.criterion_value(
+                self.slave, {"datacenter": "east"}, "datacenter",
+                self.scoring),
+            1.0)
+
+    def test_config(self):
+
+        """Function:  test_config
+
+        Description:  Test with a slave config criterion.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            score_libs.criterion_value(
+                self.slave, {"hw_class": "2"}, "hw_class", self.scoring), 2.0)
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            score_libs.criterion_value(
+                self.slave, {}, "lag", self.scoring), 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
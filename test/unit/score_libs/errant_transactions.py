@@ -0,0 +1,174 @@
+# Classification (U)
+
+"""Program:  errant_transactions.py
+
+    Description:  Unit testing of errant_transactions in score_libs.py.
+
+    Usage:
+        test/unit/score_libs/errant_transactions.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import score_libs                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, name, exe_gtidset, retrieved_gtidset=""):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) name
+            (input) exe_gtidset
+            (input) retrieved_gtidset
+
+        """
+
+        self.name = name
+        self.exe_gtidset = exe_gtidset
+        self.retrieved_gtidset = retrieved_gtidset
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_slave_list
+        test_retrieved
+        test_divergent
+        test_no_errant
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.uuid = "3e11fa47-71ca-11e1-9e33-c80aa9429562"
+        self.uuid2 = "4a2c7d11-71ca-11e1-9e33-c80aa9429562"
+        self.slave1 = SlaveRep(
+            "slave1", f"{self.uuid}:1-20", f"{self.uuid}:18-30")
+        self.slave2 = SlaveRep("slave2", f"{self.uuid}:1-10")
+        self.slave3 = SlaveRep("slave3", f"{self.uuid}:1-25")
+        self.slave4 = SlaveRep("slave4", f"{self.uuid}:1-5,{self.uuid2}:1")
+        self.slaves = [self.slave2, self.slave1, self.slave3, self.slave4]
+
+    def test_slave_list(self):
+
+        """Function:  test_slave_list
+
+        Description:  Test with the slave list of order_slaves_on_gtid.
+
+        Arguments:
+
+        """
+
+        slave_list = score_libs.order_slaves_on_gtid(
+            self.slaves, retrieved=True)
+
+        self.assertEqual(
+            score_libs.errant_transactions(
+                self.slave2, [], slave_list=slave_list),
+            {"errant": {"slave1": 20, "slave3": 15, "slave4": 1},
+             "complete": []})
+
+    def test_retrieved(self):
+
+        """Function:  test_retrieved
+
+        Description:  Test with errant transactions in the relay log.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            score_libs.errant_transactions(
+                self.slave3, self.slaves)["errant"],
+            {"slave1": 5, "slave4": 1})
+
+    def test_divergent(self):
+
+        """Function:  test_divergent
+
+        Description:  Test with divergent slaves.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            score_libs.errant_transactions(self.slave1, self.slaves),
+            {"errant": {"slave4": 1}, "complete": []})
+
+    def test_no_errant(self):
+
+        """Function:  test_no_errant
+
+        Description:  Test with a new master with every transaction.
+
+        Arguments:
+
+        """
+
+        self.slave4.exe_gtidset = f"{self.uuid}:1-5"
+
+        self.assertEqual(
+            score_libs.errant_transactions(self.slave1, self.slaves),
+            {"errant": {}, "complete": ["slave1"]})
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            score_libs.errant_transactions(self.slave2, self.slaves),
+            {"errant": {"slave1": 20, "slave3": 15, "slave4": 1},
+             "complete": []})
+
+
+if __name__ == "__main__":
+    unittest.main()
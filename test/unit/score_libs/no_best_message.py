@@ -0,0 +1,89 @@
+# Classification (U)
+
+"""Program:  no_best_message.py
+
+    Description:  Unit testing of no_best_message in score_libs.py.
+
+    Usage:
+        test/unit/score_libs/no_best_message.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import score_libs                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_excluded
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.selection = {"best": None, "divergent": ["slave1", "slave2"],
+                          "excluded": []}
+
+    def test_excluded(self):
+
+        """Function:  test_excluded
+
+        Description:  Test with the slaves with every transaction excluded.
+
+        Arguments:
+
+        """
+
+        self.selection["divergent"] = []
+        self.selection["excluded"] = ["slave1"]
+
+        self.assertEqual(
+            score_libs.no_best_message(self.selection),
+            "No best slave, slaves with every transaction are excluded from"
+            " promotion: ['slave1']")
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            score_libs.no_best_message(self.selection),
+            "No single best slave, divergent slaves: ['slave1', 'slave2']")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,7 +6,7 @@
         mysql_rep_failover.py.
 
     Usage:
-        test/unit/mysql_rep_failover/order_slaves_on_gtid.py
+        test/unit/score_libs/order_slaves_on_gtid.py
 
     Arguments:
 
@@ -21,7 +21,7 @@ import unittest
 
 # Local
 sys.path.append(os.getcwd())
-import mysql_rep_failover                       # pylint:disable=E0401,C0413
+import score_libs                               # pylint:disable=E0401,C0413
 import version                                  # pylint:disable=E0401,C0413
 
 __version__ = version.__version__
@@ -98,6 +98,9 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_retrieved
+        test_multiple_uuids
+        test_tie
         test_no_slave
         test_one_slave
         test_default
@@ -114,9 +117,11 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        self.slave1 = SlaveRep("slave1", "20", True)
-        self.slave2 = SlaveRep("slave2", "10", True)
-        self.slave3 = SlaveRep("slave3", "15", True)
+        self.uuid = "3e11fa47-71ca-11e1-9e33-c80aa9429562"
+        self.uuid2 = "4a2c7d11-71ca-11e1-9e33-c80aa9429562"
+        self.slave1 = SlaveRep("slave1", f"{self.uuid}:1-20", True)
+        self.slave2 = SlaveRep("slave2", f"{self.uuid}:1-10", True)
+        self.slave3 = SlaveRep("slave3", f"{self.uuid}:1-15", True)
         self.slavearray = []
         self.slavearray2 = []
         self.slavearray.append(self.slave1)
@@ -128,10 +133,67 @@ class UnitTest(unittest.TestCase):
         slv0 = self.slavearray[0]
         slv1 = self.slavearray[1]
         slv2 = self.slavearray[2]
-        self.slaveorder.append((slv1.exe_gtidset, slv1))
-        self.slaveorder.append((slv2.exe_gtidset, slv2))
-        self.slaveorder.append((slv0.exe_gtidset, slv0))
-        self.slaveorder2.append((slv0.exe_gtidset, slv0))
+        self.slaveorder.append(
+            (score_libs.gtid_class.GtidSet(slv0.exe_gtidset), slv0))
+        self.slaveorder.append(
+            (score_libs.gtid_class.GtidSet(slv2.exe_gtidset), slv2))
+        self.slaveorder.append(
+            (score_libs.gtid_class.GtidSet(slv1.exe_gtidset), slv1))
+        self.slaveorder2.append(
+            (score_libs.gtid_class.GtidSet(slv0.exe_gtidset), slv0))
+
+    def test_retrieved(self):
+
+        """Function:  test_retrieved
+
+        Description:  Test with the retrieved GTID set included.
+
+        Arguments:
+
+        """
+
+        self.slave2.retrieved_gtidset = f"{self.uuid}:5-30"
+        slave_list = score_libs.order_slaves_on_gtid(
+            self.slavearray, retrieved=True)
+
+        self.assertEqual([slv.name for _, slv in slave_list],
+                         ["slave2", "slave1", "slave3"])
+        self.assertEqual(str(slave_list[0][0]), f"{self.uuid}:1-30")
+
+    def test_multiple_uuids(self):
+
+        """Function:  test_multiple_uuids
+
+        Description:  Test with GTID sets from more than one source.
+
+        Arguments:
+
+        """
+
+        slave4 = SlaveRep(
+            "slave4", f"{self.uuid}:1-10,{self.uuid2}:1-12", True)
+        slave_list = score_libs.order_slaves_on_gtid(
+            [self.slave2, slave4, self.slave3])
+
+        self.assertEqual([slv.name for _, slv in slave_list],
+                         ["slave4", "slave3", "slave2"])
+
+    def test_tie(self):
+
+        """Function:  test_tie
+
+        Description:  Test slaves with equal positions keep their order.
+
+        Arguments:
+
+        """
+
+        slave4 = SlaveRep("slave4", f"{self.uuid}:1-20", True)
+        slave_list = score_libs.order_slaves_on_gtid(
+            [slave4, self.slave2, self.slave1])
+
+        self.assertEqual([slv.name for _, slv in slave_list],
+                         ["slave4", "slave1", "slave2"])
 
     def test_no_slave(self):
 
@@ -143,7 +205,7 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        self.assertEqual(mysql_rep_failover.order_slaves_on_gtid([]), [])
+        self.assertEqual(score_libs.order_slaves_on_gtid([]), [])
 
     def test_one_slave(self):
 
@@ -155,7 +217,7 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        self.assertEqual(mysql_rep_failover.order_slaves_on_gtid(
+        self.assertEqual(score_libs.order_slaves_on_gtid(
             self.slavearray2), self.slaveorder2)
 
     def test_default(self):
@@ -168,7 +230,7 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        self.assertEqual(mysql_rep_failover.order_slaves_on_gtid(
+        self.assertEqual(score_libs.order_slaves_on_gtid(
             self.slavearray), self.slaveorder)
 
 
@@ -0,0 +1,189 @@
+# Classification (U)
+
+"""Program:  pick_candidate.py
+
+    Description:  Unit testing of pick_candidate in score_libs.py.
+
+    Usage:
+        test/unit/score_libs/pick_candidate.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import score_libs                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, name, exe_gtidset, lag=None):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) name
+            (input) exe_gtidset
+            (input) lag
+
+        """
+
+        self.name = name
+        self.port = 3306
+        self.exe_gtidset = exe_gtidset
+        self.lag = lag
+        self.threads_running = None
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_in_inventory
+        test_all_excluded
+        test_excluded
+        test_weights
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        uuid = "3e11fa47-71ca-11e1-9e33-c80aa9429562"
+        self.slave1 = SlaveRep("slave1", f"{uuid}:1-20", lag=5.0)
+        self.slave2 = SlaveRep("slave2", f"{uuid}:1-20", lag=1.0)
+        self.slave3 = SlaveRep("slave3", f"{uuid}:1-10", lag=0.0)
+        self.selection = score_libs.select_candidates(
+            [self.slave1, self.slave2, self.slave3])
+        self.inventory = {
+            "keys": {("slave1", 3306): {}, ("slave2", 3306): {},
+                     ("slave3", 3306): {}},
+            "scoring": {"weights": {}, "prefer": {}}}
+
+    def test_not_in_inventory(self):
+
+        """Function:  test_not_in_inventory
+
+        Description:  Test with slaves not in the slave inventory.
+
+        Arguments:
+
+        """
+
+        self.inventory["keys"] = {}
+
+        score_libs.pick_candidate(self.selection, self.inventory)
+
+        self.assertIs(self.selection["best"], self.slave1)
+        self.assertEqual(self.selection["excluded"], [])
+
+    def test_all_excluded(self):
+
+        """Function:  test_all_excluded
+
+        Description:  Test with every slave with every transaction
+            excluded from promotion.
+
+        Arguments:
+
+        """
+
+        self.inventory["keys"][("slave1", 3306)]["promote"] = "False"
+        self.inventory["keys"][("slave2", 3306)]["promote"] = False
+
+        score_libs.pick_candidate(self.selection, self.inventory)
+
+        self.assertIsNone(self.selection["best"])
+        self.assertEqual(self.selection["ties"], [])
+        self.assertEqual(self.selection["excluded"], ["slave1", "slave2"])
+
+    def test_excluded(self):
+
+        """Function:  test_excluded
+
+        Description:  Test with the best slave excluded from promotion.
+
+        Arguments:
+
+        """
+
+        self.inventory["keys"][("slave1", 3306)]["promote"] = "False"
+
+        score_libs.pick_candidate(self.selection, self.inventory)
+
+        self.assertIs(self.selection["best"], self.slave2)
+        self.assertEqual(self.selection["ties"], ["slave1"])
+        self.assertEqual(self.selection["excluded"], ["slave1"])
+
+    def test_weights(self):
+
+        """Function:  test_weights
+
+        Description:  Test with the best slave picked on its score.
+
+        Arguments:
+
+        """
+
+        self.inventory["scoring"]["weights"] = {"lag": 1.0}
+
+        score_libs.pick_candidate(self.selection, self.inventory)
+
+        self.assertIs(self.selection["best"], self.slave2)
+        self.assertEqual(self.selection["ties"], ["slave1"])
+        self.assertEqual(
+            self.selection["scores"], {"slave1": 0.0, "slave2": 1.0})
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        score_libs.pick_candidate(self.selection, self.inventory)
+
+        self.assertIs(self.selection["best"], self.slave1)
+        self.assertEqual(self.selection["ties"], ["slave2"])
+        self.assertEqual(self.selection["scores"], {})
+
+
+if __name__ == "__main__":
+    unittest.main()
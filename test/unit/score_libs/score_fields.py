@@ -0,0 +1,85 @@
+# Classification (U)
+
+"""Program:  score_fields.py
+
+    Description:  Unit testing of score_fields in score_libs.py.
+
+    Usage:
+        test/unit/score_libs/score_fields.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import score_libs                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_config_only
+        test_no_scoring
+        test_default
+
+    """
+
+    def test_config_only(self):
+
+        """Function:  test_config_only
+
+        Description:  Test with slave config criteria only.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            score_libs.score_fields(
+                {"weights": {"hw_class": 1.0, "datacenter": 1.0}}), set())
+
+    def test_no_scoring(self):
+
+        """Function:  test_no_scoring
+
+        Description:  Test with no scoring settings.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(score_libs.score_fields(None), set())
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            score_libs.score_fields(
+                {"weights": {"lag": 1.0, "load": 1.0, "hw_class": 1.0}}),
+            {"lag", "threads_running"})
+
+
+if __name__ == "__main__":
+    unittest.main()
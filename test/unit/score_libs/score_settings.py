@@ -0,0 +1,150 @@
+# Classification (U)
+
+"""Program:  score_settings.py
+
+    Description:  Unit testing of score_settings in score_libs.py.
+
+    Usage:
+        test/unit/score_libs/score_settings.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import io
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import score_libs                               # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_quiet
+        test_invalid_weight
+        test_unknown_criterion
+        test_no_weights
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.entries = [
+            {"name": "slave1"},
+            {"name": "slave2", "score_weights": "lag:4, load:2,datacenter:1",
+             "prefer_datacenter": "east"},
+            {"name": "slave3", "score_weights": "hw_class:1",
+             "prefer_datacenter": "west"}]
+
+    def test_quiet(self):
+
+        """Function:  test_quiet
+
+        Description:  Test with the ignored criteria not printed.
+
+        Arguments:
+
+        """
+
+        self.entries[0]["score_weights"] = "speed:1"
+
+        with mock.patch("sys.stdout", new_callable=io.StringIO) as mock_out:
+            score_libs.score_settings(self.entries, quiet=True)
+
+        self.assertEqual(mock_out.getvalue(), "")
+
+    def test_invalid_weight(self):
+
+        """Function:  test_invalid_weight
+
+        Description:  Test with an invalid weight.
+
+        Arguments:
+
+        """
+
+        self.entries[0]["score_weights"] = "lag:high, hw_class:1"
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                score_libs.score_settings(self.entries)["weights"],
+                {"hw_class": 1.0})
+
+    def test_unknown_criterion(self):
+
+        """Function:  test_unknown_criterion
+
+        Description:  Test with an unknown criterion.
+
+        Arguments:
+
+        """
+
+        self.entries[0]["score_weights"] = "speed:1,lag:2"
+
+        with mock.patch("sys.stdout", new_callable=io.StringIO) as mock_out:
+            self.assertEqual(
+                score_libs.score_settings(self.entries)["weights"],
+                {"lag": 2.0})
+
+        self.assertIn(
+            "speed:1 ignored: unknown criterion", mock_out.getvalue())
+
+    def test_no_weights(self):
+
+        """Function:  test_no_weights
+
+        Description:  Test with no weights declared.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            score_libs.score_settings([{"name": "slave1"}]),
+            {"weights": {}, "prefer": {}})
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            score_libs.score_settings(self.entries),
+            {"weights": {"lag": 4.0, "load": 2.0, "datacenter": 1.0},
+             "prefer": {"datacenter": "east"}})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+# Classification (U)
+
+"""Program:  score_slaves.py
+
+    Description:  Unit testing of score_slaves in score_libs.py.
+
+    Usage:
+        test/unit/score_libs/score_slaves.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import score_libs                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, name, exe_gtidset, lag=None):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) name
+            (input) exe_gtidset
+            (input) lag
+
+        """
+
+        self.name = name
+        self.port = 3306
+        self.exe_gtidset = exe_gtidset
+        self.lag = lag
+        self.threads_running = None
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_same_value
+        test_unknown
+        test_no_slaves
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        uuid = "3e11fa47-71ca-11e1-9e33-c80aa9429562"
+        self.slave1 = SlaveRep("slave1", f"{uuid}:1-20", lag=2.0)
+        self.slave2 = SlaveRep("slave2", f"{uuid}:1-20", lag=1.5)
+        self.slave3 = SlaveRep("slave3", f"{uuid}:1-20", lag=0.0)
+        self.slaves = [self.slave1, self.slave2, self.slave3]
+        self.entries = [
+            {"hw_class": "3"}, {"hw_class": "1"}, {"hw_class": "3"}]
+        self.scoring = {"weights": {"lag": 2.0, "hw_class": 1.0}, "prefer": {}}
+
+    def test_same_value(self):
+
+        """Function:  test_same_value
+
+        Description:  Test with the slaves having the same value.
+
+        Arguments:
+
+        """
+
+        self.scoring["weights"] = {"hw_class": 2.0}
+        entries = [{"hw_class": "1"}, {"hw_class": "1"}, {"hw_class": "1"}]
+
+        self.assertEqual(
+            score_libs.score_slaves(
+                self.slaves, entries, self.scoring),
+            {"slave1": 2.0, "slave2": 2.0, "slave3": 2.0})
+
+    def test_unknown(self):
+
+        """Function:  test_unknown
+
+        Description:  Test with unknown values.
+
+        Arguments:
+
+        """
+
+        self.slave2.lag = None
+
+        self.assertEqual(
+            score_libs.score_slaves(
+                self.slaves, self.entries, self.scoring),
+            {"slave1": 1.0, "slave2": 0.0, "slave3": 3.0})
+
+    def test_no_slaves(self):
+
+        """Function:  test_no_slaves
+
+        Description:  Test with no slaves.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            score_libs.score_slaves([], [], self.scoring), {})
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            score_libs.score_slaves(
+                self.slaves, self.entries, self.scoring),
+            {"slave1": 1.0, "slave2": 0.5, "slave3": 3.0})
+
+
+if __name__ == "__main__":
+    unittest.main()
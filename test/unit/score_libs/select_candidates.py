@@ -0,0 +1,176 @@
+# Classification (U)
+
+"""Program:  select_candidates.py
+
+    Description:  Unit testing of select_candidates in score_libs.py.
+
+    Usage:
+        test/unit/score_libs/select_candidates.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import score_libs                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, name, exe_gtidset):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) name
+            (input) exe_gtidset
+
+        """
+
+        self.name = name
+        self.port = 3306
+        self.exe_gtidset = exe_gtidset
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_inventory
+        test_divergent
+        test_tie
+        test_no_slaves
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.uuid = "3e11fa47-71ca-11e1-9e33-c80aa9429562"
+        self.uuid2 = "4a2c7d11-71ca-11e1-9e33-c80aa9429562"
+        self.slave1 = SlaveRep("slave1", f"{self.uuid}:1-20")
+        self.slave2 = SlaveRep("slave2", f"{self.uuid}:1-10")
+        self.slave3 = SlaveRep("slave3", f"{self.uuid}:1-15")
+        self.slaves = [self.slave2, self.slave1, self.slave3]
+
+    def test_inventory(self):
+
+        """Function:  test_inventory
+
+        Description:  Test with the best slave picked with the slave inventory.
+
+        Arguments:
+
+        """
+
+        slave4 = SlaveRep("slave4", f"{self.uuid}:1-20")
+        inventory = {"keys": {("slave1", 3306): {"promote": "False"}}}
+        selection = score_libs.select_candidates(
+            [self.slave1, slave4, self.slave2], inventory=inventory)
+
+        self.assertIs(selection["best"], slave4)
+        self.assertEqual(selection["excluded"], ["slave1"])
+
+    def test_divergent(self):
+
+        """Function:  test_divergent
+
+        Description:  Test with slaves that diverge.
+
+        Arguments:
+
+        """
+
+        slave4 = SlaveRep("slave4", f"{self.uuid}:1-10,{self.uuid2}:1-2")
+        selection = score_libs.select_candidates(
+            [self.slave1, self.slave2, slave4])
+
+        self.assertIsNone(selection["best"])
+        self.assertEqual(selection["divergent"], ["slave1", "slave4"])
+
+    def test_tie(self):
+
+        """Function:  test_tie
+
+        Description:  Test with slaves tied with the best slave.
+
+        Arguments:
+
+        """
+
+        slave4 = SlaveRep("slave4", f"{self.uuid}:1-20")
+        selection = score_libs.select_candidates(
+            [self.slave2, slave4, self.slave1])
+
+        self.assertEqual(selection["best"], slave4)
+        self.assertEqual(selection["ties"], ["slave1"])
+
+    def test_no_slaves(self):
+
+        """Function:  test_no_slaves
+
+        Description:  Test with no slaves in list.
+
+        Arguments:
+
+        """
+
+        selection = score_libs.select_candidates([])
+
+        self.assertIsNone(selection["best"])
+        self.assertEqual(selection["divergent"], [])
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        selection = score_libs.select_candidates(self.slaves)
+
+        self.assertEqual(selection["best"], self.slave1)
+        self.assertEqual(selection["ties"], [])
+        self.assertEqual(selection["divergent"], [])
+        self.assertEqual(len(selection["slave_list"]), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
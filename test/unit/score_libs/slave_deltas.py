@@ -0,0 +1,163 @@
+# Classification (U)
+
+"""Program:  slave_deltas.py
+
+    Description:  Unit testing of slave_deltas in score_libs.py.
+
+    Usage:
+        test/unit/score_libs/slave_deltas.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import score_libs                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, name, exe_gtidset="", conn_msg=None):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) name
+            (input) exe_gtidset
+            (input) conn_msg
+
+        """
+
+        self.name = name
+        self.exe_gtidset = exe_gtidset
+        self.conn_msg = conn_msg
+        self.gtid_mode = True
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_divergent
+        test_no_slaves
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.uuid = "3e11fa47-71ca-11e1-9e33-c80aa9429562"
+        self.uuid2 = "4e11fa47-71ca-11e1-9e33-c80aa9429562"
+        self.slave1 = SlaveRep("slave1")
+        self.slave2 = SlaveRep("slave2")
+        self.slave3 = SlaveRep("slave3")
+        self.gtids = score_libs.gtid_class.GtidSet(
+            f"{self.uuid}:1-20")
+        self.gtids2 = score_libs.gtid_class.GtidSet(
+            f"{self.uuid}:1-10")
+        self.gtids3 = score_libs.gtid_class.GtidSet(
+            f"{self.uuid}:1-15,{self.uuid2}:1-3")
+        self.selection = {
+            "best": self.slave1, "ties": [], "divergent": [],
+            "frontier": [(self.gtids, self.slave1)],
+            "slave_list": [(self.gtids, self.slave1),
+                           (self.gtids2, self.slave2)]}
+        self.selection2 = {
+            "best": None, "ties": [], "divergent": ["slave1", "slave3"],
+            "frontier": [(self.gtids, self.slave1),
+                         (self.gtids3, self.slave3)],
+            "slave_list": [(self.gtids, self.slave1),
+                           (self.gtids3, self.slave3),
+                           (self.gtids2, self.slave2)]}
+
+    def test_divergent(self):
+
+        """Function:  test_divergent
+
+        Description:  Test comparing with the slave with the most
+            transactions when there is no single best slave.
+
+        Arguments:
+
+        """
+
+        deltas = score_libs.slave_deltas(self.selection2)
+
+        self.assertEqual([item["role"] for item in deltas],
+                         ["most", "candidate", "slave"])
+        self.assertEqual(deltas[1]["behind"], 5)
+        self.assertEqual(deltas[1]["not_on_best"], 3)
+        self.assertEqual(str(deltas[1]["missing"]), f"{self.uuid}:16-20")
+
+    def test_no_slaves(self):
+
+        """Function:  test_no_slaves
+
+        Description:  Test with no slaves.
+
+        Arguments:
+
+        """
+
+        self.selection["best"] = None
+        self.selection["frontier"] = []
+        self.selection["slave_list"] = []
+
+        self.assertEqual(score_libs.slave_deltas(self.selection), [])
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        deltas = score_libs.slave_deltas(self.selection)
+
+        self.assertEqual(deltas[0]["role"], "best")
+        self.assertEqual(deltas[0]["transactions"], 20)
+        self.assertEqual(deltas[0]["behind"], 0)
+        self.assertEqual(deltas[1]["role"], "slave")
+        self.assertEqual(deltas[1]["behind"], 10)
+        self.assertEqual(deltas[1]["not_on_best"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
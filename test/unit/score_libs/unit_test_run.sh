@@ -0,0 +1,19 @@
+#!/bin/bash
+# Unit testing program for the library module.
+# This will run all the units tests for this library.
+# Will need to run this from the base directory where the module file
+#   is located at.
+
+echo ""
+echo "Unit testing..."
+/usr/bin/python test/unit/score_libs/criterion_value.py
+/usr/bin/python test/unit/score_libs/errant_transactions.py
+/usr/bin/python test/unit/score_libs/no_best_message.py
+/usr/bin/python test/unit/score_libs/order_slaves_on_gtid.py
+/usr/bin/python test/unit/score_libs/pick_candidate.py
+/usr/bin/python test/unit/score_libs/score_fields.py
+/usr/bin/python test/unit/score_libs/score_settings.py
+/usr/bin/python test/unit/score_libs/score_slaves.py
+/usr/bin/python test/unit/score_libs/select_candidates.py
+/usr/bin/python test/unit/score_libs/slave_deltas.py
+/usr/bin/python test/unit/score_libs/unresolved_ties.py
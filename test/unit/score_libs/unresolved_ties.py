@@ -0,0 +1,163 @@
+# Classification (U)
+
+"""Program:  unresolved_ties.py
+
+    Description:  Unit testing of unresolved_ties in score_libs.py.
+
+    Usage:
+        test/unit/score_libs/unresolved_ties.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import score_libs                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, name):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) name -> Name of instance.
+
+        """
+
+        self.name = name
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_excluded
+        test_same_score
+        test_scored
+        test_no_best
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.selection = {"best": SlaveRep("slave1"),
+                          "ties": ["slave2", "slave3"], "excluded": [],
+                          "scores": {}}
+
+    def test_excluded(self):
+
+        """Function:  test_excluded
+
+        Description:  Test with a tied slave excluded from promotion.
+
+        Arguments:
+
+        """
+
+        self.selection["excluded"] = ["slave3"]
+
+        self.assertEqual(
+            score_libs.unresolved_ties(self.selection), ["slave2"])
+
+    def test_same_score(self):
+
+        """Function:  test_same_score
+
+        Description:  Test with a tied slave with the same score as the best
+            slave.
+
+        Arguments:
+
+        """
+
+        self.selection["scores"] = {"slave1": 0.8, "slave2": 0.8,
+                                    "slave3": 0.2}
+
+        self.assertEqual(
+            score_libs.unresolved_ties(self.selection), ["slave2"])
+
+    def test_scored(self):
+
+        """Function:  test_scored
+
+        Description:  Test with the tie broken by the scoring criteria.
+
+        Arguments:
+
+        """
+
+        self.selection["scores"] = {"slave1": 0.8, "slave2": 0.5,
+                                    "slave3": 0.2}
+
+        self.assertEqual(
+            score_libs.unresolved_ties(self.selection), [])
+
+    def test_no_best(self):
+
+        """Function:  test_no_best
+
+        Description:  Test with no best slave.
+
+        Arguments:
+
+        """
+
+        self.selection["best"] = None
+
+        self.assertEqual(
+            score_libs.unresolved_ties(self.selection), [])
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            score_libs.unresolved_ties(self.selection),
+            ["slave2", "slave3"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,22 @@
+#!/bin/bash
+# Unit test code coverage for library module.
+# This will run the Python code coverage module against all unit test modules.
+# This will show the amount of code that was tested and which lines of code
+#   that was skipped during the test.
+
+coverage erase
+
+echo ""
+echo "Running unit test modules in conjunction with coverage"
+coverage run -a --source=snapshot_libs test/unit/snapshot_libs/read_snapshot.py
+coverage run -a --source=snapshot_libs test/unit/snapshot_libs/save_snapshot.py
+coverage run -a --source=snapshot_libs test/unit/snapshot_libs/snapshot_fingerprint.py
+coverage run -a --source=snapshot_libs test/unit/snapshot_libs/snapshot_slave.py
+coverage run -a --source=snapshot_libs test/unit/snapshot_libs/snapshot_value.py
+coverage run -a --source=snapshot_libs test/unit/snapshot_libs/use_snapshot.py
+coverage run -a --source=snapshot_libs test/unit/snapshot_libs/write_snapshot.py
+
+echo ""
+echo "Producing code coverage report"
+coverage combine
+coverage report -m
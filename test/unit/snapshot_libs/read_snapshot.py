@@ -0,0 +1,255 @@
+# Classification (U)
+
+"""Program:  read_snapshot.py
+
+    Description:  Unit testing of read_snapshot in snapshot_libs.py.
+
+    Usage:
+        test/unit/snapshot_libs/read_snapshot.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import shutil
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import snapshot_libs                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, name, exe_gtidset):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) name
+            (input) exe_gtidset
+
+        """
+
+        self.name = name
+        self.host = "localhost"
+        self.port = 3306
+        self.server_id = 10
+        self.exe_gtidset = exe_gtidset
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        write
+        test_not_snapshot
+        test_missing
+        test_fingerprint
+        test_stale
+        test_snapshot
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = "test/unit/snapshot_libs/tmp"
+        self.snap_file = os.path.join(self.tmp_dir, "snapshot.bin")
+        self.cfg_file = os.path.join(self.tmp_dir, "slaves.txt")
+        os.makedirs(self.tmp_dir, exist_ok=True)
+
+        with open(self.cfg_file, mode="w", encoding="UTF-8") as f_hdlr:
+            f_hdlr.write("host = localhost\n")
+
+        self.args = ArgParser()
+        self.args.args_array = {"-d": self.tmp_dir, "-s": "slaves.txt",
+                                "-k": self.snap_file}
+
+        self.slaves = [SlaveRep("slave1", "uuid:1-10"),
+                       SlaveRep("slave2", "uuid:1-5")]
+        self.fingerprint = snapshot_libs.snapshot_fingerprint(self.args)
+        self.selection = {"best": self.slaves[0], "ties": [], "divergent": [],
+                          "slave_list": [(10, self.slaves[0]),
+                                         (5, self.slaves[1])]}
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+    def write(self):
+
+        """Function:  write
+
+        Description:  Write a snapshot file.
+
+        Arguments:
+
+        """
+
+        snapshot_libs.write_snapshot(
+            self.snap_file, self.fingerprint, self.slaves, self.selection)
+
+    def test_not_snapshot(self):
+
+        """Function:  test_not_snapshot
+
+        Description:  Test with a file which is not a snapshot.
+
+        Arguments:
+
+        """
+
+        with open(self.snap_file, mode="wb") as f_hdlr:
+            f_hdlr.write(b"slave1,slave2\n")
+
+        self.assertIsNone(snapshot_libs.read_snapshot(
+            self.snap_file, self.fingerprint, 10))
+
+    def test_missing(self):
+
+        """Function:  test_missing
+
+        Description:  Test with a missing snapshot file.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(snapshot_libs.read_snapshot(
+            self.snap_file, self.fingerprint, 10))
+
+    def test_fingerprint(self):
+
+        """Function:  test_fingerprint
+
+        Description:  Test with a snapshot for another fingerprint.
+
+        Arguments:
+
+        """
+
+        self.write()
+
+        self.assertIsNone(snapshot_libs.read_snapshot(
+            self.snap_file, b"0" * 32, 10))
+
+    def test_stale(self):
+
+        """Function:  test_stale
+
+        Description:  Test with a snapshot older than the TTL.
+
+        Arguments:
+
+        """
+
+        with mock.patch("snapshot_libs.time.time",
+                        mock.Mock(return_value=1000.0)):
+            self.write()
+
+        self.assertIsNone(snapshot_libs.read_snapshot(
+            self.snap_file, self.fingerprint, 10))
+
+    def test_snapshot(self):
+
+        """Function:  test_snapshot
+
+        Description:  Test with a snapshot within the TTL.
+
+        Arguments:
+
+        """
+
+        self.write()
+        snapshot = snapshot_libs.read_snapshot(
+            self.snap_file, self.fingerprint, 10)
+
+        self.assertEqual(snapshot["ranking"]["best"], "slave1")
+        self.assertEqual(snapshot["ranking"]["order"], ["slave1", "slave2"])
+        self.assertEqual([slv.name for slv in snapshot["slaves"]],
+                         ["slave1", "slave2"])
+        self.assertEqual(snapshot["slaves"][1].exe_gtidset, "uuid:1-5")
+        self.assertTrue(0 <= snapshot["age"] <= 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,284 @@
+# Classification (U)
+
+"""Program:  save_snapshot.py
+
+    Description:  Unit testing of save_snapshot in snapshot_libs.py.
+
+    Usage:
+        test/unit/snapshot_libs/save_snapshot.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import snapshot_libs                            # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_stream
+        test_not_written
+        test_no_config
+        test_no_slaves
+        test_failover
+        test_no_snapshot
+        test_from_snapshot
+        test_rank
+        test_save
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.args.args_array = {"-d": "config", "-s": "slaves.txt",
+                                "-k": "snapshot.bin"}
+        self.slaves = ["slave1", "slave2"]
+        self.selection = {"best": "slave1", "ties": [], "divergent": []}
+
+    @mock.patch("snapshot_libs.write_snapshot")
+    @mock.patch("snapshot_libs.snapshot_fingerprint",
+                mock.Mock(return_value=b"digest"))
+    def test_stream(self, mock_write):
+
+        """Function:  test_stream
+
+        Description:  Test with a snapshot not written while streaming.
+
+        Arguments:
+
+        """
+
+        mock_write.side_effect = OSError("Permission denied")
+
+        with gen_libs.no_std_out():
+            snapshot_libs.save_snapshot(
+                self.args, {"-B"}, self.slaves, selection=self.selection,
+                stream=print)
+
+        self.assertTrue(mock_write.called)
+
+    @mock.patch("snapshot_libs.write_snapshot")
+    @mock.patch("snapshot_libs.snapshot_fingerprint",
+                mock.Mock(return_value=b"digest"))
+    def test_not_written(self, mock_write):
+
+        """Function:  test_not_written
+
+        Description:  Test with a snapshot which is not written.
+
+        Arguments:
+
+        """
+
+        mock_write.side_effect = OSError("Permission denied")
+
+        with mock.patch("builtins.print") as mock_print:
+            snapshot_libs.save_snapshot(
+                self.args, {"-B"}, self.slaves, selection=self.selection)
+
+        self.assertIn("snapshot.bin", mock_print.call_args[0][0])
+
+    @mock.patch("snapshot_libs.write_snapshot")
+    def test_no_config(self, mock_write):
+
+        """Function:  test_no_config
+
+        Description:  Test with a slave config file which is not read.
+
+        Arguments:
+
+        """
+
+        with mock.patch("snapshot_libs.snapshot_fingerprint",
+                        mock.Mock(return_value=None)):
+            snapshot_libs.save_snapshot(self.args, {"-B"}, self.slaves)
+
+        self.assertFalse(mock_write.called)
+
+    @mock.patch("snapshot_libs.write_snapshot")
+    @mock.patch("snapshot_libs.snapshot_fingerprint",
+                mock.Mock(return_value=b"digest"))
+    def test_no_slaves(self, mock_write):
+
+        """Function:  test_no_slaves
+
+        Description:  Test with no slaves.
+
+        Arguments:
+
+        """
+
+        snapshot_libs.save_snapshot(self.args, {"-B"}, [])
+
+        self.assertFalse(mock_write.called)
+
+    @mock.patch("snapshot_libs.write_snapshot")
+    @mock.patch("snapshot_libs.snapshot_fingerprint",
+                mock.Mock(return_value=b"digest"))
+    def test_failover(self, mock_write):
+
+        """Function:  test_failover
+
+        Description:  Test with the -F option.
+
+        Arguments:
+
+        """
+
+        snapshot_libs.save_snapshot(self.args, {"-F"}, self.slaves)
+
+        self.assertFalse(mock_write.called)
+
+    @mock.patch("snapshot_libs.write_snapshot")
+    def test_no_snapshot(self, mock_write):
+
+        """Function:  test_no_snapshot
+
+        Description:  Test with no -k option.
+
+        Arguments:
+
+        """
+
+        del self.args.args_array["-k"]
+
+        snapshot_libs.save_snapshot(self.args, {"-B"}, self.slaves)
+
+        self.assertFalse(mock_write.called)
+
+    @mock.patch("snapshot_libs.write_snapshot")
+    @mock.patch("snapshot_libs.snapshot_fingerprint")
+    def test_from_snapshot(self, mock_fingerprint, mock_write):
+
+        """Function:  test_from_snapshot
+
+        Description:  Test with the slaves from the snapshot file.
+
+        Arguments:
+
+        """
+
+        snapshot_libs.save_snapshot(
+            self.args, {"-B"}, self.slaves, selection=self.selection,
+            from_snapshot=True)
+
+        self.assertFalse(mock_fingerprint.called)
+        self.assertFalse(mock_write.called)
+
+    @mock.patch("snapshot_libs.write_snapshot")
+    @mock.patch("snapshot_libs.score_libs.select_candidates")
+    @mock.patch("snapshot_libs.snapshot_fingerprint",
+                mock.Mock(return_value=b"digest"))
+    def test_rank(self, mock_select, mock_write):
+
+        """Function:  test_rank
+
+        Description:  Test with no selection passed in.
+
+        Arguments:
+
+        """
+
+        mock_select.return_value = self.selection
+
+        snapshot_libs.save_snapshot(
+            self.args, {"-B"}, self.slaves, inventory={"slave1": {}})
+
+        mock_select.assert_called_once_with(
+            self.slaves, inventory={"slave1": {}})
+        mock_write.assert_called_once_with(
+            "snapshot.bin", b"digest", self.slaves, self.selection)
+
+    @mock.patch("snapshot_libs.write_snapshot")
+    @mock.patch("snapshot_libs.score_libs.select_candidates")
+    @mock.patch("snapshot_libs.snapshot_fingerprint",
+                mock.Mock(return_value=b"digest"))
+    def test_save(self, mock_select, mock_write):
+
+        """Function:  test_save
+
+        Description:  Test with the snapshot written with the selection of
+            the command.
+
+        Arguments:
+
+        """
+
+        snapshot_libs.save_snapshot(
+            self.args, {"-D"}, self.slaves, selection=self.selection,
+            inventory={"slave1": {}})
+
+        self.assertFalse(mock_select.called)
+        mock_write.assert_called_once_with(
+            "snapshot.bin", b"digest", self.slaves, self.selection)
+
+
+if __name__ == "__main__":
+    unittest.main()
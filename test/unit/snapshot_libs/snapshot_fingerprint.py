@@ -0,0 +1,186 @@
+# Classification (U)
+
+"""Program:  snapshot_fingerprint.py
+
+    Description:  Unit testing of snapshot_fingerprint in
+        mysql_rep_failover.py.
+
+    Usage:
+        test/unit/snapshot_libs/snapshot_fingerprint.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import shutil
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import snapshot_libs                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_no_file
+        test_version
+        test_changed
+        test_fingerprint
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = "test/unit/snapshot_libs/tmp"
+        self.snap_file = os.path.join(self.tmp_dir, "snapshot.bin")
+        self.cfg_file = os.path.join(self.tmp_dir, "slaves.txt")
+        os.makedirs(self.tmp_dir, exist_ok=True)
+
+        with open(self.cfg_file, mode="w", encoding="UTF-8") as f_hdlr:
+            f_hdlr.write("host = localhost\n")
+
+        self.args = ArgParser()
+        self.args.args_array = {"-d": self.tmp_dir, "-s": "slaves.txt",
+                                "-k": self.snap_file}
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+    def test_no_file(self):
+
+        """Function:  test_no_file
+
+        Description:  Test with a slave config file which is not read.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-s"] = "missing.txt"
+
+        self.assertIsNone(snapshot_libs.snapshot_fingerprint(self.args))
+
+    def test_version(self):
+
+        """Function:  test_version
+
+        Description:  Test with a change of the program version.
+
+        Arguments:
+
+        """
+
+        digest = snapshot_libs.snapshot_fingerprint(self.args)
+
+        with mock.patch("snapshot_libs.version.__version__", "0.0.0"):
+            self.assertNotEqual(
+                snapshot_libs.snapshot_fingerprint(self.args), digest)
+
+    def test_changed(self):
+
+        """Function:  test_changed
+
+        Description:  Test with a change of the slave config file.
+
+        Arguments:
+
+        """
+
+        digest = snapshot_libs.snapshot_fingerprint(self.args)
+
+        with open(self.cfg_file, mode="a", encoding="UTF-8") as f_hdlr:
+            f_hdlr.write("port = 3307\n")
+
+        self.assertNotEqual(
+            snapshot_libs.snapshot_fingerprint(self.args), digest)
+
+    def test_fingerprint(self):
+
+        """Function:  test_fingerprint
+
+        Description:  Test the fingerprint of the slave config file.
+
+        Arguments:
+
+        """
+
+        digest = snapshot_libs.snapshot_fingerprint(self.args)
+
+        self.assertEqual(len(digest), 32)
+        self.assertEqual(
+            snapshot_libs.snapshot_fingerprint(self.args), digest)
+
+
+if __name__ == "__main__":
+    unittest.main()
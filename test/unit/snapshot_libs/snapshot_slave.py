@@ -0,0 +1,122 @@
+# Classification (U)
+
+"""Program:  snapshot_slave.py
+
+    Description:  Unit testing of snapshot_slave in snapshot_libs.py.
+
+    Usage:
+        test/unit/snapshot_libs/snapshot_slave.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import snapshot_libs                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "slave1"
+        self.host = "localhost"
+        self.port = 3306
+        self.server_id = 10
+        self.gtid_mode = True
+        self.exe_gtidset = "3e11fa47-71ca-11e1-9e33-c80aa9429562:1-20"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_probed
+        test_default
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.slave = SlaveRep()
+
+    def test_probed(self):
+
+        """Function:  test_probed
+
+        Description:  Test with probed GTID sets.
+
+        Arguments:
+
+        """
+
+        self.slave.exe_gtids = snapshot_libs.probe_libs.gtid_class.GtidSet(
+            "3e11fa47-71ca-11e1-9e33-c80aa9429562:1-25")
+        item = snapshot_libs.snapshot_slave(self.slave)
+
+        self.assertEqual(
+            item["exe_gtidset"], "3e11fa47-71ca-11e1-9e33-c80aa9429562:1-25")
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with default arguments only.
+
+        Arguments:
+
+        """
+
+        item = snapshot_libs.snapshot_slave(self.slave)
+
+        self.assertEqual(
+            set(item), set(snapshot_libs.SNAPSHOT_FIELDS))
+        self.assertEqual(
+            item["exe_gtidset"], "3e11fa47-71ca-11e1-9e33-c80aa9429562:1-20")
+        self.assertEqual(item["retrieved_gtidset"], "")
+        self.assertIsNone(item["lag"])
+        self.assertTrue(item["gtid_mode"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+# Classification (U)
+
+"""Program:  snapshot_value.py
+
+    Description:  Unit testing of snapshot_value in snapshot_libs.py.
+
+    Usage:
+        test/unit/snapshot_libs/snapshot_value.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import decimal
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import snapshot_libs                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_object
+        test_none
+        test_json
+
+    """
+
+    def test_object(self):
+
+        """Function:  test_object
+
+        Description:  Test with an object value.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            snapshot_libs.snapshot_value(
+                decimal.Decimal("1.5")), "1.5")
+
+    def test_none(self):
+
+        """Function:  test_none
+
+        Description:  Test with a None value.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(snapshot_libs.snapshot_value(None))
+
+    def test_json(self):
+
+        """Function:  test_json
+
+        Description:  Test with JSON type values.
+
+        Arguments:
+
+        """
+
+        for value in [True, 3306, 0.5, "ON"]:
+            self.assertEqual(snapshot_libs.snapshot_value(value), value)
+
+
+if __name__ == "__main__":
+    unittest.main()
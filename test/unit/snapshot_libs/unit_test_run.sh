@@ -0,0 +1,15 @@
+#!/bin/bash
+# Unit testing program for the library module.
+# This will run all the units tests for this library.
+# Will need to run this from the base directory where the module file
+#   is located at.
+
+echo ""
+echo "Unit testing..."
+/usr/bin/python test/unit/snapshot_libs/read_snapshot.py
+/usr/bin/python test/unit/snapshot_libs/save_snapshot.py
+/usr/bin/python test/unit/snapshot_libs/snapshot_fingerprint.py
+/usr/bin/python test/unit/snapshot_libs/snapshot_slave.py
+/usr/bin/python test/unit/snapshot_libs/snapshot_value.py
+/usr/bin/python test/unit/snapshot_libs/use_snapshot.py
+/usr/bin/python test/unit/snapshot_libs/write_snapshot.py
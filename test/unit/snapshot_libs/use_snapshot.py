@@ -0,0 +1,260 @@
+# Classification (U)
+
+"""Program:  use_snapshot.py
+
+    Description:  Unit testing of use_snapshot in snapshot_libs.py.
+
+    Usage:
+        test/unit/snapshot_libs/use_snapshot.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import snapshot_libs                            # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmdline = None
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_plan
+        test_no_file
+        test_failover
+        test_ttl
+        test_stale
+        test_report
+        test_snapshot
+        test_no_snapshot
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.args.args_array = {"-d": "config", "-s": "slaves.txt",
+                                "-k": "snapshot.bin"}
+        self.snapshot = {"age": 1.5, "ranking": {"best": "slave1"},
+                         "slaves": ["slave1"]}
+
+    @mock.patch("snapshot_libs.read_snapshot")
+    def test_plan(self, mock_read):
+
+        """Function:  test_plan
+
+        Description:  Test with the -F and -P options.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-P"] = True
+
+        with mock.patch("snapshot_libs.os.remove") as mock_remove:
+            self.assertIsNone(
+                snapshot_libs.use_snapshot(self.args, {"-F"}))
+
+        self.assertFalse(mock_remove.called)
+        self.assertFalse(mock_read.called)
+
+    @mock.patch("snapshot_libs.read_snapshot")
+    def test_no_file(self, mock_read):
+
+        """Function:  test_no_file
+
+        Description:  Test with the -F option and no snapshot file.
+
+        Arguments:
+
+        """
+
+        with mock.patch("snapshot_libs.os.remove",
+                        mock.Mock(side_effect=FileNotFoundError)):
+            self.assertIsNone(
+                snapshot_libs.use_snapshot(self.args, {"-F"}))
+
+        self.assertFalse(mock_read.called)
+
+    @mock.patch("snapshot_libs.read_snapshot")
+    def test_failover(self, mock_read):
+
+        """Function:  test_failover
+
+        Description:  Test with the -F option.
+
+        Arguments:
+
+        """
+
+        with mock.patch("snapshot_libs.os.remove") as mock_remove:
+            self.assertIsNone(
+                snapshot_libs.use_snapshot(self.args, {"-F"}))
+
+        mock_remove.assert_called_once_with("snapshot.bin")
+        self.assertFalse(mock_read.called)
+
+    @mock.patch("snapshot_libs.read_snapshot")
+    @mock.patch("snapshot_libs.snapshot_fingerprint",
+                mock.Mock(return_value=b"digest"))
+    def test_ttl(self, mock_read):
+
+        """Function:  test_ttl
+
+        Description:  Test with the -l option.
+
+        Arguments:
+
+        """
+
+        mock_read.return_value = None
+        self.args.args_array["-l"] = "30"
+
+        snapshot_libs.use_snapshot(self.args, {"-B"})
+
+        mock_read.assert_called_once_with("snapshot.bin", b"digest", 30.0)
+
+    @mock.patch("snapshot_libs.read_snapshot")
+    @mock.patch("snapshot_libs.snapshot_fingerprint",
+                mock.Mock(return_value=b"digest"))
+    def test_stale(self, mock_read):
+
+        """Function:  test_stale
+
+        Description:  Test with a snapshot which is not usable.
+
+        Arguments:
+
+        """
+
+        mock_read.return_value = None
+        report = {}
+
+        self.assertIsNone(
+            snapshot_libs.use_snapshot(self.args, {"-B"}, report=report))
+        self.assertEqual(report, {})
+        mock_read.assert_called_once_with("snapshot.bin", b"digest", 10.0)
+
+    @mock.patch("snapshot_libs.read_snapshot")
+    @mock.patch("snapshot_libs.snapshot_fingerprint",
+                mock.Mock(return_value=b"digest"))
+    def test_report(self, mock_read):
+
+        """Function:  test_report
+
+        Description:  Test with the snapshot added to the report.
+
+        Arguments:
+
+        """
+
+        mock_read.return_value = self.snapshot
+        report = {}
+
+        self.assertEqual(
+            snapshot_libs.use_snapshot(self.args, {"-D"}, report=report),
+            ["slave1"])
+        self.assertEqual(
+            report["snapshot"],
+            {"file": "snapshot.bin", "age": 1.5,
+             "ranking": {"best": "slave1"}})
+
+    @mock.patch("snapshot_libs.read_snapshot")
+    @mock.patch("snapshot_libs.snapshot_fingerprint",
+                mock.Mock(return_value=b"digest"))
+    def test_snapshot(self, mock_read):
+
+        """Function:  test_snapshot
+
+        Description:  Test with a snapshot within the TTL.
+
+        Arguments:
+
+        """
+
+        mock_read.return_value = self.snapshot
+
+        self.assertEqual(
+            snapshot_libs.use_snapshot(self.args, {"-B"}), ["slave1"])
+
+    @mock.patch("snapshot_libs.read_snapshot")
+    def test_no_snapshot(self, mock_read):
+
+        """Function:  test_no_snapshot
+
+        Description:  Test with no -k option.
+
+        Arguments:
+
+        """
+
+        del self.args.args_array["-k"]
+
+        self.assertIsNone(snapshot_libs.use_snapshot(self.args, {"-B"}))
+        self.assertFalse(mock_read.called)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,17 +8,108 @@ coverage erase
 
 echo ""
 echo "Running unit test modules in conjunction with coverage"
-coverage run -a --source=mysql_rep_failover test/unit/mysql_rep_failover/convert_to_master.py
-coverage run -a --source=mysql_rep_failover test/unit/mysql_rep_failover/create_instances.py
 coverage run -a --source=mysql_rep_failover test/unit/mysql_rep_failover/gtid_enabled.py
 coverage run -a --source=mysql_rep_failover test/unit/mysql_rep_failover/help_message.py
+coverage run -a --source=mysql_rep_failover test/unit/mysql_rep_failover/load_slaves.py
 coverage run -a --source=mysql_rep_failover test/unit/mysql_rep_failover/main.py
-coverage run -a --source=mysql_rep_failover test/unit/mysql_rep_failover/order_slaves_on_gtid.py
 coverage run -a --source=mysql_rep_failover test/unit/mysql_rep_failover/promote_best_slave.py
 coverage run -a --source=mysql_rep_failover test/unit/mysql_rep_failover/promote_designated_slave.py
+coverage run -a --source=mysql_rep_failover test/unit/mysql_rep_failover/rejoin_slaves.py
+coverage run -a --source=mysql_rep_failover test/unit/mysql_rep_failover/restore_signals.py
 coverage run -a --source=mysql_rep_failover test/unit/mysql_rep_failover/run_program.py
 coverage run -a --source=mysql_rep_failover test/unit/mysql_rep_failover/show_best_slave.py
 coverage run -a --source=mysql_rep_failover test/unit/mysql_rep_failover/show_slave_delays.py
+coverage run -a --source=mysql_rep_failover test/unit/mysql_rep_failover/supervise.py
+coverage run -a --source=mysql_rep_failover test/unit/mysql_rep_failover/supervisor_signals.py
+coverage run -a --source=mysql_rep_failover test/unit/mysql_rep_failover/valid_num.py
+coverage run -a --source=batch_libs test/unit/batch_libs/batch_files.py
+coverage run -a --source=batch_libs test/unit/batch_libs/run_batch.py
+coverage run -a --source=batch_libs test/unit/batch_libs/run_set.py
+coverage run -a --source=batch_libs test/unit/batch_libs/set_lock_id.py
+coverage run -a --source=converge_libs test/unit/converge_libs/convergence_reason.py
+coverage run -a --source=converge_libs test/unit/converge_libs/verify_convergence.py
+coverage run -a --source=discover_libs test/unit/discover_libs/create_instances.py
+coverage run -a --source=discover_libs test/unit/discover_libs/create_inventory.py
+coverage run -a --source=discover_libs test/unit/discover_libs/discover_slaves.py
+coverage run -a --source=discover_libs test/unit/discover_libs/find_slave.py
+coverage run -a --source=discover_libs test/unit/discover_libs/probe_reachable.py
+coverage run -a --source=discover_libs test/unit/discover_libs/slave_records.py
+coverage run -a --source=engine_libs test/unit/engine_libs/probe_tcp.py
+coverage run -a --source=engine_libs test/unit/engine_libs/run_coroutine.py
+coverage run -a --source=engine_libs test/unit/engine_libs/run_engine.py
+coverage run -a --source=gtid_class test/unit/gtid_class/gtidmatrix_complete.py
+coverage run -a --source=gtid_class test/unit/gtid_class/gtidmatrix_errant.py
+coverage run -a --source=gtid_class test/unit/gtid_class/gtidmatrix_init.py
+coverage run -a --source=gtid_class test/unit/gtid_class/gtidmatrix_issuperset.py
+coverage run -a --source=gtid_class test/unit/gtid_class/gtidmatrix_missing.py
+coverage run -a --source=gtid_class test/unit/gtid_class/gtidset_common.py
+coverage run -a --source=gtid_class test/unit/gtid_class/gtidset_count.py
+coverage run -a --source=gtid_class test/unit/gtid_class/gtidset_init.py
+coverage run -a --source=gtid_class test/unit/gtid_class/gtidset_intervals.py
+coverage run -a --source=gtid_class test/unit/gtid_class/gtidset_issuperset.py
+coverage run -a --source=gtid_class test/unit/gtid_class/gtidset_str.py
+coverage run -a --source=gtid_class test/unit/gtid_class/gtidset_subtract.py
+coverage run -a --source=gtid_class test/unit/gtid_class/gtidset_union.py
+coverage run -a --source=gtid_class test/unit/gtid_class/gtidtracker_advance.py
+coverage run -a --source=gtid_class test/unit/gtid_class/gtidtracker_digest.py
+coverage run -a --source=gtid_class test/unit/gtid_class/gtidtracker_forget.py
+coverage run -a --source=gtid_class test/unit/gtid_class/gtidtracker_get.py
+coverage run -a --source=gtid_class test/unit/gtid_class/gtidtracker_init.py
+coverage run -a --source=gtid_class test/unit/gtid_class/gtidtracker_rebase.py
+coverage run -a --source=lazy_class test/unit/lazy_class/lazymodule_delattr.py
+coverage run -a --source=lazy_class test/unit/lazy_class/lazymodule_dir.py
+coverage run -a --source=lazy_class test/unit/lazy_class/lazymodule_getattr.py
+coverage run -a --source=lazy_class test/unit/lazy_class/lazymodule_init.py
+coverage run -a --source=lazy_class test/unit/lazy_class/lazymodule_load.py
+coverage run -a --source=lazy_class test/unit/lazy_class/lazymodule_repr.py
+coverage run -a --source=lazy_class test/unit/lazy_class/lazymodule_setattr.py
+coverage run -a --source=lock_class test/unit/lock_class/lockedrep_class.py
+coverage run -a --source=lock_class test/unit/lock_class/lockedrep_getattr.py
+coverage run -a --source=lock_class test/unit/lock_class/lockedrep_init.py
+coverage run -a --source=lock_class test/unit/lock_class/lockedrep_repr.py
+coverage run -a --source=lock_class test/unit/lock_class/lockedrep_setattr.py
+coverage run -a --source=plan_libs test/unit/plan_libs/bytes_behind.py
+coverage run -a --source=plan_libs test/unit/plan_libs/failover_plan.py
+coverage run -a --source=plan_libs test/unit/plan_libs/plan_failover.py
+coverage run -a --source=probe_libs test/unit/probe_libs/probe_fields.py
+coverage run -a --source=probe_libs test/unit/probe_libs/probe_query.py
+coverage run -a --source=probe_libs test/unit/probe_libs/probe_slave.py
+coverage run -a --source=probe_libs test/unit/probe_libs/probe_slaves.py
+coverage run -a --source=probe_libs test/unit/probe_libs/probe_value.py
+coverage run -a --source=probe_libs test/unit/probe_libs/refresh_slaves.py
+coverage run -a --source=probe_libs test/unit/probe_libs/slave_gtids.py
+coverage run -a --source=probe_libs test/unit/probe_libs/wait_for_drain.py
+coverage run -a --source=repoint_libs test/unit/repoint_libs/change_slaves.py
+coverage run -a --source=repoint_libs test/unit/repoint_libs/convert_to_master.py
+coverage run -a --source=repoint_libs test/unit/repoint_libs/master_load.py
+coverage run -a --source=repoint_libs test/unit/repoint_libs/repoint_slaves.py
+coverage run -a --source=repoint_libs test/unit/repoint_libs/wait_for_load.py
+coverage run -a --source=report_libs test/unit/report_libs/add_slowest.py
+coverage run -a --source=report_libs test/unit/report_libs/emit_record.py
+coverage run -a --source=report_libs test/unit/report_libs/percentile.py
+coverage run -a --source=report_libs test/unit/report_libs/plan_value.py
+coverage run -a --source=report_libs test/unit/report_libs/ranking_record.py
+coverage run -a --source=report_libs test/unit/report_libs/slave_time.py
+coverage run -a --source=report_libs test/unit/report_libs/time_phase.py
+coverage run -a --source=report_libs test/unit/report_libs/write_report.py
+coverage run -a --source=score_libs test/unit/score_libs/criterion_value.py
+coverage run -a --source=score_libs test/unit/score_libs/errant_transactions.py
+coverage run -a --source=score_libs test/unit/score_libs/no_best_message.py
+coverage run -a --source=score_libs test/unit/score_libs/order_slaves_on_gtid.py
+coverage run -a --source=score_libs test/unit/score_libs/pick_candidate.py
+coverage run -a --source=score_libs test/unit/score_libs/score_fields.py
+coverage run -a --source=score_libs test/unit/score_libs/score_settings.py
+coverage run -a --source=score_libs test/unit/score_libs/score_slaves.py
+coverage run -a --source=score_libs test/unit/score_libs/select_candidates.py
+coverage run -a --source=score_libs test/unit/score_libs/slave_deltas.py
+coverage run -a --source=score_libs test/unit/score_libs/unresolved_ties.py
+coverage run -a --source=snapshot_libs test/unit/snapshot_libs/read_snapshot.py
+coverage run -a --source=snapshot_libs test/unit/snapshot_libs/save_snapshot.py
+coverage run -a --source=snapshot_libs test/unit/snapshot_libs/snapshot_fingerprint.py
+coverage run -a --source=snapshot_libs test/unit/snapshot_libs/snapshot_slave.py
+coverage run -a --source=snapshot_libs test/unit/snapshot_libs/snapshot_value.py
+coverage run -a --source=snapshot_libs test/unit/snapshot_libs/use_snapshot.py
+coverage run -a --source=snapshot_libs test/unit/snapshot_libs/write_snapshot.py
 
 echo ""
 echo "Producing code coverage report"